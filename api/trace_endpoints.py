@@ -11,6 +11,7 @@ Endpoints:
 - GET /api/trace/<trace_id> - Get complete trace events
 - GET /api/trace/<trace_id>/summary - Get trace summary
 - GET /api/trace/<trace_id>/timeline - Get timeline-formatted events
+- GET /api/trace/<trace_id>/stream - Server-sent events stream of new trace events
 - POST /api/trace/query - Initiate a new traced query
 - GET /api/trace/active - List active traces
 - DELETE /api/trace/<trace_id> - Clean up trace data
@@ -20,6 +21,7 @@ Version: 1.0.0
 """
 
 import json
+import queue
 import time
 from typing import Dict, List, Any, Optional
 from flask import Flask, request, jsonify, Response
@@ -43,6 +45,10 @@ logger = logging.getLogger(__name__)
 trace_app = Flask(__name__)
 CORS(trace_app)  # Enable CORS for frontend access
 
+# Live stream settings
+STREAM_HEARTBEAT_SECONDS = 15.0
+STREAM_MAX_DURATION_SECONDS = 3600.0
+
 @trace_app.route('/api/trace/<trace_id>', methods=['GET'])
 def get_trace_events(trace_id: str):
     """
@@ -172,6 +178,116 @@ def get_trace_timeline(trace_id: str):
             'trace_id': trace_id
         }), 500
 
+def _format_sse(data: Dict[str, Any], event: str = 'trace_event',
+                event_id: Optional[int] = None) -> str:
+    """Format a payload as a server-sent events message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+def _is_trace_end_event(event: Dict[str, Any]) -> bool:
+    """Check whether an event is the final event emitted by end_trace."""
+    return event.get('event_type') == 'end' and event.get('source_module') == 'TraceLogger'
+
+@trace_app.route('/api/trace/<trace_id>/stream', methods=['GET'])
+def stream_trace_events(trace_id: str):
+    """
+    Stream new trace events as server-sent events.
+    
+    Only events the client has not seen are sent. Clients resume after a
+    disconnect with the standard ``Last-Event-ID`` header or the ``since``
+    query parameter; each message id is the event sequence number.
+    
+    Args:
+        trace_id: Unique trace identifier
+        
+    Query Parameters:
+        since: Last sequence number already received (default 0)
+        heartbeat: Seconds between keep-alive comments (default 15)
+        
+    Returns:
+        text/event-stream response with trace_event messages and a final
+        trace_end message once the trace completes
+    """
+    try:
+        trace_logger = get_trace_logger()
+
+        if not trace_logger.get_trace_summary(trace_id):
+            return jsonify({
+                'success': False,
+                'error': 'Trace not found',
+                'trace_id': trace_id
+            }), 404
+
+        since = request.headers.get('Last-Event-ID') or request.args.get('since', 0)
+        since_sequence = max(0, int(since))
+        heartbeat = max(1.0, float(request.args.get('heartbeat', STREAM_HEARTBEAT_SECONDS)))
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': f'Invalid stream parameter: {e}',
+            'trace_id': trace_id
+        }), 400
+    except Exception as e:
+        logger.error(f"Error opening trace stream {trace_id}: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'trace_id': trace_id
+        }), 500
+
+    def generate():
+        last_sequence = since_sequence
+        subscriber, backlog = trace_logger.subscribe(trace_id, since_sequence)
+        deadline = time.time() + STREAM_MAX_DURATION_SECONDS
+
+        try:
+            yield f"retry: {int(heartbeat * 1000)}\n\n"
+
+            pending = list(backlog)
+            while time.time() < deadline:
+                for sequence, event in pending:
+                    if sequence <= last_sequence:
+                        continue
+                    last_sequence = sequence
+                    yield _format_sse({**event, 'sequence': sequence}, event_id=sequence)
+
+                    if _is_trace_end_event(event):
+                        yield _format_sse({'trace_id': trace_id, 'last_sequence': last_sequence},
+                                          event='trace_end')
+                        return
+                pending = []
+
+                try:
+                    sequence, event = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    if not trace_logger.is_trace_active(trace_id) and subscriber.empty():
+                        # Trace ended before we subscribed, or was cleaned up
+                        yield _format_sse({'trace_id': trace_id, 'last_sequence': last_sequence},
+                                          event='trace_end')
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                if sequence is None:
+                    # Subscriber overflowed; resubscribe from the last delivered event
+                    trace_logger.unsubscribe(trace_id, subscriber)
+                    subscriber, pending = trace_logger.subscribe(trace_id, last_sequence)
+                    continue
+
+                pending = [(sequence, event)]
+        finally:
+            trace_logger.unsubscribe(trace_id, subscriber)
+
+    return Response(generate(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
 @trace_app.route('/api/trace/query', methods=['POST'])
 def initiate_traced_query():
     """
@@ -231,7 +347,8 @@ def initiate_traced_query():
             'trace_mode': trace_mode,
             'timestamp': time.time(),
             'polling_url': f'/api/trace/{trace_id}',
-            'timeline_url': f'/api/trace/{trace_id}/timeline'
+            'timeline_url': f'/api/trace/{trace_id}/timeline',
+            'stream_url': f'/api/trace/{trace_id}/stream'
         })
         
     except Exception as e:
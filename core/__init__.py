@@ -3,12 +3,18 @@
 """
 Core module for SAM (Small Agent Model).
 
-This module provides core functionality for query routing and semantic processing.
+This module provides core functionality for query routing and semantic processing,
+and the spawn worker pool shared by the isolated web fetch and Python sandbox workers.
 """
 
 from .query_router import SemanticQueryRouter, QueryResult
+from .worker_pool import SpawnWorkerPool, WorkerPoolError, WorkerTimeoutError, WorkerCrashError
 
 __all__ = [
     'SemanticQueryRouter',
-    'QueryResult'
+    'QueryResult',
+    'SpawnWorkerPool',
+    'WorkerPoolError',
+    'WorkerTimeoutError',
+    'WorkerCrashError'
 ]
@@ -0,0 +1,277 @@
+"""
+SpawnWorkerPool: Long-lived isolated worker processes for one kind of job.
+
+Starting a fresh interpreter per job pays interpreter startup and import
+costs every time. This module keeps a small pool of worker processes, each
+started with the "spawn" method so it shares no state with SAM, that
+receive jobs over a pipe and run them one at a time with a module-level job
+runner. The web fetch pool and the Python sandbox pool are built on it.
+
+Isolation guarantees:
+- a job that exceeds its timeout gets its worker killed
+- a worker that crashes or exits is discarded (and replaced in warm pools)
+- workers are recycled after a fixed number of jobs to bound leaks
+
+Worker processes are always started outside the pool lock, so a slow spawn
+never blocks callers that could use an idle worker.
+"""
+
+import logging
+import multiprocessing
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPoolError(Exception):
+    """Raised when the pool is shut down or a worker cannot be started."""
+    pass
+
+
+class WorkerTimeoutError(WorkerPoolError):
+    """Raised when a worker does not answer a job within its timeout."""
+    pass
+
+
+class WorkerCrashError(WorkerPoolError):
+    """Raised when a worker process exits while running a job."""
+
+    def __init__(self, message: str, exitcode: Optional[int] = None):
+        super().__init__(message)
+        self.exitcode = exitcode
+
+
+def _worker_main(conn, job_runner: Callable[[Any], Any],
+                 initializer: Optional[Callable[..., None]], initargs: Tuple) -> None:
+    """Worker process loop: run jobs from the pipe until None or EOF."""
+    if initializer is not None:
+        initializer(*initargs)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+        conn.send(job_runner(job))
+    conn.close()
+
+
+class _Worker:
+    """One spawned worker process and the parent end of its pipe."""
+
+    def __init__(self, context, name: str, args: Tuple):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,) + args, daemon=True, name=name)
+        self.process.start()
+        child_conn.close()
+        self.jobs_done = 0
+
+    def stop(self, graceful: bool = True) -> None:
+        """Stop the worker, asking it to exit first when graceful."""
+        try:
+            if graceful and self.process.is_alive():
+                self.conn.send(None)
+                self.process.join(timeout=2)
+        except (OSError, ValueError):
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=2)
+        self.conn.close()
+
+
+class SpawnWorkerPool:
+    """
+    Pool of isolated worker processes running one job type.
+
+    Workers are started on demand up to pool_size, or all up front with
+    keep_warm, in which case a worker that is killed or recycled is replaced
+    right away. run() blocks while every worker is busy.
+    """
+
+    def __init__(self, job_runner: Callable[[Any], Any], pool_size: int = 2, max_jobs_per_worker: int = 50,
+                 initializer: Optional[Callable[..., None]] = None, initargs: Tuple = (),
+                 keep_warm: bool = False, name: str = "sam-worker"):
+        """
+        Initialize the pool.
+
+        Args:
+            job_runner: Module-level callable(job) run in the worker; its
+                return value is sent back as the job result
+            pool_size: Maximum number of worker processes
+            max_jobs_per_worker: Jobs a worker runs before it is replaced
+            initializer: Optional module-level callable run once in each
+                worker before its first job (e.g. to set resource limits)
+            initargs: Arguments for initializer
+            keep_warm: Start all workers now and replace lost ones at once
+            name: Worker process name
+        """
+        if pool_size <= 0:
+            raise ValueError("Pool size must be positive")
+        if max_jobs_per_worker <= 0:
+            raise ValueError("Max jobs per worker must be positive")
+
+        self.pool_size = pool_size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.keep_warm = keep_warm
+        self.name = name
+        self._worker_args = (job_runner, initializer, tuple(initargs))
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: List[_Worker] = []
+        self._worker_count = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._stats = {'jobs': 0, 'workers_started': 0, 'workers_recycled': 0,
+                       'timeouts': 0, 'crashes': 0}
+
+        if keep_warm:
+            for _ in range(pool_size):
+                self._idle.append(self._start_worker())
+            self._worker_count = pool_size
+
+    def run(self, job: Any, timeout: float) -> Any:
+        """
+        Run a job on a pooled worker.
+
+        Args:
+            job: Picklable job passed to the job runner
+            timeout: Seconds to wait for the result, counted from when the
+                worker receives the job; the worker is killed after that
+
+        Returns:
+            The job runner's result
+
+        Raises:
+            WorkerTimeoutError: If the worker did not answer within timeout
+            WorkerCrashError: If the worker exited during the job
+            WorkerPoolError: If the pool is shut down or no worker could start
+        """
+        worker = self._acquire()
+        healthy = False
+
+        try:
+            try:
+                worker.conn.send(job)
+                if not worker.conn.poll(timeout):
+                    self._count('timeouts')
+                    raise WorkerTimeoutError(f"Worker did not answer within {timeout} seconds")
+                result = worker.conn.recv()
+            except (EOFError, OSError) as e:
+                self._count('crashes')
+                worker.process.join(timeout=1)
+                raise WorkerCrashError(f"Worker exited unexpectedly: {e}", exitcode=worker.process.exitcode)
+
+            healthy = True
+            worker.jobs_done += 1
+            self._count('jobs')
+            return result
+
+        finally:
+            self._release(worker, healthy)
+
+    def shutdown(self) -> None:
+        """Stop all idle workers; busy workers are stopped when released."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._worker_count -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._condition:
+            return {
+                **self._stats,
+                'pool_size': self.pool_size,
+                'max_jobs_per_worker': self.max_jobs_per_worker,
+                'live_workers': self._worker_count,
+                'idle_workers': len(self._idle)
+            }
+
+    def _count(self, key: str) -> None:
+        """Increment a statistics counter."""
+        with self._condition:
+            self._stats[key] += 1
+
+    def _start_worker(self) -> _Worker:
+        """Start a worker process (called without the pool lock held)."""
+        worker = _Worker(self._context, self.name, self._worker_args)
+        self._count('workers_started')
+        return worker
+
+    def _acquire(self) -> _Worker:
+        """Take an idle worker, start a new one, or wait for one to be released."""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise WorkerPoolError(f"{self.name} pool is shut down")
+                while self._idle:
+                    worker = self._idle.pop()
+                    if worker.process.is_alive():
+                        return worker
+                    # Died while idle
+                    self._stats['crashes'] += 1
+                    self._worker_count -= 1
+                    worker.stop(graceful=False)
+                if self._worker_count < self.pool_size:
+                    # Reserve the slot; the worker is started below, outside the lock
+                    self._worker_count += 1
+                    break
+                self._condition.wait()
+
+        try:
+            return self._start_worker()
+        except Exception as e:
+            with self._condition:
+                self._worker_count -= 1
+                self._condition.notify()
+            raise WorkerPoolError(f"Failed to start {self.name} worker: {e}")
+
+    def _release(self, worker: _Worker, healthy: bool) -> None:
+        """Return a worker to the pool, or stop (and in warm pools replace) it."""
+        keep = healthy and worker.jobs_done < self.max_jobs_per_worker
+        replace = False
+        with self._condition:
+            keep = keep and not self._closed
+            if keep:
+                self._idle.append(worker)
+            else:
+                if healthy:
+                    self._stats['workers_recycled'] += 1
+                # In warm pools the slot passes to the replacement started below
+                replace = self.keep_warm and not self._closed
+                if not replace:
+                    self._worker_count -= 1
+            self._condition.notify()
+
+        if not keep:
+            worker.stop(graceful=healthy)
+        if replace:
+            self._add_replacement()
+
+    def _add_replacement(self) -> None:
+        """Start a worker for a reserved slot and make it available."""
+        try:
+            replacement = self._start_worker()
+        except Exception as e:
+            logger.warning(f"Failed to start replacement {self.name} worker: {e}")
+            with self._condition:
+                self._worker_count -= 1
+                self._condition.notify()
+            return
+
+        with self._condition:
+            closed = self._closed
+            if closed:
+                self._worker_count -= 1
+            else:
+                self._idle.append(replacement)
+            self._condition.notify()
+
+        if closed:
+            replacement.stop()
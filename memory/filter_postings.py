@@ -0,0 +1,249 @@
+"""
+Filter Posting Lists for SAM Memory Search
+Per-memory-type, per-tag and per-metadata-value posting lists over vector index rows.
+
+MemoryVectorStore keeps its SIMPLE and FAISS embeddings as rows aligned with
+``chunk_ids``. FilterPostings tracks which rows carry each memory type, tag
+and indexed metadata value (such as a table_id), so filtered searches can
+mask candidate rows before top-k selection instead of over-fetching
+neighbours and discarding them afterwards.
+
+Each posting list is a sorted, append-only numpy array of row ids. A row id
+is assigned when the row is added and never changes, so appending a row
+touches only the lists it belongs to. Removing a row only drops it from the
+live id array; posting lists keep the dead id until enough rows are dead,
+then every list is compacted and the ids renumbered in one pass.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+# Chunk metadata fields with equality posting lists
+INDEXED_METADATA_FIELDS = ("table_id", "cell_row", "cell_column")
+
+
+def _grow(array: np.ndarray, min_size: int) -> np.ndarray:
+    """Return array with capacity for at least min_size items (doubling)."""
+    if len(array) >= min_size:
+        return array
+    grown = np.empty(max(min_size, 2 * len(array), 8), dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+class _SortedIds:
+    """Growable sorted array of row ids."""
+
+    __slots__ = ("ids", "size")
+
+    def __init__(self, ids: Optional[np.ndarray] = None):
+        self.ids = ids if ids is not None else np.empty(8, dtype=np.int64)
+        self.size = len(ids) if ids is not None else 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def view(self) -> np.ndarray:
+        """The ids as an array view (valid until the next change)."""
+        return self.ids[:self.size]
+
+    def append(self, row_id: int) -> None:
+        """Add an id larger than every id in the array."""
+        self.ids = _grow(self.ids, self.size + 1)
+        self.ids[self.size] = row_id
+        self.size += 1
+
+    def insert(self, row_id: int) -> None:
+        """Add an id at its sorted position (no-op if present)."""
+        pos = int(np.searchsorted(self.view(), row_id))
+        if pos < self.size and self.ids[pos] == row_id:
+            return
+        self.ids = _grow(self.ids, self.size + 1)
+        self.ids[pos + 1:self.size + 1] = self.ids[pos:self.size]
+        self.ids[pos] = row_id
+        self.size += 1
+
+    def discard(self, row_id: int) -> None:
+        """Remove an id if present."""
+        pos = int(np.searchsorted(self.view(), row_id))
+        if pos < self.size and self.ids[pos] == row_id:
+            self.pop(pos)
+
+    def pop(self, pos: int) -> int:
+        """Remove and return the id at a position."""
+        row_id = int(self.ids[pos])
+        self.ids[pos:self.size - 1] = self.ids[pos + 1:self.size]
+        self.size -= 1
+        return row_id
+
+
+class FilterPostings:
+    """Type, tag and metadata posting lists over vector index rows."""
+
+    def __init__(self, indexed_fields: Iterable[str] = INDEXED_METADATA_FIELDS):
+        self.type_postings: Dict[str, _SortedIds] = {}
+        self.tag_postings: Dict[str, _SortedIds] = {}
+        self.field_postings: Dict[str, Dict[Any, _SortedIds]] = {field: {} for field in indexed_fields}
+        # Row ids of the live rows in index order; index row i has id _live_ids[i]
+        self._live_ids = _SortedIds()
+        self._alive = np.empty(8, dtype=bool)
+        self._next_id = 0
+        self._dead = 0
+
+    @property
+    def num_rows(self) -> int:
+        """Number of live index rows."""
+        return len(self._live_ids)
+
+    def is_indexed(self, field: str) -> bool:
+        """Check whether a metadata field has posting lists."""
+        return field in self.field_postings
+
+    def add_row(self, row: int, memory_type: str, tags: Iterable[str],
+                metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Register a newly appended index row."""
+        if row != self.num_rows:
+            raise ValueError(f"Rows must be appended in order (expected {self.num_rows}, got {row})")
+
+        row_id = self._next_id
+        self._next_id += 1
+        self._alive = _grow(self._alive, self._next_id)
+        self._alive[row_id] = True
+        self._live_ids.append(row_id)
+
+        self.type_postings.setdefault(memory_type, _SortedIds()).append(row_id)
+        for tag in set(tags or ()):
+            self.tag_postings.setdefault(tag, _SortedIds()).append(row_id)
+        for field, postings in self.field_postings.items():
+            value = (metadata or {}).get(field)
+            if isinstance(value, (str, int, float)):
+                postings.setdefault(value, _SortedIds()).append(row_id)
+
+    def remove_row(self, row: int) -> None:
+        """Remove an index row, shifting later rows down by one (mirrors list.pop)."""
+        if not 0 <= row < self.num_rows:
+            return
+
+        # Posting lists keep the dead id until the next compaction
+        self._alive[self._live_ids.pop(row)] = False
+        self._dead += 1
+        if self._dead > self.num_rows:
+            self._compact()
+
+    def update_tags(self, row: int, old_tags: Iterable[str], new_tags: Iterable[str]) -> None:
+        """Move a row between tag posting lists after its tags change."""
+        row_id = int(self._live_ids.ids[row])
+        old_tags, new_tags = set(old_tags or ()), set(new_tags or ())
+
+        for tag in old_tags - new_tags:
+            self._discard(self.tag_postings, tag, row_id)
+        for tag in new_tags - old_tags:
+            self.tag_postings.setdefault(tag, _SortedIds()).insert(row_id)
+
+    def update_metadata(self, row: int, old_metadata: Optional[Dict[str, Any]],
+                        new_metadata: Optional[Dict[str, Any]]) -> None:
+        """Move a row between metadata posting lists after its metadata changes."""
+        row_id = int(self._live_ids.ids[row])
+        for field, postings in self.field_postings.items():
+            old_value = (old_metadata or {}).get(field)
+            new_value = (new_metadata or {}).get(field)
+            if old_value == new_value:
+                continue
+
+            if isinstance(old_value, (str, int, float)):
+                self._discard(postings, old_value, row_id)
+            if isinstance(new_value, (str, int, float)):
+                postings.setdefault(new_value, _SortedIds()).insert(row_id)
+
+    def clear(self) -> None:
+        """Drop all posting lists."""
+        self.type_postings.clear()
+        self.tag_postings.clear()
+        for postings in self.field_postings.values():
+            postings.clear()
+        self._live_ids = _SortedIds()
+        self._alive = np.empty(8, dtype=bool)
+        self._next_id = 0
+        self._dead = 0
+
+    def candidate_rows(self, memory_types: Optional[List[str]] = None,
+                       tags: Optional[List[str]] = None,
+                       metadata_filter: Optional[Dict[str, Any]] = None) -> Optional[np.ndarray]:
+        """
+        Combine posting lists for a filter.
+
+        Rows must match any of ``memory_types``, any of ``tags`` and every
+        indexed field of ``metadata_filter``, the same semantics as the
+        post-hoc filters in search_memories. Non-indexed metadata fields are
+        left to the caller.
+
+        Returns:
+            Sorted array of matching index rows, or None when no filter applies
+        """
+        groups = []
+        if memory_types:
+            groups.append(self._union(self.type_postings, memory_types))
+        if tags:
+            groups.append(self._union(self.tag_postings, tags))
+        for field, value in (metadata_filter or {}).items():
+            if field in self.field_postings:
+                groups.append(self._union(self.field_postings[field], [value]))
+
+        row_ids = None
+        # Intersect from the shortest list so each step probes the fewest ids
+        for group_ids in sorted(groups, key=len):
+            row_ids = group_ids if row_ids is None else self._intersect(row_ids, group_ids)
+
+        if row_ids is None:
+            return None
+        if self._dead:
+            row_ids = row_ids[self._alive[row_ids]]
+        # Live ids are sorted, so an id's position among them is its index row
+        return np.searchsorted(self._live_ids.view(), row_ids)
+
+    @staticmethod
+    def _union(postings: Dict[Any, _SortedIds], keys: Iterable[Any]) -> np.ndarray:
+        """Sorted ids in any of the posting lists for keys."""
+        arrays = [postings[key].view() for key in set(keys) if key in postings]
+        if not arrays:
+            return np.empty(0, dtype=np.int64)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    @staticmethod
+    def _intersect(short_ids: np.ndarray, long_ids: np.ndarray) -> np.ndarray:
+        """Ids in both sorted arrays, by binary search of the longer one."""
+        if len(short_ids) == 0 or len(long_ids) == 0:
+            return short_ids[:0]
+        positions = np.minimum(np.searchsorted(long_ids, short_ids), len(long_ids) - 1)
+        return short_ids[long_ids[positions] == short_ids]
+
+    @staticmethod
+    def _discard(postings: Dict[Any, _SortedIds], key: Any, row_id: int) -> None:
+        """Remove an id from a posting list, dropping the list when it empties."""
+        posting_list = postings.get(key)
+        if posting_list is None:
+            return
+        posting_list.discard(row_id)
+        if not posting_list:
+            del postings[key]
+
+    def _compact(self) -> None:
+        """Drop dead ids from every posting list and renumber ids to index rows."""
+        live_ids = self._live_ids.view()
+        for postings in (self.type_postings, self.tag_postings, *self.field_postings.values()):
+            for key in list(postings):
+                row_ids = postings[key].view()
+                row_ids = row_ids[self._alive[row_ids]]
+                if len(row_ids):
+                    postings[key] = _SortedIds(np.searchsorted(live_ids, row_ids))
+                else:
+                    del postings[key]
+
+        num_rows = self.num_rows
+        self._live_ids = _SortedIds(np.arange(num_rows, dtype=np.int64))
+        self._alive = np.ones(max(num_rows, 8), dtype=bool)
+        self._next_id = num_rows
+        self._dead = 0
@@ -0,0 +1,469 @@
+"""
+Lazy Chunk Table for the Chroma Memory Backend
+Keeps only ids and light metadata resident and fetches content and
+embeddings from ChromaDB on demand.
+
+The Chroma collection is the source of truth for document text and
+embeddings, so holding a full MemoryChunk (with a Python float list per
+embedding) for every record duplicates the whole store in process memory.
+LazyChromaChunkMap behaves like the ``Dict[str, MemoryChunk]`` that
+MemoryVectorStore.memory_chunks used to be, but materializes chunks through
+a bounded LRU cache. ChunkRecordIndex keeps the light fields in a SQLite
+sidecar so startup needs only the ids from Chroma, not every record's
+metadata.
+"""
+
+import logging
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ChunkRecord:
+    """Compact resident record for one memory chunk (no content, no embedding)."""
+
+    __slots__ = ('memory_type', 'source', 'created_at', 'tags', 'importance_score',
+                 'access_count', 'last_accessed')
+
+    def __init__(self, memory_type: str, source: str, created_at: float, tags: Tuple[str, ...],
+                 importance_score: float, access_count: int, last_accessed: float):
+        self.memory_type = memory_type
+        self.source = source
+        self.created_at = created_at
+        self.tags = tags
+        self.importance_score = importance_score
+        self.access_count = access_count
+        self.last_accessed = last_accessed
+
+
+def _to_epoch(value: Any) -> float:
+    """Convert a Chroma timestamp (epoch number or ISO string) to epoch seconds."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value:
+        try:
+            return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+        except ValueError:
+            pass
+    return 0.0
+
+
+class ChunkRecordIndex:
+    """
+    SQLite sidecar holding the ChunkRecord fields of one Chroma collection.
+
+    Chroma can only return whole metadata dicts, which include up to 500
+    characters of text_content per record, so building the record table from
+    Chroma pages through most of the stored text. The sidecar is written
+    whenever the lazy table adds, updates or deletes a record and is
+    reconciled against the collection's ids at load.
+    """
+
+    def __init__(self, db_path: str, collection_name: str):
+        """
+        Initialize the record index.
+
+        Args:
+            db_path: Path to the SQLite database file
+            collection_name: Chroma collection the records belong to
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.collection_name = collection_name
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30.0, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunk_records (
+                    collection TEXT NOT NULL,
+                    chunk_id TEXT NOT NULL,
+                    memory_type TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    tags TEXT NOT NULL,
+                    importance_score REAL NOT NULL,
+                    access_count INTEGER NOT NULL,
+                    last_accessed REAL NOT NULL,
+                    PRIMARY KEY (collection, chunk_id)
+                ) WITHOUT ROWID
+            """)
+
+    def load(self) -> Iterator[Tuple]:
+        """Yield every stored record as (chunk_id, *ChunkRecord fields in slot order)."""
+        with self._lock:
+            yield from self._conn.execute(
+                "SELECT chunk_id, memory_type, source, created_at, tags, importance_score, "
+                "access_count, last_accessed FROM chunk_records WHERE collection = ?",
+                (self.collection_name,)
+            )
+
+    def put(self, records: Iterable[Tuple[str, ChunkRecord]]) -> None:
+        """Insert or replace records."""
+        rows = [(self.collection_name, chunk_id, record.memory_type, record.source, record.created_at,
+                 ",".join(record.tags), record.importance_score, record.access_count, record.last_accessed)
+                for chunk_id, record in records]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO chunk_records VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def delete(self, chunk_ids: Iterable[str]) -> None:
+        """Delete records by chunk id."""
+        rows = [(self.collection_name, chunk_id) for chunk_id in chunk_ids]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM chunk_records WHERE collection = ? AND chunk_id = ?", rows)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class LazyChromaChunkMap(MutableMapping):
+    """
+    Mapping of chunk id to MemoryChunk backed by a Chroma collection.
+
+    Resident state is one ChunkRecord per chunk plus at most ``cache_size``
+    materialized chunks. Reads of non-cached chunks fetch document, embedding
+    and metadata from Chroma; ``prefetch`` and iteration fetch in batches.
+    Deleting an entry only removes it from this table, matching the behaviour
+    of the plain dict it replaces. The LRU is guarded by an internal lock so
+    concurrent readers of the memory store can share the table. With a
+    ``record_index``, records are loaded from the sidecar and every set or
+    delete is written through to it.
+    """
+
+    def __init__(self, collection: Any,
+                 chunk_builder: Callable[[str, Optional[str], Any, Dict[str, Any]], Any],
+                 cache_size: int = 2048, fetch_batch_size: int = 256,
+                 record_index: Optional[ChunkRecordIndex] = None):
+        """
+        Initialize the lazy chunk table.
+
+        Args:
+            collection: ChromaDB collection holding the memories
+            chunk_builder: Callable(chunk_id, document, embedding, metadata)
+                returning a MemoryChunk
+            cache_size: Maximum number of materialized chunks kept resident
+            fetch_batch_size: Number of ids per Chroma request when fetching in bulk
+            record_index: Optional sidecar holding the records between runs
+        """
+        self.collection = collection
+        self.record_index = record_index
+        self.chunk_builder = chunk_builder
+        self.cache_size = max(1, cache_size)
+        self.fetch_batch_size = max(1, fetch_batch_size)
+
+        self.records: Dict[str, ChunkRecord] = {}
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._interned: Dict[Any, Any] = {}
+        self._lock = threading.RLock()
+
+        self.stats = {'cache_hits': 0, 'cache_misses': 0, 'fetches': 0}
+
+    # Loading
+
+    def load_records(self, page_size: int = 5000) -> int:
+        """
+        Load light metadata for every chunk in the collection.
+
+        With a record index, only the ids are read from Chroma; records come
+        from the sidecar, ids missing from it are backfilled from Chroma
+        metadata and sidecar rows for deleted ids are dropped. Without one,
+        metadatas are paged from Chroma. Documents and embeddings stay in
+        Chroma either way.
+
+        Returns:
+            Number of records loaded
+        """
+        if self.record_index is None:
+            loaded = self._load_records_from_metadata(page_size)
+        else:
+            loaded = self._load_records_from_index(page_size)
+
+        logger.info(f"Loaded {loaded} lazy memory records from ChromaDB")
+        return loaded
+
+    def _load_records_from_metadata(self, page_size: int) -> int:
+        """Build every record from Chroma metadata, page by page."""
+        offset = 0
+        loaded = 0
+
+        while True:
+            page = self.collection.get(include=["metadatas"], limit=page_size, offset=offset)
+            ids = page.get("ids") or []
+            if not ids:
+                break
+
+            for chunk_id, metadata in zip(ids, page.get("metadatas") or [{}] * len(ids)):
+                self.records[chunk_id] = self._record_from_metadata(metadata or {})
+            loaded += len(ids)
+
+            if len(ids) < page_size:
+                break
+            offset += page_size
+
+        return loaded
+
+    def _load_records_from_index(self, page_size: int) -> int:
+        """Build records from the sidecar, reconciled against the collection's ids."""
+        chunk_ids = self.collection.get(include=[]).get("ids") or []
+        indexed = {row[0]: self._record_from_row(row[1:]) for row in self.record_index.load()}
+
+        # Keep Chroma's order, as the metadata load does
+        missing = []
+        for chunk_id in chunk_ids:
+            record = indexed.pop(chunk_id, None)
+            if record is None:
+                missing.append(chunk_id)
+            else:
+                self.records[chunk_id] = record
+
+        # Records written to Chroma without going through this table
+        for start in range(0, len(missing), page_size):
+            page = self.collection.get(ids=missing[start:start + page_size], include=["metadatas"])
+            ids = page.get("ids") or []
+            backfilled = []
+            for chunk_id, metadata in zip(ids, page.get("metadatas") or [{}] * len(ids)):
+                record = self._record_from_metadata(metadata or {})
+                self.records[chunk_id] = record
+                backfilled.append((chunk_id, record))
+            self.record_index.put(backfilled)
+
+        if missing:
+            logger.info(f"Backfilled {len(missing)} memory records into the record index")
+        if indexed:
+            self.record_index.delete(indexed)
+
+        return len(self.records)
+
+    def _intern(self, value: Any) -> Any:
+        """Share identical small values (sources, tag tuples) between records."""
+        return self._interned.setdefault(value, value)
+
+    def _record_from_metadata(self, metadata: Dict[str, Any]) -> ChunkRecord:
+        """Build a compact record from Chroma metadata."""
+        tags_str = metadata.get("tags", "")
+        return ChunkRecord(
+            memory_type=sys.intern(str(metadata.get("memory_type", "document"))),
+            source=self._intern(metadata.get("source_path", "")),
+            created_at=_to_epoch(metadata.get("created_at")),
+            tags=self._intern(tuple(tags_str.split(",")) if tags_str else ()),
+            importance_score=float(metadata.get("importance_score", 0.0)),
+            access_count=int(metadata.get("access_count", 0)),
+            last_accessed=_to_epoch(metadata.get("last_accessed"))
+        )
+
+    def _record_from_row(self, row: Tuple) -> ChunkRecord:
+        """Build a compact record from a record index row."""
+        memory_type, source, created_at, tags_str, importance_score, access_count, last_accessed = row
+        return ChunkRecord(
+            memory_type=sys.intern(memory_type),
+            source=self._intern(source),
+            created_at=created_at,
+            tags=self._intern(tuple(tags_str.split(",")) if tags_str else ()),
+            importance_score=importance_score,
+            access_count=access_count,
+            last_accessed=last_accessed
+        )
+
+    def _record_from_chunk(self, chunk: Any) -> ChunkRecord:
+        """Build a compact record from a materialized MemoryChunk."""
+        memory_type = chunk.memory_type.value if hasattr(chunk.memory_type, 'value') else str(chunk.memory_type)
+        return ChunkRecord(
+            memory_type=sys.intern(memory_type),
+            source=self._intern(chunk.source),
+            created_at=_to_epoch(chunk.timestamp),
+            tags=self._intern(tuple(chunk.tags or ())),
+            importance_score=float(chunk.importance_score),
+            access_count=int(chunk.access_count),
+            last_accessed=_to_epoch(chunk.last_accessed)
+        )
+
+    # Cache management
+
+    def _cache_put(self, chunk_id: str, chunk: Any) -> None:
+        """Insert a chunk in the LRU, writing back light fields of evicted chunks."""
+        self._cache[chunk_id] = chunk
+        self._cache.move_to_end(chunk_id)
+
+        while len(self._cache) > self.cache_size:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            if evicted_id in self.records:
+                # Keep access tracking and tag/importance edits made while cached
+                self.records[evicted_id] = self._record_from_chunk(evicted)
+
+    def _apply_record(self, chunk: Any, record: ChunkRecord) -> Any:
+        """Overlay resident light fields (which may be newer than Chroma) on a fetched chunk."""
+        chunk.tags = list(record.tags)
+        chunk.importance_score = record.importance_score
+        chunk.access_count = record.access_count
+        if record.last_accessed:
+            chunk.last_accessed = datetime.fromtimestamp(record.last_accessed).isoformat()
+        return chunk
+
+    def _fetch(self, chunk_ids: List[str]) -> Dict[str, Any]:
+        """Fetch full chunks from Chroma for the given ids."""
+        fetched = {}
+
+        for start in range(0, len(chunk_ids), self.fetch_batch_size):
+            batch = chunk_ids[start:start + self.fetch_batch_size]
+            data = self.collection.get(ids=batch, include=["metadatas", "documents", "embeddings"])
+            self.stats['fetches'] += 1
+
+            documents = data.get("documents")
+            embeddings = data.get("embeddings")
+            metadatas = data.get("metadatas")
+
+            for i, chunk_id in enumerate(data.get("ids") or []):
+                record = self.records.get(chunk_id)
+                if record is None:
+                    continue
+                try:
+                    chunk = self.chunk_builder(
+                        chunk_id,
+                        documents[i] if documents is not None else None,
+                        embeddings[i] if embeddings is not None else None,
+                        metadatas[i] if metadatas is not None else {}
+                    )
+                    fetched[chunk_id] = self._apply_record(chunk, record)
+                except Exception as e:
+                    logger.error(f"Error materializing memory chunk {chunk_id}: {e}")
+
+        return fetched
+
+    def prefetch(self, chunk_ids: List[str]) -> None:
+        """Materialize the given chunks into the cache with batched Chroma reads."""
+        with self._lock:
+            missing = [cid for cid in dict.fromkeys(chunk_ids)
+                       if cid in self.records and cid not in self._cache]
+        if not missing:
+            return
+
+        fetched = self._fetch(missing[:self.cache_size])
+        with self._lock:
+            for chunk_id, chunk in fetched.items():
+                if chunk_id in self.records and chunk_id not in self._cache:
+                    self._cache_put(chunk_id, chunk)
+
+    def find_by_content_hash(self, content_hash: str) -> Optional[str]:
+        """Find a chunk id by content hash using the Chroma metadata index."""
+        with self._lock:
+            for chunk_id, chunk in self._cache.items():
+                if chunk.content_hash == content_hash:
+                    return chunk_id
+
+        try:
+            data = self.collection.get(where={"content_hash": content_hash}, include=[], limit=1)
+            for chunk_id in data.get("ids") or []:
+                if chunk_id in self.records:
+                    return chunk_id
+        except Exception as e:
+            logger.warning(f"Content hash lookup failed: {e}")
+
+        return None
+
+    def cache_info(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            cached_chunks = len(self._cache)
+        return {
+            'records': len(self.records),
+            'cached_chunks': cached_chunks,
+            'cache_size': self.cache_size,
+            **self.stats
+        }
+
+    # Mapping interface
+
+    def __getitem__(self, chunk_id: str) -> Any:
+        with self._lock:
+            if chunk_id not in self.records:
+                raise KeyError(chunk_id)
+
+            chunk = self._cache.get(chunk_id)
+            if chunk is not None:
+                self.stats['cache_hits'] += 1
+                self._cache.move_to_end(chunk_id)
+                return chunk
+
+            self.stats['cache_misses'] += 1
+
+        # Fetch outside the lock so other readers are not blocked on ChromaDB
+        chunk = self._fetch([chunk_id]).get(chunk_id)
+        if chunk is None:
+            raise KeyError(chunk_id)
+
+        with self._lock:
+            # Keep the first materialized copy if another reader fetched it meanwhile
+            cached = self._cache.get(chunk_id)
+            if cached is not None:
+                return cached
+            if chunk_id in self.records:
+                self._cache_put(chunk_id, chunk)
+        return chunk
+
+    def __setitem__(self, chunk_id: str, chunk: Any) -> None:
+        with self._lock:
+            record = self._record_from_chunk(chunk)
+            self.records[chunk_id] = record
+            self._cache_put(chunk_id, chunk)
+            if self.record_index is not None:
+                self.record_index.put([(chunk_id, record)])
+
+    def __delitem__(self, chunk_id: str) -> None:
+        with self._lock:
+            del self.records[chunk_id]
+            self._cache.pop(chunk_id, None)
+            if self.record_index is not None:
+                self.record_index.delete([chunk_id])
+
+    def __contains__(self, chunk_id: object) -> bool:
+        return chunk_id in self.records
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.records))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def values(self) -> Iterator[Any]:
+        """Iterate over all chunks, fetching non-cached ones in batches without caching them."""
+        for _, chunk in self.items():
+            yield chunk
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Iterate over (chunk_id, chunk) pairs, fetching in batches."""
+        chunk_ids = list(self.records)
+
+        for start in range(0, len(chunk_ids), self.fetch_batch_size):
+            batch = chunk_ids[start:start + self.fetch_batch_size]
+            with self._lock:
+                cached = {cid: self._cache[cid] for cid in batch if cid in self._cache}
+            missing = [cid for cid in batch if cid not in cached]
+            fetched = self._fetch(missing) if missing else {}
+
+            for chunk_id in batch:
+                chunk = cached.get(chunk_id) or fetched.get(chunk_id)
+                if chunk is not None:
+                    yield chunk_id, chunk
+
+    def clear(self) -> None:
+        """Drop all resident records and cached chunks."""
+        with self._lock:
+            self.records.clear()
+            self._cache.clear()
+            self._interned.clear()
@@ -7,8 +7,11 @@ Sprint 11 Task 3: Persistent Vector Store
 
 import logging
 import json
+import os
 import uuid
 import hashlib
+import re
+import threading
 import numpy as np
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +20,10 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import pickle
 
+from .lazy_chunk_store import ChunkRecordIndex, LazyChromaChunkMap
+from .filter_postings import FilterPostings
+from .rw_lock import ReadWriteLock
+
 # Import ranking engine for Phase 3
 try:
     from .ranking_engine import MemoryRankingEngine, RankedMemoryResult
@@ -103,6 +110,12 @@ class MemoryVectorStore:
         self.memory_chunks: Dict[str, MemoryChunk] = {}
         self.embeddings_matrix: Optional[np.ndarray] = None
         self.chunk_ids: List[str] = []
+        self.filter_postings = FilterPostings()
+
+        # Concurrency: searches share the read lock, index mutations take the
+        # write lock; access tracking has its own mutex so searches never upgrade
+        self._lock = ReadWriteLock()
+        self._access_lock = threading.Lock()
         
         # Vector store instances
         self.faiss_index = None
@@ -169,12 +182,13 @@ class MemoryVectorStore:
             content_hash = hashlib.sha256(content.encode()).hexdigest()
             
             # Check for duplicate content
-            for existing_chunk in self.memory_chunks.values():
-                if existing_chunk.content_hash == content_hash:
-                    logger.debug(f"Duplicate memory content detected, updating existing: {existing_chunk.chunk_id}")
-                    return self._update_memory_access(existing_chunk.chunk_id)
+            with self._lock.read_lock():
+                existing_chunk_id = self._find_duplicate_chunk(content_hash)
+            if existing_chunk_id:
+                logger.debug(f"Duplicate memory content detected, updating existing: {existing_chunk_id}")
+                return self._update_memory_access(existing_chunk_id)
             
-            # Generate embedding
+            # Generate embedding (outside the lock; this is the slow part)
             embedding = self._generate_embedding(content)
             
             # Create memory chunk
@@ -193,11 +207,19 @@ class MemoryVectorStore:
                 metadata=metadata or {}
             )
             
-            # Add to storage
-            self.memory_chunks[chunk_id] = memory_chunk
-            
-            # Add to vector index
-            self._add_to_vector_index(chunk_id, embedding)
+            with self._lock.write_lock():
+                # Another writer may have stored the same content meanwhile
+                existing_chunk_id = self._find_duplicate_chunk(content_hash)
+
+                if not existing_chunk_id:
+                    # Add to storage
+                    self.memory_chunks[chunk_id] = memory_chunk
+                    
+                    # Add to vector index
+                    self._add_to_vector_index(chunk_id, embedding)
+
+            if existing_chunk_id:
+                return self._update_memory_access(existing_chunk_id)
             
             # Save to disk
             self._save_memory_chunk(memory_chunk)
@@ -213,7 +235,8 @@ class MemoryVectorStore:
                        memory_types: List[MemoryType] = None,
                        tags: List[str] = None,
                        min_similarity: float = None,
-                       where_filter: Optional[Dict[str, Any]] = None) -> List[MemorySearchResult]:
+                       where_filter: Optional[Dict[str, Any]] = None,
+                       metadata_filter: Optional[Dict[str, Any]] = None) -> List[MemorySearchResult]:
         """
         Search for relevant memories.
         
@@ -223,6 +246,9 @@ class MemoryVectorStore:
             memory_types: Optional filter by memory types
             tags: Optional filter by tags
             min_similarity: Minimum similarity threshold
+            where_filter: Optional ChromaDB where clause (Chroma backend only)
+            metadata_filter: Optional equality filter on chunk metadata fields,
+                e.g. {"table_id": "t1"}; indexed fields are applied before top-k
             
         Returns:
             List of memory search results
@@ -234,17 +260,33 @@ class MemoryVectorStore:
             # Generate query embedding
             query_embedding = self._generate_embedding(query)
             
-            # Search vector index with optional filtering
-            similar_chunks = self._search_vector_index(query_embedding, max_results * 2, where_filter=where_filter)
+            min_sim = min_similarity or self.config['similarity_threshold']
+
+            with self._lock.read_lock():
+                # Search vector index with filters pushed down to the backend
+                similar_chunks = self._search_vector_index(
+                    query_embedding, max_results,
+                    where_filter=where_filter,
+                    memory_types=memory_types,
+                    tags=tags,
+                    metadata_filter=metadata_filter,
+                    min_similarity=min_sim
+                )
+
+                # Fetch lazily loaded chunks for all candidates in one round trip
+                if isinstance(self.memory_chunks, LazyChromaChunkMap):
+                    self.memory_chunks.prefetch([chunk_id for chunk_id, _ in similar_chunks])
+
+                candidates = [(self.memory_chunks.get(chunk_id), similarity)
+                              for chunk_id, similarity in similar_chunks]
             
             # Filter and rank results
             results = []
-            min_sim = min_similarity or self.config['similarity_threshold']
             
-            for chunk_id, similarity in similar_chunks:
-                chunk = self.memory_chunks.get(chunk_id)
+            for chunk, similarity in candidates:
                 if not chunk:
                     continue
+                chunk_id = chunk.chunk_id
                 
                 # Apply filters
                 if memory_types and chunk.memory_type not in memory_types:
@@ -252,6 +294,9 @@ class MemoryVectorStore:
                 
                 if tags and not any(tag in chunk.tags for tag in tags):
                     continue
+
+                if not self._matches_residual_metadata(chunk, metadata_filter):
+                    continue
                 
                 if similarity < min_sim:
                     continue
@@ -278,6 +323,76 @@ class MemoryVectorStore:
             logger.error(f"Error searching memories: {e}")
             return []
 
+    def get_memories_by_metadata(self, metadata_filter: Dict[str, Any],
+                                 max_results: Optional[int] = None) -> List[MemoryChunk]:
+        """
+        Get all memories whose metadata matches an equality filter, without scoring.
+
+        Indexed fields (see memory.filter_postings.INDEXED_METADATA_FIELDS) are
+        resolved from posting lists, or a where clause for Chroma, so the cost
+        depends on the number of matching memories rather than the store size.
+
+        Args:
+            metadata_filter: Equality filter on chunk metadata fields
+            max_results: Optional maximum number of memories
+
+        Returns:
+            Matching memory chunks in index order
+        """
+        try:
+            with self._lock.read_lock():
+                if self.store_type == VectorStoreType.CHROMA and self.chroma_collection:
+                    where_filter, post_filter = self._build_chroma_where(None, None, None, metadata_filter)
+                    chunk_ids = self.chroma_collection.get(where=where_filter, include=[],
+                                                           limit=None if post_filter else max_results)["ids"]
+                    if isinstance(self.memory_chunks, LazyChromaChunkMap):
+                        self.memory_chunks.prefetch(chunk_ids)
+                    candidates = [self.memory_chunks.get(chunk_id) for chunk_id in chunk_ids]
+                    indexed = True
+                else:
+                    candidate_rows = self.filter_postings.candidate_rows(metadata_filter=metadata_filter)
+                    indexed = candidate_rows is not None
+                    if candidate_rows is None:
+                        candidates = list(self.memory_chunks.values())
+                    else:
+                        candidates = [self.memory_chunks.get(self.chunk_ids[row])
+                                      for row in candidate_rows if row < len(self.chunk_ids)]
+
+            results = []
+            for chunk in candidates:
+                if not chunk or not self._matches_residual_metadata(chunk, metadata_filter, indexed=indexed):
+                    continue
+                results.append(chunk)
+                if max_results is not None and len(results) >= max_results:
+                    break
+            return results
+
+        except Exception as e:
+            logger.error(f"Error getting memories by metadata: {e}")
+            return []
+
+    def _matches_residual_metadata(self, chunk: MemoryChunk, metadata_filter: Optional[Dict[str, Any]],
+                                   indexed: bool = True) -> bool:
+        """Check the metadata filter fields that were not pushed down to the backend."""
+        if not metadata_filter:
+            return True
+
+        if self.store_type == VectorStoreType.CHROMA:
+            residual_fields = self._chroma_residual_fields(metadata_filter)
+            if not residual_fields:
+                return True
+            # Chunks loaded from ChromaDB carry their fields with the extra_ prefix;
+            # values set since then are unprefixed and take precedence
+            chunk_metadata = {key[len("extra_"):]: value for key, value in chunk.metadata.items()
+                              if key.startswith("extra_")}
+            chunk_metadata.update(chunk.metadata)
+            chunk_metadata = self._indexed_metadata(chunk_metadata)
+            return all(chunk_metadata.get(field) == metadata_filter[field] for field in residual_fields)
+
+        chunk_metadata = self._indexed_metadata(chunk.metadata)
+        return all(chunk_metadata.get(field) == value for field, value in metadata_filter.items()
+                   if not (indexed and self.filter_postings.is_indexed(field)))
+
     def search(self, query: str, max_results: int = 5, **kwargs) -> List[MemorySearchResult]:
         """
         Alias for search_memories for compatibility.
@@ -504,9 +619,12 @@ class MemoryVectorStore:
         """Apply additional filters to ranked results."""
         filtered_results = []
 
+        with self._lock.read_lock():
+            chunks = {result.chunk_id: self.memory_chunks.get(result.chunk_id) for result in ranked_results}
+
         for result in ranked_results:
             # Get memory chunk for filtering
-            chunk = self.memory_chunks.get(result.chunk_id)
+            chunk = chunks.get(result.chunk_id)
             if not chunk:
                 continue
 
@@ -585,7 +703,8 @@ class MemoryVectorStore:
     
     def get_memory(self, chunk_id: str) -> Optional[MemoryChunk]:
         """Get a specific memory by ID."""
-        chunk = self.memory_chunks.get(chunk_id)
+        with self._lock.read_lock():
+            chunk = self.memory_chunks.get(chunk_id)
         if chunk:
             self._update_memory_access(chunk_id)
         return chunk
@@ -598,7 +717,8 @@ class MemoryVectorStore:
             List of all memory chunks
         """
         try:
-            all_memories = list(self.memory_chunks.values())
+            with self._lock.read_lock():
+                all_memories = list(self.memory_chunks.values())
             logger.info(f"Retrieved {len(all_memories)} total memories")
             return all_memories
 
@@ -622,30 +742,52 @@ class MemoryVectorStore:
             True if successful
         """
         try:
-            chunk = self.memory_chunks.get(chunk_id)
-            if not chunk:
-                logger.error(f"Memory not found: {chunk_id}")
-                return False
-            
-            # Update fields
-            if content is not None:
-                chunk.content = content
-                chunk.content_hash = hashlib.sha256(content.encode()).hexdigest()
-                chunk.embedding = self._generate_embedding(content)
-                # Update vector index
-                self._update_vector_index(chunk_id, chunk.embedding)
-            
-            if tags is not None:
-                chunk.tags = tags
-            
-            if importance_score is not None:
-                chunk.importance_score = importance_score
-            
-            if metadata is not None:
-                chunk.metadata.update(metadata)
+            # Generate the new embedding before taking the write lock
+            embedding = self._generate_embedding(content) if content is not None else None
+
+            with self._lock.write_lock():
+                chunk = self.memory_chunks.get(chunk_id)
+                if not chunk:
+                    logger.error(f"Memory not found: {chunk_id}")
+                    return False
+                
+                # Update fields
+                if content is not None:
+                    chunk.content = content
+                    chunk.content_hash = hashlib.sha256(content.encode()).hexdigest()
+                    chunk.embedding = embedding
+                    # Update vector index
+                    self._update_vector_index(chunk_id, chunk.embedding)
+                
+                removed_tags = []
+                if tags is not None:
+                    if chunk_id in self.chunk_ids:
+                        self.filter_postings.update_tags(self.chunk_ids.index(chunk_id), chunk.tags, tags)
+                    removed_tags = [tag for tag in chunk.tags if tag not in tags]
+                    for tag in removed_tags:
+                        # Chunks loaded from ChromaDB carry their tag fields in metadata
+                        if chunk.metadata.get(self._chroma_tag_field(tag)) is True:
+                            del chunk.metadata[self._chroma_tag_field(tag)]
+                    chunk.tags = tags
+                
+                if importance_score is not None:
+                    chunk.importance_score = importance_score
+                
+                if metadata is not None:
+                    old_metadata = self._indexed_metadata(chunk.metadata)
+                    chunk.metadata.update(metadata)
+                    if chunk_id in self.chunk_ids:
+                        self.filter_postings.update_metadata(self.chunk_ids.index(chunk_id), old_metadata,
+                                                             self._indexed_metadata(chunk.metadata))
+
+                # Chroma is the source of truth for content and metadata of lazily loaded chunks
+                if any(value is not None for value in (content, tags, importance_score, metadata)):
+                    self._update_chroma_record(chunk, content_changed=content is not None,
+                                               removed_tags=removed_tags)
             
             # Save updated chunk
-            self._save_memory_chunk(chunk)
+            with self._access_lock:
+                self._save_memory_chunk(chunk)
             
             logger.info(f"Updated memory: {chunk_id}")
             return True
@@ -665,15 +807,16 @@ class MemoryVectorStore:
             True if successful
         """
         try:
-            if chunk_id not in self.memory_chunks:
-                logger.error(f"Memory not found: {chunk_id}")
-                return False
-            
-            # Remove from memory
-            del self.memory_chunks[chunk_id]
-            
-            # Remove from vector index
-            self._remove_from_vector_index(chunk_id)
+            with self._lock.write_lock():
+                if chunk_id not in self.memory_chunks:
+                    logger.error(f"Memory not found: {chunk_id}")
+                    return False
+                
+                # Remove from memory
+                del self.memory_chunks[chunk_id]
+                
+                # Remove from vector index
+                self._remove_from_vector_index(chunk_id)
             
             # Remove file
             chunk_file = self.storage_dir / f"{chunk_id}.json"
@@ -707,17 +850,18 @@ class MemoryVectorStore:
             if older_than_days:
                 cutoff_date = datetime.now() - timedelta(days=older_than_days)
             
-            for chunk_id, chunk in self.memory_chunks.items():
-                # Apply filters
-                if memory_types and chunk.memory_type not in memory_types:
-                    continue
-                
-                if cutoff_date:
-                    chunk_date = datetime.fromisoformat(chunk.timestamp)
-                    if chunk_date > cutoff_date:
+            with self._lock.read_lock():
+                for chunk_id, chunk in self.memory_chunks.items():
+                    # Apply filters
+                    if memory_types and chunk.memory_type not in memory_types:
                         continue
-                
-                chunks_to_delete.append(chunk_id)
+                    
+                    if cutoff_date:
+                        chunk_date = datetime.fromisoformat(chunk.timestamp)
+                        if chunk_date > cutoff_date:
+                            continue
+                    
+                    chunks_to_delete.append(chunk_id)
             
             # Delete chunks
             deleted_count = 0
@@ -743,13 +887,14 @@ class MemoryVectorStore:
             True if successful
         """
         try:
-            export_data = {
-                'export_timestamp': datetime.now().isoformat(),
-                'store_type': self.store_type.value,
-                'embedding_dimension': self.embedding_dimension,
-                'memory_count': len(self.memory_chunks),
-                'memories': [asdict(chunk) for chunk in self.memory_chunks.values()]
-            }
+            with self._lock.read_lock():
+                export_data = {
+                    'export_timestamp': datetime.now().isoformat(),
+                    'store_type': self.store_type.value,
+                    'embedding_dimension': self.embedding_dimension,
+                    'memory_count': len(self.memory_chunks),
+                    'memories': [asdict(chunk) for chunk in self.memory_chunks.values()]
+                }
             
             with open(export_file, 'w', encoding='utf-8') as f:
                 json.dump(export_data, f, indent=2, ensure_ascii=False)
@@ -795,12 +940,13 @@ class MemoryVectorStore:
                         metadata=memory_data['metadata']
                     )
                     
-                    # Add to storage
-                    self.memory_chunks[chunk.chunk_id] = chunk
-                    
-                    # Add to vector index
-                    if chunk.embedding:
-                        self._add_to_vector_index(chunk.chunk_id, chunk.embedding)
+                    with self._lock.write_lock():
+                        # Add to storage
+                        self.memory_chunks[chunk.chunk_id] = chunk
+                        
+                        # Add to vector index
+                        if chunk.embedding:
+                            self._add_to_vector_index(chunk.chunk_id, chunk.embedding)
                     
                     imported_count += 1
                     
@@ -816,6 +962,11 @@ class MemoryVectorStore:
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory store statistics."""
+        with self._lock.read_lock():
+            return self._collect_memory_stats()
+
+    def _collect_memory_stats(self) -> Dict[str, Any]:
+        """Compute memory store statistics (caller holds the read lock)."""
         try:
             stats = {
                 'total_memories': len(self.memory_chunks),
@@ -829,15 +980,19 @@ class MemoryVectorStore:
                 'most_accessed': None
             }
             
+            # Calculate storage size
+            for file_path in self.storage_dir.glob("*.json"):
+                stats['total_size_mb'] += file_path.stat().st_size / (1024 * 1024)
+
+            if isinstance(self.memory_chunks, LazyChromaChunkMap):
+                # Answer from resident records without fetching every chunk from ChromaDB
+                return self._get_lazy_memory_stats(stats)
+
             # Calculate type distribution
             for chunk in self.memory_chunks.values():
                 mem_type = chunk.memory_type.value
                 stats['memory_types'][mem_type] = stats['memory_types'].get(mem_type, 0) + 1
             
-            # Calculate storage size
-            for file_path in self.storage_dir.glob("*.json"):
-                stats['total_size_mb'] += file_path.stat().st_size / (1024 * 1024)
-            
             # Find oldest and newest (with safe timestamp handling)
             if self.memory_chunks:
                 try:
@@ -901,6 +1056,30 @@ class MemoryVectorStore:
                 'error': str(e)
             }
     
+    def _get_lazy_memory_stats(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill memory statistics from the lazy chunk table's resident records."""
+        records = self.memory_chunks.records
+
+        for record in records.values():
+            stats['memory_types'][record.memory_type] = stats['memory_types'].get(record.memory_type, 0) + 1
+
+        if records:
+            oldest_id = min(records, key=lambda cid: records[cid].created_at)
+            newest_id = max(records, key=lambda cid: records[cid].created_at)
+            stats['oldest_memory'] = datetime.fromtimestamp(records[oldest_id].created_at).isoformat()
+            stats['newest_memory'] = datetime.fromtimestamp(records[newest_id].created_at).isoformat()
+
+            most_accessed_id = max(records, key=lambda cid: records[cid].access_count)
+            most_accessed = self.memory_chunks.get(most_accessed_id)
+            stats['most_accessed'] = {
+                'chunk_id': most_accessed_id,
+                'access_count': records[most_accessed_id].access_count,
+                'content_preview': most_accessed.content[:100] if most_accessed else ''
+            }
+
+        stats['chunk_cache'] = self.memory_chunks.cache_info()
+        return stats
+
     def _initialize_vector_store(self):
         """Initialize the vector store backend."""
         try:
@@ -984,6 +1163,11 @@ class MemoryVectorStore:
             # Store configuration for later use
             self.chroma_config = chroma_config
 
+            # Per-tag and cell coordinate fields are only complete for collections created empty
+            features = self._load_chroma_feature_flags(chroma_path)
+            self.chroma_tag_fields = features.get("tag_fields", False)
+            self.chroma_cell_fields = features.get("cell_fields", False)
+
             logger.info(f"Initialized enhanced Chroma vector store: {self.chroma_collection.name}")
             logger.info(f"Collection count: {self.chroma_collection.count()}")
 
@@ -1026,7 +1210,10 @@ class MemoryVectorStore:
             "enable_hnsw": True,
             "hnsw_space": "cosine",
             "hnsw_construction_ef": 200,
-            "hnsw_search_ef": 50
+            "hnsw_search_ef": 50,
+            "lazy_loading": False,
+            "load_page_size": 5000,
+            "chunk_cache_size": 2048
         }
 
     def _prepare_chroma_metadata(self, memory_chunk: MemoryChunk) -> Dict[str, Any]:
@@ -1057,8 +1244,8 @@ class MemoryVectorStore:
                     except (IndexError, ValueError):
                         chunk_index = 0
 
-            # Get metadata from memory chunk
-            chunk_metadata = memory_chunk.metadata or {}
+            # Get metadata from memory chunk (with indexed fields such as cell_row)
+            chunk_metadata = self._indexed_metadata(memory_chunk.metadata)
 
             # Calculate document position (0.0-1.0 relative location)
             document_position = 0.0
@@ -1113,16 +1300,30 @@ class MemoryVectorStore:
                 "upload_timestamp": chunk_metadata.get("upload_timestamp", "")
             }
 
+            # One boolean field per tag so tag filters can be pushed into where clauses
+            for tag in memory_chunk.tags or []:
+                enhanced_metadata[self._chroma_tag_field(tag)] = True
+
             # Add any additional metadata from the original chunk (ChromaDB compatible)
             for key, value in chunk_metadata.items():
-                if key not in enhanced_metadata:
-                    # Convert lists to comma-separated strings for ChromaDB compatibility
-                    if isinstance(value, list):
-                        enhanced_metadata[f"extra_{key}"] = ",".join(str(v) for v in value)
-                    elif isinstance(value, (str, int, float, bool)):
-                        enhanced_metadata[f"extra_{key}"] = value
-                    elif value is not None:
-                        enhanced_metadata[f"extra_{key}"] = str(value)
+                if key in enhanced_metadata:
+                    continue
+                if key.startswith("extra_"):
+                    # Chunks loaded from ChromaDB already carry prefixed fields; a newer
+                    # unprefixed value for the same field takes precedence
+                    if key[len("extra_"):] in chunk_metadata:
+                        continue
+                    field = key
+                else:
+                    field = f"extra_{key}"
+
+                # Convert lists to comma-separated strings for ChromaDB compatibility
+                if isinstance(value, list):
+                    enhanced_metadata[field] = ",".join(str(v) for v in value)
+                elif isinstance(value, (str, int, float, bool)):
+                    enhanced_metadata[field] = value
+                elif value is not None:
+                    enhanced_metadata[field] = str(value)
 
             return enhanced_metadata
 
@@ -1144,83 +1345,121 @@ class MemoryVectorStore:
             if not self.chroma_collection:
                 return
 
-            # Get all documents from ChromaDB
-            all_data = self.chroma_collection.get(include=["metadatas", "documents", "embeddings"])
+            page_size = int(self.chroma_config.get("load_page_size", 5000))
+
+            if self.chroma_config.get("lazy_loading", False):
+                # Keep only ids and light metadata resident; content and embeddings
+                # are fetched from ChromaDB on demand through a bounded LRU.
+                # Opt-in: callers that iterate memory_chunks.values() refetch the
+                # whole collection on every pass and lose edits to the returned chunks
+                record_index = ChunkRecordIndex(self.storage_dir / "chroma_db" / "sam_chunk_records.db",
+                                                self.chroma_collection.name)
+                lazy_chunks = LazyChromaChunkMap(
+                    self.chroma_collection,
+                    chunk_builder=self._chunk_from_chroma,
+                    cache_size=int(self.chroma_config.get("chunk_cache_size", 2048)),
+                    fetch_batch_size=int(self.chroma_config.get("batch_size", 100)),
+                    record_index=record_index
+                )
+                loaded_count = lazy_chunks.load_records(page_size=page_size)
+                self.memory_chunks = lazy_chunks
 
-            if not all_data["ids"]:
-                logger.info("No existing memories found in ChromaDB")
+                if not loaded_count:
+                    logger.info("No existing memories found in ChromaDB")
                 return
 
-            logger.info(f"Loading {len(all_data['ids'])} existing memories from ChromaDB...")
             loaded_count = 0
+            offset = 0
 
-            for i, chunk_id in enumerate(all_data["ids"]):
-                try:
-                    # Reconstruct MemoryChunk from ChromaDB data
-                    content = all_data["documents"][i]
-                    embedding = all_data["embeddings"][i]
-                    metadata = all_data["metadatas"][i]
-
-                    # Extract core fields from metadata
-                    memory_type_str = metadata.get("memory_type", "document")
-                    if memory_type_str == "document":
-                        memory_type = MemoryType.DOCUMENT
-                    elif memory_type_str == "conversation":
-                        memory_type = MemoryType.CONVERSATION
-                    elif memory_type_str == "system":
-                        memory_type = MemoryType.SYSTEM
-                    else:
-                        memory_type = MemoryType.DOCUMENT
-
-                    # Reconstruct tags from string
-                    tags_str = metadata.get("tags", "")
-                    tags = tags_str.split(",") if tags_str else []
-
-                    # Handle timestamp conversion from ChromaDB
-                    created_at = metadata.get("created_at", "")
-                    if isinstance(created_at, (int, float)):
-                        # Convert Unix timestamp to ISO format
-                        from datetime import datetime
-                        timestamp = datetime.fromtimestamp(created_at).isoformat()
-                    else:
-                        timestamp = str(created_at) if created_at else datetime.now().isoformat()
-
-                    # Handle last_accessed timestamp
-                    last_accessed = metadata.get("last_accessed", "")
-                    if isinstance(last_accessed, (int, float)):
-                        from datetime import datetime
-                        last_accessed = datetime.fromtimestamp(last_accessed).isoformat()
-                    elif not last_accessed:
-                        last_accessed = datetime.now().isoformat()
-
-                    # Create MemoryChunk
-                    chunk = MemoryChunk(
-                        chunk_id=chunk_id,
-                        content=content,
-                        content_hash=metadata.get("content_hash", ""),
-                        embedding=embedding,
-                        memory_type=memory_type,
-                        source=metadata.get("source_path", ""),
-                        timestamp=timestamp,
-                        tags=tags,
-                        importance_score=float(metadata.get("importance_score", 0.0)),
-                        access_count=int(metadata.get("access_count", 0)),
-                        last_accessed=last_accessed,
-                        metadata=metadata  # Store all metadata
-                    )
+            while True:
+                page = self.chroma_collection.get(include=["metadatas", "documents", "embeddings"],
+                                                  limit=page_size, offset=offset)
+                if not page["ids"]:
+                    break
 
-                    # Add to memory store (no need to add to vector index since it's already in ChromaDB)
-                    self.memory_chunks[chunk_id] = chunk
-                    loaded_count += 1
+                for i, chunk_id in enumerate(page["ids"]):
+                    try:
+                        # Add to memory store (no need to add to vector index since it's already in ChromaDB)
+                        self.memory_chunks[chunk_id] = self._chunk_from_chroma(
+                            chunk_id, page["documents"][i], page["embeddings"][i], page["metadatas"][i]
+                        )
+                        loaded_count += 1
+
+                    except Exception as e:
+                        logger.error(f"Error loading memory chunk {chunk_id}: {e}")
+                        continue
 
-                except Exception as e:
-                    logger.error(f"Error loading memory chunk {chunk_id}: {e}")
-                    continue
+                if len(page["ids"]) < page_size:
+                    break
+                offset += page_size
 
-            logger.info(f"Loaded {loaded_count} existing memories")
+            if loaded_count:
+                logger.info(f"Loaded {loaded_count} existing memories")
+            else:
+                logger.info("No existing memories found in ChromaDB")
 
         except Exception as e:
             logger.error(f"Error loading memories from ChromaDB: {e}")
+
+    def _chunk_from_chroma(self, chunk_id: str, content: Optional[str], embedding: Any,
+                           metadata: Dict[str, Any]) -> MemoryChunk:
+        """Reconstruct a MemoryChunk from ChromaDB data."""
+        metadata = metadata or {}
+
+        # Extract core fields from metadata
+        try:
+            memory_type = MemoryType(metadata.get("memory_type", "document"))
+        except ValueError:
+            memory_type = MemoryType.DOCUMENT
+
+        # Reconstruct tags from string
+        tags_str = metadata.get("tags", "")
+        tags = tags_str.split(",") if tags_str else []
+
+        # Handle timestamp conversion from ChromaDB
+        created_at = metadata.get("created_at", "")
+        if isinstance(created_at, (int, float)):
+            # Convert Unix timestamp to ISO format
+            timestamp = datetime.fromtimestamp(created_at).isoformat()
+        else:
+            timestamp = str(created_at) if created_at else datetime.now().isoformat()
+
+        # Handle last_accessed timestamp
+        last_accessed = metadata.get("last_accessed", "")
+        if isinstance(last_accessed, (int, float)):
+            last_accessed = datetime.fromtimestamp(last_accessed).isoformat()
+        elif not last_accessed:
+            last_accessed = datetime.now().isoformat()
+
+        # Convert numpy embeddings returned by newer ChromaDB versions
+        if embedding is not None and hasattr(embedding, 'tolist'):
+            embedding = embedding.tolist()
+
+        return MemoryChunk(
+            chunk_id=chunk_id,
+            content=content or "",
+            content_hash=metadata.get("content_hash", ""),
+            embedding=embedding,
+            memory_type=memory_type,
+            source=metadata.get("source_path", ""),
+            timestamp=timestamp,
+            tags=tags,
+            importance_score=float(metadata.get("importance_score", 0.0)),
+            access_count=int(metadata.get("access_count", 0)),
+            last_accessed=last_accessed,
+            metadata=metadata  # Store all metadata
+        )
+
+    def _find_duplicate_chunk(self, content_hash: str) -> Optional[str]:
+        """Find an existing chunk with the same content hash."""
+        if isinstance(self.memory_chunks, LazyChromaChunkMap):
+            # Avoid materializing every chunk; ChromaDB indexes content_hash
+            return self.memory_chunks.find_by_content_hash(content_hash)
+
+        for existing_chunk in self.memory_chunks.values():
+            if existing_chunk.content_hash == content_hash:
+                return existing_chunk.chunk_id
+        return None
     
     def _generate_embedding(self, text: str) -> List[float]:
         """Generate embedding for text using proper embedding model."""
@@ -1279,6 +1518,7 @@ class MemoryVectorStore:
                 embedding_array = np.array([embedding], dtype=np.float32)
                 self.faiss_index.add(embedding_array)
                 self.chunk_ids.append(chunk_id)
+                self._add_filter_postings(chunk_id)
 
                 # Save index
                 index_file = self.storage_dir / "faiss_index.bin"
@@ -1315,35 +1555,64 @@ class MemoryVectorStore:
                 if self.embeddings_matrix is None:
                     self.embeddings_matrix = np.array([embedding])
                     self.chunk_ids = [chunk_id]
+                    self.filter_postings.clear()
                 else:
                     self.embeddings_matrix = np.vstack([self.embeddings_matrix, embedding])
                     self.chunk_ids.append(chunk_id)
+                self._add_filter_postings(chunk_id)
 
         except Exception as e:
             logger.error(f"Error adding to vector index: {e}")
     
     def _search_vector_index(self, query_embedding: List[float], max_results: int, **kwargs) -> List[Tuple[str, float]]:
-        """Search vector index for similar embeddings."""
+        """
+        Search vector index for similar embeddings.
+
+        Optional ``memory_types``, ``tags``, ``metadata_filter`` and
+        ``min_similarity`` keyword arguments are applied before top-k
+        selection: as posting-list masks for SIMPLE and FAISS, and as a
+        ``where`` clause for Chroma.
+        """
         try:
             results = []
+            memory_types = kwargs.get('memory_types')
+            tags = kwargs.get('tags')
+            metadata_filter = kwargs.get('metadata_filter')
+            min_similarity = kwargs.get('min_similarity')
+
+            type_values = [t.value if hasattr(t, 'value') else str(t) for t in memory_types] if memory_types else None
+            filtered_rows = self.filter_postings.candidate_rows(type_values, tags, metadata_filter)
             
             if self.store_type == VectorStoreType.FAISS and self.faiss_index:
                 query_array = np.array([query_embedding], dtype=np.float32)
-                scores, indices = self.faiss_index.search(query_array, min(max_results, len(self.chunk_ids)))
+
+                if filtered_rows is None:
+                    scores, indices = self.faiss_index.search(query_array, min(max_results, len(self.chunk_ids)))
+                else:
+                    if len(filtered_rows) == 0:
+                        return []
+                    scores, indices = self._faiss_search_rows(query_array, filtered_rows, max_results)
                 
                 for score, idx in zip(scores[0], indices[0]):
-                    if idx < len(self.chunk_ids):
+                    if 0 <= idx < len(self.chunk_ids):
+                        if min_similarity is not None and score < min_similarity:
+                            continue
                         results.append((self.chunk_ids[idx], float(score)))
                         
             elif self.store_type == VectorStoreType.CHROMA and self.chroma_client:
+                where_filter, post_filter = self._build_chroma_where(kwargs.get('where_filter'), type_values,
+                                                                     tags, metadata_filter)
+
+                # Filters that cannot be pushed down (collections created before tag
+                # or cell fields existed) still need a wider candidate pool
+                n_results = max_results * 4 if post_filter else max_results
+
                 # Prepare query parameters
                 query_params = {
                     "query_embeddings": [query_embedding],
-                    "n_results": max_results
+                    "n_results": n_results
                 }
 
-                # Add where filter if provided in metadata
-                where_filter = kwargs.get('where_filter')
                 if where_filter:
                     query_params["where"] = where_filter
 
@@ -1351,33 +1620,182 @@ class MemoryVectorStore:
 
                 for chunk_id, distance in zip(chroma_results['ids'][0], chroma_results['distances'][0]):
                     similarity = 1.0 - distance  # Convert distance to similarity
+                    if min_similarity is not None and similarity < min_similarity:
+                        continue
                     results.append((chunk_id, similarity))
                     
             elif self.store_type == VectorStoreType.SIMPLE and self.embeddings_matrix is not None:
                 query_array = np.array(query_embedding)
-                similarities = np.dot(self.embeddings_matrix, query_array)
-                
-                # Get top results
-                top_indices = np.argsort(similarities)[::-1][:max_results]
+
+                # Score only rows that pass the filters, so a search restricted
+                # to one table costs as much as that table
+                if filtered_rows is None:
+                    candidate_rows = np.arange(len(self.embeddings_matrix))
+                    similarities = np.dot(self.embeddings_matrix, query_array)
+                else:
+                    candidate_rows = filtered_rows[filtered_rows < len(self.embeddings_matrix)]
+                    similarities = np.dot(self.embeddings_matrix[candidate_rows], query_array)
+
+                if min_similarity is not None:
+                    keep = similarities >= min_similarity
+                    candidate_rows, similarities = candidate_rows[keep], similarities[keep]
+
+                if len(candidate_rows) > max_results:
+                    top = np.argpartition(-similarities, max_results - 1)[:max_results]
+                    candidate_rows, similarities = candidate_rows[top], similarities[top]
+
+                order = np.argsort(-similarities, kind='stable')
                 
-                for idx in top_indices:
+                for idx, similarity in zip(candidate_rows[order], similarities[order]):
                     if idx < len(self.chunk_ids):
-                        results.append((self.chunk_ids[idx], float(similarities[idx])))
+                        results.append((self.chunk_ids[idx], float(similarity)))
             
             return results
             
         except Exception as e:
             logger.error(f"Error searching vector index: {e}")
             return []
+
+    def _faiss_search_rows(self, query_array: np.ndarray, candidate_rows: np.ndarray,
+                           max_results: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Search a FAISS index restricted to the given rows."""
+        import faiss
+
+        k = min(max_results, len(candidate_rows))
+        try:
+            selector = faiss.IDSelectorBatch(candidate_rows.astype(np.int64))
+            return self.faiss_index.search(query_array, k, params=faiss.SearchParameters(sel=selector))
+        except (AttributeError, TypeError):
+            # Older FAISS without search-time selectors: score candidate rows directly
+            vectors = np.vstack([self.faiss_index.reconstruct(int(row)) for row in candidate_rows])
+            scores = vectors @ query_array[0]
+            order = np.argsort(-scores, kind='stable')[:k]
+            return scores[order][np.newaxis, :], candidate_rows[order][np.newaxis, :]
+
+    def _build_chroma_where(self, where_filter: Optional[Dict[str, Any]],
+                            memory_types: Optional[List[str]],
+                            tags: Optional[List[str]],
+                            metadata_filter: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Translate memory type, tag and metadata filters into a ChromaDB where clause.
+
+        Chunk metadata fields are stored with an ``extra_`` prefix (see
+        _prepare_chroma_metadata). Fields that older records may lack are
+        left out of the clause (see _chroma_residual_fields).
+
+        Returns:
+            Tuple of (where clause or None, whether results must still be post-filtered)
+        """
+        clauses = [where_filter] if where_filter else []
+        residual_fields = self._chroma_residual_fields(metadata_filter)
+        post_filter = bool(residual_fields)
+
+        if memory_types:
+            clauses.append({"memory_type": {"$in": list(memory_types)}})
+
+        if tags:
+            if self._chroma_has_tag_fields():
+                tag_clauses = [{self._chroma_tag_field(tag): True} for tag in tags]
+                clauses.append(tag_clauses[0] if len(tag_clauses) == 1 else {"$or": tag_clauses})
+            else:
+                post_filter = True
+
+        for field, value in (metadata_filter or {}).items():
+            if field not in residual_fields:
+                clauses.append({f"extra_{field}": value})
+
+        if not clauses:
+            return None, post_filter
+        return (clauses[0] if len(clauses) == 1 else {"$and": clauses}), post_filter
+
+    def _chroma_residual_fields(self, metadata_filter: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Metadata filter fields that must be checked after a Chroma query.
+
+        Table cell chunks written before cell_row and cell_column were stored
+        only carry cell_coordinates as a string, so coordinate filters are
+        post-filtered unless every record has the separate fields.
+        """
+        if not metadata_filter or getattr(self, 'chroma_cell_fields', False):
+            return []
+        return [field for field in ("cell_row", "cell_column") if field in metadata_filter]
+
+    def _chroma_has_tag_fields(self) -> bool:
+        """Check whether every record in the collection carries per-tag metadata fields."""
+        return getattr(self, 'chroma_tag_fields', False)
+
+    def _load_chroma_feature_flags(self, chroma_path: Path) -> Dict[str, bool]:
+        """
+        Determine which derived metadata fields every record in the collection has.
+
+        ``tag_fields`` covers the per-tag fields and ``cell_fields`` the
+        extra_cell_row and extra_cell_column fields. Collections that already
+        held records before a field was written keep post-filtering on it. The
+        decision is persisted beside the Chroma data because collection
+        metadata may be overwritten on open.
+        """
+        flag_file = chroma_path / "sam_collection_features.json"
+        collection_name = self.chroma_collection.name
+
+        try:
+            features = json.loads(flag_file.read_text()) if flag_file.exists() else {}
+        except Exception as e:
+            logger.warning(f"Could not read collection feature flags: {e}")
+            features = {}
+
+        collection_features = features.setdefault(collection_name, {})
+        missing = [flag for flag in ("tag_fields", "cell_fields") if flag not in collection_features]
+        if missing:
+            is_empty = self.chroma_collection.count() == 0
+            for flag in missing:
+                collection_features[flag] = is_empty
+            try:
+                flag_file.write_text(json.dumps(features, indent=2))
+            except Exception as e:
+                logger.warning(f"Could not write collection feature flags: {e}")
+
+        return {flag: bool(value) for flag, value in collection_features.items()}
+
+    @staticmethod
+    def _chroma_tag_field(tag: str) -> str:
+        """Metadata key marking a chunk as carrying a tag."""
+        return f"tag_{tag}"
+
+    def _add_filter_postings(self, chunk_id: str):
+        """Register the newest index row in the type, tag and metadata posting lists."""
+        chunk = self.memory_chunks.get(chunk_id)
+        memory_type = chunk.memory_type.value if chunk and hasattr(chunk.memory_type, 'value') else "document"
+        self.filter_postings.add_row(len(self.chunk_ids) - 1, memory_type, chunk.tags if chunk else [],
+                                     self._indexed_metadata(chunk.metadata if chunk else None))
+
+    @staticmethod
+    def _indexed_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Metadata used for posting lists and Chroma where clauses.
+
+        Table cell chunks written before cell_row and cell_column were stored
+        carry only cell_coordinates, so the coordinates are split here. ChromaDB
+        stores the coordinates as a string such as "(3, 4)".
+        """
+        indexed = dict(metadata or {})
+        coordinates = indexed.get("cell_coordinates")
+        if isinstance(coordinates, str):
+            coordinates = [int(value) for value in re.findall(r"-?\d+", coordinates)]
+        if isinstance(coordinates, (list, tuple)) and len(coordinates) == 2:
+            indexed.setdefault("cell_row", coordinates[0])
+            indexed.setdefault("cell_column", coordinates[1])
+        return indexed
     
     def _update_memory_access(self, chunk_id: str) -> str:
         """Update memory access tracking."""
         try:
-            chunk = self.memory_chunks.get(chunk_id)
+            with self._lock.read_lock():
+                chunk = self.memory_chunks.get(chunk_id)
             if chunk:
-                chunk.access_count += 1
-                chunk.last_accessed = datetime.now().isoformat()
-                self._save_memory_chunk(chunk)
+                with self._access_lock:
+                    chunk.access_count += 1
+                    chunk.last_accessed = datetime.now().isoformat()
+                    self._save_memory_chunk(chunk)
             return chunk_id
             
         except Exception as e:
@@ -1402,8 +1820,11 @@ class MemoryVectorStore:
                 else:
                     chunk_dict['embedding'] = list(chunk_dict['embedding'])  # Convert to list
 
-            with open(chunk_file, 'w', encoding='utf-8') as f:
+            # Write to a temporary file and rename so concurrent readers never see a partial file
+            temp_file = chunk_file.with_name(f"{chunk_file.name}.{threading.get_ident()}.tmp")
+            with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(chunk_dict, f, indent=2, ensure_ascii=False)
+            os.replace(temp_file, chunk_file)
 
         except Exception as e:
             logger.error(f"Error saving memory chunk: {e}")
@@ -1449,6 +1870,27 @@ class MemoryVectorStore:
         except Exception as e:
             logger.error(f"Error loading memories: {e}")
     
+    def _update_chroma_record(self, chunk: MemoryChunk, content_changed: bool,
+                              removed_tags: List[str] = None):
+        """Write an edited chunk's metadata (and content and embedding) back to ChromaDB."""
+        if self.store_type != VectorStoreType.CHROMA or not self.chroma_collection:
+            return
+
+        chroma_metadata = self._prepare_chroma_metadata(chunk)
+        # ChromaDB merges metadata on update; None deletes the fields of removed tags
+        for tag in removed_tags or []:
+            chroma_metadata.setdefault(self._chroma_tag_field(tag), None)
+        update = {'ids': [chunk.chunk_id], 'metadatas': [chroma_metadata]}
+        if content_changed:
+            update['documents'] = [chunk.content]
+            if chunk.embedding is not None:
+                update['embeddings'] = [list(chunk.embedding)]
+        self.chroma_collection.update(**update)
+
+        if isinstance(self.memory_chunks, LazyChromaChunkMap):
+            # Keep the resident record and its sidecar row in step with ChromaDB
+            self.memory_chunks[chunk.chunk_id] = chunk
+
     def _update_vector_index(self, chunk_id: str, embedding: List[float]):
         """Update embedding in vector index."""
         # For simplicity, remove and re-add
@@ -1461,6 +1903,7 @@ class MemoryVectorStore:
             if chunk_id in self.chunk_ids:
                 idx = self.chunk_ids.index(chunk_id)
                 self.chunk_ids.pop(idx)
+                self.filter_postings.remove_row(idx)
                 
                 if self.store_type == VectorStoreType.SIMPLE and self.embeddings_matrix is not None:
                     self.embeddings_matrix = np.delete(self.embeddings_matrix, idx, axis=0)
@@ -1473,6 +1916,7 @@ class MemoryVectorStore:
 
 # Global memory vector store instance
 _memory_store = None
+_memory_store_lock = threading.Lock()
 
 def get_memory_store(store_type: VectorStoreType = VectorStoreType.SIMPLE,
                     storage_directory: str = "memory_store",
@@ -1481,11 +1925,13 @@ def get_memory_store(store_type: VectorStoreType = VectorStoreType.SIMPLE,
     global _memory_store
 
     if _memory_store is None:
-        _memory_store = MemoryVectorStore(
-            store_type=store_type,
-            storage_directory=storage_directory,
-            embedding_dimension=embedding_dimension
-        )
+        with _memory_store_lock:
+            if _memory_store is None:
+                _memory_store = MemoryVectorStore(
+                    store_type=store_type,
+                    storage_directory=storage_directory,
+                    embedding_dimension=embedding_dimension
+                )
 
     return _memory_store
 
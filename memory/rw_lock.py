@@ -0,0 +1,109 @@
+"""
+Reader/Writer Lock for SAM Memory Stores
+Lets concurrent searches proceed in parallel while index mutations run exclusively.
+
+The lock is writer-preferring so a steady stream of searches cannot starve
+ingestion. It is reentrant: a thread holding the write lock may take the read
+or write lock again, and a thread holding the read lock may take it again.
+Upgrading a read lock to a write lock is refused because two upgrading
+readers would deadlock each other.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """Writer-preferring, reentrant reader/writer lock."""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for shared (read) access."""
+        me = threading.get_ident()
+
+        if self._writer == me:
+            # Reads nested inside this thread's write section need no bookkeeping
+            self._local.write_nested_reads = getattr(self._local, 'write_nested_reads', 0) + 1
+            return
+
+        read_depth = getattr(self._local, 'read_depth', 0)
+        with self._cond:
+            if read_depth == 0:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        self._local.read_depth = read_depth + 1
+
+    def release_read(self) -> None:
+        """Release shared access."""
+        if getattr(self._local, 'write_nested_reads', 0):
+            self._local.write_nested_reads -= 1
+            return
+
+        read_depth = getattr(self._local, 'read_depth', 0)
+        if read_depth == 0:
+            raise RuntimeError("release_read called without holding the read lock")
+
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+        self._local.read_depth = read_depth - 1
+
+    def acquire_write(self) -> None:
+        """Acquire the lock for exclusive (write) access."""
+        me = threading.get_ident()
+
+        if self._writer == me:
+            self._writer_depth += 1
+            return
+
+        if getattr(self._local, 'read_depth', 0):
+            raise RuntimeError("Cannot upgrade a read lock to a write lock")
+
+        with self._cond:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Release exclusive access."""
+        if self._writer != threading.get_ident():
+            raise RuntimeError("release_write called by a thread that does not hold the write lock")
+
+        with self._cond:
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Context manager for shared access."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Context manager for exclusive access."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
@@ -0,0 +1,127 @@
+"""
+BM25 Inverted Index for SAM Local File Search
+Token-level postings with Okapi BM25 scoring.
+
+Search reads only the postings of the query terms, so its cost grows with
+the number of matching documents instead of the total size of the corpus.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Iterable
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens (underscores separate words)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def count_terms(text: str) -> Dict[str, int]:
+    """Count the term frequencies of a text."""
+    return dict(Counter(tokenize(text)))
+
+
+class BM25Index:
+    """
+    Inverted index from terms to per-document term frequencies.
+
+    Documents are identified by the search engine's index ids. The index
+    keeps no forward copy of each document's terms; callers pass the
+    previous terms when replacing or removing a document.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        """
+        Initialize an empty index.
+
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_lengths: Dict[str, int] = {}
+        self.total_length = 0
+
+    def add_document(self, doc_id: str, term_frequencies: Dict[str, int],
+                     previous_terms: Optional[Iterable[str]] = None) -> None:
+        """
+        Index a document, replacing any previous version with the same id.
+
+        Args:
+            doc_id: Document identifier
+            term_frequencies: Term frequencies of the document (see count_terms)
+            previous_terms: Terms of the previous version, if known
+        """
+        self.remove_document(doc_id, previous_terms)
+
+        for term, frequency in term_frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        length = sum(term_frequencies.values())
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def remove_document(self, doc_id: str, terms: Optional[Iterable[str]] = None) -> None:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: Document identifier
+            terms: The document's terms, to visit only its own postings
+                instead of every term in the index
+        """
+        if doc_id not in self.doc_lengths:
+            return
+
+        for term in list(terms if terms is not None else self.postings):
+            postings = self.postings.get(term)
+            if postings and postings.pop(doc_id, None) is not None and not postings:
+                del self.postings[term]
+
+        self.total_length -= self.doc_lengths.pop(doc_id)
+
+    def search(self, query: str) -> List[Tuple[str, float]]:
+        """
+        Score the documents containing any query term.
+
+        Args:
+            query: Search query
+
+        Returns:
+            (doc_id, score) pairs sorted by descending score, with scores
+            normalized to [0, 1] by the best score any document could reach
+        """
+        terms = set(tokenize(query))
+        doc_count = len(self.doc_lengths)
+        if not terms or not doc_count:
+            return []
+
+        average_length = self.total_length / doc_count or 1.0
+        scores: Dict[str, float] = {}
+        max_score = 0.0
+
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                # A missing term still counts towards the best possible score
+                max_score += self._idf(0, doc_count) * (self.k1 + 1)
+                continue
+
+            idf = self._idf(len(postings), doc_count)
+            max_score += idf * (self.k1 + 1)
+            for doc_id, frequency in postings.items():
+                length_norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + length_norm)
+
+        return sorted(((doc_id, score / max_score) for doc_id, score in scores.items()),
+                      key=lambda item: item[1], reverse=True)
+
+    @staticmethod
+    def _idf(document_frequency: int, doc_count: int) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        return math.log(1 + (doc_count - document_frequency + 0.5) / (document_frequency + 0.5))
@@ -7,7 +7,9 @@ Sprint 9 Task 2: Local File Search Integration
 
 import logging
 import json
+import sqlite3
 import hashlib
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -15,6 +17,8 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import re
 
+from .bm25_index import BM25Index, count_terms
+
 logger = logging.getLogger(__name__)
 
 class SearchResultType(Enum):
@@ -64,16 +68,22 @@ class LocalFileSearchEngine:
         
         Args:
             knowledge_directory: Directory containing documents to index
-            index_file: Path to search index storage file
+            index_file: Path to search index storage file (entries are stored in a
+                SQLite database beside it; an existing JSON index is migrated once)
         """
         self.knowledge_dir = Path(knowledge_directory)
         self.knowledge_dir.mkdir(exist_ok=True)
         
         self.index_file = Path(index_file)
+        self.index_db = self.index_file.with_suffix('.db')
         
         # Storage
         self.search_index: Dict[str, SearchIndex] = {}
         self.document_embeddings: Dict[str, List[float]] = {}
+        self.bm25_index = BM25Index()
+        # Entries changed since the last save, with their new term frequencies
+        # (None when only the entry itself changed)
+        self._pending_writes: Dict[str, Optional[Dict[str, int]]] = {}
         
         # Configuration
         self.config = {
@@ -86,6 +96,7 @@ class LocalFileSearchEngine:
         }
         
         # Load existing index
+        self._init_index_database()
         self._load_search_index()
         
         logger.info(f"Local file search engine initialized with {len(self.search_index)} indexed items")
@@ -186,18 +197,22 @@ class LocalFileSearchEngine:
             results = []
             query_lower = query.lower()
             
-            # Search through all indexed items
-            for index_id, search_index in self.search_index.items():
+            # BM25 over the postings of the query terms, best matches first
+            for index_id, relevance_score in self.bm25_index.search(query):
+                if relevance_score <= 0.1:  # Minimum relevance threshold
+                    break
+                
+                search_index = self.search_index.get(index_id)
+                if search_index is None:
+                    continue
+                
                 # Filter by result type if specified
                 if result_types:
                     index_type = self._determine_result_type(search_index)
                     if index_type not in result_types:
                         continue
                 
-                # Calculate relevance score
-                relevance_score = self._calculate_relevance(query_lower, search_index)
-                
-                if relevance_score > 0.1:  # Minimum relevance threshold
+                if len(results) < max_results:
                     # Find best matching section
                     best_section, section_content = self._find_best_section(query_lower, search_index)
                     
@@ -216,12 +231,10 @@ class LocalFileSearchEngine:
                     )
                     
                     results.append(result)
+                else:
+                    break
             
-            # Sort by relevance score
-            results.sort(key=lambda r: r.confidence_score, reverse=True)
-            
-            # Return top results
-            return results[:max_results]
+            return results
             
         except Exception as e:
             logger.error(f"Error performing search: {e}")
@@ -280,19 +293,26 @@ class LocalFileSearchEngine:
     def _index_file(self, file_path: Path) -> bool:
         """Index a single file."""
         try:
+            # Cheap first check: unchanged size, mtime and inode mean unchanged content
+            index_id = str(file_path)
+            file_stat = file_path.stat()
+            file_signature = [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+            existing_index = self.search_index.get(index_id)
+            if existing_index and existing_index.metadata.get('file_signature') == file_signature:
+                return False
+            
             # Calculate file hash to check if already indexed
             with open(file_path, 'rb') as f:
                 file_content = f.read()
             
             content_hash = hashlib.sha256(file_content).hexdigest()
             
-            # Check if already indexed with same hash
-            index_id = str(file_path)
-            if index_id in self.search_index:
-                existing_index = self.search_index[index_id]
-                if existing_index.content_hash == content_hash:
-                    logger.debug(f"File already indexed: {file_path}")
-                    return False
+            # Check if already indexed with same hash (touched or copied back unchanged)
+            if existing_index and existing_index.content_hash == content_hash:
+                existing_index.metadata['file_signature'] = file_signature
+                self._pending_writes.setdefault(index_id, None)
+                logger.debug(f"File already indexed: {file_path}")
+                return False
             
             # Extract text content
             text_content = self._extract_text_content(file_path, file_content)
@@ -321,11 +341,12 @@ class LocalFileSearchEngine:
                 last_updated=datetime.now().isoformat(),
                 metadata={
                     'file_size': len(file_content),
-                    'modification_time': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    'modification_time': datetime.fromtimestamp(file_stat.st_mtime).isoformat(),
+                    'file_signature': file_signature
                 }
             )
             
-            self.search_index[index_id] = search_index
+            self._add_to_index(search_index)
             
             logger.debug(f"Indexed file: {file_path}")
             return True
@@ -393,7 +414,7 @@ class LocalFileSearchEngine:
                 }
             )
             
-            self.search_index[index_id] = search_index
+            self._add_to_index(search_index)
             
             logger.debug(f"Indexed capsule: {capsule.name}")
             return True
@@ -402,6 +423,23 @@ class LocalFileSearchEngine:
             logger.error(f"Error indexing capsule: {e}")
             return False
     
+    def _add_to_index(self, search_index: SearchIndex):
+        """Store a search index entry, update its BM25 postings and queue it for saving."""
+        previous = self.search_index.get(search_index.index_id)
+        term_frequencies = count_terms(self._bm25_text(search_index))
+        
+        self.search_index[search_index.index_id] = search_index
+        self.bm25_index.add_document(
+            search_index.index_id,
+            term_frequencies,
+            previous_terms=count_terms(self._bm25_text(previous)) if previous else None
+        )
+        self._pending_writes[search_index.index_id] = term_frequencies
+    
+    def _bm25_text(self, search_index: SearchIndex) -> str:
+        """Text indexed for BM25: title, filename and content."""
+        return f"{self._extract_title(search_index)}\n{search_index.filename}\n{search_index.indexed_content}"
+    
     def _extract_text_content(self, file_path: Path, file_content: bytes) -> str:
         """Extract text content from a file."""
         try:
@@ -646,57 +684,99 @@ class LocalFileSearchEngine:
         else:
             return SearchResultType.DOCUMENT
     
-    def _load_search_index(self):
-        """Load search index from storage."""
+    @contextmanager
+    def _connect(self):
+        """Open a connection to the index database that commits on success and is always closed."""
+        conn = sqlite3.connect(self.index_db, timeout=30.0)
         try:
-            if self.index_file.exists():
-                with open(self.index_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                for index_data in data.get('indices', []):
-                    search_index = SearchIndex(
-                        index_id=index_data['index_id'],
-                        file_path=index_data['file_path'],
-                        filename=index_data['filename'],
-                        file_type=index_data['file_type'],
-                        content_hash=index_data['content_hash'],
-                        indexed_content=index_data['indexed_content'],
-                        sections=index_data['sections'],
-                        keywords=index_data['keywords'],
-                        created_at=index_data['created_at'],
-                        last_updated=index_data['last_updated'],
-                        metadata=index_data.get('metadata', {})
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def _init_index_database(self):
+        """Initialize the index database schema."""
+        try:
+            self.index_db.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS search_indices (
+                        index_id TEXT PRIMARY KEY,
+                        entry TEXT NOT NULL,
+                        term_frequencies TEXT NOT NULL
                     )
-                    
-                    self.search_index[search_index.index_id] = search_index
-                
+                """)
+        except Exception as e:
+            logger.error(f"Error initializing search index database: {e}")
+    
+    def _load_search_index(self):
+        """Load search index entries and their BM25 postings from storage."""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT entry, term_frequencies FROM search_indices ORDER BY rowid").fetchall()
+            
+            for entry, term_frequencies in rows:
+                search_index = self._search_index_from_dict(json.loads(entry))
+                self.search_index[search_index.index_id] = search_index
+                self.bm25_index.add_document(search_index.index_id, json.loads(term_frequencies))
+            
+            if rows:
                 logger.info(f"Loaded {len(self.search_index)} search indices")
+            elif self.index_file.exists():
+                self._migrate_json_index()
             
         except Exception as e:
             logger.error(f"Error loading search index: {e}")
     
+    def _migrate_json_index(self):
+        """Import a search index saved as JSON by earlier versions."""
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        for index_data in data.get('indices', []):
+            self._add_to_index(self._search_index_from_dict(index_data))
+        
+        self._save_search_index()
+        logger.info(f"Migrated {len(self.search_index)} search indices from {self.index_file} to {self.index_db}")
+    
+    def _search_index_from_dict(self, index_data: Dict[str, Any]) -> SearchIndex:
+        """Create a search index entry from its stored form."""
+        return SearchIndex(
+            index_id=index_data['index_id'],
+            file_path=index_data['file_path'],
+            filename=index_data['filename'],
+            file_type=index_data['file_type'],
+            content_hash=index_data['content_hash'],
+            indexed_content=index_data['indexed_content'],
+            sections=index_data['sections'],
+            keywords=index_data['keywords'],
+            created_at=index_data['created_at'],
+            last_updated=index_data['last_updated'],
+            metadata=index_data.get('metadata', {})
+        )
+    
     def _save_search_index(self):
-        """Save search index to storage."""
+        """Save the entries changed since the last save."""
         try:
-            indices_data = []
-            
-            for search_index in self.search_index.values():
-                indices_data.append(asdict(search_index))
-            
-            data = {
-                'indices': indices_data,
-                'last_updated': datetime.now().isoformat(),
-                'version': '1.0.0'
-            }
-            
-            # Ensure directory exists
-            self.index_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save to file
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            logger.debug(f"Saved {len(self.search_index)} search indices")
+            if not self._pending_writes:
+                return
+            
+            with self._connect() as conn:
+                for index_id, term_frequencies in self._pending_writes.items():
+                    entry = json.dumps(asdict(self.search_index[index_id]), ensure_ascii=False)
+                    if term_frequencies is None:
+                        conn.execute("UPDATE search_indices SET entry = ? WHERE index_id = ?", (entry, index_id))
+                    else:
+                        conn.execute("""
+                            INSERT INTO search_indices (index_id, entry, term_frequencies) VALUES (?, ?, ?)
+                            ON CONFLICT (index_id) DO UPDATE SET
+                                entry = excluded.entry, term_frequencies = excluded.term_frequencies
+                        """, (index_id, entry, json.dumps(term_frequencies, ensure_ascii=False)))
+            
+            logger.debug(f"Saved {len(self._pending_writes)} changed search indices")
+            self._pending_writes.clear()
             
         except Exception as e:
             logger.error(f"Error saving search index: {e}")
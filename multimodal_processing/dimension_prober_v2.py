@@ -6,6 +6,7 @@ The FIRST AI system with human-like conceptual understanding.
 """
 
 import os
+import re
 import sys
 import json
 import torch
@@ -66,6 +67,194 @@ class DimensionProbeResultV2:
     processing_time_ms: float
     chunk_context: Optional[Dict[str, Any]] = None
 
+# Leading word run of a pattern or keyword literal
+_WORD_RE = re.compile(r'\w+')
+
+# Non-ASCII characters that re.IGNORECASE matches to ASCII letters
+_IGNORECASE_FOLD = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+
+def _pattern_regex(pattern: str) -> str:
+    """Build the regex used to count a dimension pattern (matched with re.IGNORECASE)."""
+    pattern_words = pattern.lower().split()
+    if len(pattern_words) > 1:
+        # Multi-word pattern - look for words within reasonable distance
+        return r'\b' + r'\W+'.join(re.escape(word) for word in pattern_words) + r'\b'
+    # Single word pattern
+    return r'\b' + re.escape(pattern.lower()) + r'\b'
+
+
+def _pattern_counts_score(pattern_counts: List[int]) -> float:
+    """Combine per-pattern match counts into a dimension base score."""
+    max_score = 0.0
+    total_matches = 0
+
+    for matches in pattern_counts:
+        if matches > 0:
+            # Logarithmic scaling for multiple matches
+            score = min(1.0, 0.6 + 0.2 * np.log(1 + matches))
+            max_score = max(max_score, score)
+            total_matches += matches
+
+    # Combine max score with frequency bonus
+    if total_matches > 0:
+        frequency_bonus = min(0.3, total_matches * 0.05)
+        return min(1.0, max_score + frequency_bonus)
+
+    return 0.0
+
+
+class ProfileMatcher:
+    """
+    Precompiled matcher for the patterns and boost keywords of one profile.
+
+    Each distinct pattern and keyword regex is compiled once and indexed by
+    the word it must start with. A single alternation regex over those words
+    scans the text once for candidate positions, and at each candidate only
+    the expressions indexed under its word are tried. Counts are identical to
+    running re.findall (patterns) and re.search (keywords) separately for
+    each expression.
+    """
+
+    def __init__(self, profile_config: Dict[str, Any]):
+        """
+        Compile the matcher for a profile.
+
+        Args:
+            profile_config: Profile configuration with a 'dimensions' mapping
+        """
+        self.profile_config = profile_config
+        self._expressions = []  # (compiled regex, count every match?)
+        self._expression_ids: Dict[Tuple[str, bool], int] = {}
+        self._pattern_index: Dict[str, List[int]] = {}
+        self._keyword_index: Dict[str, List[int]] = {}
+        self._unindexed: List[int] = []
+
+        # (name, pattern expression IDs, keyword expression IDs, weight) per dimension
+        self.dimensions = []
+        for dim_name, dim_config in profile_config.get('dimensions', {}).items():
+            pattern_ids = [self._add_expression(_pattern_regex(pattern), self._pattern_first_literal(pattern),
+                                                count_all=True)
+                           for pattern in dim_config.get('patterns', [])]
+            keyword_ids = [self._add_expression(r'\b' + re.escape(keyword.lower()) + r'\b', keyword.lower(),
+                                                count_all=False)
+                           for keyword in dim_config.get('boost_keywords', [])]
+            self.dimensions.append((dim_name, pattern_ids, keyword_ids, dim_config.get('weight', 1.0)))
+
+        # One alternation over all indexed words finds the candidate positions in a single scan
+        index_words = sorted(set(self._pattern_index) | set(self._keyword_index), key=len, reverse=True)
+        self._word_scanner = re.compile(r'\b(?:' + '|'.join(re.escape(word) for word in index_words) + r')\b',
+                                        re.IGNORECASE) if index_words else None
+
+    @staticmethod
+    def _pattern_first_literal(pattern: str) -> str:
+        """Literal text a pattern's regex starts with (see _pattern_regex)."""
+        pattern_words = pattern.lower().split()
+        return pattern_words[0] if len(pattern_words) > 1 else pattern.lower()
+
+    def _add_expression(self, regex: str, first_literal: str, count_all: bool) -> int:
+        """
+        Compile and index an expression, reusing identical ones.
+
+        Args:
+            regex: Regular expression, starting with a word boundary
+            first_literal: Literal text the expression matches first
+            count_all: Count every match (patterns) instead of presence (keywords)
+
+        Returns:
+            Expression ID
+        """
+        key = (regex, count_all)
+        if key in self._expression_ids:
+            return self._expression_ids[key]
+
+        expression_id = len(self._expressions)
+        # Patterns ignore case; keywords are matched against lowercased text as is
+        compiled = re.compile(regex, re.IGNORECASE) if count_all else re.compile(regex)
+        self._expressions.append((compiled, count_all))
+        self._expression_ids[key] = expression_id
+
+        # Matches start at a word boundary followed by the literal's leading word run,
+        # which is then a whole word of the text. Pattern literals that are not ASCII
+        # may match other characters under re.IGNORECASE, so they are not indexed.
+        first_word = _WORD_RE.match(first_literal) if regex.startswith(r'\b') else None
+        if first_word is None or (count_all and not first_word.group().isascii()):
+            self._unindexed.append(expression_id)
+        elif count_all:
+            self._pattern_index.setdefault(first_word.group(), []).append(expression_id)
+        else:
+            self._keyword_index.setdefault(first_word.group(), []).append(expression_id)
+
+        return expression_id
+
+    def count_matches(self, text: str) -> List[int]:
+        """
+        Count the matches of every expression in one pass over the text.
+
+        Args:
+            text: Lowercased text to scan
+
+        Returns:
+            Match count per expression ID (0 or 1 for keywords)
+        """
+        counts = [0] * len(self._expressions)
+        next_start = [0] * len(self._expressions)
+
+        for word in (self._word_scanner.finditer(text) if self._word_scanner else ()):
+            start = word.start()
+            token = word.group()
+            candidates = self._pattern_index.get(token.translate(_IGNORECASE_FOLD), [])
+            if token in self._keyword_index:
+                candidates = candidates + self._keyword_index[token]
+
+            for expression_id in candidates:
+                # findall does not return overlapping matches; keywords need one match
+                if start < next_start[expression_id]:
+                    continue
+                compiled, count_all = self._expressions[expression_id]
+                match = compiled.match(text, start)
+                if match:
+                    counts[expression_id] += 1
+                    next_start[expression_id] = match.end() if count_all else len(text) + 1
+
+        for expression_id in self._unindexed:
+            compiled, count_all = self._expressions[expression_id]
+            if count_all:
+                counts[expression_id] = len(compiled.findall(text))
+            else:
+                counts[expression_id] = 1 if compiled.search(text) else 0
+
+        return counts
+
+    def score(self, text: str) -> Dict[str, float]:
+        """
+        Score every dimension of the profile.
+
+        Args:
+            text: Lowercased text to score
+
+        Returns:
+            Dimension scores, identical to scoring each pattern and keyword separately
+        """
+        counts = self.count_matches(text)
+        scores = {}
+
+        for dim_name, pattern_ids, keyword_ids, weight in self.dimensions:
+            # Calculate base score from patterns
+            base_score = _pattern_counts_score([counts[i] for i in pattern_ids])
+
+            # Apply boost from keywords
+            keyword_boost = min(1.0, sum(counts[i] for i in keyword_ids) / len(keyword_ids)) if keyword_ids else 0.0
+
+            # Combine scores with diminishing returns
+            combined_score = base_score + (keyword_boost * 0.3)
+
+            # Apply profile weight
+            scores[dim_name] = min(1.0, combined_score * weight)
+
+        return scores
+
+
 class ProfileManager:
     """Manages dimension profiles for different reasoning modes."""
     
@@ -74,6 +263,7 @@ class ProfileManager:
         self.profiles_dir = profiles_dir or Path(__file__).parent / "dimension_profiles"
         self.profiles = {}
         self.default_profile = "general"
+        self._matchers: Dict[int, ProfileMatcher] = {}
         self._load_profiles()
     
     def _load_profiles(self):
@@ -87,7 +277,7 @@ class ProfileManager:
                 with open(profile_file, 'r') as f:
                     profile_data = json.load(f)
                     profile_name = profile_data.get('name', profile_file.stem)
-                    self.profiles[profile_name] = profile_data
+                    self.update_profile(profile_name, profile_data)
                     logging.info(f"Loaded profile: {profile_name}")
             except Exception as e:
                 logging.error(f"Failed to load profile {profile_file}: {e}")
@@ -100,6 +290,34 @@ class ProfileManager:
         
         return self.profiles.get(profile_name, {})
     
+    def update_profile(self, profile_name: str, profile_data: Dict[str, Any]):
+        """Add or replace a profile and compile its matcher."""
+        previous = self.profiles.get(profile_name)
+        if previous is not None:
+            self._matchers.pop(id(previous), None)
+
+        self.profiles[profile_name] = profile_data
+        self._matchers[id(profile_data)] = ProfileMatcher(profile_data)
+
+    def get_matcher(self, profile_config: Dict[str, Any]) -> ProfileMatcher:
+        """
+        Get the compiled matcher for a profile configuration.
+
+        Matchers of profiles are compiled when the profile is loaded or passed to
+        update_profile; any other configuration is compiled for this call.
+
+        Args:
+            profile_config: Profile configuration, as returned by get_profile
+
+        Returns:
+            ProfileMatcher for the configuration
+        """
+        # A cached matcher keeps its configuration alive, so its id cannot be reused
+        matcher = self._matchers.get(id(profile_config))
+        if matcher is not None and matcher.profile_config is profile_config:
+            return matcher
+        return ProfileMatcher(profile_config)
+
     def list_profiles(self) -> List[str]:
         """List available profiles."""
         return list(self.profiles.keys())
@@ -227,71 +445,19 @@ class EnhancedDimensionProberV2:
     def _enhanced_pattern_probing(self, text: str, profile_config: Dict[str, Any], 
                                  context: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
         """Enhanced pattern-based scoring with profile awareness."""
-        text_lower = text.lower()
-        scores = {}
-        
-        dimensions = profile_config.get('dimensions', {})
-        
-        for dim_name, dim_config in dimensions.items():
-            # Get patterns and boost keywords for this dimension
-            patterns = dim_config.get('patterns', [])
-            boost_keywords = dim_config.get('boost_keywords', [])
-            
-            # Calculate base score from patterns
-            base_score = self._score_patterns_enhanced(text_lower, patterns)
-            
-            # Apply boost from keywords
-            keyword_boost = self._score_keywords(text_lower, boost_keywords)
-            
-            # Combine scores with diminishing returns
-            combined_score = base_score + (keyword_boost * 0.3)
-            
-            # Apply profile weight
-            weight = dim_config.get('weight', 1.0)
-            final_score = min(1.0, combined_score * weight)
-            
-            scores[dim_name] = final_score
-        
-        return scores
+        # All dimensions are scored from one pass of the profile's compiled matcher
+        return self.profile_manager.get_matcher(profile_config).score(text.lower())
     
     def _score_patterns_enhanced(self, text: str, patterns: List[str]) -> float:
         """Enhanced pattern scoring with semantic awareness."""
-        import re
-        
         if not patterns:
             return 0.0
         
-        max_score = 0.0
-        total_matches = 0
-        
-        for pattern in patterns:
-            # Create flexible regex pattern
-            pattern_words = pattern.lower().split()
-            if len(pattern_words) > 1:
-                # Multi-word pattern - look for words within reasonable distance
-                regex_pattern = r'\b' + r'\W+'.join(re.escape(word) for word in pattern_words) + r'\b'
-            else:
-                # Single word pattern
-                regex_pattern = r'\b' + re.escape(pattern.lower()) + r'\b'
-            
-            matches = len(re.findall(regex_pattern, text, re.IGNORECASE))
-            if matches > 0:
-                # Logarithmic scaling for multiple matches
-                score = min(1.0, 0.6 + 0.2 * np.log(1 + matches))
-                max_score = max(max_score, score)
-                total_matches += matches
-        
-        # Combine max score with frequency bonus
-        if total_matches > 0:
-            frequency_bonus = min(0.3, total_matches * 0.05)
-            return min(1.0, max_score + frequency_bonus)
-        
-        return 0.0
+        return _pattern_counts_score([len(re.findall(_pattern_regex(pattern), text, re.IGNORECASE))
+                                      for pattern in patterns])
     
     def _score_keywords(self, text: str, keywords: List[str]) -> float:
         """Score based on keyword presence."""
-        import re
-        
         if not keywords:
             return 0.0
         
@@ -8,14 +8,25 @@ Sprint 4 Task 1: Multimodal Ingestion Pipeline
 import logging
 import json
 import re
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
 from dataclasses import dataclass
 import hashlib
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Pages parsed by PyPDF2 between clears of the reader's object cache
+PYPDF2_CACHE_PAGES = 50
+
+# Page attributes that /Page nodes inherit from their /Pages ancestors
+PYPDF2_INHERITED_ATTRIBUTES = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+
 @dataclass
 class MultimodalContent:
     """Represents a piece of multimodal content."""
@@ -38,8 +49,23 @@ class MultimodalDocumentParser:
     Parses various document formats and extracts multimodal content.
     """
     
-    def __init__(self):
-        """Initialize the multimodal document parser."""
+    def __init__(self, pdf_workers: int = 1, pdf_pages_per_task: int = 25):
+        """
+        Initialize the multimodal document parser.
+
+        Args:
+            pdf_workers: Worker processes for PDF page extraction (1 parses serially)
+            pdf_pages_per_task: Pages per range handed to a worker process
+        """
+        if pdf_workers <= 0:
+            raise ValueError("PDF workers must be positive")
+        if pdf_pages_per_task <= 0:
+            raise ValueError("PDF pages per task must be positive")
+
+        self.pdf_workers = pdf_workers
+        self.pdf_pages_per_task = pdf_pages_per_task
+        self._pdf_executor: Optional[ProcessPoolExecutor] = None
+        self._pdf_executor_lock = threading.Lock()
         self.supported_formats = {'.pdf', '.docx', '.md', '.html', '.htm', '.txt', '.py', '.js', '.java', '.cpp', '.c'}
         self.parsers = {
             '.pdf': self._parse_pdf,
@@ -117,6 +143,42 @@ class MultimodalDocumentParser:
             logger.error(f"Error parsing document {file_path}: {e}")
             return None
     
+    def iter_content_blocks(self, file_path: Union[str, Path]) -> Iterator[MultimodalContent]:
+        """
+        Parse a document and yield content blocks as they are extracted.
+
+        PDFs are parsed page by page, and parser caches are released every few
+        pages, so callers can chunk and embed while parsing continues. Parser
+        memory is bounded by a few pages plus the PDF's cross-reference table,
+        which grows with the number of objects in the file. Other formats are
+        parsed whole and then yielded.
+
+        Args:
+            file_path: Path to the document to parse
+
+        Yields:
+            MultimodalContent blocks in document order
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            logger.error(f"File not found: {file_path}")
+            return
+
+        file_extension = file_path.suffix.lower()
+
+        if file_extension not in self.supported_formats:
+            logger.warning(f"Unsupported file format: {file_extension}")
+            return
+
+        try:
+            if file_extension == '.pdf':
+                yield from self._iter_pdf(file_path)
+            else:
+                yield from self.parsers[file_extension](file_path)
+        except Exception as e:
+            logger.error(f"Error parsing document {file_path}: {e}")
+
     def _generate_document_id(self, file_path: Path) -> str:
         """Generate a unique document ID."""
         content = f"{file_path.name}_{file_path.stat().st_mtime}_{file_path.stat().st_size}"
@@ -124,82 +186,213 @@ class MultimodalDocumentParser:
     
     def _parse_pdf(self, file_path: Path) -> List[MultimodalContent]:
         """Parse PDF documents."""
-        content_blocks = []
-        
+        return list(self._iter_pdf(file_path))
+
+    def _iter_pdf(self, file_path: Path) -> Iterator[MultimodalContent]:
+        """Parse PDF documents page by page, yielding content blocks."""
+        # Try to import PDF parsing libraries
         try:
-            # Try to import PDF parsing libraries
+            import PyPDF2
+            pdf_parser = 'PyPDF2'
+        except ImportError:
             try:
-                import PyPDF2
-                pdf_parser = 'PyPDF2'
+                import pdfplumber
+                pdf_parser = 'pdfplumber'
             except ImportError:
-                try:
-                    import pdfplumber
-                    pdf_parser = 'pdfplumber'
-                except ImportError:
-                    logger.warning("No PDF parsing library available. Install PyPDF2 or pdfplumber.")
-                    return self._parse_as_text_fallback(file_path)
-            
-            if pdf_parser == 'pdfplumber':
-                content_blocks = self._parse_pdf_with_pdfplumber(file_path)
-            else:
-                content_blocks = self._parse_pdf_with_pypdf2(file_path)
-                
+                logger.warning("No PDF parsing library available. Install PyPDF2 or pdfplumber.")
+                yield from self._parse_as_text_fallback(file_path)
+                return
+
+        if self.pdf_workers > 1:
+            page_blocks = self._iter_pdf_parallel(file_path, pdf_parser)
+        elif pdf_parser == 'pdfplumber':
+            page_blocks = self._iter_pdf_with_pdfplumber(file_path)
+        else:
+            page_blocks = self._iter_pdf_with_pypdf2(file_path)
+        blocks_yielded = False
+
+        try:
+            for block in page_blocks:
+                blocks_yielded = True
+                yield block
         except Exception as e:
             logger.error(f"Error parsing PDF {file_path}: {e}")
-            # Fallback to basic text parsing
-            content_blocks = self._parse_as_text_fallback(file_path)
-        
-        return content_blocks
+            # Fallback to basic text parsing, unless blocks were already handed out
+            if not blocks_yielded:
+                yield from self._parse_as_text_fallback(file_path)
     
+    def _iter_pdf_parallel(self, file_path: Path, pdf_parser: str) -> Iterator[MultimodalContent]:
+        """
+        Extract PDF page ranges in worker processes, yielding blocks in page order.
+
+        At most two ranges per worker are in flight, so results waiting to be
+        consumed stay bounded while the workers keep busy.
+
+        Args:
+            file_path: Path to the PDF
+            pdf_parser: 'PyPDF2' or 'pdfplumber'
+
+        Yields:
+            MultimodalContent blocks with the same locations as a serial parse
+        """
+        page_count = self._count_pdf_pages(file_path, pdf_parser)
+        page_ranges = [(first_page, min(first_page + self.pdf_pages_per_task - 1, page_count))
+                       for first_page in range(1, page_count + 1, self.pdf_pages_per_task)]
+
+        if len(page_ranges) <= 1:
+            serial_blocks = (self._iter_pdf_with_pdfplumber if pdf_parser == 'pdfplumber'
+                             else self._iter_pdf_with_pypdf2)
+            yield from serial_blocks(file_path)
+            return
+
+        logger.info(f"Extracting {page_count} PDF pages in {len(page_ranges)} ranges "
+                    f"with {self.pdf_workers} workers")
+
+        executor = self._get_pdf_executor()
+        remaining_ranges = iter(page_ranges)
+        pending = deque()
+
+        def submit_next() -> None:
+            page_range = next(remaining_ranges, None)
+            if page_range is not None:
+                pending.append(executor.submit(_extract_pdf_page_range, str(file_path), pdf_parser, page_range))
+
+        try:
+            for _ in range(2 * self.pdf_workers):
+                submit_next()
+            while pending:
+                range_blocks = pending.popleft().result()
+                submit_next()
+                yield from range_blocks
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool for the next document
+            self.shutdown()
+            raise
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def count_pdf_pages(self, file_path: Union[str, Path]) -> int:
+        """
+        Count the pages of a PDF without extracting its content.
+
+        Args:
+            file_path: Path to the document
+
+        Returns:
+            Page count, or 0 if the file is not a PDF or cannot be read
+        """
+        file_path = Path(file_path)
+        if file_path.suffix.lower() != '.pdf' or not file_path.exists():
+            return 0
+
+        try:
+            import PyPDF2
+            pdf_parser = 'PyPDF2'
+        except ImportError:
+            pdf_parser = 'pdfplumber'
+
+        try:
+            return self._count_pdf_pages(file_path, pdf_parser)
+        except Exception as e:
+            logger.warning(f"Could not count pages of {file_path}: {e}")
+            return 0
+
+    def _count_pdf_pages(self, file_path: Path, pdf_parser: str) -> int:
+        """Count the pages of a PDF with the selected library."""
+        if pdf_parser == 'pdfplumber':
+            import pdfplumber
+            with pdfplumber.open(file_path) as pdf:
+                return len(pdf.pages)
+
+        import PyPDF2
+        with open(file_path, 'rb') as file:
+            return _count_pypdf2_pages(PyPDF2.PdfReader(file))
+
+    def _get_pdf_executor(self) -> ProcessPoolExecutor:
+        """Get the page extraction process pool, starting it on first use."""
+        with self._pdf_executor_lock:
+            if self._pdf_executor is None:
+                self._pdf_executor = ProcessPoolExecutor(max_workers=self.pdf_workers,
+                                                         mp_context=multiprocessing.get_context("spawn"))
+            return self._pdf_executor
+
+    def shutdown(self) -> None:
+        """Stop the page extraction worker processes, if any were started."""
+        with self._pdf_executor_lock:
+            executor, self._pdf_executor = self._pdf_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _parse_pdf_with_pdfplumber(self, file_path: Path) -> List[MultimodalContent]:
         """Parse PDF using pdfplumber (better table support)."""
+        return list(self._iter_pdf_with_pdfplumber(file_path))
+
+    def _iter_pdf_with_pdfplumber(self, file_path: Path,
+                                  page_range: Optional[Tuple[int, int]] = None) -> Iterator[MultimodalContent]:
+        """Parse PDF using pdfplumber, yielding each page's blocks (optionally for pages first..last)."""
         import pdfplumber
         
+        pages = list(range(page_range[0], page_range[1] + 1)) if page_range else None
+        with pdfplumber.open(file_path, pages=pages) as pdf:
+            for page in pdf.pages:
+                page_num = page.page_number
+                try:
+                    page_blocks = self._extract_pdfplumber_page(page, page_num)
+                finally:
+                    # Drop the page's cached layout objects
+                    page.close()
+                yield from page_blocks
+
+    def _extract_pdfplumber_page(self, page, page_num: int) -> List[MultimodalContent]:
+        """Extract text and table blocks from one pdfplumber page."""
         content_blocks = []
+
+        # Extract text
+        text = page.extract_text()
+        if text and text.strip():
+            # Split text into paragraphs and detect code blocks
+            text_blocks = self._process_text_content(text, f"page_{page_num}")
+            content_blocks.extend(text_blocks)
         
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                # Extract text
-                text = page.extract_text()
-                if text and text.strip():
-                    # Split text into paragraphs and detect code blocks
-                    text_blocks = self._process_text_content(text, f"page_{page_num}")
-                    content_blocks.extend(text_blocks)
-                
-                # Extract tables
-                tables = page.extract_tables()
-                for table_num, table in enumerate(tables, 1):
-                    if table:
-                        content_blocks.append(MultimodalContent(
-                            content_type='table',
-                            content=table,
-                            metadata={
-                                'page': page_num,
-                                'table_index': table_num,
-                                'rows': len(table),
-                                'columns': len(table[0]) if table else 0
-                            },
-                            source_location=f"page_{page_num}_table_{table_num}"
-                        ))
+        # Extract tables
+        tables = page.extract_tables()
+        for table_num, table in enumerate(tables, 1):
+            if table:
+                content_blocks.append(MultimodalContent(
+                    content_type='table',
+                    content=table,
+                    metadata={
+                        'page': page_num,
+                        'table_index': table_num,
+                        'rows': len(table),
+                        'columns': len(table[0]) if table else 0
+                    },
+                    source_location=f"page_{page_num}_table_{table_num}"
+                ))
         
         return content_blocks
     
     def _parse_pdf_with_pypdf2(self, file_path: Path) -> List[MultimodalContent]:
         """Parse PDF using PyPDF2 (basic text extraction)."""
+        return list(self._iter_pdf_with_pypdf2(file_path))
+
+    def _iter_pdf_with_pypdf2(self, file_path: Path,
+                              page_range: Optional[Tuple[int, int]] = None) -> Iterator[MultimodalContent]:
+        """Parse PDF using PyPDF2, yielding each page's blocks (optionally for pages first..last)."""
         import PyPDF2
         
-        content_blocks = []
-        
         with open(file_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
+            first_page, last_page = page_range or (1, _count_pypdf2_pages(pdf_reader))
             
-            for page_num, page in enumerate(pdf_reader.pages, 1):
+            for page_num, page in _iter_pypdf2_pages(pdf_reader, first_page, last_page):
                 text = page.extract_text()
+                if page_num % PYPDF2_CACHE_PAGES == 0:
+                    # Release parsed objects (page dictionaries, content streams, fonts) cached by the reader
+                    pdf_reader.resolved_objects.clear()
                 if text and text.strip():
-                    text_blocks = self._process_text_content(text, f"page_{page_num}")
-                    content_blocks.extend(text_blocks)
-        
-        return content_blocks
+                    yield from self._process_text_content(text, f"page_{page_num}")
     
     def _parse_docx(self, file_path: Path) -> List[MultimodalContent]:
         """Parse DOCX documents."""
@@ -649,6 +842,84 @@ class MultimodalDocumentParser:
         
         return stats
 
+def _count_pypdf2_pages(pdf_reader) -> int:
+    """Page count from the page tree root, without building PyPDF2's list of all pages."""
+    return int(pdf_reader.trailer["/Root"]["/Pages"].get_object()["/Count"])
+
+
+def _iter_pypdf2_pages(pdf_reader, first_page: int, last_page: int) -> Iterator[Tuple[int, Any]]:
+    """
+    Walk the PDF page tree, yielding (page number, PageObject) for pages first..last.
+
+    PdfReader.pages flattens the whole tree into one PageObject per page on
+    first access. This walk keeps only the path to the current page, skips
+    subtrees outside the range by their /Count, and applies inherited page
+    attributes the same way PyPDF2 does. /Pages nodes that were already
+    entered are skipped, so a malformed /Kids entry pointing back to an
+    ancestor cannot make the walk loop forever.
+    """
+    from PyPDF2 import PageObject
+    from PyPDF2.generic import IndirectObject, NameObject
+
+    # Stack of (kids iterator, inherited attributes) for the /Pages nodes on the current path
+    stack = [(iter([pdf_reader.trailer["/Root"].raw_get("/Pages")]), {})]
+    entered = set()
+    page_num = 0
+
+    while stack and page_num < last_page:
+        kids, inherited = stack[-1]
+        reference = next(kids, None)
+        if reference is None:
+            stack.pop()
+            continue
+
+        node = reference.get_object()
+        if node.get("/Type", "/Pages") == "/Pages":
+            node_key = ((reference.idnum, reference.generation) if isinstance(reference, IndirectObject)
+                        else id(node))
+            if node_key in entered:
+                logger.warning(f"Skipping repeated /Pages node {node_key} in PDF page tree")
+                continue
+            entered.add(node_key)
+
+            count = int(node.get("/Count", 0))
+            if count and page_num + count < first_page:
+                page_num += count
+                continue
+            node_inherited = dict(inherited)
+            node_inherited.update({key: node[key] for key in PYPDF2_INHERITED_ATTRIBUTES if key in node})
+            stack.append((iter(node.get("/Kids", [])), node_inherited))
+            continue
+
+        page_num += 1
+        if page_num < first_page:
+            continue
+        page = PageObject(pdf_reader, reference if reference is not node else None)
+        page.update(node)
+        for key, value in inherited.items():
+            if key not in page:
+                page[NameObject(key)] = value
+        yield page_num, page
+
+
+def _extract_pdf_page_range(file_path: str, pdf_parser: str,
+                            page_range: Tuple[int, int]) -> List[MultimodalContent]:
+    """
+    Extract the content blocks of a PDF page range (runs in a worker process).
+
+    Args:
+        file_path: Path to the PDF
+        pdf_parser: 'PyPDF2' or 'pdfplumber'
+        page_range: First and last page number (1-based, inclusive)
+
+    Returns:
+        Content blocks of the range in page order
+    """
+    parser = get_document_parser()
+    if pdf_parser == 'pdfplumber':
+        return list(parser._iter_pdf_with_pdfplumber(Path(file_path), page_range))
+    return list(parser._iter_pdf_with_pypdf2(Path(file_path), page_range))
+
 # Global parser instance
 _document_parser = None
 
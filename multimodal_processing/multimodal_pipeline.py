@@ -9,7 +9,7 @@ import logging
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable
 from dataclasses import asdict
 
 from .document_parser import get_document_parser, ParsedDocument
@@ -22,6 +22,10 @@ from sam.cognition.table_processing.sam_integration import get_table_aware_chunk
 
 logger = logging.getLogger(__name__)
 
+# PDFs with at least this many pages are stored block by block while they are
+# parsed instead of being parsed whole for the full pipeline
+STREAM_PDF_MIN_PAGES = 200
+
 class MultimodalProcessingPipeline:
     """
     Complete pipeline for processing multimodal documents and integrating with SAM's knowledge base.
@@ -65,22 +69,40 @@ class MultimodalProcessingPipeline:
         logger.info(f"Multimodal processing pipeline initialized")
         logger.info(f"Output directory: {self.output_dir}")
     
-    def process_document(self, file_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    def process_document(self, file_path: Union[str, Path],
+                         progress_callback: Optional[Callable[[str, float], bool]] = None) -> Optional[Dict[str, Any]]:
         """
         Process a single multimodal document through the complete pipeline.
+
+        PDFs with at least STREAM_PDF_MIN_PAGES pages are streamed into the
+        memory system instead (see _process_streamed_document), which skips
+        the whole-document steps.
         
         Args:
             file_path: Path to the document to process
+            progress_callback: Optional callable(stage, progress) invoked before each
+                pipeline stage; returning False stops processing early
             
         Returns:
-            Processing results dictionary or None if processing failed
+            Processing results dictionary or None if processing failed or was stopped
         """
         file_path = Path(file_path)
+
+        def report(stage: str, progress: float) -> bool:
+            if progress_callback is None or progress_callback(stage, progress) is not False:
+                return True
+            logger.info(f"Processing stopped before stage '{stage}': {file_path}")
+            return False
         
         try:
             logger.info(f"Starting multimodal processing: {file_path}")
             
             # Step 1: Parse document
+            if not report('parsing', 0.05):
+                return None
+            if self.document_parser.count_pdf_pages(file_path) >= STREAM_PDF_MIN_PAGES:
+                return self._process_streamed_document(file_path, report)
+
             parsed_doc = self.document_parser.parse_document(file_path)
             if not parsed_doc:
                 logger.error(f"Failed to parse document: {file_path}")
@@ -90,10 +112,9 @@ class MultimodalProcessingPipeline:
             logger.info(f"Parsed document: {len(parsed_doc.content_blocks)} content blocks")
             self.processing_stats['total_content_blocks'] += len(parsed_doc.content_blocks)
 
-            # Step 1.5: Process tables with semantic role classification
-            table_processing_result = self._process_tables_in_document(parsed_doc, file_path)
-
             # Step 2: Consolidate knowledge
+            if not report('consolidation', 0.3):
+                return None
             consolidated = self.knowledge_consolidator.consolidate_document(parsed_doc)
             if not consolidated:
                 logger.error(f"Failed to consolidate knowledge: {file_path}")
@@ -104,18 +125,30 @@ class MultimodalProcessingPipeline:
             self.processing_stats['consolidated_knowledge_items'] += 1
             
             # Step 3: Score enrichment value
+            if not report('enrichment_scoring', 0.55):
+                return None
             enrichment_score = self.enrichment_scorer.score_consolidated_knowledge(consolidated)
             
             logger.info(f"Enrichment score: {enrichment_score.overall_score:.2f} ({enrichment_score.priority_level})")
             
             # Step 4: Add to vector store
+            if not report('vector_indexing', 0.65):
+                return None
             self.vector_manager.add_consolidated_knowledge(consolidated, enrichment_score)
             self.processing_stats['vector_store_additions'] += 1
 
+            # Step 4.2: Process tables with semantic role classification; this writes
+            # the tables to the table store and their chunks to memory
+            # (no early stop from here on: the vector store already holds this document)
+            report('table_processing', 0.7)
+            table_processing_result = self._process_tables_in_document(parsed_doc, file_path)
+
             # Step 4.5: Store in memory system for Q&A retrieval
+            report('memory_storage', 0.75)
             memory_storage_result = self._store_document_in_memory(parsed_doc, consolidated, enrichment_score)
 
             # Step 5: Save processing outputs
+            report('saving_outputs', 0.9)
             processing_result = self._save_processing_outputs(parsed_doc, consolidated, enrichment_score)
 
             # Add memory storage information to processing result
@@ -141,6 +174,49 @@ class MultimodalProcessingPipeline:
             self.processing_stats['processing_errors'] += 1
             return None
     
+    def _process_streamed_document(self, file_path: Path,
+                                   report: Callable[[str, float], bool]) -> Optional[Dict[str, Any]]:
+        """
+        Process a large document by streaming its content blocks into memory.
+
+        Parser memory stays bounded by a few pages instead of the whole block
+        list. The steps that need the whole document are skipped: knowledge
+        consolidation, enrichment scoring, vector store indexing, table
+        processing, the document summary memory and the saved output files.
+
+        Args:
+            file_path: Path to the document to process
+            report: Stage reporter of process_document
+
+        Returns:
+            Processing results dictionary shaped like process_document's, or
+            None if no content could be parsed
+        """
+        logger.info(f"Streaming large document into memory: {file_path}")
+
+        # No early stop: blocks are stored from the first page on
+        report('memory_storage', 0.1)
+        memory_storage_result = self.stream_document_to_memory(file_path)
+        if not memory_storage_result:
+            return None
+
+        return {
+            'document_id': memory_storage_result['document_id'],
+            'source_file': memory_storage_result['source_file'],
+            'output_directory': None,
+            'content_blocks': memory_storage_result['blocks_parsed'],
+            'summary_length': 0,
+            'key_concepts': 0,
+            'enrichment_score': 0.0,
+            'priority_level': 'unscored',
+            'content_types': list(memory_storage_result['content_type_counts']),
+            'processing_timestamp': datetime.now().isoformat(),
+            'memory_storage': memory_storage_result,
+            'streamed': True,
+            'skipped_steps': ['consolidation', 'enrichment_scoring', 'vector_indexing',
+                              'table_processing', 'saving_outputs']
+        }
+
     def process_documents_batch(self, file_paths: List[Union[str, Path]]) -> List[Dict[str, Any]]:
         """
         Process multiple documents in batch.
@@ -428,45 +504,16 @@ Enrichment Score: {enrichment_score.overall_score:.2f} ({enrichment_score.priori
             # Store individual content blocks for detailed Q&A
             content_chunk_ids = []
             for i, content_block in enumerate(parsed_doc.content_blocks):
-                # Handle different content types properly
-                content_str = ""
-                if isinstance(content_block.content, str):
-                    content_str = content_block.content.strip()
-                elif isinstance(content_block.content, list):
-                    # Handle table content (list of lists)
-                    if content_block.content and all(isinstance(row, list) for row in content_block.content):
-                        # Convert table to string representation
-                        content_str = "\n".join(["\t".join(row) for row in content_block.content])
-                    else:
-                        content_str = str(content_block.content)
-                elif isinstance(content_block.content, dict):
-                    # Handle image/metadata content
-                    content_str = str(content_block.content)
-                else:
-                    content_str = str(content_block.content)
+                content_str = self._block_content_to_text(content_block)
 
                 if content_str:  # Only store non-empty content
 
                     # Create detailed content for this block
-                    block_content = f"""Document: {parsed_doc.source_file} (Block {i+1})
-Content Type: {content_block.content_type}
-
-{content_str}
-"""
-
-                    # Add metadata if available
-                    if content_block.metadata:
-                        metadata_str = "\n".join([f"{k}: {v}" for k, v in content_block.metadata.items()])
-                        block_content += f"\n\nMetadata:\n{metadata_str}"
+                    block_content = self._format_block_memory(parsed_doc.source_file, i, content_block, content_str)
 
                     # Determine importance based on content type and enrichment score
-                    block_importance = enrichment_score.overall_score / 10.0
-                    if content_block.content_type in ['code', 'table']:
-                        block_importance *= 1.2  # Boost technical content
-                    elif content_block.content_type == 'image':
-                        block_importance *= 0.8  # Lower importance for images without text
-
-                    block_importance = min(block_importance, 1.0)  # Cap at 1.0
+                    block_importance = self._block_importance(content_block.content_type,
+                                                              enrichment_score.overall_score / 10.0)
 
                     chunk_id = self.memory_store.add_memory(
                         content=block_content,
@@ -514,6 +561,141 @@ Content Type: {content_block.content_type}
             logger.error(f"Error storing document in memory: {e}")
             return None
 
+    def stream_document_to_memory(self, file_path: Union[str, Path],
+                                  progress_callback: Optional[Callable[[int], bool]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Store a document's content blocks in the memory system while it is parsed.
+
+        Blocks are stored as the parser yields them (page by page for PDFs), so
+        memory use does not grow with document length and the first blocks are
+        searchable before parsing finishes. Whole-document steps (consolidation,
+        enrichment scoring and table detection) are not run; process_document
+        runs them for documents below STREAM_PDF_MIN_PAGES pages.
+
+        Args:
+            file_path: Path to the document to process
+            progress_callback: Optional callable(blocks_stored) invoked after each
+                stored block; returning False stops processing early
+
+        Returns:
+            Dictionary with the document ID, stored chunk IDs and block counts per
+            content type, or None if no content could be parsed
+        """
+        file_path = Path(file_path)
+        source_file = str(file_path)
+        document_id = self.document_parser._generate_document_id(file_path)
+        content_chunk_ids = []
+        content_type_counts: Dict[str, int] = {}
+        blocks_parsed = 0
+        stopped = False
+
+        try:
+            logger.info(f"Streaming document into memory system: {file_path}")
+
+            for i, content_block in enumerate(self.document_parser.iter_content_blocks(file_path)):
+                blocks_parsed += 1
+                content_str = self._block_content_to_text(content_block)
+                if not content_str:
+                    continue
+
+                chunk_id = self.memory_store.add_memory(
+                    content=self._format_block_memory(source_file, i, content_block, content_str),
+                    memory_type=MemoryType.DOCUMENT,
+                    source=f"document:{source_file}:block_{i+1}",
+                    tags=["document", "content_block", content_block.content_type, f"block_{i+1}"],
+                    importance_score=self._block_importance(content_block.content_type, 0.5),
+                    metadata={
+                        "document_id": document_id,
+                        "source_file": source_file,
+                        "file_name": file_path.name,
+                        "block_index": i,
+                        "content_type": content_block.content_type,
+                        "block_metadata": content_block.metadata,
+                        "document_type": "content_block",
+                        "block_length": len(content_str),
+                        "upload_timestamp": datetime.now().isoformat()
+                    }
+                )
+
+                content_chunk_ids.append(chunk_id)
+                content_type_counts[content_block.content_type] = \
+                    content_type_counts.get(content_block.content_type, 0) + 1
+
+                if progress_callback is not None and progress_callback(len(content_chunk_ids)) is False:
+                    logger.info(f"Streaming stopped after {len(content_chunk_ids)} blocks: {file_path}")
+                    stopped = True
+                    break
+
+        except Exception as e:
+            logger.error(f"Error streaming document {file_path} into memory: {e}")
+            self.processing_stats['processing_errors'] += 1
+            if not content_chunk_ids:
+                return None
+
+        self.processing_stats['total_content_blocks'] += blocks_parsed
+        self.processing_stats['memory_store_additions'] += len(content_chunk_ids)
+
+        if not blocks_parsed:
+            logger.error(f"No content parsed from document: {file_path}")
+            self.processing_stats['processing_errors'] += 1
+            return None
+
+        if not stopped:
+            self.processing_stats['documents_processed'] += 1
+
+        logger.info(f"Streamed document into memory: {len(content_chunk_ids)} content blocks")
+        return {
+            "document_id": document_id,
+            "source_file": source_file,
+            "content_chunk_ids": content_chunk_ids,
+            "content_type_counts": content_type_counts,
+            "blocks_parsed": blocks_parsed,
+            "total_chunks_stored": len(content_chunk_ids),
+            "completed": not stopped
+        }
+
+    @staticmethod
+    def _block_content_to_text(content_block) -> str:
+        """Render a content block's content as text for memory storage."""
+        # Handle different content types properly
+        if isinstance(content_block.content, str):
+            return content_block.content.strip()
+        if isinstance(content_block.content, list):
+            # Handle table content (list of lists)
+            if content_block.content and all(isinstance(row, list) for row in content_block.content):
+                # Convert table to string representation
+                return "\n".join(["\t".join(row) for row in content_block.content])
+            return str(content_block.content)
+        # Handle image/metadata content
+        return str(content_block.content)
+
+    @staticmethod
+    def _format_block_memory(source_file: str, block_index: int, content_block, content_str: str) -> str:
+        """Build the memory content stored for a single content block."""
+        block_content = f"""Document: {source_file} (Block {block_index+1})
+Content Type: {content_block.content_type}
+
+{content_str}
+"""
+
+        # Add metadata if available
+        if content_block.metadata:
+            metadata_str = "\n".join([f"{k}: {v}" for k, v in content_block.metadata.items()])
+            block_content += f"\n\nMetadata:\n{metadata_str}"
+
+        return block_content
+
+    @staticmethod
+    def _block_importance(content_type: str, base_importance: float) -> float:
+        """Adjust a block's importance score for its content type."""
+        block_importance = base_importance
+        if content_type in ['code', 'table']:
+            block_importance *= 1.2  # Boost technical content
+        elif content_type == 'image':
+            block_importance *= 0.8  # Lower importance for images without text
+
+        return min(block_importance, 1.0)  # Cap at 1.0
+
     def _process_tables_in_document(self, parsed_doc: ParsedDocument, file_path: Path) -> Optional[TableProcessingResult]:
         """
         Process tables in the document using the table processing system.
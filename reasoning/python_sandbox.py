@@ -0,0 +1,208 @@
+"""
+PythonSandboxPool: Warm worker processes for the python_interpreter tool.
+
+Running tool code with exec in SAM's own process cannot be interrupted,
+and redirecting sys.stdout there captures the output of every other thread.
+This module runs each snippet in a pool of worker processes, started with
+the "spawn" method so they share no state with SAM, and started up front so
+a call does not pay interpreter startup. The pool is the shared
+core.worker_pool.SpawnWorkerPool in keep-warm mode.
+
+Each job is limited by:
+- a wall-clock timeout, after which its worker is killed and replaced
+- a CPU time rlimit, as a backstop if the parent stops waiting
+- an address space rlimit on the worker (Unix only)
+
+Workers run one job at a time, so stdout is captured per job.
+"""
+
+import atexit
+import io
+import logging
+import math
+import signal
+import threading
+from contextlib import redirect_stdout
+from typing import Optional, Dict, Any
+
+from core.worker_pool import SpawnWorkerPool, WorkerCrashError, WorkerPoolError, WorkerTimeoutError
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:
+    RESOURCE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Builtins available to sandboxed code
+SAFE_BUILTINS = (
+    'print', 'len', 'str', 'int', 'float', 'list', 'dict', 'tuple', 'set', 'range',
+    'enumerate', 'zip', 'sum', 'min', 'max', 'abs', 'round', 'sorted', 'reversed'
+)
+
+
+def run_python_job(code: str) -> Dict[str, Any]:
+    """
+    Execute code with restricted builtins, capturing its stdout.
+
+    Args:
+        code: Python source to execute
+
+    Returns:
+        Result dictionary with success, output, variables and error
+    """
+    import builtins
+    import math as math_module
+
+    safe_globals = {
+        '__builtins__': {name: getattr(builtins, name) for name in SAFE_BUILTINS},
+        'math': math_module
+    }
+    local_vars = {}
+    captured_output = io.StringIO()
+
+    try:
+        with redirect_stdout(captured_output):
+            exec(code, safe_globals, local_vars)
+
+        return {
+            'success': True,
+            'output': captured_output.getvalue(),
+            'variables': {k: str(v) for k, v in local_vars.items() if not k.startswith('_')},
+            'error': None,
+            'timed_out': False
+        }
+
+    except BaseException as e:
+        return {
+            'success': False,
+            'output': captured_output.getvalue(),
+            'variables': {},
+            'error': str(e) or type(e).__name__,
+            'timed_out': False
+        }
+
+
+def _process_memory_bytes() -> int:
+    """Virtual memory size of this process (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * resource.getpagesize()
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _limit_cpu(cpu_seconds: float) -> None:
+    """Allow this process cpu_seconds more CPU time before SIGXCPU."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _limit_memory(memory_limit_mb: int) -> None:
+    """Worker initializer: cap the address space at memory_limit_mb beyond the current footprint."""
+    if RESOURCE_AVAILABLE and memory_limit_mb > 0:
+        # The budget is on top of the interpreter's own footprint
+        limit = _process_memory_bytes() + memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def run_sandbox_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker job runner: apply the job's CPU limit, then run its code."""
+    if RESOURCE_AVAILABLE:
+        _limit_cpu(job['cpu_seconds'])
+    return run_python_job(job['code'])
+
+
+class PythonSandboxPool(SpawnWorkerPool):
+    """
+    Pool of pre-warmed, isolated Python execution workers.
+
+    All pool_size workers are started when the pool is created, and a
+    worker that is killed or recycled is replaced right away. run() blocks
+    while every worker is busy.
+    """
+
+    def __init__(self, pool_size: int = 2, max_jobs_per_worker: int = 100, memory_limit_mb: int = 100):
+        """
+        Initialize the pool and start its workers.
+
+        Args:
+            pool_size: Number of worker processes
+            max_jobs_per_worker: Jobs a worker runs before it is replaced
+            memory_limit_mb: Address space a worker may use beyond its
+                startup footprint (0 for no limit)
+        """
+        self.memory_limit_mb = memory_limit_mb
+        super().__init__(run_sandbox_job, pool_size, max_jobs_per_worker,
+                         initializer=_limit_memory, initargs=(memory_limit_mb,),
+                         keep_warm=True, name="sam-python-sandbox")
+
+    def run(self, code: str, timeout: float, cpu_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Execute code on a pooled worker.
+
+        Args:
+            code: Python source to execute
+            timeout: Wall-clock limit in seconds, counted from when a
+                worker receives the job
+            cpu_seconds: CPU time limit (default timeout + 1)
+
+        Returns:
+            Result dictionary from run_python_job; timeouts and crashed
+            workers are reported as unsuccessful results
+
+        Raises:
+            RuntimeError: If the pool is shut down
+        """
+        cpu_seconds = cpu_seconds if cpu_seconds is not None else timeout + 1
+        try:
+            return super().run({'code': code, 'cpu_seconds': cpu_seconds}, timeout)
+        except WorkerTimeoutError:
+            logger.warning(f"Python execution timed out after {timeout} seconds")
+            return self._error_result(f"Execution timed out after {timeout} seconds", timed_out=True)
+        except WorkerCrashError as e:
+            return self._error_result(self._describe_exit(e.exitcode))
+        except WorkerPoolError as e:
+            raise RuntimeError(str(e))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {**super().get_stats(), 'memory_limit_mb': self.memory_limit_mb}
+
+    @staticmethod
+    def _error_result(error: str, timed_out: bool = False) -> Dict[str, Any]:
+        """Build an unsuccessful result payload."""
+        return {'success': False, 'output': '', 'variables': {}, 'error': error, 'timed_out': timed_out}
+
+    @staticmethod
+    def _describe_exit(exitcode: Optional[int]) -> str:
+        """Explain why a worker exited during a job."""
+        if exitcode == -getattr(signal, 'SIGXCPU', 0):
+            return "Execution exceeded its CPU time limit"
+        if exitcode == -signal.SIGKILL:
+            return "Execution was killed (memory limit exceeded?)"
+        return f"Sandbox worker exited unexpectedly (exit code {exitcode})"
+
+
+# Global instance for easy access
+_python_sandbox_pool: Optional[PythonSandboxPool] = None
+_python_sandbox_pool_lock = threading.Lock()
+
+
+def get_python_sandbox_pool(pool_size: int = 2, max_jobs_per_worker: int = 100,
+                            memory_limit_mb: int = 100) -> PythonSandboxPool:
+    """Get global Python sandbox pool instance."""
+    global _python_sandbox_pool
+    with _python_sandbox_pool_lock:
+        if _python_sandbox_pool is None:
+            _python_sandbox_pool = PythonSandboxPool(pool_size, max_jobs_per_worker, memory_limit_mb)
+            atexit.register(_python_sandbox_pool.shutdown)
+        return _python_sandbox_pool
@@ -7,6 +7,10 @@ Sprint 5 Task 1: SELF-DECIDE Framework Integration
 
 import logging
 import json
+import math
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -87,7 +91,8 @@ class SelfDecideFramework:
     10. Evaluate Response Quality - Assess answer completeness and accuracy
     """
 
-    def __init__(self, model=None, vector_manager=None, tool_selector=None):
+    def __init__(self, model=None, vector_manager=None, tool_selector=None,
+                 max_parallel_tools: int = 4, tool_timeout_seconds: float = 30.0):
         """
         Initialize the SELF-DECIDE framework.
 
@@ -95,10 +100,14 @@ class SelfDecideFramework:
             model: Language model for reasoning
             vector_manager: Vector store for knowledge retrieval
             tool_selector: Tool selection module
+            max_parallel_tools: Maximum number of tools executing at once in step 6
+            tool_timeout_seconds: Time a tool may run before it is reported as timed out
         """
         self.model = model
         self.vector_manager = vector_manager
         self.tool_selector = tool_selector
+        self.max_parallel_tools = max(1, max_parallel_tools)
+        self.tool_timeout_seconds = tool_timeout_seconds
 
         # Session tracking
         self.active_sessions: Dict[str, SelfDecideSession] = {}
@@ -527,41 +536,9 @@ Analysis:"""
             tools_step = next((s for s in session.reasoning_steps if s.step == ReasoningStep.DECIDE_TOOLS), None)
             selected_tools = tools_step.output_data.get('selected_tools', []) if tools_step else []
 
-            tool_results = []
-
-            # Execute each selected tool
-            for tool_config in selected_tools:
-                tool_name = tool_config.get('tool_name')
-                input_params = tool_config.get('input_params', {})
-
-                try:
-                    # Execute tool (placeholder - will be implemented with actual tool executor)
-                    result = self._execute_single_tool(tool_name, input_params)
-
-                    tool_execution = {
-                        'tool_name': tool_name,
-                        'input_params': input_params,
-                        'result': result,
-                        'success': result.get('success', False),
-                        'execution_time_ms': result.get('execution_time_ms', 0),
-                        'timestamp': datetime.now().isoformat()
-                    }
-
-                    tool_results.append(tool_execution)
-                    session.tool_executions.append(tool_execution)
-
-                except Exception as e:
-                    logger.error(f"Tool execution failed for {tool_name}: {e}")
-                    tool_execution = {
-                        'tool_name': tool_name,
-                        'input_params': input_params,
-                        'result': {'success': False, 'error': str(e)},
-                        'success': False,
-                        'execution_time_ms': 0,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    tool_results.append(tool_execution)
-                    session.tool_executions.append(tool_execution)
+            # Selected tools are independent, so they run concurrently; results keep plan order
+            tool_results = self._execute_tools_concurrently(selected_tools)
+            session.tool_executions.extend(tool_results)
 
             successful_executions = sum(1 for r in tool_results if r['success'])
 
@@ -724,6 +701,88 @@ Analysis:"""
 
     # Helper methods for SELF-DECIDE steps
 
+    def _execute_tools_concurrently(self, selected_tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute tools on a bounded thread pool with a per-tool timeout.
+
+        Args:
+            selected_tools: Tool configurations from step 5
+
+        Returns:
+            Tool execution records in the order of selected_tools
+        """
+        if not selected_tools:
+            return []
+
+        workers = min(self.max_parallel_tools, len(selected_tools))
+        timeout = self.tool_timeout_seconds
+        started = [threading.Event() for _ in selected_tools]
+        start_times: Dict[int, float] = {}
+
+        def run(index: int, tool_config: Dict[str, Any]) -> Dict[str, Any]:
+            start_times[index] = time.monotonic()
+            started[index].set()
+            return self._run_tool_execution(tool_config)
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="self-decide-tool")
+        # A queued tool waits for a slot; hung tools keep theirs, so bound the whole step
+        step_deadline = time.monotonic() + timeout * math.ceil(len(selected_tools) / workers)
+        futures = [executor.submit(run, index, tool_config) for index, tool_config in enumerate(selected_tools)]
+
+        tool_results = []
+        try:
+            for index, (tool_config, future) in enumerate(zip(selected_tools, futures)):
+                started[index].wait(max(0.0, step_deadline - time.monotonic()))
+                tool_deadline = min(start_times.get(index, step_deadline) + timeout, step_deadline)
+
+                try:
+                    tool_results.append(future.result(timeout=max(0.0, tool_deadline - time.monotonic())))
+                except FuturesTimeoutError:
+                    tool_name = tool_config.get('tool_name')
+                    logger.warning(f"Tool {tool_name} timed out after {timeout} seconds")
+                    tool_results.append(self._failed_tool_execution(
+                        tool_config, f"Tool timed out after {timeout} seconds",
+                        int(timeout * 1000) if index in start_times else 0))
+        finally:
+            # Timed-out tools cannot be interrupted; their threads finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return tool_results
+
+    def _run_tool_execution(self, tool_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one selected tool and build its execution record."""
+        tool_name = tool_config.get('tool_name')
+        input_params = tool_config.get('input_params', {})
+
+        try:
+            # Execute tool (placeholder - will be implemented with actual tool executor)
+            result = self._execute_single_tool(tool_name, input_params)
+
+            return {
+                'tool_name': tool_name,
+                'input_params': input_params,
+                'result': result,
+                'success': result.get('success', False),
+                'execution_time_ms': result.get('execution_time_ms', 0),
+                'timestamp': datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            logger.error(f"Tool execution failed for {tool_name}: {e}")
+            return self._failed_tool_execution(tool_config, str(e), 0)
+
+    def _failed_tool_execution(self, tool_config: Dict[str, Any], error: str,
+                               execution_time_ms: int) -> Dict[str, Any]:
+        """Build the execution record of a tool that failed or timed out."""
+        return {
+            'tool_name': tool_config.get('tool_name'),
+            'input_params': tool_config.get('input_params', {}),
+            'result': {'success': False, 'error': error},
+            'success': False,
+            'execution_time_ms': execution_time_ms,
+            'timestamp': datetime.now().isoformat()
+        }
+
     def _execute_single_tool(self, tool_name: str, input_params: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a single tool and return results."""
         # Placeholder implementation - will be replaced with actual tool executor
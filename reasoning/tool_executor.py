@@ -9,14 +9,14 @@ import logging
 import subprocess
 import tempfile
 import json
-import io
-import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import traceback
 
+from .python_sandbox import get_python_sandbox_pool
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -434,62 +434,18 @@ class ToolExecutor:
             raise ValueError("File operations not allowed in safety mode")
     
     def _execute_python_code_safely(self, code: str, timeout: int) -> Dict[str, Any]:
-        """Execute Python code in a safe environment."""
+        """
+        Execute Python code in a pooled sandbox process.
+
+        The worker enforces the wall-clock timeout and the CPU and memory
+        limits, and captures stdout for this call only.
+        """
         try:
-            # Capture stdout
-            old_stdout = sys.stdout
-            sys.stdout = captured_output = io.StringIO()
-            
-            # Create restricted globals
-            safe_globals = {
-                '__builtins__': {
-                    'print': print,
-                    'len': len,
-                    'str': str,
-                    'int': int,
-                    'float': float,
-                    'list': list,
-                    'dict': dict,
-                    'tuple': tuple,
-                    'set': set,
-                    'range': range,
-                    'enumerate': enumerate,
-                    'zip': zip,
-                    'sum': sum,
-                    'min': min,
-                    'max': max,
-                    'abs': abs,
-                    'round': round,
-                    'sorted': sorted,
-                    'reversed': reversed
-                }
-            }
-            
-            # Add math functions
-            import math
-            safe_globals['math'] = math
-            
-            # Execute code
-            local_vars = {}
-            exec(code, safe_globals, local_vars)
-            
-            # Get output
-            output = captured_output.getvalue()
-            
-            # Restore stdout
-            sys.stdout = old_stdout
-            
-            return {
-                'success': True,
-                'output': output,
-                'variables': {k: str(v) for k, v in local_vars.items() if not k.startswith('_')},
-                'error': None
-            }
-            
+            pool = get_python_sandbox_pool(memory_limit_mb=self.python_restrictions['max_memory_mb'])
+            return pool.run(code, timeout)
+
         except Exception as e:
-            # Restore stdout
-            sys.stdout = old_stdout
-            
+            logger.error(f"Python sandbox execution failed: {e}")
             return {
                 'success': False,
                 'output': '',
@@ -17,7 +17,7 @@ from .state import PlanningState
 from .search_node import SearchNode, SearchNodeFactory
 from .frontier import Frontier
 from .sam_tool_registry import SAMTool, ToolCategory, SAMToolRegistry, get_sam_tool_registry
-from .state_similarity import SimilarityMetrics, StateSimilarityDetector
+from .state_similarity import SimilarityMetrics, StateLSHIndex, StateSimilarityDetector
 from .sam_context_manager import (
     DocumentContext, MemoryContext, ConversationContext, SAMContextManager
 )
@@ -38,6 +38,7 @@ __all__ = [
     'SAMToolRegistry',
     'get_sam_tool_registry',
     'SimilarityMetrics',
+    'StateLSHIndex',
     'StateSimilarityDetector',
     'DocumentContext',
     'MemoryContext',
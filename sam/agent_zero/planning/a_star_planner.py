@@ -327,8 +327,8 @@ class AStarPlanner:
         # Get possible actions
         possible_actions = self.action_expander.get_next_possible_actions(node.state)
         
-        # Create child nodes
-        child_nodes = []
+        # Create child states
+        candidates = []
         for action in possible_actions:
             # Simulate action execution (in real implementation, this would execute the action)
             observation = f"Executed {action}"
@@ -341,10 +341,14 @@ class AStarPlanner:
             if child_signature in self.visited_states:
                 continue
             
-            # Get heuristic estimate for child
-            h_score = self.heuristic_estimator.estimate_cost_to_go(child_state)
-            
-            # Create child node
+            candidates.append((action, observation, child_state))
+        
+        # Score all children together (one batched/concurrent heuristic request)
+        h_scores = self.heuristic_estimator.estimate_costs_to_go([state for _, _, state in candidates])
+        
+        # Create child nodes
+        child_nodes = []
+        for (action, observation, _), h_score in zip(candidates, h_scores):
             child_node = SearchNodeFactory.create_child_node(node, action, observation, h_score)
             child_nodes.append(child_node)
         
@@ -150,6 +150,25 @@ class EpisodicMemoryHeuristic(HeuristicEstimator):
         """
         # Get base estimate from parent class
         base_estimate = super().get_detailed_estimate(state)
+        return self._apply_experience_learning(state, base_estimate)
+    
+    def get_detailed_estimates(self, states: List[PlanningState]) -> List[HeuristicEstimate]:
+        """
+        Get experience-adjusted estimates for several states at once.
+        
+        Args:
+            states: Planning states to estimate costs for
+            
+        Returns:
+            Enhanced HeuristicEstimates, in the same order as states
+        """
+        base_estimates = super().get_detailed_estimates(states)
+        return [self._apply_experience_learning(state, estimate)
+                for state, estimate in zip(states, base_estimates)]
+    
+    def _apply_experience_learning(self, state: PlanningState,
+                                   base_estimate: HeuristicEstimate) -> HeuristicEstimate:
+        """Apply the experience-based adjustment to a base estimate."""
         
         # Apply experience-based learning if enabled
         if self.enable_experience_learning and self.episodic_store:
@@ -8,43 +8,67 @@ and managing search nodes.
 
 import heapq
 import logging
-from typing import List, Optional, Set, Dict, Any
-from collections import defaultdict
+from typing import List, Optional, Dict, Any
+from collections import deque
 from .search_node import SearchNode
 
 logger = logging.getLogger(__name__)
 
 
+class _WorstFirst:
+    """Heap entry that orders SearchNodes worst-first (for the eviction heap)."""
+    
+    __slots__ = ('node',)
+    
+    def __init__(self, node: SearchNode):
+        self.node = node
+    
+    def __lt__(self, other: '_WorstFirst') -> bool:
+        return other.node.is_better_than(self.node)
+
+
 class Frontier:
     """
     Priority queue for managing SearchNodes in A* search.
     
-    This class wraps Python's heapq module to provide a clean interface
-    for managing the frontier of nodes to explore. It includes optimizations
-    for duplicate detection and frontier management.
+    Nodes live in two heaps: a min-heap ordered best-first for popping and a
+    max-heap ordered worst-first for evicting when the frontier is bounded.
+    Removing a node from one heap leaves a stale entry in the other, which is
+    skipped lazily and compacted away once stale entries outnumber live ones,
+    so pop and bounded add are both O(log n) amortized.
     """
     
-    def __init__(self, max_size: Optional[int] = None):
+    def __init__(self, max_size: Optional[int] = None, history_size: int = 1000):
         """
         Initialize the frontier.
         
         Args:
             max_size: Optional maximum size limit for the frontier
+            history_size: Number of recent size samples kept for statistics
         """
-        self._heap: List[SearchNode] = []
-        self._node_set: Set[str] = set()  # Track state IDs for duplicate detection
+        self._heap: List[SearchNode] = []  # best-first
+        self._worst_heap: List[_WorstFirst] = []  # worst-first
+        self._nodes: Dict[str, SearchNode] = {}  # live nodes by state ID
         self._max_size = max_size
         self._total_added = 0
         self._total_popped = 0
+        self._total_evicted = 0
         
-        # Statistics tracking
-        self._size_history: List[int] = []
-        self._best_f_score_history: List[int] = []
+        # Statistics tracking (bounded ring of recent sizes plus running aggregates)
+        self._size_history: deque = deque(maxlen=history_size)
+        self._max_size_reached = 0
+        self._size_sum = 0
+        self._size_samples = 0
+        self._initial_best_f_score: Optional[int] = None
+        self._best_f_score_ever: Optional[int] = None
     
     def add(self, node: SearchNode) -> bool:
         """
         Add a node to the frontier.
         
+        When the frontier is full, the new node replaces the worst node if it
+        is better than it; the best nodes are never evicted.
+        
         Args:
             node: SearchNode to add to the frontier
             
@@ -52,17 +76,18 @@ class Frontier:
             True if node was added, False if it was a duplicate or frontier is full
         """
         # Check for duplicates
-        if node.state.state_id in self._node_set:
+        if node.state.state_id in self._nodes:
             logger.debug(f"Skipping duplicate node: {node.state.state_id[:8]}")
             return False
         
         # Check size limit
-        if self._max_size and len(self._heap) >= self._max_size:
+        if self._max_size and len(self._nodes) >= self._max_size:
             # If new node is better than worst node, replace it
-            if self._heap and node.is_better_than(self._heap[0]):
-                worst_node = heapq.heappop(self._heap)
-                self._node_set.remove(worst_node.state.state_id)
-                worst_node.in_frontier = False
+            worst_node = self._peek_worst()
+            if worst_node is not None and node.is_better_than(worst_node):
+                heapq.heappop(self._worst_heap)
+                self._discard(worst_node)
+                self._total_evicted += 1
                 logger.debug(f"Replaced worst node with better node")
             else:
                 logger.debug(f"Frontier full, rejecting node: {node.get_search_summary()}")
@@ -70,14 +95,19 @@ class Frontier:
         
         # Add node to frontier
         heapq.heappush(self._heap, node)
-        self._node_set.add(node.state.state_id)
+        heapq.heappush(self._worst_heap, _WorstFirst(node))
+        self._nodes[node.state.state_id] = node
         node.in_frontier = True
         self._total_added += 1
         
         # Update statistics
-        self._size_history.append(len(self._heap))
-        if self._heap:
-            self._best_f_score_history.append(self._heap[0].f_score)
+        self._record_size()
+        best_node = self.peek()
+        if best_node is not None:
+            if self._initial_best_f_score is None:
+                self._initial_best_f_score = best_node.f_score
+            if self._best_f_score_ever is None or best_node.f_score < self._best_f_score_ever:
+                self._best_f_score_ever = best_node.f_score
         
         logger.debug(f"Added node to frontier: {node.get_search_summary()}")
         return True
@@ -89,17 +119,17 @@ class Frontier:
         Returns:
             Best SearchNode according to A* criteria, or None if frontier is empty
         """
-        if not self._heap:
+        best_node = self.peek()
+        if best_node is None:
             return None
         
         # Get best node
-        best_node = heapq.heappop(self._heap)
-        self._node_set.remove(best_node.state.state_id)
-        best_node.in_frontier = False
+        heapq.heappop(self._heap)
+        self._discard(best_node)
         self._total_popped += 1
         
         # Update statistics
-        self._size_history.append(len(self._heap))
+        self._record_size()
         
         logger.debug(f"Popped node from frontier: {best_node.get_search_summary()}")
         return best_node
@@ -111,7 +141,54 @@ class Frontier:
         Returns:
             Best SearchNode or None if frontier is empty
         """
-        return self._heap[0] if self._heap else None
+        heap = self._heap
+        while heap and not self._is_live(heap[0]):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+    
+    def peek_worst(self) -> Optional[SearchNode]:
+        """
+        Look at the worst node (the next eviction candidate) without removing it.
+        
+        Returns:
+            Worst SearchNode or None if frontier is empty
+        """
+        return self._peek_worst()
+    
+    def _peek_worst(self) -> Optional[SearchNode]:
+        """Drop stale entries from the top of the worst-first heap and return its top node."""
+        heap = self._worst_heap
+        while heap and not self._is_live(heap[0].node):
+            heapq.heappop(heap)
+        return heap[0].node if heap else None
+    
+    def _is_live(self, node: SearchNode) -> bool:
+        """Check whether a heap entry still refers to a node in the frontier."""
+        return self._nodes.get(node.state.state_id) is node
+    
+    def _discard(self, node: SearchNode):
+        """Remove a node from the live set; its entry in the other heap becomes stale."""
+        del self._nodes[node.state.state_id]
+        node.in_frontier = False
+        
+        # Compact once stale entries dominate so heap sizes stay O(live nodes)
+        if len(self._heap) + len(self._worst_heap) > 4 * len(self._nodes) + 64:
+            self._rebuild()
+    
+    def _rebuild(self):
+        """Rebuild both heaps from the live nodes."""
+        self._heap = list(self._nodes.values())
+        heapq.heapify(self._heap)
+        self._worst_heap = [_WorstFirst(node) for node in self._heap]
+        heapq.heapify(self._worst_heap)
+    
+    def _record_size(self):
+        """Record the current size in the ring buffer and running aggregates."""
+        size = len(self._nodes)
+        self._size_history.append(size)
+        self._max_size_reached = max(self._max_size_reached, size)
+        self._size_sum += size
+        self._size_samples += 1
     
     def is_empty(self) -> bool:
         """
@@ -120,7 +197,7 @@ class Frontier:
         Returns:
             True if no nodes are in the frontier
         """
-        return len(self._heap) == 0
+        return len(self._nodes) == 0
     
     def size(self) -> int:
         """
@@ -129,7 +206,7 @@ class Frontier:
         Returns:
             Number of nodes currently in the frontier
         """
-        return len(self._heap)
+        return len(self._nodes)
     
     def contains_state(self, state_id: str) -> bool:
         """
@@ -141,7 +218,7 @@ class Frontier:
         Returns:
             True if state is in frontier
         """
-        return state_id in self._node_set
+        return state_id in self._nodes
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -151,34 +228,34 @@ class Frontier:
             Dictionary with frontier statistics
         """
         stats = {
-            'current_size': len(self._heap),
+            'current_size': len(self._nodes),
             'max_size_limit': self._max_size,
             'total_added': self._total_added,
             'total_popped': self._total_popped,
+            'total_evicted': self._total_evicted,
             'is_empty': self.is_empty()
         }
         
-        if self._heap:
+        best_node = self.peek()
+        if best_node is not None:
             stats.update({
-                'best_f_score': self._heap[0].f_score,
-                'best_g_score': self._heap[0].state.g_score,
-                'best_h_score': self._heap[0].h_score,
-                'best_depth': self._heap[0].state.depth
+                'best_f_score': best_node.f_score,
+                'best_g_score': best_node.state.g_score,
+                'best_h_score': best_node.h_score,
+                'best_depth': best_node.state.depth
             })
         
-        if self._size_history:
+        if self._size_samples:
             stats.update({
-                'max_size_reached': max(self._size_history),
-                'avg_size': sum(self._size_history) / len(self._size_history)
+                'max_size_reached': self._max_size_reached,
+                'avg_size': self._size_sum / self._size_samples,
+                'recent_avg_size': sum(self._size_history) / len(self._size_history)
             })
         
-        if self._best_f_score_history:
+        if self._best_f_score_ever is not None:
             stats.update({
-                'best_f_score_ever': min(self._best_f_score_history),
-                'f_score_improvement': (
-                    self._best_f_score_history[0] - min(self._best_f_score_history)
-                    if len(self._best_f_score_history) > 1 else 0
-                )
+                'best_f_score_ever': self._best_f_score_ever,
+                'f_score_improvement': self._initial_best_f_score - self._best_f_score_ever
             })
         
         return stats
@@ -193,7 +270,7 @@ class Frontier:
         if self.is_empty():
             return "Frontier: EMPTY"
         
-        best = self._heap[0]
+        best = self.peek()
         stats = self.get_statistics()
         
         return (
@@ -204,11 +281,12 @@ class Frontier:
     
     def clear(self):
         """Clear all nodes from the frontier."""
-        for node in self._heap:
+        for node in self._nodes.values():
             node.in_frontier = False
         
         self._heap.clear()
-        self._node_set.clear()
+        self._worst_heap.clear()
+        self._nodes.clear()
         logger.debug("Frontier cleared")
     
     def get_nodes_by_f_score(self, max_nodes: int = 10) -> List[SearchNode]:
@@ -221,9 +299,7 @@ class Frontier:
         Returns:
             List of best nodes sorted by f_score
         """
-        # Create a copy of heap and sort it
-        sorted_nodes = sorted(self._heap, key=lambda n: (n.f_score, n.state.g_score))
-        return sorted_nodes[:max_nodes]
+        return heapq.nsmallest(max_nodes, self._nodes.values(), key=lambda n: (n.f_score, n.state.g_score))
     
     def prune_high_cost_nodes(self, f_score_threshold: int) -> int:
         """
@@ -235,22 +311,18 @@ class Frontier:
         Returns:
             Number of nodes removed
         """
-        original_size = len(self._heap)
+        original_size = len(self._nodes)
         
-        # Filter out high-cost nodes
-        filtered_nodes = [node for node in self._heap if node.f_score <= f_score_threshold]
-        
-        # Update node set
-        removed_nodes = [node for node in self._heap if node.f_score > f_score_threshold]
+        # Drop high-cost nodes from the live set
+        removed_nodes = [node for node in self._nodes.values() if node.f_score > f_score_threshold]
         for node in removed_nodes:
-            self._node_set.remove(node.state.state_id)
+            del self._nodes[node.state.state_id]
             node.in_frontier = False
         
-        # Rebuild heap
-        self._heap = filtered_nodes
-        heapq.heapify(self._heap)
+        # Rebuild heaps
+        self._rebuild()
         
-        removed_count = original_size - len(self._heap)
+        removed_count = original_size - len(self._nodes)
         if removed_count > 0:
             logger.info(f"Pruned {removed_count} high-cost nodes (f_score > {f_score_threshold})")
         
@@ -258,7 +330,7 @@ class Frontier:
     
     def __len__(self) -> int:
         """Return the size of the frontier."""
-        return len(self._heap)
+        return len(self._nodes)
     
     def __bool__(self) -> bool:
         """Return True if frontier is not empty."""
@@ -266,4 +338,4 @@ class Frontier:
     
     def __repr__(self) -> str:
         """String representation for debugging."""
-        return f"Frontier(size={len(self._heap)}, max_size={self._max_size})"
+        return f"Frontier(size={len(self._nodes)}, max_size={self._max_size})"
@@ -6,7 +6,11 @@ Uses SAM's core LLM to estimate the cost-to-go from any planning state
 to the goal, enabling optimal path finding in the search space.
 """
 
+import hashlib
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from .state import PlanningState
@@ -48,7 +52,9 @@ class HeuristicEstimator:
                  llm_interface=None,
                  context_manager: Optional[SAMContextManager] = None,
                  max_cost: int = 100,
-                 use_caching: bool = True):
+                 use_caching: bool = True,
+                 max_concurrent_estimates: int = 4,
+                 use_batch_prompt: bool = False):
         """
         Initialize the heuristic estimator.
         
@@ -57,17 +63,26 @@ class HeuristicEstimator:
             context_manager: SAM context manager for enhanced estimates
             max_cost: Maximum cost to return (for failed estimates)
             use_caching: Whether to cache estimates for similar states
+            max_concurrent_estimates: Maximum concurrent LLM calls when scoring a batch
+            use_batch_prompt: Score a batch of states with a single combined prompt
         """
         self.llm_interface = llm_interface
         self.context_manager = context_manager
         self.max_cost = max_cost
         self.use_caching = use_caching
+        self.max_concurrent_estimates = max(1, max_concurrent_estimates)
+        self.use_batch_prompt = use_batch_prompt
         
-        # Estimation cache for performance
+        # Estimation cache for performance, keyed by state fingerprint
         self._estimate_cache: Dict[str, HeuristicEstimate] = {}
         self._cache_hits = 0
         self._cache_misses = 0
         
+        # LLM call accounting (calls may come from worker threads)
+        self._stats_lock = threading.Lock()
+        self._llm_calls = 0
+        self._batched_requests = 0
+        
         logger.info("Initialized HeuristicEstimator")
     
     def estimate_cost_to_go(self, state: PlanningState) -> int:
@@ -90,6 +105,63 @@ class HeuristicEstimator:
             # Return high cost for failed estimates
             return self.max_cost
     
+    def estimate_costs_to_go(self, states: List[PlanningState]) -> List[int]:
+        """
+        Estimate the cost to reach the goal for several states at once.
+        
+        Args:
+            states: Planning states to estimate costs for (e.g. the children of one expansion)
+            
+        Returns:
+            Estimated costs, in the same order as states
+        """
+        try:
+            return [estimate.estimated_cost for estimate in self.get_detailed_estimates(states)]
+            
+        except Exception as e:
+            logger.error(f"Error in batch cost estimation: {e}")
+            return [self.max_cost] * len(states)
+    
+    def get_detailed_estimates(self, states: List[PlanningState]) -> List[HeuristicEstimate]:
+        """
+        Get detailed heuristic estimates for several states at once.
+        
+        Cached states and duplicates within the batch cost nothing. The
+        remaining states are scored with one combined prompt when
+        use_batch_prompt is set, otherwise with up to
+        max_concurrent_estimates concurrent LLM calls.
+        
+        Args:
+            states: Planning states to estimate costs for
+            
+        Returns:
+            HeuristicEstimates, in the same order as states
+        """
+        fingerprints = [self.state_fingerprint(state) for state in states]
+        estimates: Dict[str, HeuristicEstimate] = {}
+        pending: Dict[str, PlanningState] = {}
+        
+        for fingerprint, state in zip(fingerprints, states):
+            if fingerprint in estimates or fingerprint in pending:
+                continue
+            if self.use_caching:
+                cached_estimate = self._estimate_cache.get(fingerprint)
+                if cached_estimate:
+                    self._cache_hits += 1
+                    estimates[fingerprint] = cached_estimate
+                    continue
+                self._cache_misses += 1
+            pending[fingerprint] = state
+        
+        if pending:
+            new_estimates = self._generate_llm_estimates(list(pending.values()))
+            for fingerprint, estimate in zip(pending, new_estimates):
+                estimates[fingerprint] = estimate
+                if self.use_caching:
+                    self._cache_estimate(pending[fingerprint], estimate)
+        
+        return [estimates[fingerprint] for fingerprint in fingerprints]
+    
     def get_detailed_estimate(self, state: PlanningState) -> HeuristicEstimate:
         """
         Get detailed heuristic estimate with reasoning and confidence.
@@ -135,6 +207,51 @@ class HeuristicEstimator:
             # Use fallback estimation when no LLM available
             return self._fallback_estimate(state)
     
+    def _generate_llm_estimates(self, states: List[PlanningState]) -> List[HeuristicEstimate]:
+        """Generate estimates for uncached states with one batched prompt or bounded concurrent calls."""
+        if not self.llm_interface or len(states) == 1:
+            return [self._generate_llm_estimate(state) for state in states]
+        
+        if self.use_batch_prompt:
+            return self._generate_batch_prompt_estimates(states)
+        
+        if self.max_concurrent_estimates == 1:
+            return [self._generate_llm_estimate(state) for state in states]
+        
+        with self._stats_lock:
+            self._batched_requests += 1
+        workers = min(self.max_concurrent_estimates, len(states))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sam-heuristic") as executor:
+            return list(executor.map(self._generate_llm_estimate, states))
+    
+    def _generate_batch_prompt_estimates(self, states: List[PlanningState]) -> List[HeuristicEstimate]:
+        """Score several states with a single LLM call, falling back per state on parse gaps."""
+        with self._stats_lock:
+            self._batched_requests += 1
+        
+        try:
+            response = self._call_llm(self._build_batch_heuristic_prompt(states))
+            costs = self._parse_batch_response(response, len(states))
+        except Exception as e:
+            logger.warning(f"Batched LLM estimation failed: {e}")
+            costs = {}
+        
+        estimates = []
+        for index, state in enumerate(states, 1):
+            if index in costs:
+                estimates.append(HeuristicEstimate(
+                    estimated_cost=max(0, min(costs[index], self.max_cost)),
+                    confidence=0.7,
+                    reasoning=f"Batched estimate {index} of {len(states)}",
+                    context_factors=self._identify_context_factors(state),
+                    fallback_used=False
+                ))
+            else:
+                # Missing line in the batched answer: score this state on its own
+                estimates.append(self._generate_llm_estimate(state))
+        
+        return estimates
+    
     def _build_heuristic_prompt(self, state: PlanningState) -> str:
         """Build context-aware prompt for heuristic estimation."""
         
@@ -179,6 +296,59 @@ class HeuristicEstimator:
         
         return "\n".join(prompt_parts)
     
+    def _build_batch_heuristic_prompt(self, states: List[PlanningState]) -> str:
+        """Build a single prompt that asks for an estimate for each of several states."""
+        
+        # States in one batch share the task (they are siblings of one expansion)
+        prompt_parts = [
+            "You are an expert planning assistant. Estimate the number of steps needed to complete a task.",
+            "",
+            f"TASK: {states[0].task_description}",
+            "",
+            "CANDIDATE STATES:"
+        ]
+        
+        for index, state in enumerate(states, 1):
+            if state.task_description != states[0].task_description:
+                prompt_parts.append(f"State {index} task: {state.task_description}")
+            prompt_parts.extend([
+                f"State {index}:",
+                f"- Action history: {state.action_history if state.action_history else 'None'}",
+                f"- Current observation: {state.current_observation}"
+            ])
+        prompt_parts.append("")
+        
+        if self.context_manager:
+            context_info = self._get_context_info(states[0])
+            if context_info:
+                prompt_parts.extend([
+                    "AVAILABLE CONTEXT:",
+                    context_info,
+                    ""
+                ])
+        
+        prompt_parts.extend([
+            "ESTIMATION TASK:",
+            "For each state, estimate how many more steps are needed to complete the task.",
+            "Respond with ONLY one line per state in the form '<state number>: <estimate>',",
+            "using numbers between 0 and 50 (0 if the task appears complete).",
+            "",
+            "ESTIMATES:"
+        ])
+        
+        return "\n".join(prompt_parts)
+    
+    def _parse_batch_response(self, response: str, num_states: int) -> Dict[int, int]:
+        """Parse '<state number>: <estimate>' lines from a batched response."""
+        costs = {}
+        
+        for match in re.finditer(r'^\s*(?:state\s*)?(\d+)\s*[:.)=-]\s*(\d+)', response, re.IGNORECASE | re.MULTILINE):
+            index, cost = int(match.group(1)), int(match.group(2))
+            if 1 <= index <= num_states and index not in costs:
+                costs[index] = cost
+        
+        return costs
+    
     def _get_context_info(self, state: PlanningState) -> str:
         """Get context information for the prompt."""
         context_parts = []
@@ -211,6 +381,8 @@ class HeuristicEstimator:
         """Call the LLM interface with the prompt."""
         # This would integrate with SAM's actual LLM interface
         # For now, we'll simulate the call
+        with self._stats_lock:
+            self._llm_calls += 1
         
         if hasattr(self.llm_interface, 'generate'):
             return self.llm_interface.generate(prompt, temperature=0.3, max_tokens=50)
@@ -225,7 +397,6 @@ class HeuristicEstimator:
         """Parse LLM response to extract cost estimate."""
         
         # Extract number from response
-        import re
         numbers = re.findall(r'\b\d+\b', response.strip())
         
         if numbers:
@@ -323,16 +494,30 @@ class HeuristicEstimator:
             fallback_used=True
         )
     
+    def state_fingerprint(self, state: PlanningState) -> str:
+        """
+        Canonical fingerprint of the state content that the estimate depends on.
+        
+        Two states with the same task, action sequence, observation and
+        available context kinds share an estimate; metadata such as state_id
+        and timestamps is ignored.
+        """
+        context = state.get_context_summary()
+        content = "\x1f".join([
+            state.task_description,
+            "\x1e".join(state.action_history),
+            state.current_observation,
+            "".join('1' if context[kind] else '0' for kind in ('documents', 'memory', 'conversation'))
+        ])
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+    
     def _get_cached_estimate(self, state: PlanningState) -> Optional[HeuristicEstimate]:
-        """Get cached estimate for similar state."""
-        # Simple cache key based on state signature
-        cache_key = f"{state.task_description}_{len(state.action_history)}_{state.current_observation}"
-        return self._estimate_cache.get(cache_key)
+        """Get cached estimate for an equivalent state."""
+        return self._estimate_cache.get(self.state_fingerprint(state))
     
     def _cache_estimate(self, state: PlanningState, estimate: HeuristicEstimate):
         """Cache estimate for future use."""
-        cache_key = f"{state.task_description}_{len(state.action_history)}_{state.current_observation}"
-        self._estimate_cache[cache_key] = estimate
+        self._estimate_cache[self.state_fingerprint(state)] = estimate
         
         # Limit cache size
         if len(self._estimate_cache) > 1000:
@@ -351,8 +536,12 @@ class HeuristicEstimator:
             'cache_misses': self._cache_misses,
             'cache_hit_rate': cache_hit_rate,
             'cache_size': len(self._estimate_cache),
+            'llm_calls': self._llm_calls,
+            'batched_requests': self._batched_requests,
             'max_cost': self.max_cost,
-            'caching_enabled': self.use_caching
+            'caching_enabled': self.use_caching,
+            'max_concurrent_estimates': self.max_concurrent_estimates,
+            'batch_prompt_enabled': self.use_batch_prompt
         }
     
     def clear_cache(self):
@@ -7,9 +7,13 @@ in the A* search algorithm.
 """
 
 from typing import Dict, List, Tuple, Optional, Set
+from collections import defaultdict
 from dataclasses import dataclass
 import hashlib
 import logging
+
+import numpy as np
+
 from .state import PlanningState
 
 logger = logging.getLogger(__name__)
@@ -52,6 +56,122 @@ class SimilarityMetrics:
         )
 
 
+class StateLSHIndex:
+    """
+    MinHash/LSH index over planning state shingles.
+    
+    Each state is reduced to a set of shingles (task words, actions with
+    their occurrence number, action bigrams and observation words). A MinHash
+    signature of ``num_perm`` values is split into ``bands`` bands; states
+    that share any band bucket become candidates. States whose shingle sets
+    have Jaccard similarity s collide with probability
+    1 - (1 - s^rows)^bands, so near-duplicates are found without scanning
+    every known state.
+    """
+    
+    _MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+    
+    def __init__(self, num_perm: int = 144, bands: int = 48, seed: int = 1):
+        """
+        Initialize the index.
+        
+        Args:
+            num_perm: Number of MinHash values per signature
+            bands: Number of LSH bands (must divide num_perm)
+            seed: Seed for the hash permutations
+        """
+        if num_perm % bands != 0:
+            raise ValueError(f"bands ({bands}) must divide num_perm ({num_perm})")
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._seeds = np.random.default_rng(seed).integers(
+            1, 2**63 - 1, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._buckets: List[Dict[bytes, Set[str]]] = [defaultdict(set) for _ in range(bands)]
+        self._band_keys: Dict[str, List[bytes]] = {}
+    
+    @staticmethod
+    def shingles(state: PlanningState) -> Set[str]:
+        """Build the shingle set that the similarity-relevant state content maps to."""
+        shingle_set = {f"t:{word}" for word in state.task_description.lower().split()}
+        
+        counts: Dict[str, int] = {}
+        previous = "^"
+        for step, action in enumerate(state.action_history):
+            counts[action] = counts.get(action, 0) + 1
+            shingle_set.add(f"a:{action}#{counts[action]}")
+            shingle_set.add(f"b:{previous}>{action}")
+            shingle_set.add(f"p:{step}:{action}")
+            previous = action
+        
+        shingle_set.update(f"o:{word}" for word in state.current_observation.lower().split())
+        return shingle_set or {"empty"}
+    
+    def signature(self, state: PlanningState) -> np.ndarray:
+        """Compute the MinHash signature of a state."""
+        values = np.array([int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+                           for shingle in self.shingles(state)], dtype=np.uint64)
+        
+        # splitmix64 finalizer over (shingle hash xor permutation seed)
+        with np.errstate(over='ignore'):
+            x = values[None, :] ^ self._seeds[:, None]
+            x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            x = x ^ (x >> np.uint64(31))
+        return x.min(axis=1)
+    
+    def _band_keys_for(self, state: PlanningState) -> List[bytes]:
+        signature = self.signature(state)
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+    
+    def add(self, state: PlanningState) -> None:
+        """Index a state (re-indexing replaces the previous entry)."""
+        if state.state_id in self._band_keys:
+            self.remove(state.state_id)
+        
+        band_keys = self._band_keys_for(state)
+        for band, key in enumerate(band_keys):
+            self._buckets[band][key].add(state.state_id)
+        self._band_keys[state.state_id] = band_keys
+    
+    def remove(self, state_id: str) -> None:
+        """Remove a state from the index."""
+        band_keys = self._band_keys.pop(state_id, None)
+        if band_keys is None:
+            return
+        
+        for band, key in enumerate(band_keys):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(state_id)
+                if not bucket:
+                    del self._buckets[band][key]
+    
+    def query(self, state: PlanningState) -> Set[str]:
+        """Return ids of indexed states sharing at least one band bucket with the state."""
+        band_keys = self._band_keys.get(state.state_id) or self._band_keys_for(state)
+        candidates: Set[str] = set()
+        for band, key in enumerate(band_keys):
+            bucket = self._buckets[band].get(key)
+            if bucket:
+                candidates.update(bucket)
+        candidates.discard(state.state_id)
+        return candidates
+    
+    def clear(self) -> None:
+        """Drop all indexed states."""
+        for buckets in self._buckets:
+            buckets.clear()
+        self._band_keys.clear()
+    
+    def __contains__(self, state_id: object) -> bool:
+        return state_id in self._band_keys
+    
+    def __len__(self) -> int:
+        return len(self._band_keys)
+
+
 class StateSimilarityDetector:
     """
     Detects similarity between planning states for optimization.
@@ -61,16 +181,45 @@ class StateSimilarityDetector:
     computed values.
     """
     
-    def __init__(self, similarity_threshold: float = 0.8):
+    def __init__(self, similarity_threshold: float = 0.8, use_index: bool = True,
+                 exact_scan_limit: int = 64, lsh_num_perm: int = 144, lsh_bands: int = 48):
         """
         Initialize the similarity detector.
         
         Args:
             similarity_threshold: Minimum similarity score to consider states similar
+            use_index: Whether to pre-filter candidates with the LSH index
+            exact_scan_limit: Candidate lists up to this size are scanned exactly
+            lsh_num_perm: Number of MinHash values per state signature
+            lsh_bands: Number of LSH bands
         """
         self.similarity_threshold = similarity_threshold
+        self.use_index = use_index
+        self.exact_scan_limit = exact_scan_limit
         self._state_cache: Dict[str, PlanningState] = {}
         self._similarity_cache: Dict[Tuple[str, str], SimilarityMetrics] = {}
+        self._index = StateLSHIndex(num_perm=lsh_num_perm, bands=lsh_bands)
+        self._exact_comparisons = 0
+    
+    def index_state(self, state: PlanningState):
+        """
+        Add a state to the similarity index.
+        
+        Args:
+            state: Planning state to index
+        """
+        self._state_cache[state.state_id] = state
+        self._index.add(state)
+    
+    def remove_state(self, state_id: str):
+        """
+        Remove a state from the similarity index.
+        
+        Args:
+            state_id: ID of the state to remove
+        """
+        self._state_cache.pop(state_id, None)
+        self._index.remove(state_id)
     
     def compute_similarity(self, state1: PlanningState, state2: PlanningState) -> SimilarityMetrics:
         """
@@ -125,23 +274,34 @@ class StateSimilarityDetector:
         return metrics.overall_similarity >= self.similarity_threshold
     
     def find_similar_states(self, target_state: PlanningState, 
-                           candidate_states: List[PlanningState]) -> List[Tuple[PlanningState, float]]:
+                           candidate_states: Optional[List[PlanningState]] = None) -> List[Tuple[PlanningState, float]]:
         """
         Find states similar to the target state from a list of candidates.
         
+        Large candidate lists are narrowed with the LSH index (candidates not
+        yet indexed are indexed on the way), so the exact similarity function
+        only runs on likely near-duplicates. Pass None to search every
+        indexed state.
+        
         Args:
             target_state: State to find similarities for
-            candidate_states: List of candidate states to compare
+            candidate_states: List of candidate states to compare, or None for all indexed states
             
         Returns:
             List of (state, similarity_score) tuples for similar states
         """
+        if candidate_states is None:
+            candidate_states = [self._state_cache[state_id] for state_id in self._index.query(target_state)]
+        elif self.use_index and len(candidate_states) > self.exact_scan_limit:
+            candidate_states = self._narrow_candidates(target_state, candidate_states)
+        
         similar_states = []
         
         for candidate in candidate_states:
             if candidate.state_id == target_state.state_id:
                 continue  # Skip self
             
+            self._exact_comparisons += 1
             metrics = self.compute_similarity(target_state, candidate)
             if metrics.overall_similarity >= self.similarity_threshold:
                 similar_states.append((candidate, metrics.overall_similarity))
@@ -151,6 +311,16 @@ class StateSimilarityDetector:
         
         return similar_states
     
+    def _narrow_candidates(self, target_state: PlanningState,
+                           candidate_states: List[PlanningState]) -> List[PlanningState]:
+        """Keep only candidates that share an LSH bucket with the target."""
+        for candidate in candidate_states:
+            if self._state_cache.get(candidate.state_id) is not candidate:
+                self.index_state(candidate)
+        
+        bucket_ids = self._index.query(target_state)
+        return [candidate for candidate in candidate_states if candidate.state_id in bucket_ids]
+    
     def _compute_task_similarity(self, state1: PlanningState, state2: PlanningState) -> float:
         """Compute similarity of task descriptions."""
         if state1.task_description == state2.task_description:
@@ -331,13 +501,17 @@ class StateSimilarityDetector:
         return hashlib.md5(signature_string.encode()).hexdigest()
     
     def clear_cache(self):
-        """Clear similarity computation cache."""
+        """Clear similarity computation cache and the state index."""
         self._similarity_cache.clear()
+        self._state_cache.clear()
+        self._index.clear()
         logger.debug("Cleared state similarity cache")
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
         return {
             'similarity_cache_size': len(self._similarity_cache),
-            'state_cache_size': len(self._state_cache)
+            'state_cache_size': len(self._state_cache),
+            'indexed_states': len(self._index),
+            'exact_comparisons': self._exact_comparisons
         }
@@ -174,11 +174,56 @@ class DNALayer(nn.Module):
         """
         General processing for top-k routing (tokens can go to multiple experts).
 
-        This implementation handles the case where each token can be processed
-        by multiple experts and the results are combined.
+        Tokens are grouped by expert so each expert runs once per forward pass
+        on all of its (token, slot) assignments. Every token is passed as its
+        own length-1 sequence, so results match per-token processing, and the
+        weighted expert outputs are combined with a scatter-add.
+        """
+        batch_size, seq_len, hidden_size = hidden_states.shape
+
+        flat_hidden = hidden_states.reshape(-1, hidden_size)  # [num_tokens, hidden_size]
+        flat_weights = routing_weights.reshape(-1, routing_weights.shape[-1])  # [num_tokens, num_experts]
+        flat_mask = attention_mask.reshape(-1) if attention_mask is not None else None
+
+        # Top-k experts per token with renormalized weights
+        top_k_weights, top_k_indices = torch.topk(flat_weights, self.top_k, dim=-1)
+        top_k_weights = top_k_weights / (top_k_weights.sum(dim=-1, keepdim=True) + 1e-8)
+
+        output_hidden_states = torch.zeros_like(flat_hidden)
+
+        for expert_id in range(self.num_experts):
+            token_indices, slot_indices = torch.nonzero(top_k_indices == expert_id, as_tuple=True)
+
+            if token_indices.numel() == 0:
+                continue  # No tokens for this expert
+
+            # Each token becomes a length-1 sequence: [num_assigned, 1, hidden_size]
+            expert_tokens = flat_hidden.index_select(0, token_indices).unsqueeze(1)
+
+            expert_attention_mask = None
+            if flat_mask is not None:
+                expert_attention_mask = flat_mask.index_select(0, token_indices).unsqueeze(1)
+
+            expert_output = self.experts[expert_id](expert_tokens, expert_attention_mask).squeeze(1)
+
+            # Weighted scatter-add back to token positions
+            expert_weights = top_k_weights[token_indices, slot_indices].unsqueeze(-1)
+            output_hidden_states = output_hidden_states.index_add(
+                0, token_indices, expert_output * expert_weights.to(expert_output.dtype)
+            )
+
+        return output_hidden_states.view(batch_size, seq_len, hidden_size)
+
+    def _process_topk_routing_per_token(self,
+                                        hidden_states: torch.Tensor,
+                                        routing_weights: torch.Tensor,
+                                        attention_mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """
+        Reference top-k processing that calls the experts once per token.
+
+        Kept to validate and benchmark the grouped dispatch in _process_topk_routing.
         """
         batch_size, seq_len, hidden_size = hidden_states.shape
-        device = hidden_states.device
 
         # Initialize output tensor
         output_hidden_states = torch.zeros_like(hidden_states)
@@ -186,7 +231,7 @@ class DNALayer(nn.Module):
         # For each position, process through top-k experts and combine
         for batch_idx in range(batch_size):
             for seq_idx in range(seq_len):
-                token_hidden = hidden_states[batch_idx, seq_idx:seq_idx+1, :]  # [1, 1, hidden_size]
+                token_hidden = hidden_states[batch_idx, seq_idx:seq_idx+1, :].unsqueeze(0)  # [1, 1, hidden_size]
                 token_weights = routing_weights[batch_idx, seq_idx, :]  # [num_experts]
 
                 # Get top-k experts for this token
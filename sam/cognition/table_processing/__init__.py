@@ -24,6 +24,7 @@ from .table_enhancer import TableEnhancer, EnhancementResult
 from .token_roles import TokenRole, SEMANTIC_ROLES
 from .config import TableProcessingConfig, get_table_config
 from .utils import TableUtils, CoordinateSystem
+from .table_store import TableStore, StoredTable, get_table_store
 
 __version__ = "1.0.0"
 __author__ = "SAM Development Team"
@@ -90,6 +91,9 @@ __all__ = [
     'get_table_config',
     'TableUtils',
     'CoordinateSystem',
+    'TableStore',
+    'StoredTable',
+    'get_table_store',
     'get_table_processing_config',
     'update_table_processing_config',
     'initialize_table_processing'
@@ -9,6 +9,7 @@ This implements Task 4 from task23.md - Enhanced Integration with SAM's Ecosyste
 """
 
 import logging
+import hashlib
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,6 +19,7 @@ from .role_classifier import TableRoleClassifier, RoleClassification
 from .table_validator import TableValidator, ValidationResult
 from .table_enhancer import TableEnhancer, EnhancementResult
 from .utils import TableUtils, CellDataType
+from .table_store import TableStore, StoredTable, get_table_store
 
 logger = logging.getLogger(__name__)
 
@@ -37,17 +39,30 @@ class TableAwareChunker:
     """
     Table-aware chunking system that integrates with SAM's enhanced chunker.
     
-    Processes tables and creates enriched chunks with table metadata.
+    Processes tables and creates enriched chunks with table metadata. Complete
+    tables are kept in the columnar table store, and only summary, header and
+    row-group chunks are created for the vector store.
     """
     
-    def __init__(self):
-        """Initialize the table-aware chunker."""
+    def __init__(self, table_store: Optional[TableStore] = None, row_group_size: int = 50,
+                 use_columnar_store: bool = True):
+        """
+        Initialize the table-aware chunker.
+
+        Args:
+            table_store: Columnar table store (defaults to the global store)
+            row_group_size: Number of data rows per row-group chunk
+            use_columnar_store: Store tables in the table store; if False, create
+                one chunk per table cell instead
+        """
         self.parser = TableParser()
         self.classifier = TableRoleClassifier()
         self.validator = TableValidator()
         self.enhancer = TableEnhancer()
+        self.row_group_size = max(1, row_group_size)
+        self.table_store = (table_store or get_table_store()) if use_columnar_store else None
         
-        logger.info("TableAwareChunker initialized")
+        logger.info(f"TableAwareChunker initialized (columnar store: {self.table_store is not None})")
     
     def process_document_with_tables(self, doc_content: str, doc_type: str,
                                    document_context: Optional[str] = None) -> TableProcessingResult:
@@ -85,7 +100,8 @@ class TableAwareChunker:
             
             # Step 5: Create enhanced chunks
             enhanced_chunks = self._create_enhanced_chunks(
-                tables, classifications, enhancements, document_context
+                tables, classifications, enhancements, document_context,
+                self._get_document_key(doc_content, document_context)
             )
             
             # Step 6: Calculate processing metrics
@@ -116,14 +132,26 @@ class TableAwareChunker:
     def _create_enhanced_chunks(self, tables: List[TableObject],
                               classifications: List[List[List[RoleClassification]]],
                               enhancements: List[EnhancementResult],
-                              document_context: Optional[str]) -> List[Dict[str, Any]]:
+                              document_context: Optional[str],
+                              document_key: str) -> List[Dict[str, Any]]:
         """Create enhanced chunks with table metadata."""
         enhanced_chunks = []
         
         for table_idx, table in enumerate(tables):
             table_classifications = classifications[table_idx] if table_idx < len(classifications) else []
             enhancement = enhancements[table_idx] if table_idx < len(enhancements) else None
-            
+            # Parser table IDs are only unique within a document
+            table_id = f"{document_key}_{table.table_id or f'table_{table_idx}'}"
+
+            # Keep the table in the columnar store and index only a few chunks
+            if self.table_store is not None:
+                if self._store_table(table, table_id, table_classifications, document_context):
+                    enhanced_chunks.extend(self._create_table_level_chunks(
+                        table, table_idx, table_id, table_classifications, enhancement, document_context
+                    ))
+                    continue
+                logger.warning(f"Falling back to cell chunks for table {table_idx}")
+
             # Create chunks for each cell
             rows, cols = table.get_dimensions()
             
@@ -145,15 +173,127 @@ class TableAwareChunker:
                     
                     # Create enhanced chunk metadata
                     chunk_metadata = self._create_table_chunk_metadata(
-                        table, table_idx, row_idx, col_idx, cell_classification,
+                        table, table_idx, table_id, row_idx, col_idx, cell_classification,
                         cell_data_type, enhancement, document_context
                     )
                     
                     enhanced_chunks.append(chunk_metadata)
         
         return enhanced_chunks
+
+    @staticmethod
+    def _get_document_key(doc_content: str, document_context: Optional[str]) -> str:
+        """Short hash identifying a document by its context and content."""
+        # Re-ingesting identical content replaces its tables; a changed document
+        # under the same name gets new table IDs instead of overwriting the old ones
+        key_source = f"{document_context or ''}\0{doc_content}"
+        return hashlib.md5(key_source.encode("utf-8")).hexdigest()[:12]
     
-    def _create_table_chunk_metadata(self, table: TableObject, table_idx: int,
+    def _store_table(self, table: TableObject, table_id: str,
+                     table_classifications: List[List[RoleClassification]],
+                     document_context: Optional[str]) -> bool:
+        """Write a table with its cell roles, data types and confidences to the table store."""
+        rows, cols = table.get_dimensions()
+        data = [[table.get_cell(row_idx, col_idx) for col_idx in range(cols)] for row_idx in range(rows)]
+        roles = [["DATA"] * cols for _ in range(rows)]
+        confidences = [[0.0] * cols for _ in range(rows)]
+        data_types = [[TableUtils.detect_cell_data_type(cell)[0].value for cell in row] for row in data]
+
+        for row_idx, row_classifications in enumerate(table_classifications[:rows]):
+            for col_idx, cell_classification in enumerate(row_classifications[:cols]):
+                roles[row_idx][col_idx] = cell_classification.role.value
+                confidences[row_idx][col_idx] = cell_classification.confidence
+
+        return self.table_store.put_table(
+            table_id=table_id,
+            data=data,
+            roles=roles,
+            data_types=data_types,
+            confidences=confidences,
+            title=table.title or table.caption,
+            source=document_context,
+            table_structure=self._get_table_structure(table)
+        )
+
+    def _create_table_level_chunks(self, table: TableObject, table_idx: int, table_id: str,
+                                   table_classifications: List[List[RoleClassification]],
+                                   enhancement: Optional[EnhancementResult],
+                                   document_context: Optional[str]) -> List[Dict[str, Any]]:
+        """Create the summary, header and row-group chunks for a stored table."""
+        rows, cols = table.get_dimensions()
+        title = table.title or table.caption
+
+        # Header row: first row with a cell classified as HEADER, if any
+        header_row = None
+        for row_idx, row_classifications in enumerate(table_classifications[:rows]):
+            if any(c.role.value == "HEADER" for c in row_classifications):
+                header_row = row_idx
+                break
+        headers = ([table.get_cell(header_row, col_idx) for col_idx in range(cols)]
+                   if header_row is not None else [f"Column_{col_idx}" for col_idx in range(cols)])
+
+        def base_metadata(chunk_type: str, source_location: str) -> Dict[str, Any]:
+            return {
+                "chunk_type": chunk_type,
+                "source_location": f"table_{table_idx}_{source_location}",
+                "is_table_part": True,
+                "table_id": table_id,
+                "table_title": title,
+                "table_context": document_context,
+                "columnar_store": True,
+                "confidence_score": table.detection_confidence,
+                "table_structure": self._get_table_structure(table)
+            }
+
+        summary = base_metadata("TABLE_SUMMARY", "summary")
+        summary["content"] = (f"Table {title or summary['table_id']} with {rows} rows and {cols} columns: "
+                              f"{', '.join(header for header in headers if header)}")
+        if enhancement:
+            summary.update({
+                "enhancement_metrics": enhancement.enhancement_metrics,
+                "semantic_metadata": enhancement.semantic_metadata,
+                "relationships": enhancement.relationships
+            })
+        chunks = [summary]
+
+        if header_row is not None:
+            header_chunk = base_metadata("TABLE_HEADER", "header")
+            header_chunk.update({
+                "content": " | ".join(headers),
+                "cell_role": "HEADER",
+                "row_range": (header_row, header_row + 1)
+            })
+            chunks.append(header_chunk)
+
+        data_start = header_row + 1 if header_row is not None else 0
+        for start in range(data_start, rows, self.row_group_size):
+            end = min(start + self.row_group_size, rows)
+            # Repeat the header line so each row group is self-describing
+            lines = [" | ".join(headers)] if header_row is not None else []
+            lines.extend(" | ".join(table.get_cell(row_idx, col_idx) for col_idx in range(cols))
+                         for row_idx in range(start, end))
+
+            row_group = base_metadata("TABLE_ROW_GROUP", f"rows_{start}_{end}")
+            row_group.update({
+                "content": "\n".join(lines),
+                "cell_role": "DATA",
+                "row_range": (start, end)
+            })
+            chunks.append(row_group)
+
+        return chunks
+
+    def _get_table_structure(self, table: TableObject) -> Dict[str, Any]:
+        """Table structure metadata shared by all chunks of a table."""
+        return {
+            "dimensions": table.get_dimensions(),
+            "source_format": table.source_format,
+            "detection_confidence": table.detection_confidence,
+            "quality_indicators": table.quality_indicators,
+            "table_metadata": table.table_metadata
+        }
+
+    def _create_table_chunk_metadata(self, table: TableObject, table_idx: int, table_id: str,
                                    row_idx: int, col_idx: int,
                                    cell_classification: Optional[RoleClassification],
                                    cell_data_type: CellDataType,
@@ -170,20 +310,16 @@ class TableAwareChunker:
             
             # Table-specific metadata
             "is_table_part": True,
-            "table_id": table.table_id or f"table_{table_idx}",
+            "table_id": table_id,
             "table_title": table.title or table.caption,
             "cell_coordinates": (row_idx, col_idx),
+            "cell_row": row_idx,
+            "cell_column": col_idx,
             "cell_data_type": cell_data_type.value,
             "table_context": document_context,
             
             # Table structure metadata
-            "table_structure": {
-                "dimensions": table.get_dimensions(),
-                "source_format": table.source_format,
-                "detection_confidence": table.detection_confidence,
-                "quality_indicators": table.quality_indicators,
-                "table_metadata": table.table_metadata
-            }
+            "table_structure": self._get_table_structure(table)
         }
         
         # Add classification metadata
@@ -290,24 +426,37 @@ class TableAwareRetrieval:
     Advanced table-aware retrieval system for Phase 2.
 
     Reconstructs complete tables from Phase 1 metadata and enables
-    sophisticated querying for the Table-to-Code Expert Tool.
+    sophisticated querying for the Table-to-Code Expert Tool. Tables in the
+    columnar table store are read with one keyed lookup; tables ingested as
+    per-cell chunks are reassembled from memory search results.
     """
 
-    def __init__(self, memory_store):
-        """Initialize with memory store reference."""
+    def __init__(self, memory_store, table_store: Optional[TableStore] = None):
+        """Initialize with memory store and table store references."""
         self.memory_store = memory_store
+        self.table_store = table_store or get_table_store()
         self._table_cache = {}  # Cache for reconstructed tables
         logger.info("TableAwareRetrieval initialized for Phase 2")
     
     def search_table_content(self, query: str, role_filter: Optional[str] = None,
-                           table_id_filter: Optional[str] = None) -> List[Dict[str, Any]]:
+                           table_id_filter: Optional[str] = None,
+                           row_filter: Optional[int] = None,
+                           column_filter: Optional[int] = None,
+                           max_results: int = 50) -> List[Dict[str, Any]]:
         """
         Search specifically within table content with role and table filtering.
+
+        Table ID and cell coordinate filters are pushed down to the memory
+        store's metadata index, so they are applied before ranking. An empty
+        query with a table ID filter returns every chunk of that table.
         
         Args:
             query: Search query
             role_filter: Filter by cell role (HEADER, DATA, etc.)
             table_id_filter: Filter by specific table ID
+            row_filter: Filter by cell row index
+            column_filter: Filter by cell column index
+            max_results: Maximum number of ranked results
             
         Returns:
             List of matching table chunks
@@ -316,17 +465,32 @@ class TableAwareRetrieval:
             # Search for table content using tags
             tags = ["table"]
 
-            # Perform search with table tag
-            search_results = self.memory_store.search_memories(
-                query=query if query.strip() else "table",
-                max_results=50,  # Get more results to filter
-                tags=tags
-            )
+            metadata_filter = {
+                field: value for field, value in (
+                    ("table_id", table_id_filter), ("cell_row", row_filter), ("cell_column", column_filter)
+                ) if value is not None
+            }
+
+            if metadata_filter and not query.strip():
+                # Whole-table lookup: no ranking, no result cap
+                chunks = self.memory_store.get_memories_by_metadata(metadata_filter)
+                search_results = [(chunk, 1.0) for chunk in chunks if "table" in chunk.tags]
+            else:
+                # Perform search with table tag and metadata predicates pushed down
+                search_results = [
+                    (result.chunk, result.similarity_score)
+                    for result in self.memory_store.search_memories(
+                        query=query if query.strip() else "table",
+                        max_results=max_results,
+                        tags=tags,
+                        metadata_filter=metadata_filter or None
+                    )
+                ]
 
             # Filter results based on table metadata
             filtered_results = []
-            for result in search_results:
-                metadata = result.chunk.metadata
+            for chunk, similarity in search_results:
+                metadata = chunk.metadata
 
                 # Check if it's a table part
                 if not metadata.get("is_table_part", False):
@@ -336,15 +500,11 @@ class TableAwareRetrieval:
                 if role_filter and metadata.get("cell_role") != role_filter:
                     continue
 
-                # Apply table ID filter
-                if table_id_filter and metadata.get("table_id") != table_id_filter:
-                    continue
-
                 # Convert to dict format for compatibility
                 filtered_results.append({
-                    "content": result.chunk.content,
+                    "content": chunk.content,
                     "metadata": metadata,
-                    "similarity": result.similarity_score
+                    "similarity": similarity
                 })
 
             logger.info(f"Table search returned {len(filtered_results)} results")
@@ -354,11 +514,52 @@ class TableAwareRetrieval:
             logger.error(f"Table search failed: {e}")
             return []
     
+    def get_table_cells(self, table_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all non-empty cells of a table in the search result format.
+
+        Reads the table store first and falls back to searching per-cell chunks.
+
+        Args:
+            table_id: ID of the table
+
+        Returns:
+            List of cell dicts with content, metadata (cell_coordinates, cell_role,
+            cell_data_type, confidence_score) and similarity
+        """
+        stored = self.table_store.get_table(table_id) if self.table_store else None
+        if stored is None:
+            return self.search_table_content("", table_id_filter=table_id)
+
+        cells = []
+        for row_idx, row in enumerate(stored.data):
+            for col_idx, content in enumerate(row):
+                if not content or not content.strip():
+                    continue  # Empty cells were never chunked either
+                cells.append({
+                    "content": content,
+                    "metadata": {
+                        "is_table_part": True,
+                        "table_id": table_id,
+                        "table_title": stored.title,
+                        "source": stored.source,
+                        "cell_coordinates": (row_idx, col_idx),
+                        "cell_row": row_idx,
+                        "cell_column": col_idx,
+                        "cell_role": stored.roles[row_idx][col_idx],
+                        "cell_data_type": stored.data_types[row_idx][col_idx],
+                        "confidence_score": stored.confidences[row_idx][col_idx],
+                        "table_structure": stored.table_structure
+                    },
+                    "similarity": 1.0
+                })
+        return cells
+
     def get_table_summary(self, table_id: str) -> Dict[str, Any]:
         """Get comprehensive summary of a specific table."""
         try:
-            # Get all chunks for this table
-            table_chunks = self.search_table_content("", table_id_filter=table_id)
+            # Get all cells for this table
+            table_chunks = self.get_table_cells(table_id)
             
             if not table_chunks:
                 return {"error": f"No table found with ID: {table_id}"}
@@ -405,6 +606,14 @@ class TableAwareRetrieval:
             if table_id in self._table_cache:
                 return self._table_cache[table_id]
 
+            # Single keyed read from the columnar table store
+            stored = self.table_store.get_table(table_id) if self.table_store else None
+            if stored is not None:
+                reconstructed_table = self._reconstruct_from_store(stored)
+                self._table_cache[table_id] = reconstructed_table
+                logger.info(f"Reconstructed table {table_id} from table store with dimensions {stored.dimensions}")
+                return reconstructed_table
+
             # Get all chunks for this table
             table_chunks = self.search_table_content("", table_id_filter=table_id)
 
@@ -488,6 +697,31 @@ class TableAwareRetrieval:
             logger.error(f"Table reconstruction failed for {table_id}: {e}")
             return None
 
+    def _reconstruct_from_store(self, stored: StoredTable) -> ReconstructedTable:
+        """Build a ReconstructedTable from a table store entry."""
+        rows, cols = stored.dimensions
+
+        # Header row: first row with a cell classified as HEADER, as in the chunker
+        header_row = next((row_idx for row_idx, row_roles in enumerate(stored.roles)
+                           if any(role == "HEADER" for role in row_roles)), None)
+        if header_row is not None:
+            headers = [stored.data[header_row][col] or f"Column_{col}" for col in range(cols)]
+        else:
+            headers = [f"Column_{col}" for col in range(cols)]
+
+        return ReconstructedTable(
+            table_id=stored.table_id,
+            title=stored.title,
+            dimensions=(rows, cols),
+            data=stored.data,
+            headers=headers,
+            role_matrix=stored.roles,
+            data_types=stored.data_types,
+            metadata=stored.table_structure,
+            confidence_scores=stored.confidences,
+            source_document=stored.source or "unknown"
+        )
+
     def find_tables_by_content(self, query: str, max_results: int = 5) -> List[str]:
         """
         Find table IDs that contain content matching the query and have retrievable data.
@@ -513,11 +747,11 @@ class TableAwareRetrieval:
                 if table_id and table_id not in candidate_table_ids:
                     candidate_table_ids.add(table_id)
 
-                    # Validate that this table actually has retrievable chunks
-                    table_chunks = self.search_table_content("", table_id_filter=table_id)
-                    if table_chunks:
+                    # Validate that this table actually has retrievable data
+                    if (self.table_store and self.table_store.has_table(table_id)) or \
+                            self.search_table_content("", table_id_filter=table_id):
                         validated_table_ids.append(table_id)
-                        logger.debug(f"Validated table {table_id} with {len(table_chunks)} chunks")
+                        logger.debug(f"Validated table {table_id}")
 
                         if len(validated_table_ids) >= max_results:
                             break
@@ -622,8 +856,8 @@ class TableAwareRetrieval:
             Dictionary with structured data for analysis
         """
         try:
-            # Get all chunks for this table
-            table_chunks = self.search_table_content("", table_id_filter=table_id)
+            # Get all cells for this table
+            table_chunks = self.get_table_cells(table_id)
 
             if not table_chunks:
                 logger.warning(f"No chunks found for table ID: {table_id}")
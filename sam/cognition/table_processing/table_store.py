@@ -0,0 +1,296 @@
+"""
+Columnar Table Store for SAM
+============================
+
+Local SQLite store that keeps complete tables keyed by table_id, one row per
+table column, so the vector store only needs to index a few summary, header
+and row-group chunks per table. Reconstructing a table is a keyed read
+instead of reassembling one memory chunk per cell.
+"""
+
+import json
+import sqlite3
+import logging
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StoredTable:
+    """Complete table read back from the columnar store (row-major matrices)."""
+    table_id: str
+    title: Optional[str]
+    source: Optional[str]
+    data: List[List[str]]
+    roles: List[List[str]]
+    data_types: List[List[str]]
+    confidences: List[List[float]]
+    table_structure: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def dimensions(self) -> Tuple[int, int]:
+        """Table dimensions (rows, columns)."""
+        return len(self.data), len(self.data[0]) if self.data else 0
+
+
+class TableStore:
+    """
+    SQLite-backed columnar storage for extracted tables.
+
+    Each column is stored as JSON arrays of its cell values, roles, data types
+    and classification confidences, with the table's primary key as prefix of
+    the column key, so a whole table is read with a single indexed range scan.
+    """
+
+    def __init__(self, db_path: str = "data/table_store.db"):
+        """
+        Initialize the table store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_database()
+
+        logger.info(f"Table store initialized with DB: {self.db_path}")
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_database(self) -> None:
+        """Initialize the database schema."""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS stored_tables (
+                    table_id TEXT PRIMARY KEY,
+                    title TEXT,
+                    source TEXT,
+                    num_rows INTEGER NOT NULL,
+                    num_columns INTEGER NOT NULL,
+                    table_structure TEXT,
+                    created_at TEXT NOT NULL
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS table_columns (
+                    table_id TEXT NOT NULL,
+                    column_index INTEGER NOT NULL,
+                    cell_values TEXT NOT NULL,
+                    cell_roles TEXT NOT NULL,
+                    cell_data_types TEXT NOT NULL,
+                    cell_confidences TEXT NOT NULL,
+                    PRIMARY KEY (table_id, column_index)
+                ) WITHOUT ROWID
+            """)
+
+    def put_table(self, table_id: str, data: List[List[str]],
+                  roles: Optional[List[List[str]]] = None,
+                  data_types: Optional[List[List[str]]] = None,
+                  confidences: Optional[List[List[float]]] = None,
+                  title: Optional[str] = None, source: Optional[str] = None,
+                  table_structure: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Store a table, replacing any table with the same ID.
+
+        Args:
+            table_id: Table identifier
+            data: Row-major cell contents; ragged rows are padded with ""
+            roles: Optional row-major cell roles (default "DATA")
+            data_types: Optional row-major cell data types (default "text")
+            confidences: Optional row-major classification confidences (default 0.0)
+            title: Optional table title
+            source: Optional source document description
+            table_structure: Optional JSON-serializable table-level metadata
+
+        Returns:
+            True if the table was stored, False otherwise
+        """
+        try:
+            num_rows = len(data)
+            num_columns = max((len(row) for row in data), default=0)
+
+            def column(matrix, col_idx, default):
+                if matrix is None:
+                    return [default] * num_rows
+                return [row[col_idx] if col_idx < len(row) else default for row in matrix]
+
+            column_rows = [
+                (
+                    table_id,
+                    col_idx,
+                    json.dumps(column(data, col_idx, "")),
+                    json.dumps(column(roles, col_idx, "DATA")),
+                    json.dumps(column(data_types, col_idx, "text")),
+                    json.dumps(column(confidences, col_idx, 0.0))
+                )
+                for col_idx in range(num_columns)
+            ]
+
+            with self._connect() as conn:
+                conn.execute("DELETE FROM table_columns WHERE table_id = ?", (table_id,))
+                conn.execute("""
+                    INSERT OR REPLACE INTO stored_tables (
+                        table_id, title, source, num_rows, num_columns, table_structure, created_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    table_id, title, source, num_rows, num_columns,
+                    json.dumps(table_structure or {}, default=str),
+                    datetime.now().isoformat()
+                ))
+                conn.executemany("""
+                    INSERT INTO table_columns (
+                        table_id, column_index, cell_values, cell_roles, cell_data_types, cell_confidences
+                    ) VALUES (?, ?, ?, ?, ?, ?)
+                """, column_rows)
+
+            logger.debug(f"Stored table {table_id} ({num_rows}x{num_columns})")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to store table {table_id}: {e}")
+            return False
+
+    def get_table(self, table_id: str) -> Optional[StoredTable]:
+        """
+        Read a complete table.
+
+        Args:
+            table_id: Table identifier
+
+        Returns:
+            StoredTable or None if the table is not stored
+        """
+        try:
+            with self._connect() as conn:
+                table_row = conn.execute(
+                    "SELECT title, source, num_rows, table_structure FROM stored_tables WHERE table_id = ?",
+                    (table_id,)
+                ).fetchone()
+                if table_row is None:
+                    return None
+
+                column_rows = conn.execute("""
+                    SELECT cell_values, cell_roles, cell_data_types, cell_confidences
+                    FROM table_columns WHERE table_id = ? ORDER BY column_index
+                """, (table_id,)).fetchall()
+
+            title, source, num_rows, table_structure = table_row
+            columns = [[json.loads(value) for value in column_row] for column_row in column_rows]
+
+            def rows(part: int) -> List[List[Any]]:
+                return [list(row) for row in zip(*(column[part] for column in columns))] if columns \
+                    else [[] for _ in range(num_rows)]
+
+            return StoredTable(
+                table_id=table_id,
+                title=title,
+                source=source,
+                data=rows(0),
+                roles=rows(1),
+                data_types=rows(2),
+                confidences=rows(3),
+                table_structure=json.loads(table_structure) if table_structure else {}
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to read table {table_id}: {e}")
+            return None
+
+    def has_table(self, table_id: str) -> bool:
+        """
+        Check whether a table is stored.
+
+        Args:
+            table_id: Table identifier
+
+        Returns:
+            True if the table is stored
+        """
+        try:
+            with self._connect() as conn:
+                return conn.execute(
+                    "SELECT 1 FROM stored_tables WHERE table_id = ?", (table_id,)
+                ).fetchone() is not None
+        except Exception as e:
+            logger.error(f"Failed to look up table {table_id}: {e}")
+            return False
+
+    def delete_table(self, table_id: str) -> bool:
+        """
+        Delete a stored table.
+
+        Args:
+            table_id: Table identifier
+
+        Returns:
+            True if a table was deleted
+        """
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM table_columns WHERE table_id = ?", (table_id,))
+                deleted = conn.execute("DELETE FROM stored_tables WHERE table_id = ?", (table_id,)).rowcount
+            return deleted > 0
+        except Exception as e:
+            logger.error(f"Failed to delete table {table_id}: {e}")
+            return False
+
+    def list_table_ids(self) -> List[str]:
+        """
+        List the IDs of all stored tables.
+
+        Returns:
+            Table IDs in insertion order
+        """
+        try:
+            with self._connect() as conn:
+                return [row[0] for row in conn.execute("SELECT table_id FROM stored_tables ORDER BY created_at")]
+        except Exception as e:
+            logger.error(f"Failed to list tables: {e}")
+            return []
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with table and cell counts and database size
+        """
+        try:
+            with self._connect() as conn:
+                tables, cells = conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(num_rows * num_columns), 0) FROM stored_tables"
+                ).fetchone()
+            return {
+                "total_tables": tables,
+                "total_cells": cells,
+                "db_size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0
+            }
+        except Exception as e:
+            logger.error(f"Failed to get table store stats: {e}")
+            return {"total_tables": 0, "total_cells": 0, "db_size_bytes": 0}
+
+
+# Global instance for easy access
+_table_store: Optional[TableStore] = None
+
+
+def get_table_store(db_path: str = "data/table_store.db") -> TableStore:
+    """Get global table store instance."""
+    global _table_store
+    if _table_store is None:
+        _table_store = TableStore(db_path)
+    return _table_store
@@ -23,8 +23,9 @@ import uuid
 import time
 import threading
 import json
+import queue
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
@@ -93,6 +94,7 @@ class TraceLogger:
         self._active_traces: Dict[str, Dict[str, Any]] = {}
         self._lock = threading.RLock()
         self._performance_metrics: Dict[str, Dict[str, float]] = {}
+        self._subscribers: Dict[str, List[queue.Queue]] = {}
         
         logger.info("TraceLogger initialized")
 
@@ -210,12 +212,17 @@ class TraceLogger:
 
         with self._lock:
             self._traces[trace_id].append(event)
+            sequence = len(self._traces[trace_id])
             
             # Update performance metrics
             if trace_id in self._performance_metrics:
                 self._performance_metrics[trace_id]['events_logged'] += 1
                 self._performance_metrics[trace_id]['modules_involved'].add(source_module)
 
+            # Push the new event to live stream subscribers
+            if self._subscribers.get(trace_id):
+                self._publish_event(trace_id, sequence, event)
+
         # Handle both EventType enum and string values
         event_type_str = event_type.value if hasattr(event_type, 'value') else str(event_type)
         logger.debug(f"Logged {event_type_str} event for trace {trace_id}: {message}")
@@ -284,6 +291,96 @@ class TraceLogger:
             
             return [event.to_dict() for event in self._traces[trace_id]]
 
+    def get_trace_events_since(self, trace_id: str, sequence: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Get events logged after a given sequence number.
+        
+        Args:
+            trace_id: Trace identifier
+            sequence: Last sequence number already seen (0 for all events)
+            
+        Returns:
+            List of (sequence, event dictionary) tuples
+        """
+        with self._lock:
+            events = self._traces.get(trace_id, [])
+            start = max(0, sequence)
+            return [(index + 1, events[index].to_dict())
+                    for index in range(start, len(events))]
+
+    def subscribe(self, trace_id: str, since_sequence: int = 0,
+                  max_queue_size: int = 1000) -> Tuple[queue.Queue, List[Tuple[int, Dict[str, Any]]]]:
+        """
+        Subscribe to live events for a trace.
+        
+        The backlog of events after ``since_sequence`` is captured atomically with
+        the registration, so no event is lost or duplicated between the replay and
+        the live queue.
+        
+        Args:
+            trace_id: Trace identifier
+            since_sequence: Last sequence number the subscriber has already seen
+            max_queue_size: Maximum number of undelivered events before the
+                subscriber is dropped and receives a (None, None) overflow marker
+            
+        Returns:
+            Tuple of (subscriber queue, backlog of (sequence, event) tuples)
+        """
+        subscriber = queue.Queue(maxsize=max_queue_size)
+
+        with self._lock:
+            backlog = self.get_trace_events_since(trace_id, since_sequence)
+            self._subscribers.setdefault(trace_id, []).append(subscriber)
+
+        logger.debug(f"Added stream subscriber for trace {trace_id} from sequence {since_sequence}")
+        return subscriber, backlog
+
+    def unsubscribe(self, trace_id: str, subscriber: queue.Queue) -> None:
+        """
+        Remove a live event subscriber.
+        
+        Args:
+            trace_id: Trace identifier
+            subscriber: Queue returned by subscribe()
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(trace_id, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self._subscribers.pop(trace_id, None)
+
+    def is_trace_active(self, trace_id: str) -> bool:
+        """Check whether a trace exists and has not ended yet."""
+        with self._lock:
+            info = self._active_traces.get(trace_id)
+            return bool(info) and info.get('status') == 'active'
+
+    def _publish_event(self, trace_id: str, sequence: int, event: TraceEvent) -> None:
+        """Deliver an event to all subscribers of a trace (caller holds the lock)."""
+        event_dict = event.to_dict()
+        stale = []
+
+        for subscriber in self._subscribers.get(trace_id, []):
+            try:
+                subscriber.put_nowait((sequence, event_dict))
+            except queue.Full:
+                # A stalled client must not block tracing; it can resume by sequence
+                stale.append(subscriber)
+
+        for subscriber in stale:
+            logger.warning(f"Dropping slow stream subscriber for trace {trace_id}")
+            self._subscribers[trace_id].remove(subscriber)
+
+            # Replace the backlog with an overflow marker so the reader resubscribes
+            # from its last delivered sequence instead of silently missing events
+            while True:
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    break
+            subscriber.put_nowait((None, None))
+
     def get_trace_summary(self, trace_id: str) -> Dict[str, Any]:
         """
         Get a summary of a trace.
@@ -348,6 +445,7 @@ class TraceLogger:
                     del self._active_traces[trace_id]
                 if trace_id in self._performance_metrics:
                     del self._performance_metrics[trace_id]
+                self._subscribers.pop(trace_id, None)
                 cleaned_count += 1
 
         logger.info(f"Cleaned up {cleaned_count} old traces")
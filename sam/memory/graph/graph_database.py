@@ -5,7 +5,7 @@ Supports Neo4j and fallback to NetworkX for development
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterator
 from dataclasses import dataclass
 from datetime import datetime
 import json
@@ -22,6 +22,9 @@ except ImportError:
 import networkx as nx
 from pathlib import Path
 
+from sam.memory.graph.graph_store import GraphStore
+from sam.memory.graph.graph_index import GraphIndex, MatchQuery, NodePattern, node_labels, parse_match_query
+
 # SAM imports
 try:
     from config.logging_config import get_logger
@@ -285,22 +288,34 @@ class NetworkXDatabase(GraphDatabaseInterface):
     def __init__(self, persist_path: Optional[str] = None):
         self.graph = nx.MultiDiGraph()
         self.persist_path = persist_path
+        self.store: Optional[GraphStore] = None
+        self.index = GraphIndex()
         self.connected = False
         self.node_counter = 0
         self.relationship_counter = 0
     
     async def connect(self) -> bool:
-        """Initialize NetworkX graph."""
+        """Initialize NetworkX graph from its SQLite store."""
         try:
-            if self.persist_path and Path(self.persist_path).exists():
-                # Load existing graph
-                self.graph = nx.read_gml(self.persist_path)
-                logger.info(f"Loaded existing graph from {self.persist_path}")
+            if self.persist_path:
+                # Mutations are persisted incrementally in a SQLite store next to persist_path
+                self.store = GraphStore(str(Path(self.persist_path).with_suffix(".db")))
+
+                legacy_path = Path(self.persist_path).with_suffix(".gml")
+                if self.store.is_empty() and legacy_path.exists():
+                    # One-time migration of a graph saved by earlier versions
+                    self.store.import_graph(nx.read_gml(legacy_path))
+                    logger.info(f"Migrated graph from {legacy_path} to {self.store.db_path}")
+
+                self.graph = self.store.load_graph()
+                logger.info(f"Loaded graph from {self.store.db_path}: "
+                            f"{self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
             else:
                 # Create new graph
                 self.graph = nx.MultiDiGraph()
                 logger.info("Created new NetworkX graph")
             
+            self.index.rebuild(self.graph)
             self.connected = True
             return True
             
@@ -309,16 +324,18 @@ class NetworkXDatabase(GraphDatabaseInterface):
             return False
     
     async def disconnect(self) -> None:
-        """Save and disconnect from NetworkX graph."""
+        """Close the graph store and disconnect from NetworkX graph."""
         try:
-            if self.persist_path:
-                nx.write_gml(self.graph, self.persist_path)
-                logger.info(f"Saved graph to {self.persist_path}")
+            if self.store:
+                # Every mutation is already committed; closing only checkpoints the log
+                self.store.close()
+                self.store = None
+                logger.info(f"Closed graph store for {self.persist_path}")
             
             self.connected = False
             
         except Exception as e:
-            logger.error(f"Failed to save NetworkX graph: {e}")
+            logger.error(f"Failed to close NetworkX graph store: {e}")
     
     async def create_node(self, node: NodeData) -> bool:
         """Create a node in NetworkX graph."""
@@ -326,12 +343,20 @@ class NetworkXDatabase(GraphDatabaseInterface):
             if not self.connected:
                 return False
             
+            old_attributes = dict(self.graph.nodes.get(node.id, {}))
+            attributes = {**old_attributes, "labels": node.labels, **node.properties}
+            
+            # Persist before mutating so the graph never holds unsaved state
+            if self.store:
+                self.store.save_node(node.id, attributes)
+            
             # Add node with properties
             self.graph.add_node(
                 node.id,
                 labels=node.labels,
                 **node.properties
             )
+            self.index.update_node(node.id, old_attributes, attributes)
             
             self.node_counter += 1
             logger.debug(f"Created NetworkX node: {node.id}")
@@ -347,14 +372,26 @@ class NetworkXDatabase(GraphDatabaseInterface):
             if not self.connected:
                 return False
             
+            start_node, end_node = relationship.start_node, relationship.end_node
+            existing = self.graph.get_edge_data(start_node, end_node, key=relationship.id)
+            old_type = existing.get("type") if existing is not None else None
+            
+            # Persist before mutating so the graph never holds unsaved state
+            if self.store:
+                attributes = {**(existing or {}), "type": relationship.type, **relationship.properties}
+                new_nodes = [node_id for node_id in dict.fromkeys((start_node, end_node))
+                             if node_id not in self.graph]
+                self.store.save_edge(start_node, end_node, relationship.id, attributes, new_nodes)
+            
             # Add edge with properties
             self.graph.add_edge(
-                relationship.start_node,
-                relationship.end_node,
+                start_node,
+                end_node,
                 key=relationship.id,
                 type=relationship.type,
                 **relationship.properties
             )
+            self.index.update_edge(start_node, end_node, old_type, relationship.type, existed=existing is not None)
             
             self.relationship_counter += 1
             logger.debug(f"Created NetworkX relationship: {relationship.id}")
@@ -372,8 +409,12 @@ class NetworkXDatabase(GraphDatabaseInterface):
             # For NetworkX, implement basic query patterns
             # This is a simplified implementation
             data = []
+            match_query = parse_match_query(query, parameters)
             
-            if "MATCH" in query.upper() and "RETURN" in query.upper():
+            if match_query:
+                # Label, property and typed-relationship patterns answered from the indexes
+                data = self._execute_match(match_query)
+            elif "MATCH" in query.upper() and "RETURN" in query.upper():
                 # Basic node retrieval
                 if "RETURN n" in query:
                     for node_id in self.graph.nodes():
@@ -425,13 +466,13 @@ class NetworkXDatabase(GraphDatabaseInterface):
             neighbors = []
             
             if node_id in self.graph.nodes:
-                for neighbor_id in self.graph.neighbors(node_id):
-                    # Check relationship type if specified
-                    if relationship_type:
-                        edge_data = self.graph.get_edge_data(node_id, neighbor_id)
-                        if not any(data.get("type") == relationship_type for data in edge_data.values()):
-                            continue
-                    
+                if relationship_type:
+                    # Typed adjacency index instead of checking every edge of the node
+                    neighbor_ids = self.index.neighbors(node_id, relationship_type)
+                else:
+                    neighbor_ids = self.graph.neighbors(node_id)
+                
+                for neighbor_id in neighbor_ids:
                     neighbor_data = self.graph.nodes[neighbor_id]
                     neighbors.append(NodeData(
                         id=neighbor_id,
@@ -444,6 +485,91 @@ class NetworkXDatabase(GraphDatabaseInterface):
         except Exception as e:
             logger.error(f"Failed to get NetworkX neighbors for {node_id}: {e}")
             return []
+    
+    def _execute_match(self, match_query: MatchQuery) -> List[Dict[str, Any]]:
+        """
+        Answer a parsed MATCH query from the indexes.
+        
+        Args:
+            match_query: Parsed single-node or single-hop query
+            
+        Returns:
+            Result records keyed by the RETURN columns
+        """
+        rows = []
+        for bindings in self._match_bindings(match_query):
+            record = {}
+            for column, kind, variable in match_query.returns:
+                node_id = bindings[variable]
+                node_data = self.graph.nodes[node_id]
+                record[column] = {"id": node_id, **node_data} if kind == "node" else node_labels(node_data)
+            rows.append(record)
+            if match_query.limit is not None and len(rows) >= match_query.limit:
+                break
+        return rows
+    
+    def _match_bindings(self, match_query: MatchQuery) -> Iterator[Dict[str, str]]:
+        """Yield {variable: node_id} bindings for each match of the pattern."""
+        first = match_query.nodes[0]
+        if len(match_query.nodes) == 1:
+            for node_id in self._match_nodes(first):
+                yield {first.variable: node_id}
+            return
+        
+        # Start from the constrained end of the relationship when only one end is constrained
+        second = match_query.nodes[1]
+        direction = match_query.direction
+        reverse = not first.constrained and second.constrained
+        if reverse:
+            first, second = second, first
+            direction = {"out": "in", "in": "out"}.get(direction, direction)
+        
+        for node_id in self._match_nodes(first):
+            for neighbor_id in self._adjacent(node_id, match_query.relationship_type, direction):
+                if self._node_matches(neighbor_id, second):
+                    yield {first.variable: node_id, second.variable: neighbor_id}
+    
+    def _match_nodes(self, pattern: NodePattern) -> Iterator[str]:
+        """Find the nodes matching a node pattern via its most selective index."""
+        if "id" in pattern.properties:
+            node_id = pattern.properties["id"]
+            candidates = [node_id] if self._has_node(node_id) else []
+        else:
+            candidate_sets = [self.index.nodes_with_label(label) for label in pattern.labels]
+            candidate_sets += [nodes for nodes in (self.index.nodes_with_property(key, value)
+                                                   for key, value in pattern.properties.items())
+                               if nodes is not None]
+            candidates = min(candidate_sets, key=len) if candidate_sets else self.graph.nodes
+        
+        return (node_id for node_id in candidates if self._node_matches(node_id, pattern))
+    
+    def _node_matches(self, node_id: str, pattern: NodePattern) -> bool:
+        """Check a node against a node pattern's labels and properties."""
+        node_data = self.graph.nodes[node_id]
+        labels = node_labels(node_data)
+        if any(label not in labels for label in pattern.labels):
+            return False
+        return all(node_id == value if key == "id" else key in node_data and node_data[key] == value
+                   for key, value in pattern.properties.items())
+    
+    def _adjacent(self, node_id: str, relationship_type: Optional[str], direction: str) -> List[str]:
+        """Get the nodes one relationship away in the given direction."""
+        if relationship_type:
+            return self.index.neighbors(node_id, relationship_type, direction)
+        
+        neighbors = {}
+        if direction in ("out", "both"):
+            neighbors.update(dict.fromkeys(self.graph.successors(node_id)))
+        if direction in ("in", "both"):
+            neighbors.update(dict.fromkeys(self.graph.predecessors(node_id)))
+        return list(neighbors)
+    
+    def _has_node(self, node_id: Any) -> bool:
+        """Check for a node, treating unhashable ids as missing."""
+        try:
+            return node_id in self.graph
+        except TypeError:
+            return False
 
 class GraphDatabaseManager:
     """Manager for graph database operations with fallback support."""
@@ -482,7 +608,7 @@ class GraphDatabaseManager:
         
         # Fallback to NetworkX
         self.database = NetworkXDatabase(
-            persist_path="sam/memory/graph/networkx_graph.gml"
+            persist_path="sam/memory/graph/networkx_graph.db"
         )
         
         if await self.database.connect():
@@ -0,0 +1,312 @@
+"""
+Graph Indexes for SAM's NetworkX Graph Backend
+Label, property and typed-adjacency indexes plus MATCH pattern parsing
+
+NetworkXDatabase keeps these indexes in step with every write so that
+match-by-label, match-by-property and typed-neighbor lookups cost time
+proportional to the result instead of a scan over the whole graph.
+"""
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional, Tuple, Hashable, Iterable
+
+import networkx as nx
+
+
+def node_labels(attributes: Dict[str, Any]) -> List[str]:
+    """
+    Get a node's labels from its attributes.
+
+    Args:
+        attributes: Node attribute dictionary
+
+    Returns:
+        List of labels (GML stores a single label as a plain string)
+    """
+    labels = attributes.get("labels", [])
+    if isinstance(labels, str):
+        return [labels]
+    return list(labels)
+
+
+def _is_hashable(value: Any) -> bool:
+    """Check whether a property value can be used as an index key."""
+    try:
+        hash(value)
+        return True
+    except TypeError:
+        return False
+
+
+class GraphIndex:
+    """
+    Secondary indexes over a NetworkX MultiDiGraph.
+
+    Buckets are insertion-ordered dicts used as ordered sets. Property values
+    that are not hashable (lists, dicts) are not indexed; lookups for them
+    return None so callers fall back to checking nodes directly.
+    """
+
+    def __init__(self):
+        self._labels: Dict[str, Dict[Hashable, None]] = {}
+        self._properties: Dict[Tuple[str, Any], Dict[Hashable, None]] = {}
+        # node -> relationship type -> neighbor -> number of parallel edges of that type
+        self._successors: Dict[Hashable, Dict[Any, Dict[Hashable, int]]] = defaultdict(dict)
+        self._predecessors: Dict[Hashable, Dict[Any, Dict[Hashable, int]]] = defaultdict(dict)
+
+    def rebuild(self, graph: nx.MultiDiGraph) -> None:
+        """
+        Index every node and edge of a graph, replacing the current indexes.
+
+        Args:
+            graph: Graph to index
+        """
+        self.__init__()
+        for node_id, attributes in graph.nodes(data=True):
+            self.update_node(node_id, {}, attributes)
+        for start_node, end_node, attributes in graph.edges(data=True):
+            self.update_edge(start_node, end_node, None, attributes.get("type"))
+
+    def update_node(self, node_id: Hashable, old_attributes: Dict[str, Any],
+                    new_attributes: Dict[str, Any]) -> None:
+        """
+        Re-index a node whose attributes changed.
+
+        Args:
+            node_id: Node identifier
+            old_attributes: Attributes before the write ({} for a new node)
+            new_attributes: Attributes after the write
+        """
+        for label in node_labels(old_attributes):
+            self._discard(self._labels, label, node_id)
+        for entry in self._property_entries(old_attributes):
+            self._discard(self._properties, entry, node_id)
+
+        for label in node_labels(new_attributes):
+            self._labels.setdefault(label, {})[node_id] = None
+        for entry in self._property_entries(new_attributes):
+            self._properties.setdefault(entry, {})[node_id] = None
+
+    def update_edge(self, start_node: Hashable, end_node: Hashable,
+                    old_type: Optional[Any], new_type: Any, existed: bool = False) -> None:
+        """
+        Re-index an edge that was created or whose type changed.
+
+        Args:
+            start_node: Source node identifier
+            end_node: Target node identifier
+            old_type: Relationship type before the write
+            new_type: Relationship type after the write
+            existed: Whether the edge (same key) existed before the write
+        """
+        if existed:
+            self._unlink(self._successors, start_node, old_type, end_node)
+            self._unlink(self._predecessors, end_node, old_type, start_node)
+        self._link(self._successors, start_node, new_type, end_node)
+        self._link(self._predecessors, end_node, new_type, start_node)
+
+    def nodes_with_label(self, label: str) -> Iterable[Hashable]:
+        """Get the nodes carrying a label."""
+        return self._labels.get(label, {}).keys()
+
+    def nodes_with_property(self, key: str, value: Any) -> Optional[Iterable[Hashable]]:
+        """
+        Get the nodes whose property equals a value.
+
+        Returns:
+            Matching node ids, or None if the value cannot be looked up in the index
+        """
+        if not _is_hashable(value):
+            return None
+        return self._properties.get((key, value), {}).keys()
+
+    def neighbors(self, node_id: Hashable, relationship_type: Any, direction: str = "out") -> List[Hashable]:
+        """
+        Get the nodes connected to a node by relationships of one type.
+
+        Args:
+            node_id: Node to start from
+            relationship_type: Relationship type to follow
+            direction: "out" for successors, "in" for predecessors, "both" for either
+
+        Returns:
+            Neighbor ids without duplicates
+        """
+        neighbors: Dict[Hashable, None] = {}
+        if direction in ("out", "both"):
+            neighbors.update(dict.fromkeys(self._successors.get(node_id, {}).get(relationship_type, {})))
+        if direction in ("in", "both"):
+            neighbors.update(dict.fromkeys(self._predecessors.get(node_id, {}).get(relationship_type, {})))
+        return list(neighbors)
+
+    @staticmethod
+    def _property_entries(attributes: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """Get the indexable (key, value) pairs of a node's attributes."""
+        return [(key, value) for key, value in attributes.items()
+                if key != "labels" and _is_hashable(value)]
+
+    @staticmethod
+    def _discard(index: Dict[Any, Dict[Hashable, None]], key: Any, node_id: Hashable) -> None:
+        """Remove a node from an index bucket, dropping the bucket when it empties."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(node_id, None)
+            if not bucket:
+                del index[key]
+
+    @staticmethod
+    def _link(adjacency, node_id: Hashable, relationship_type: Any, neighbor: Hashable) -> None:
+        """Count one more edge of a type between two nodes."""
+        by_type = adjacency[node_id].setdefault(relationship_type, {})
+        by_type[neighbor] = by_type.get(neighbor, 0) + 1
+
+    @staticmethod
+    def _unlink(adjacency, node_id: Hashable, relationship_type: Any, neighbor: Hashable) -> None:
+        """Count one edge of a type less between two nodes."""
+        by_type = adjacency.get(node_id, {}).get(relationship_type)
+        if not by_type or neighbor not in by_type:
+            return
+        by_type[neighbor] -= 1
+        if not by_type[neighbor]:
+            del by_type[neighbor]
+            if not by_type:
+                del adjacency[node_id][relationship_type]
+
+
+@dataclass
+class NodePattern:
+    """A node pattern such as (n:Concept {name: $name})."""
+    variable: Optional[str]
+    labels: List[str] = field(default_factory=list)
+    properties: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def constrained(self) -> bool:
+        """Whether the pattern restricts which nodes match."""
+        return bool(self.labels or self.properties)
+
+
+@dataclass
+class MatchQuery:
+    """A parsed single-hop MATCH ... RETURN query."""
+    nodes: List[NodePattern]
+    relationship_type: Optional[str] = None
+    direction: str = "out"
+    returns: List[Tuple[str, str, str]] = field(default_factory=list)  # (column, "node" | "labels", variable)
+    limit: Optional[int] = None
+
+
+_VALUE = r"""\$\w+|'[^']*'|"[^"]*"|-?\d+(?:\.\d+)?|true|false|null"""
+_NODE = r"\(\s*(\w+)?((?:\s*:\s*\w+)*)\s*(\{[^}]*\})?\s*\)"
+_RELATIONSHIP = r"(<)?-(?:\[\s*\w*\s*(?::\s*(\w+))?\s*\])?-(>)?"
+_MATCH_RE = re.compile(
+    rf"\s*MATCH\s+{_NODE}(?:\s*({_RELATIONSHIP})\s*{_NODE})?"
+    rf"(?:\s+WHERE\s+(.+?))?\s+RETURN\s+(.+?)(?:\s+LIMIT\s+(\d+))?\s*;?\s*",
+    re.IGNORECASE | re.DOTALL
+)
+_PROPERTY_RE = re.compile(rf"\s*(\w+)\s*:\s*({_VALUE})\s*", re.IGNORECASE)
+_CONDITION_RE = re.compile(rf"\s*(\w+)\.(\w+)\s*=\s*({_VALUE})\s*", re.IGNORECASE)
+_RETURN_RE = re.compile(r"\s*(?:labels\(\s*(\w+)\s*\)(?:\s+as\s+(\w+))?|(\w+))\s*", re.IGNORECASE)
+
+
+def _parse_value(token: str, parameters: Dict[str, Any]) -> Any:
+    """Resolve a literal or $parameter token."""
+    if token.startswith("$"):
+        if token[1:] not in parameters:
+            raise ValueError(f"Missing query parameter: {token}")
+        return parameters[token[1:]]
+    if token[0] in "'\"":
+        return token[1:-1]
+    lowered = token.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered == "null":
+        return None
+    return float(token) if "." in token else int(token)
+
+
+def _split_clauses(text: str, separator: str) -> List[str]:
+    """Split on a separator pattern that is outside of quoted strings."""
+    return re.split(rf"""{separator}(?=(?:[^'"]|'[^']*'|"[^"]*")*$)""", text, flags=re.IGNORECASE)
+
+
+def _parse_node_pattern(variable: Optional[str], labels: str, properties: Optional[str],
+                        parameters: Dict[str, Any]) -> Optional[NodePattern]:
+    """Parse one node pattern, or return None if its property map is not supported."""
+    pattern = NodePattern(variable, [label.strip() for label in labels.split(":") if label.strip()])
+    body = properties.strip()[1:-1] if properties else ""
+    if body.strip():
+        for item in _split_clauses(body, ","):
+            item_match = _PROPERTY_RE.fullmatch(item)
+            if not item_match:
+                return None
+            pattern.properties[item_match.group(1)] = _parse_value(item_match.group(2), parameters)
+    return pattern
+
+
+def parse_match_query(query: str, parameters: Optional[Dict[str, Any]] = None) -> Optional[MatchQuery]:
+    """
+    Parse the MATCH patterns the NetworkX backend answers from its indexes.
+
+    Supported: one node pattern, or two joined by a single typed or untyped
+    relationship; labels and property maps on nodes; WHERE clauses of
+    var.key = value joined by AND; RETURN of node variables and labels(var);
+    and LIMIT.
+
+    Args:
+        query: Cypher-style query string
+        parameters: Values for $parameters in the query
+
+    Returns:
+        Parsed query, or None if the query uses anything else
+
+    Raises:
+        ValueError: If the query references a parameter that was not given
+    """
+    parameters = parameters or {}
+    match = _MATCH_RE.fullmatch(query)
+    if not match:
+        return None
+
+    (var1, labels1, props1, relationship, left_arrow, relationship_type, right_arrow,
+     var2, labels2, props2, where, returns, limit) = match.groups()
+    if left_arrow and right_arrow:
+        return None
+
+    nodes = [_parse_node_pattern(var1, labels1, props1, parameters)]
+    if relationship:
+        nodes.append(_parse_node_pattern(var2, labels2, props2, parameters))
+    if None in nodes:
+        return None
+
+    named = [node.variable for node in nodes if node.variable]
+    if len(set(named)) != len(named):
+        return None
+    variables = {node.variable: node for node in nodes if node.variable}
+
+    if where:
+        for condition in _split_clauses(where, r"\s+AND\s+"):
+            condition_match = _CONDITION_RE.fullmatch(condition)
+            if not condition_match or condition_match.group(1) not in variables:
+                return None
+            variables[condition_match.group(1)].properties[condition_match.group(2)] = \
+                _parse_value(condition_match.group(3), parameters)
+
+    columns = []
+    for item in _split_clauses(returns, ","):
+        item_match = _RETURN_RE.fullmatch(item)
+        if not item_match:
+            return None
+        labels_variable, alias, node_variable = item_match.groups()
+        if (labels_variable or node_variable) not in variables:
+            return None
+        if node_variable:
+            columns.append((node_variable, "node", node_variable))
+        else:
+            columns.append((alias or f"labels({labels_variable})", "labels", labels_variable))
+
+    direction = "out" if right_arrow else "in" if left_arrow else "both"
+    return MatchQuery(nodes=nodes, relationship_type=relationship_type, direction=direction,
+                      returns=columns, limit=int(limit) if limit else None)
@@ -0,0 +1,179 @@
+"""
+SQLite Graph Store for SAM's NetworkX Graph Backend
+Persists graph mutations incrementally instead of rewriting a GML file
+
+Nodes and edges live in their own tables, keyed like the in-memory
+MultiDiGraph, with their attribute dictionaries stored as JSON. Every
+mutation is committed as its own small transaction. In WAL mode a commit
+appends the changed pages to the write-ahead log, and SQLite checkpoints
+fold the log back into the tables. A crash therefore loses at most the
+mutation in progress. Startup reads the two tables back in insertion order.
+"""
+
+import json
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Hashable
+
+import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+
+class GraphStore:
+    """
+    SQLite-backed persistence for a NetworkX MultiDiGraph.
+
+    Writes are O(1) in the size of the graph: creating or updating a node or
+    edge upserts one row (plus endpoint rows for edges to new nodes).
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the graph store.
+
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # Append-only log of committed mutations
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # Commits survive process crashes
+        self._init_database()
+
+        logger.info(f"Graph store initialized with DB: {self.db_path}")
+
+    def _init_database(self) -> None:
+        """Initialize the database schema."""
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS graph_nodes (
+                    node_id TEXT NOT NULL UNIQUE,
+                    attributes TEXT NOT NULL
+                )
+            """)
+
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS graph_edges (
+                    start_node TEXT NOT NULL,
+                    end_node TEXT NOT NULL,
+                    edge_key TEXT NOT NULL,
+                    attributes TEXT NOT NULL,
+                    UNIQUE (start_node, end_node, edge_key)
+                )
+            """)
+
+    def save_node(self, node_id: Hashable, attributes: Dict[str, Any]) -> None:
+        """
+        Insert or replace a node's attributes.
+
+        Args:
+            node_id: Node identifier
+            attributes: Complete attribute dictionary of the node
+        """
+        with self._lock, self._conn:
+            self._upsert_node(node_id, attributes)
+
+    def save_edge(self, start_node: Hashable, end_node: Hashable, edge_key: Hashable,
+                  attributes: Dict[str, Any], new_nodes: Optional[List[Hashable]] = None) -> None:
+        """
+        Insert or replace an edge's attributes.
+
+        Args:
+            start_node: Source node identifier
+            end_node: Target node identifier
+            edge_key: Key distinguishing parallel edges
+            attributes: Complete attribute dictionary of the edge
+            new_nodes: Endpoints that do not exist yet and are created without attributes
+        """
+        with self._lock, self._conn:
+            for node_id in new_nodes or []:
+                self._upsert_node(node_id, {})
+            self._conn.execute("""
+                INSERT INTO graph_edges (start_node, end_node, edge_key, attributes) VALUES (?, ?, ?, ?)
+                ON CONFLICT (start_node, end_node, edge_key) DO UPDATE SET attributes = excluded.attributes
+            """, (str(start_node), str(end_node), str(edge_key), json.dumps(attributes, default=str)))
+
+    def _upsert_node(self, node_id: Hashable, attributes: Dict[str, Any]) -> None:
+        """Upsert a node row, keeping its original insertion position."""
+        self._conn.execute("""
+            INSERT INTO graph_nodes (node_id, attributes) VALUES (?, ?)
+            ON CONFLICT (node_id) DO UPDATE SET attributes = excluded.attributes
+        """, (str(node_id), json.dumps(attributes, default=str)))
+
+    def load_graph(self) -> nx.MultiDiGraph:
+        """
+        Read the stored graph.
+
+        Returns:
+            MultiDiGraph with nodes and edges in insertion order
+        """
+        graph = nx.MultiDiGraph()
+        with self._lock:
+            graph.add_nodes_from(
+                (node_id, json.loads(attributes))
+                for node_id, attributes in self._conn.execute(
+                    "SELECT node_id, attributes FROM graph_nodes ORDER BY rowid")
+            )
+            graph.add_edges_from(
+                (start_node, end_node, edge_key, json.loads(attributes))
+                for start_node, end_node, edge_key, attributes in self._conn.execute(
+                    "SELECT start_node, end_node, edge_key, attributes FROM graph_edges ORDER BY rowid")
+            )
+        return graph
+
+    def import_graph(self, graph: nx.MultiDiGraph) -> None:
+        """
+        Store a complete graph in one transaction, replacing stored rows with the same keys.
+
+        Args:
+            graph: Graph to import, e.g. one read from a legacy GML file
+        """
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO graph_nodes (node_id, attributes) VALUES (?, ?)
+                ON CONFLICT (node_id) DO UPDATE SET attributes = excluded.attributes
+            """, ((str(node_id), json.dumps(attributes, default=str))
+                  for node_id, attributes in graph.nodes(data=True)))
+
+            edges = graph.edges(keys=True, data=True) if graph.is_multigraph() \
+                else ((u, v, 0, data) for u, v, data in graph.edges(data=True))
+            self._conn.executemany("""
+                INSERT INTO graph_edges (start_node, end_node, edge_key, attributes) VALUES (?, ?, ?, ?)
+                ON CONFLICT (start_node, end_node, edge_key) DO UPDATE SET attributes = excluded.attributes
+            """, ((str(u), str(v), str(key), json.dumps(attributes, default=str))
+                  for u, v, key, attributes in edges))
+
+    def is_empty(self) -> bool:
+        """Check whether the store holds no nodes."""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM graph_nodes LIMIT 1").fetchone() is None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with node and edge counts and database size
+        """
+        with self._lock:
+            nodes = self._conn.execute("SELECT COUNT(*) FROM graph_nodes").fetchone()[0]
+            edges = self._conn.execute("SELECT COUNT(*) FROM graph_edges").fetchone()[0]
+        return {
+            "total_nodes": nodes,
+            "total_edges": edges,
+            "db_size_bytes": self.db_path.stat().st_size if self.db_path.exists() else 0
+        }
+
+    def close(self) -> None:
+        """Checkpoint the write-ahead log and close the connection."""
+        with self._lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
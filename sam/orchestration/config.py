@@ -26,7 +26,8 @@ class SOFConfig:
     # Skill execution settings
     max_execution_time: float = 60.0  # Maximum total execution time
     skill_timeout: float = 30.0       # Maximum time per skill
-    enable_parallel_execution: bool = False  # Future feature
+    enable_parallel_execution: bool = False  # Run independent skills of a plan concurrently
+    max_parallel_skills: int = 4      # Maximum skills executing at once in parallel mode
     
     # Plan validation settings
     enable_plan_validation: bool = True
@@ -46,6 +47,7 @@ class SOFConfig:
     # Performance settings
     enable_plan_caching: bool = True
     plan_cache_ttl: int = 3600  # 1 hour
+    plan_cache_max_entries: int = 256  # Least recently used plans are evicted beyond this
     enable_execution_metrics: bool = True
     
     # Integration settings
@@ -228,10 +230,16 @@ class SOFConfigManager:
         
         if config.max_retry_attempts < 0:
             issues.append("max_retry_attempts cannot be negative")
+
+        if config.max_parallel_skills <= 0:
+            issues.append("max_parallel_skills must be positive")
         
         # Validate cache settings
         if config.plan_cache_ttl <= 0:
             issues.append("plan_cache_ttl must be positive")
+
+        if config.plan_cache_max_entries <= 0:
+            issues.append("plan_cache_max_entries must be positive")
         
         # Validate data size limits
         if config.max_intermediate_data_size <= 0:
@@ -20,6 +20,7 @@ from .planner import DynamicPlanner, PlanGenerationResult
 from .config import get_sof_config
 from .loss_balancer import LossBalancer, EffortAllocation
 from .domain_constraints import DomainConstraints, ConstraintSeverity
+from .skill_scheduler import ParallelSkillScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -263,6 +264,10 @@ class CoordinatorEngine:
         """
         Execute a validated plan step by step with PINN-inspired effort allocation.
 
+        With parallel execution enabled, independent skills run concurrently and
+        their results are committed here in plan order, as a sequential run would.
+        Plans with effort allocation always run sequentially.
+
         Args:
             plan: Validated execution plan
             uif: Universal Interface Format
@@ -293,78 +298,93 @@ class CoordinatorEngine:
 
             uif.add_log_entry(f"Effort allocation initialized for {len(execution_plan)} skills", "LossBalancer")
         
-        for i, skill_name in enumerate(execution_plan):
-            try:
-                # Check timeout
-                if self._is_execution_timeout(uif):
-                    uif.add_warning("Execution timeout reached")
-                    return ExecutionResult.TIMEOUT
-
-                # Check for early termination based on confidence
-                if (effort_allocation and i > 0 and
-                    self._loss_balancer.should_terminate_early(
-                        effort_allocation,
-                        getattr(uif, 'current_confidence', 0.5),
-                        uif.executed_skills,
-                        execution_plan[i:]
-                    )):
-                    uif.add_log_entry("Early termination triggered by high confidence", "LossBalancer")
-                    break
-
-                # Get the skill
-                if skill_name not in self._registered_skills:
-                    error_msg = f"Skill '{skill_name}' not found during execution"
-                    uif.set_error(error_msg)
-                    failed_skills.append(skill_name)
+        scheduler = None
+        if self._config.enable_parallel_execution and len(execution_plan) > 1:
+            if effort_allocation:
+                # Effort is adapted after every skill, so later skills cannot start early
+                self.logger.debug("Loss balancing is enabled; executing plan sequentially")
+            else:
+                scheduler = self._create_skill_scheduler(execution_plan, uif)
 
-                    if not self._config.continue_on_skill_failure:
-                        return ExecutionResult.FAILURE
-                    continue
-                
-                skill = self._registered_skills[skill_name]
+        try:
+            for i, skill_name in enumerate(execution_plan):
+                try:
+                    # Check timeout
+                    if self._is_execution_timeout(uif):
+                        uif.add_warning("Execution timeout reached")
+                        return ExecutionResult.TIMEOUT
+
+                    # Check for early termination based on confidence
+                    if (effort_allocation and i > 0 and
+                        self._loss_balancer.should_terminate_early(
+                            effort_allocation,
+                            getattr(uif, 'current_confidence', 0.5),
+                            uif.executed_skills,
+                            execution_plan[i:]
+                        )):
+                        uif.add_log_entry("Early termination triggered by high confidence", "LossBalancer")
+                        break
+
+                    # Get the skill
+                    if skill_name not in self._registered_skills:
+                        error_msg = f"Skill '{skill_name}' not found during execution"
+                        uif.set_error(error_msg)
+                        failed_skills.append(skill_name)
 
-                # Apply effort configuration if available
-                if effort_allocation and skill_name in effort_allocation.skill_efforts:
-                    effort_config = effort_allocation.skill_efforts[skill_name]
-                    self._apply_effort_configuration(uif, skill, effort_config)
-                    uif.add_log_entry(f"Executing skill {i+1}/{len(plan)}: {skill_name} (effort: {effort_config.effort_level.value})")
-                else:
-                    uif.add_log_entry(f"Executing skill {i+1}/{len(plan)}: {skill_name}")
-
-                # Execute the skill with monitoring
-                uif = skill.execute_with_monitoring(uif)
-
-                # Update effort allocation based on intermediate results
-                if effort_allocation and self._loss_balancer and i < len(execution_plan) - 1:
-                    current_confidence = getattr(uif, 'current_confidence', 0.5)
-                    effort_allocation = self._loss_balancer.adapt_effort(
-                        effort_allocation,
-                        uif.executed_skills,
-                        current_confidence,
-                        execution_plan[i+1:]
-                    )
+                        if not self._config.continue_on_skill_failure:
+                            return ExecutionResult.FAILURE
+                        continue
                 
-                # Check if skill failed
-                if uif.status == UIFStatus.FAILURE:
-                    failed_skills.append(skill_name)
-                    uif.add_log_entry(f"Skill {skill_name} failed: {uif.error_details}")
+                    skill = self._registered_skills[skill_name]
+
+                    # Apply effort configuration if available
+                    if effort_allocation and skill_name in effort_allocation.skill_efforts:
+                        effort_config = effort_allocation.skill_efforts[skill_name]
+                        self._apply_effort_configuration(uif, skill, effort_config)
+                        uif.add_log_entry(f"Executing skill {i+1}/{len(plan)}: {skill_name} (effort: {effort_config.effort_level.value})")
+                    else:
+                        uif.add_log_entry(f"Executing skill {i+1}/{len(plan)}: {skill_name}")
+
+                    # Execute the skill with monitoring (in parallel mode: wait for it and merge its changes)
+                    if scheduler:
+                        scheduler.commit(i, uif)
+                    else:
+                        uif = skill.execute_with_monitoring(uif)
+
+                    # Update effort allocation based on intermediate results
+                    if effort_allocation and self._loss_balancer and i < len(execution_plan) - 1:
+                        current_confidence = getattr(uif, 'current_confidence', 0.5)
+                        effort_allocation = self._loss_balancer.adapt_effort(
+                            effort_allocation,
+                            uif.executed_skills,
+                            current_confidence,
+                            execution_plan[i+1:]
+                        )
+                
+                    # Check if skill failed
+                    if uif.status == UIFStatus.FAILURE:
+                        failed_skills.append(skill_name)
+                        uif.add_log_entry(f"Skill {skill_name} failed: {uif.error_details}")
                     
-                    if not self._config.continue_on_skill_failure:
-                        return ExecutionResult.FAILURE
+                        if not self._config.continue_on_skill_failure:
+                            return ExecutionResult.FAILURE
                     
-                    # Reset status to continue with next skill
-                    uif.status = UIFStatus.RUNNING
+                        # Reset status to continue with next skill
+                        uif.status = UIFStatus.RUNNING
                 
-            except Exception as e:
-                error_msg = f"Unexpected error in skill {skill_name}: {str(e)}"
-                self.logger.exception(error_msg)
-                uif.add_log_entry(error_msg)
-                failed_skills.append(skill_name)
+                except Exception as e:
+                    error_msg = f"Unexpected error in skill {skill_name}: {str(e)}"
+                    self.logger.exception(error_msg)
+                    uif.add_log_entry(error_msg)
+                    failed_skills.append(skill_name)
                 
-                if not self._config.continue_on_skill_failure:
-                    uif.set_error(error_msg)
-                    return ExecutionResult.FAILURE
-        
+                    if not self._config.continue_on_skill_failure:
+                        uif.set_error(error_msg)
+                        return ExecutionResult.FAILURE
+        finally:
+            if scheduler:
+                scheduler.shutdown()
+
         # Phase 5C: Post-execution processing for SELF-REFLECT
         self._process_self_reflect_results(uif, execution_plan)
 
@@ -379,6 +399,32 @@ class CoordinatorEngine:
             uif.set_error("All skills in plan failed")
             return ExecutionResult.FAILURE
     
+    def _create_skill_scheduler(self, execution_plan: List[str], uif: SAM_UIF) -> ParallelSkillScheduler:
+        """
+        Create a scheduler that runs independent skills of a plan concurrently.
+
+        Dependencies come from the skills' declared inputs and outputs. Unless
+        skill failures are tolerated, no skill after a failed one is started.
+
+        Args:
+            execution_plan: Plan to execute
+            uif: Universal Interface Format at the start of the plan
+
+        Returns:
+            Scheduler with the skills without dependencies already dispatched
+        """
+        dependency_graph = self._validator.build_execution_graph(execution_plan)
+        self.logger.debug(f"Parallel execution graph for {execution_plan}: {dependency_graph}")
+
+        return ParallelSkillScheduler(
+            plan=execution_plan,
+            uif=uif,
+            skills=self._registered_skills,
+            dependency_graph=dependency_graph,
+            max_workers=self._config.max_parallel_skills,
+            stop_on_failure=not self._config.continue_on_skill_failure
+        )
+
     def _handle_invalid_plan(self, plan: List[str], uif: SAM_UIF, 
                            validation_report: PlanValidationReport, start_time: float) -> ExecutionReport:
         """Handle execution of an invalid plan."""
@@ -11,7 +11,8 @@ import logging
 import hashlib
 import time
 import re
-from typing import List, Dict, Any, Optional, Set
+from collections import OrderedDict, deque
+from typing import List, Dict, Any, Optional, Set, Deque, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 
@@ -31,7 +32,8 @@ class PlanCacheEntry:
     created_at: datetime
     usage_count: int
     query_hash: str
-    skill_context: str
+    skill_fingerprint: str
+    expires_at: float = 0.0
 
 
 @dataclass
@@ -63,7 +65,15 @@ class DynamicPlanner:
         self.logger = logging.getLogger(f"{__name__}.DynamicPlanner")
         self._config = get_sof_config()
         self._registered_skills: Dict[str, BaseSkillModule] = {}
-        self._plan_cache: Dict[str, PlanCacheEntry] = {}
+        # LRU order (least recently used first) plus an insertion-ordered expiry queue;
+        # every entry shares the same TTL, so expiry order equals insertion order
+        self._plan_cache: OrderedDict[str, PlanCacheEntry] = OrderedDict()
+        self._cache_expiry_queue: Deque[Tuple[float, str, PlanCacheEntry]] = deque()
+        self._skill_fingerprint = self._generate_skill_fingerprint()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
+        self._cache_expirations = 0
         self._llm_model = None
         self._graph_database = None
         self._goal_stack = goal_stack  # Phase B: Goal-informed planning
@@ -114,6 +124,7 @@ class DynamicPlanner:
             skill: Skill to register
         """
         self._registered_skills[skill.skill_name] = skill
+        self._skill_fingerprint = self._generate_skill_fingerprint()
         self.logger.debug(f"Registered skill for planning: {skill.skill_name}")
     
     def register_skills(self, skills: List[BaseSkillModule]) -> None:
@@ -227,20 +238,23 @@ class DynamicPlanner:
             Cached plan entry if found, None otherwise
         """
         query_hash = self._generate_query_hash(uif)
+        entry = self._plan_cache.get(query_hash)
         
-        if query_hash in self._plan_cache:
-            entry = self._plan_cache[query_hash]
-            
+        if entry is not None:
             # Check if cache entry is still valid
             if self._is_cache_entry_valid(entry):
+                self._plan_cache.move_to_end(query_hash)
                 entry.usage_count += 1
+                self._cache_hits += 1
                 self.logger.debug(f"Cache hit for query hash: {query_hash}")
                 return entry
             else:
                 # Remove expired entry
                 del self._plan_cache[query_hash]
+                self._cache_expirations += 1
                 self.logger.debug(f"Removed expired cache entry: {query_hash}")
         
+        self._cache_misses += 1
         return None
 
     def _get_background_goal(self):
@@ -640,7 +654,6 @@ class DynamicPlanner:
             result: Plan generation result to cache
         """
         query_hash = self._generate_query_hash(uif)
-        skill_context = self._generate_skill_context()
         
         entry = PlanCacheEntry(
             plan=result.plan,
@@ -648,10 +661,13 @@ class DynamicPlanner:
             created_at=datetime.now(),
             usage_count=0,
             query_hash=query_hash,
-            skill_context=skill_context
+            skill_fingerprint=self._skill_fingerprint,
+            expires_at=time.time() + self._config.plan_cache_ttl
         )
         
         self._plan_cache[query_hash] = entry
+        self._plan_cache.move_to_end(query_hash)
+        self._cache_expiry_queue.append((entry.expires_at, query_hash, entry))
         self.logger.debug(f"Cached plan for query hash: {query_hash}")
         
         # Clean old cache entries if needed
@@ -664,16 +680,19 @@ class DynamicPlanner:
         Returns:
             Query hash string
         """
-        # Include query, user profile, and available skills in hash
-        hash_input = f"{uif.input_query}|{uif.active_profile}|{sorted(self._registered_skills.keys())}"
+        # Include query, user profile, and the skill registry in hash
+        hash_input = f"{uif.input_query}|{uif.active_profile}|{self._skill_fingerprint}"
         return hashlib.md5(hash_input.encode()).hexdigest()
     
-    def _generate_skill_context(self) -> str:
+    def _generate_skill_fingerprint(self) -> str:
         """
-        Generate a context string representing current skill configuration.
+        Generate a fingerprint of the current skill configuration.
+        
+        Computed when skills are registered, so cache validity checks are a
+        single comparison.
         
         Returns:
-            Skill context string
+            Skill registry fingerprint
         """
         skill_signatures = []
         for skill_name in sorted(self._registered_skills.keys()):
@@ -681,7 +700,7 @@ class DynamicPlanner:
             signature = f"{skill_name}:{skill.skill_version}"
             skill_signatures.append(signature)
         
-        return "|".join(skill_signatures)
+        return hashlib.md5("|".join(skill_signatures).encode()).hexdigest()
     
     def _is_cache_entry_valid(self, entry: PlanCacheEntry) -> bool:
         """
@@ -691,30 +710,37 @@ class DynamicPlanner:
             True if entry is valid, False otherwise
         """
         # Check TTL
-        age = datetime.now() - entry.created_at
-        if age.total_seconds() > self._config.plan_cache_ttl:
-            return False
-        
-        # Check if skill context has changed
-        current_context = self._generate_skill_context()
-        if entry.skill_context != current_context:
+        if time.time() >= entry.expires_at:
             return False
         
-        return True
+        # Check if the skill registry has changed
+        return entry.skill_fingerprint == self._skill_fingerprint
     
     def _cleanup_cache(self) -> None:
-        """Clean up expired cache entries."""
-        expired_keys = []
+        """Drop expired entries, then evict least recently used entries over capacity."""
+        now = time.time()
+        expired = 0
         
-        for key, entry in self._plan_cache.items():
-            if not self._is_cache_entry_valid(entry):
-                expired_keys.append(key)
+        # Queue items whose entry was replaced or already removed are skipped
+        while self._cache_expiry_queue and self._cache_expiry_queue[0][0] <= now:
+            _, key, entry = self._cache_expiry_queue.popleft()
+            if self._plan_cache.get(key) is entry:
+                del self._plan_cache[key]
+                expired += 1
         
-        for key in expired_keys:
-            del self._plan_cache[key]
+        while len(self._plan_cache) > self._config.plan_cache_max_entries:
+            self._plan_cache.popitem(last=False)
+            self._cache_evictions += 1
         
-        if expired_keys:
-            self.logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
+        # Keep the queue proportional to the cache when entries are replaced or evicted
+        if len(self._cache_expiry_queue) > 2 * len(self._plan_cache) + 64:
+            self._cache_expiry_queue = deque(
+                item for item in self._cache_expiry_queue if self._plan_cache.get(item[1]) is item[2]
+            )
+
+        if expired:
+            self._cache_expirations += expired
+            self.logger.debug(f"Cleaned up {expired} expired cache entries")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
@@ -725,17 +751,25 @@ class DynamicPlanner:
         """
         total_entries = len(self._plan_cache)
         total_usage = sum(entry.usage_count for entry in self._plan_cache.values())
+        lookups = self._cache_hits + self._cache_misses
         
         return {
             "total_entries": total_entries,
+            "max_entries": self._config.plan_cache_max_entries,
             "total_usage": total_usage,
             "average_usage": total_usage / total_entries if total_entries > 0 else 0,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups > 0 else 0.0,
+            "evictions": self._cache_evictions,
+            "expirations": self._cache_expirations,
             "cache_enabled": self._config.enable_plan_caching
         }
     
     def clear_cache(self) -> None:
         """Clear the plan cache."""
         self._plan_cache.clear()
+        self._cache_expiry_queue.clear()
         self.logger.info("Plan cache cleared")
 
     def record_curriculum_performance(
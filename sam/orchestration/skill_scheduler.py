@@ -0,0 +1,297 @@
+"""
+Parallel Skill Scheduler for SAM Orchestration Framework
+========================================================
+
+Runs the skills of a validated plan as a dependency DAG so that skills which
+do not read each other's outputs execute concurrently.
+
+Each skill runs on its own copy of the UIF holding the state at the start of
+the plan plus the changes made by the skills it depends on, which are exactly
+the declared inputs it would see in a sequential run. The coordinator commits
+the recorded changes to the shared UIF in plan order, so the final UIF matches
+a sequential execution while latency follows the plan's critical path.
+
+When failures are fatal, no skill after a failed one is dispatched once the
+failure is known; skills that were already running when it happened still
+finish, and the coordinator discards their changes.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import List, Dict, Any, Set
+
+from .uif import SAM_UIF, UIFStatus
+from .skills.base import BaseSkillModule
+
+logger = logging.getLogger(__name__)
+
+
+def copy_containers(value: Any, memo: Dict[int, Any] = None) -> Any:
+    """
+    Copy nested lists, dictionaries and sets, sharing all other objects.
+
+    Args:
+        value: Value to copy
+        memo: Copies made so far, by id of the original (handles shared and cyclic containers)
+
+    Returns:
+        Copy whose containers at any depth can be modified without affecting the original
+    """
+    if not isinstance(value, (dict, list, set)):
+        return value
+
+    memo = {} if memo is None else memo
+    copied = memo.get(id(value))
+    if copied is not None:
+        return copied
+
+    if isinstance(value, set):
+        copied = memo[id(value)] = set(value)
+    elif isinstance(value, list):
+        copied = memo[id(value)] = []
+        copied.extend(copy_containers(item, memo) for item in value)
+    else:
+        copied = memo[id(value)] = {}
+        for key, item in value.items():
+            copied[key] = copy_containers(item, memo)
+    return copied
+
+
+def copy_uif(uif: SAM_UIF) -> SAM_UIF:
+    """
+    Copy a UIF with its own lists and dictionaries, including nested ones.
+
+    Args:
+        uif: UIF to copy
+
+    Returns:
+        Copy whose containers can be modified in place without affecting the original
+    """
+    updates = {}
+    for field_name in SAM_UIF.model_fields:
+        value = getattr(uif, field_name)
+        if isinstance(value, (list, dict)):
+            updates[field_name] = copy_containers(value)
+    return uif.model_copy(update=updates)
+
+
+def _changed(old: Any, new: Any) -> bool:
+    """Check whether a value differs from the copy taken before a skill ran."""
+    if old is new:
+        return False
+    try:
+        return bool(old != new)
+    except Exception:
+        # Values without a truthy comparison (e.g. arrays) count as changed
+        return True
+
+
+def diff_uif(before: SAM_UIF, after: SAM_UIF) -> Dict[str, Any]:
+    """
+    Record the changes a skill made to its UIF.
+
+    Lists record appended entries, dictionaries record changed and removed
+    keys, and other fields record their new value.
+
+    Args:
+        before: Copy of the UIF taken before the skill ran
+        after: UIF returned by the skill
+
+    Returns:
+        Mapping of field name to (kind, change)
+    """
+    delta = {}
+    for field_name in SAM_UIF.model_fields:
+        old = getattr(before, field_name)
+        new = getattr(after, field_name)
+
+        if isinstance(old, list) and isinstance(new, list):
+            if new[:len(old)] == old:
+                if len(new) > len(old):
+                    delta[field_name] = ("extend", new[len(old):])
+            else:
+                delta[field_name] = ("set", list(new))
+        elif isinstance(old, dict) and isinstance(new, dict):
+            changed = {key: value for key, value in new.items()
+                       if key not in old or _changed(old[key], value)}
+            removed = [key for key in old if key not in new]
+            if changed or removed:
+                delta[field_name] = ("update", (changed, removed))
+        elif new is not old and new != old:
+            delta[field_name] = ("set", new)
+    return delta
+
+
+def apply_uif_delta(uif: SAM_UIF, delta: Dict[str, Any]) -> None:
+    """
+    Apply changes recorded by diff_uif to a UIF in place.
+
+    The applied values are copied, so UIFs updated from the same delta never
+    share mutable containers.
+
+    Args:
+        uif: UIF to update
+        delta: Changes recorded by diff_uif
+    """
+    for field_name, (kind, change) in delta.items():
+        if kind == "extend":
+            getattr(uif, field_name).extend(copy_containers(change))
+        elif kind == "update":
+            changed, removed = change
+            target = getattr(uif, field_name)
+            target.update(copy_containers(changed))
+            for key in removed:
+                target.pop(key, None)
+        else:
+            setattr(uif, field_name, copy_containers(change))
+
+
+class ParallelSkillScheduler:
+    """
+    Executes plan skills concurrently according to their dependency graph.
+
+    Skills are dispatched as soon as the skills they depend on have finished,
+    with at most max_workers running at once. commit() waits for a skill and
+    applies its changes to the shared UIF; callers commit in plan order.
+    """
+
+    def __init__(self, plan: List[str], uif: SAM_UIF, skills: Dict[str, BaseSkillModule],
+                 dependency_graph: List[Set[int]], max_workers: int = 4,
+                 stop_on_failure: bool = True):
+        """
+        Initialize the scheduler and start every skill without dependencies.
+
+        Args:
+            plan: Skill names in execution order
+            uif: UIF at the start of the plan
+            skills: Registered skills by name
+            dependency_graph: For each plan position, the earlier positions it depends on
+            max_workers: Maximum number of skills executing at once
+            stop_on_failure: Whether a failed or missing skill ends the plan, so
+                no later skill may be dispatched after it
+        """
+        self.plan = plan
+        self.skills = skills
+        self.dependency_graph = dependency_graph
+        self.stop_on_failure = stop_on_failure
+        self._base_uif = copy_uif(uif)
+
+        # Plan position of the first fatal failure; nothing after it is dispatched
+        self._stop_index = len(plan)
+
+        # Transitive dependencies decide which changes a skill's UIF copy includes
+        self._ancestors: List[Set[int]] = []
+        for dependencies in dependency_graph:
+            ancestors = set(dependencies)
+            for dependency in dependencies:
+                ancestors.update(self._ancestors[dependency])
+            self._ancestors.append(ancestors)
+
+        self._futures: Dict[int, Future] = {}
+        self._results: Dict[int, Any] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                            thread_name_prefix="sof-skill")
+        self._dispatch_ready()
+
+    def commit(self, index: int, uif: SAM_UIF) -> None:
+        """
+        Wait for the skill at a plan position and apply its changes to the UIF.
+
+        Args:
+            index: Plan position of the skill
+            uif: Shared UIF to update
+
+        Raises:
+            Exception: Any unexpected error raised while running the skill
+        """
+        while index not in self._results:
+            pending = [future for position, future in self._futures.items()
+                       if position not in self._results]
+            if not pending:
+                raise RuntimeError(f"Skill at plan position {index} was never dispatched")
+
+            wait(pending, return_when=FIRST_COMPLETED)
+            self._collect_finished()
+            self._dispatch_ready()
+
+        result = self._results[index]
+        if isinstance(result, Exception):
+            raise result
+        if result is not None:
+            apply_uif_delta(uif, result)
+
+    def shutdown(self) -> None:
+        """Stop dispatching skills; skills already running finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _dispatch_ready(self) -> None:
+        """Start every skill whose dependencies have all finished."""
+        for index, skill_name in enumerate(self.plan):
+            if index >= self._stop_index:
+                break
+            if index in self._futures or index in self._results:
+                continue
+            if not all(dependency in self._results for dependency in self.dependency_graph[index]):
+                continue
+
+            skill = self.skills.get(skill_name)
+            if skill is None:
+                # Missing skills are reported by the coordinator at commit time
+                self._results[index] = None
+                self._record_failure(index)
+                continue
+
+            skill_uif = self._build_skill_uif(index)
+            self._futures[index] = self._executor.submit(self._run_skill, skill, skill_uif)
+            logger.debug(f"Dispatched skill {index + 1}/{len(self.plan)}: {skill_name}")
+
+    def _collect_finished(self) -> None:
+        """Record the changes or errors of finished skills."""
+        for index, future in self._futures.items():
+            if index not in self._results and future.done():
+                error = future.exception()
+                self._results[index] = error if error is not None else future.result()
+                if error is not None or self._results[index].get('status') == ("set", UIFStatus.FAILURE):
+                    self._record_failure(index)
+
+    def _record_failure(self, index: int) -> None:
+        """Stop dispatching skills after a failure that ends the plan."""
+        if self.stop_on_failure and index < self._stop_index:
+            self._stop_index = index
+            logger.debug(f"Skill at plan position {index} failed; not dispatching later skills")
+
+    def _build_skill_uif(self, index: int) -> SAM_UIF:
+        """
+        Build the UIF copy a skill runs on.
+
+        Args:
+            index: Plan position of the skill
+
+        Returns:
+            Start-of-plan UIF with the changes of the skill's dependencies applied
+        """
+        skill_uif = copy_uif(self._base_uif)
+        for ancestor in sorted(self._ancestors[index]):
+            result = self._results.get(ancestor)
+            if result is not None and not isinstance(result, Exception):
+                apply_uif_delta(skill_uif, result)
+
+        # Failed dependencies were tolerated (continue_on_skill_failure), as sequentially
+        skill_uif.status = UIFStatus.RUNNING
+        return skill_uif
+
+    @staticmethod
+    def _run_skill(skill: BaseSkillModule, skill_uif: SAM_UIF) -> Dict[str, Any]:
+        """
+        Run a skill on its UIF copy and record the changes it made.
+
+        Args:
+            skill: Skill to execute
+            skill_uif: UIF copy for the skill
+
+        Returns:
+            Changes made by the skill, as recorded by diff_uif
+        """
+        before = copy_uif(skill_uif)
+        result_uif = skill.execute_with_monitoring(skill_uif)
+        return diff_uif(before, result_uif)
@@ -298,8 +298,8 @@ class TableToCodeTool(BaseSkillModule):
                 logger.info("Using mock table data for demonstration")
                 return self._create_mock_table_reconstruction(table_id)
 
-            # Get all chunks for this table
-            table_chunks = self.table_retrieval.search_table_content("", table_id_filter=table_id)
+            # Get all cells for this table (a keyed table store read when available)
+            table_chunks = self.table_retrieval.get_table_cells(table_id)
 
             if not table_chunks:
                 logger.warning(f"No table chunks found for table_id: {table_id}, using mock data")
@@ -82,7 +82,49 @@ class PlanValidationEngine:
         """
         for skill in skills:
             self.register_skill(skill)
-    
+
+    def build_execution_graph(self, plan: List[str]) -> List[Set[int]]:
+        """
+        Build the execution dependency graph of a plan from declared skill I/O.
+
+        A plan position depends on the latest earlier position that writes a key
+        it reads (required or optional inputs) or a key it also writes. Repeated
+        skills are ordered since they share their skill_outputs entry, and skills
+        that are missing or cannot run in parallel act as barriers.
+
+        Args:
+            plan: List of skill names in execution order
+
+        Returns:
+            For each plan position, the set of earlier positions it depends on
+        """
+        graph: List[Set[int]] = []
+        last_writer: Dict[Any, int] = {}
+        barrier: Optional[int] = None
+
+        for i, skill_name in enumerate(plan):
+            skill = self._registered_skills.get(skill_name)
+            writes = {("skill", skill_name)}
+
+            if skill is None or not skill.can_run_parallel:
+                dependencies = set(range(i))
+                barrier = i
+            else:
+                reads = set(skill.required_inputs) | set(skill.optional_inputs)
+                writes.update(skill.output_keys)
+                dependencies = {last_writer[key] for key in reads | writes if key in last_writer}
+                if barrier is not None:
+                    dependencies.add(barrier)
+
+            if skill is not None:
+                writes.update(skill.output_keys)
+            for key in writes:
+                last_writer[key] = i
+
+            graph.append(dependencies)
+
+        return graph
+
     def validate_plan(self, plan: List[str], uif: SAM_UIF) -> PlanValidationReport:
         """
         Validate an execution plan comprehensively.
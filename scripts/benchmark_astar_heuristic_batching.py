@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+A* Heuristic Batching Benchmark
+===============================
+
+Scores the children of synthetic A* expansions against a local fake LLM
+endpoint that adds a fixed latency per request, comparing:
+
+- sequential: one LLM round trip per child (the previous behaviour)
+- concurrent: bounded concurrent round trips per expansion
+- batch prompt: one round trip per expansion
+
+Expansions revisit some states, so memoization by state fingerprint is
+exercised as well.
+
+Usage:
+    python scripts/benchmark_astar_heuristic_batching.py
+    python scripts/benchmark_astar_heuristic_batching.py --latency-ms 200 --branching 8
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sam.agent_zero.planning.heuristic_estimator import HeuristicEstimator
+from sam.agent_zero.planning.state import PlanningState
+
+ACTIONS = ["web_search", "document_search", "summarize", "extract_tables", "compare_sources",
+           "apply_logical_reasoning", "validate_conclusions", "create_structured_response"]
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Answers every prompt after a fixed delay, with one line per batched state."""
+
+    latency_seconds = 0.1
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        prompt = body['prompt']
+        time.sleep(self.latency_seconds)
+
+        states = re.findall(r'^State (\d+):', prompt, re.MULTILINE)
+        if states:
+            text = "\n".join(f"{index}: {random.randint(1, 20)}" for index in states)
+        else:
+            text = str(random.randint(1, 20))
+
+        payload = json.dumps({'response': text}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_llm_interface(url: str):
+    """LLM interface callable that posts the prompt to the fake endpoint."""
+    def generate(prompt: str) -> str:
+        request = urllib.request.Request(url, data=json.dumps({'prompt': prompt}).encode(),
+                                         headers={'Content-Type': 'application/json'})
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return json.loads(response.read())['response']
+    return generate
+
+
+def build_expansions(num_expansions: int, branching: int):
+    """Build child-state batches for a synthetic search, with revisited parents."""
+    random.seed(7)
+    root = PlanningState(task_description="Analyze the uploaded quarterly report and summarize the risks")
+    frontier = [root]
+    expansions = []
+
+    for _ in range(num_expansions):
+        parent = random.choice(frontier)
+        children = [parent.add_action(action, f"Executed {action}")
+                    for action in random.sample(ACTIONS, branching)]
+        expansions.append(children)
+        frontier.extend(children[:2])
+
+    return expansions
+
+
+def run(name: str, estimator: HeuristicEstimator, expansions, batched: bool) -> dict:
+    start = time.perf_counter()
+    for children in expansions:
+        if batched:
+            estimator.estimate_costs_to_go(children)
+        else:
+            for child in children:
+                estimator.estimate_cost_to_go(child)
+    elapsed = time.perf_counter() - start
+    stats = estimator.get_estimation_stats()
+    return {'mode': name, 'seconds': elapsed, 'llm_calls': stats['llm_calls'],
+            'cache_hits': stats['cache_hits']}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched A* heuristic estimation")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="Fake LLM latency per request")
+    parser.add_argument("--expansions", type=int, default=20, help="Number of node expansions")
+    parser.add_argument("--branching", type=int, default=6, help="Children per expansion")
+    parser.add_argument("--concurrency", type=int, default=4, help="Concurrent LLM calls per expansion")
+    args = parser.parse_args()
+
+    FakeLLMHandler.latency_seconds = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    llm = make_llm_interface(f"http://127.0.0.1:{server.server_address[1]}/generate")
+
+    expansions = build_expansions(args.expansions, args.branching)
+    total_children = sum(len(children) for children in expansions)
+    print(f"{args.expansions} expansions x {args.branching} children ({total_children} estimates), "
+          f"fake LLM latency {args.latency_ms:.0f} ms")
+
+    results = [
+        run("sequential", HeuristicEstimator(llm, max_concurrent_estimates=1), expansions, batched=False),
+        run(f"concurrent x{args.concurrency}",
+            HeuristicEstimator(llm, max_concurrent_estimates=args.concurrency), expansions, batched=True),
+        run("batch prompt", HeuristicEstimator(llm, use_batch_prompt=True), expansions, batched=True)
+    ]
+    server.shutdown()
+
+    print(f"\n{'mode':<16}{'time (s)':>10}{'LLM calls':>11}{'cache hits':>12}{'speedup':>10}")
+    baseline = results[0]['seconds']
+    for result in results:
+        print(f"{result['mode']:<16}{result['seconds']:>10.2f}{result['llm_calls']:>11}"
+              f"{result['cache_hits']:>12}{baseline / max(result['seconds'], 1e-9):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Chroma Memory Store Cold-Start Benchmark
+
+Compares eager loading (full MemoryChunk with content and embedding per record)
+against lazy loading (compact records plus on-demand LRU fetch) of a ChromaDB
+backed MemoryVectorStore.
+
+Each measurement runs in a fresh interpreter so peak RSS reflects only the
+store being loaded. The store is populated directly through ChromaDB, so the
+first lazy start backfills the chunk record index from Chroma metadata and
+later lazy starts read only ids from Chroma.
+
+Usage:
+    python scripts/benchmark_chroma_cold_start.py --chunks 500000
+    python scripts/benchmark_chroma_cold_start.py --chunks 50000 --keep-store /tmp/sam_bench
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import resource
+import logging
+import subprocess
+import tempfile
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+COLLECTION_NAME = "sam_memory_store"
+WORDS = ("memory retrieval vector index planner table document security synthesis "
+         "reasoning context embedding chunk knowledge source citation query").split()
+
+
+def populate_store(store_dir: Path, num_chunks: int, dimension: int, batch_size: int = 5000) -> None:
+    """Write synthetic memory chunks straight into a Chroma collection."""
+    import chromadb
+    import numpy as np
+
+    client = chromadb.PersistentClient(path=str(store_dir / "chroma_db"))
+    collection = client.get_or_create_collection(name=COLLECTION_NAME)
+    rng = np.random.default_rng(42)
+    random.seed(42)
+
+    for start in range(0, num_chunks, batch_size):
+        count = min(batch_size, num_chunks - start)
+        ids = [f"mem_{i:012x}" for i in range(start, start + count)]
+        documents = [" ".join(random.choices(WORDS, k=120)) for _ in range(count)]
+        embeddings = rng.standard_normal((count, dimension)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        metadatas = [{
+            "memory_type": "document",
+            "source_path": f"uploads/doc_{i // 200}.pdf",
+            "content_hash": f"{i:064x}",
+            "importance_score": 0.5,
+            "access_count": 0,
+            "last_accessed": "2025-01-01T00:00:00",
+            "created_at": 1735689600 + i,
+            "tags": "document,benchmark",
+            "text_content": documents[j][:500]
+        } for j, i in enumerate(range(start, start + count))]
+
+        collection.add(ids=ids, documents=documents, embeddings=embeddings.tolist(), metadatas=metadatas)
+        print(f"  populated {start + count:,}/{num_chunks:,}", end="\r", flush=True)
+
+    print()
+
+
+def measure_load(store_dir: Path, lazy: bool, dimension: int) -> dict:
+    """Load the store once and report cold-start time and peak RSS (runs in a child process)."""
+    from memory.memory_vectorstore import MemoryVectorStore, VectorStoreType
+
+    class BenchmarkStore(MemoryVectorStore):
+        def _load_chroma_config(self):
+            config = super()._load_chroma_config()
+            config["collection_name"] = COLLECTION_NAME
+            config["lazy_loading"] = lazy
+            return config
+
+    baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    store = BenchmarkStore(store_type=VectorStoreType.CHROMA, storage_directory=str(store_dir),
+                           embedding_dimension=dimension)
+    load_seconds = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Random point reads exercise the on-demand path
+    chunk_ids = random.sample(list(store.memory_chunks), min(1000, len(store.memory_chunks)))
+    start = time.perf_counter()
+    for chunk_id in chunk_ids:
+        _ = store.memory_chunks[chunk_id].content
+    read_ms = (time.perf_counter() - start) * 1000 / max(1, len(chunk_ids))
+
+    return {
+        'mode': 'lazy' if lazy else 'eager',
+        'chunks': len(store.memory_chunks),
+        'load_seconds': round(load_seconds, 3),
+        'rss_delta_mb': round((peak_rss - baseline_rss) / 1024, 1),
+        'avg_point_read_ms': round(read_ms, 3)
+    }
+
+
+def run_child(store_dir: Path, lazy: bool, dimension: int) -> dict:
+    """Run measure_load in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--measure", "lazy" if lazy else "eager",
+         "--store", str(store_dir), "--dimension", str(dimension)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Chroma memory store cold start")
+    parser.add_argument("--chunks", type=int, default=500000, help="Number of synthetic chunks")
+    parser.add_argument("--dimension", type=int, default=384, help="Embedding dimension")
+    parser.add_argument("--keep-store", type=str, help="Reuse or keep the store at this path")
+    parser.add_argument("--measure", choices=["lazy", "eager"], help=argparse.SUPPRESS)
+    parser.add_argument("--store", type=str, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure_load(Path(args.store), args.measure == "lazy", args.dimension)))
+        return
+
+    store_dir = Path(args.keep_store) if args.keep_store else Path(tempfile.mkdtemp(prefix="sam_chroma_bench_"))
+    try:
+        if not (store_dir / "chroma_db").exists():
+            print(f"📦 Populating {args.chunks:,} chunks in {store_dir}...")
+            populate_store(store_dir, args.chunks, args.dimension)
+
+        results = [run_child(store_dir, lazy=False, dimension=args.dimension),
+                   run_child(store_dir, lazy=True, dimension=args.dimension),
+                   run_child(store_dir, lazy=True, dimension=args.dimension)]
+        results[1]['mode'] = 'lazy (index build)'
+
+        print(f"\n{'mode':<20}{'chunks':>10}{'load (s)':>12}{'RSS (MB)':>12}{'read (ms)':>12}")
+        for result in results:
+            print(f"{result['mode']:<20}{result['chunks']:>10,}{result['load_seconds']:>12}"
+                  f"{result['rss_delta_mb']:>12}{result['avg_point_read_ms']:>12}")
+
+        eager, _, lazy = results
+        print(f"\n🚀 Cold start: {eager['load_seconds'] / max(lazy['load_seconds'], 1e-9):.1f}x faster, "
+              f"resident memory: {eager['rss_delta_mb'] / max(lazy['rss_delta_mb'], 1e-9):.1f}x smaller")
+    finally:
+        if not args.keep_store:
+            shutil.rmtree(store_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Dimension Prober Matching Benchmark
+===================================
+
+Scores a synthetic corpus of chunks against every dimension profile,
+comparing:
+
+- per-pattern: one regex search per pattern and keyword, per dimension
+- compiled matcher: the profile's precompiled single-pass ProfileMatcher
+
+Scores are checked to be identical before throughput is reported.
+
+Usage:
+    python scripts/benchmark_dimension_prober.py
+    python scripts/benchmark_dimension_prober.py --chunks 5000 --words 300
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from multimodal_processing.dimension_prober_v2 import EnhancedDimensionProberV2
+
+FILLER_WORDS = ("the", "of", "and", "report", "quarter", "team", "system", "results", "data", "review",
+                "customer", "process", "model", "section", "figure", "court", "study", "market", "plan")
+
+
+def build_corpus(prober: EnhancedDimensionProberV2, chunks: int, words: int, seed: int = 0):
+    """Build chunks of filler words with profile patterns and keywords mixed in."""
+    vocabulary = []
+    for profile_name in prober.profile_manager.list_profiles():
+        for dim_config in prober.profile_manager.get_profile(profile_name).get('dimensions', {}).values():
+            vocabulary.extend(dim_config.get('patterns', []))
+            vocabulary.extend(dim_config.get('boost_keywords', []))
+
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(chunks):
+        tokens = [rng.choice(vocabulary) if vocabulary and rng.random() < 0.08 else rng.choice(FILLER_WORDS)
+                  for _ in range(words)]
+        corpus.append(" ".join(tokens).capitalize() + ".")
+    return corpus
+
+
+def score_per_pattern(prober: EnhancedDimensionProberV2, text: str, profile_config):
+    """Score dimensions with one regex search per pattern and keyword (previous behaviour)."""
+    text_lower = text.lower()
+    scores = {}
+    for dim_name, dim_config in profile_config.get('dimensions', {}).items():
+        base_score = prober._score_patterns_enhanced(text_lower, dim_config.get('patterns', []))
+        keyword_boost = prober._score_keywords(text_lower, dim_config.get('boost_keywords', []))
+        combined_score = base_score + (keyword_boost * 0.3)
+        scores[dim_name] = min(1.0, combined_score * dim_config.get('weight', 1.0))
+    return scores
+
+
+def run(label: str, score, corpus, profile_configs) -> dict:
+    """Score every chunk against every profile and time it."""
+    start = time.perf_counter()
+    results = [score(text, profile_config) for text in corpus for profile_config in profile_configs]
+    seconds = time.perf_counter() - start
+    return {"mode": label, "seconds": seconds, "chunks_per_second": len(corpus) / seconds, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dimension prober pattern matching")
+    parser.add_argument("--chunks", type=int, default=2000, help="Number of chunks in the corpus")
+    parser.add_argument("--words", type=int, default=200, help="Words per chunk")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    prober = EnhancedDimensionProberV2({'enable_spose': False})
+    profile_configs = [prober.profile_manager.get_profile(name) for name in prober.profile_manager.list_profiles()]
+    corpus = build_corpus(prober, args.chunks, args.words)
+    print(f"{args.chunks} chunks of {args.words} words, {len(profile_configs)} profiles per chunk")
+
+    results = [
+        run("per-pattern", lambda text, config: score_per_pattern(prober, text, config), corpus, profile_configs),
+        run("compiled matcher", prober._enhanced_pattern_probing, corpus, profile_configs)
+    ]
+    identical = results[0]["results"] == results[1]["results"]
+
+    print(f"\n{'mode':<18}{'time (s)':>10}{'chunks/s':>11}{'speedup':>10}")
+    baseline = results[0]["seconds"]
+    for result in results:
+        print(f"{result['mode']:<18}{result['seconds']:>10.2f}{result['chunks_per_second']:>11.1f}"
+              f"{baseline / max(result['seconds'], 1e-9):>9.1f}x")
+    print(f"\nIdentical scores: {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+DNA Layer Top-k Dispatch Benchmark
+==================================
+
+Compares the grouped expert dispatch in DNALayer._process_topk_routing with
+the per-token reference loop on CPU across several batch and sequence sizes,
+and checks that both produce the same outputs.
+
+Usage:
+    python scripts/benchmark_dna_topk_dispatch.py
+    python scripts/benchmark_dna_topk_dispatch.py --hidden-size 768 --top-k 2 --repeats 3
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import torch
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sam.cognition.dna_layer.config import DNAConfig
+from sam.cognition.dna_layer.dynamic_layer import DNALayer
+
+SHAPES = [(1, 16), (1, 128), (4, 64), (8, 128), (16, 256)]
+
+
+def time_call(fn, repeats: int) -> float:
+    """Return the best wall time of ``repeats`` calls in milliseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DNA layer top-k expert dispatch on CPU")
+    parser.add_argument("--hidden-size", type=int, default=384, help="Hidden size (divisible by 12)")
+    parser.add_argument("--top-k", type=int, default=2, help="Experts per token")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed repeats per shape")
+    parser.add_argument("--max-loop-tokens", type=int, default=4096,
+                        help="Skip the per-token loop above this many tokens")
+    args = parser.parse_args()
+
+    torch.manual_seed(0)
+    config = DNAConfig(hidden_size=args.hidden_size, top_k=args.top_k,
+                       mlp_intermediate_size=4 * args.hidden_size, track_routing_stats=False)
+    layer = DNALayer(config).eval()
+
+    print(f"DNA top-{args.top_k} dispatch, hidden_size={args.hidden_size}, "
+          f"{layer.num_experts} experts, torch {torch.__version__}, {torch.get_num_threads()} threads")
+    print(f"\n{'batch':>6}{'seq':>6}{'tokens':>8}{'loop (ms)':>12}{'grouped (ms)':>14}{'speedup':>10}{'max diff':>12}")
+
+    with torch.no_grad():
+        for batch_size, seq_len in SHAPES:
+            hidden_states = torch.randn(batch_size, seq_len, args.hidden_size)
+            routing_weights = torch.softmax(torch.randn(batch_size, seq_len, layer.num_experts), dim=-1)
+            num_tokens = batch_size * seq_len
+
+            grouped_ms = time_call(
+                lambda: layer._process_topk_routing(hidden_states, routing_weights), args.repeats)
+
+            if num_tokens > args.max_loop_tokens:
+                print(f"{batch_size:>6}{seq_len:>6}{num_tokens:>8}{'skipped':>12}{grouped_ms:>14.2f}"
+                      f"{'-':>10}{'-':>12}")
+                continue
+
+            loop_ms = time_call(
+                lambda: layer._process_topk_routing_per_token(hidden_states, routing_weights), 1)
+            max_diff = (layer._process_topk_routing(hidden_states, routing_weights) -
+                        layer._process_topk_routing_per_token(hidden_states, routing_weights)).abs().max().item()
+
+            print(f"{batch_size:>6}{seq_len:>6}{num_tokens:>8}{loop_ms:>12.2f}{grouped_ms:>14.2f}"
+                  f"{loop_ms / max(grouped_ms, 1e-9):>9.1f}x{max_diff:>12.2e}")
+
+
+if __name__ == "__main__":
+    main()
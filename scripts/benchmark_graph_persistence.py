@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Graph Persistence Benchmark
+===========================
+
+Builds a synthetic concept graph with NetworkXDatabase and compares:
+
+- GML: the previous persistence, rewriting the whole graph with
+  nx.write_gml on save and parsing it with nx.read_gml on load
+- SQLite: the incremental GraphStore, committing each mutation as it is made
+  and loading the node and edge tables on connect
+
+Reports the cost of persisting one more mutation, the load time at startup
+and the total cost of committing every mutation while building the graph.
+
+Usage:
+    python scripts/benchmark_graph_persistence.py
+    python scripts/benchmark_graph_persistence.py --nodes 50000 --edges 250000
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+
+import networkx as nx
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sam.memory.graph.graph_database import NetworkXDatabase, NodeData, RelationshipData
+
+
+async def build_graph(db: NetworkXDatabase, nodes: int, edges: int) -> float:
+    """Create the synthetic graph and return the elapsed seconds."""
+    start = time.perf_counter()
+    for i in range(nodes):
+        await db.create_node(NodeData(id=f"concept_{i}", labels=["Concept"],
+                                      properties={"name": f"Concept {i}", "rank": i}))
+    for i in range(edges):
+        await db.create_relationship(RelationshipData(
+            id=f"rel_{i}", type="RELATES_TO" if i % 3 else "MENTIONS",
+            start_node=f"concept_{i % nodes}", end_node=f"concept_{(i * 7 + 1) % nodes}",
+            properties={"weight": i % 10}))
+    return time.perf_counter() - start
+
+
+def timed(function, repeats: int = 1) -> float:
+    """Return the best wall time of function over the given repeats."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GML and SQLite graph persistence")
+    parser.add_argument("--nodes", type=int, default=20000, help="Number of nodes")
+    parser.add_argument("--edges", type=int, default=100000, help="Number of edges")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        in_memory = NetworkXDatabase()
+        asyncio.run(in_memory.connect())
+        memory_seconds = asyncio.run(build_graph(in_memory, args.nodes, args.edges))
+
+        persisted = NetworkXDatabase(str(Path(temp_dir) / "graph.db"))
+        asyncio.run(persisted.connect())
+        sqlite_build_seconds = asyncio.run(build_graph(persisted, args.nodes, args.edges))
+        mutations = args.nodes + args.edges
+        print(f"{args.nodes} nodes, {args.edges} edges ({mutations} mutations)")
+
+        # Persisting one more mutation: a full rewrite for GML, one commit for SQLite
+        gml_path = Path(temp_dir) / "graph.gml"
+        gml_save = timed(lambda: nx.write_gml(in_memory.graph, gml_path))
+        extra = iter(range(10 ** 9))
+        sqlite_save = timed(lambda: asyncio.run(persisted.create_node(
+            NodeData(id=f"extra_{next(extra)}", labels=["Concept"], properties={}))), repeats=50)
+        asyncio.run(persisted.disconnect())
+
+        gml_load = timed(lambda: nx.read_gml(gml_path))
+        reloaded = NetworkXDatabase(str(Path(temp_dir) / "graph.db"))
+        sqlite_load = timed(lambda: asyncio.run(reloaded.connect()))
+        asyncio.run(reloaded.disconnect())
+
+        print(f"\n{'backend':<10}{'save one mutation (ms)':>24}{'load (s)':>10}{'file (MB)':>11}")
+        print(f"{'GML':<10}{gml_save * 1000:>24.2f}{gml_load:>10.2f}{gml_path.stat().st_size / 1e6:>11.1f}")
+        print(f"{'SQLite':<10}{sqlite_save * 1000:>24.3f}{sqlite_load:>10.2f}"
+              f"{(Path(temp_dir) / 'graph.db').stat().st_size / 1e6:>11.1f}")
+        print(f"\nCommitting all {mutations} mutations to SQLite added "
+              f"{sqlite_build_seconds - memory_seconds:.2f}s to the {memory_seconds:.2f}s in-memory build.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Graph Query Benchmark
+=====================
+
+Builds a synthetic concept graph in NetworkXDatabase and times lookups that
+return a handful of nodes, comparing:
+
+- scan: checking every node, or every edge of the start node
+  (the previous NetworkX implementation)
+- indexed: NetworkXDatabase.query and get_neighbors answered from the
+  label, property and typed-adjacency indexes
+
+Results are checked to be the same before timings are reported.
+
+Usage:
+    python scripts/benchmark_graph_queries.py
+    python scripts/benchmark_graph_queries.py --nodes 100000 --edges 500000
+"""
+
+import sys
+import time
+import asyncio
+import logging
+import argparse
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sam.memory.graph.graph_database import NetworkXDatabase, NodeData, RelationshipData
+
+TYPES = ["RELATES_TO", "MENTIONS", "CITES", "PART_OF"]
+
+
+async def build_graph(db: NetworkXDatabase, nodes: int, edges: int, hub_degree: int) -> None:
+    """Create concept nodes with a few rare labels and a hub node with many edges."""
+    for i in range(nodes):
+        labels = ["Concept"] + (["Person"] if i % 1000 == 0 else [])
+        await db.create_node(NodeData(id=f"concept_{i}", labels=labels,
+                                      properties={"name": f"Concept {i}", "cluster": i % 5000}))
+    for i in range(edges):
+        await db.create_relationship(RelationshipData(
+            id=f"rel_{i}", type=TYPES[i % len(TYPES)] if i % 97 else "AUTHORED_BY",
+            start_node=f"concept_{i % nodes}", end_node=f"concept_{(i * 7919 + 1) % nodes}", properties={}))
+    for i in range(hub_degree):
+        await db.create_relationship(RelationshipData(
+            id=f"hub_{i}", type="AUTHORED_BY" if i % 500 == 0 else TYPES[i % len(TYPES)],
+            start_node="concept_0", end_node=f"concept_{i % nodes}", properties={}))
+
+
+def scan_nodes(graph, label=None, key=None, value=None):
+    """Previous behaviour: check every node."""
+    return sorted(node_id for node_id, data in graph.nodes(data=True)
+                  if (label is None or label in data.get("labels", [])) and (key is None or data.get(key) == value))
+
+
+def scan_neighbors(graph, node_id, relationship_type):
+    """Previous get_neighbors: check the edges to every neighbor."""
+    return sorted(neighbor_id for neighbor_id in graph.neighbors(node_id)
+                  if any(data.get("type") == relationship_type
+                         for data in graph.get_edge_data(node_id, neighbor_id).values()))
+
+
+def timed(function, repeats: int):
+    """Return the mean milliseconds per call and the last result."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = function()
+    return (time.perf_counter() - start) * 1000 / repeats, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark indexed NetworkX graph queries")
+    parser.add_argument("--nodes", type=int, default=50000, help="Number of nodes")
+    parser.add_argument("--edges", type=int, default=200000, help="Number of edges")
+    parser.add_argument("--hub-degree", type=int, default=20000, help="Edges from the hub node")
+    parser.add_argument("--repeats", type=int, default=20, help="Calls per measurement")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    db = NetworkXDatabase()
+    asyncio.run(db.connect())
+    asyncio.run(build_graph(db, args.nodes, args.edges, args.hub_degree))
+    graph = db.graph
+    print(f"{graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges")
+
+    def query_ids(query, parameters=None):
+        return sorted(record["n"]["id"] for record in asyncio.run(db.query(query, parameters)).data)
+
+    def neighbor_ids(node_id, relationship_type):
+        return sorted(node.id for node in asyncio.run(db.get_neighbors(node_id, relationship_type)))
+
+    cases = [
+        ("match by label", lambda: scan_nodes(graph, label="Person"),
+         lambda: query_ids("MATCH (n:Person) RETURN n")),
+        ("match by property", lambda: scan_nodes(graph, key="cluster", value=42),
+         lambda: query_ids("MATCH (n {cluster: $cluster}) RETURN n", {"cluster": 42})),
+        ("typed neighbors (hub)", lambda: scan_neighbors(graph, "concept_0", "AUTHORED_BY"),
+         lambda: neighbor_ids("concept_0", "AUTHORED_BY")),
+    ]
+
+    print(f"\n{'lookup':<24}{'results':>8}{'scan (ms)':>11}{'indexed (ms)':>14}{'speedup':>10}{'same':>6}")
+    for name, scan, indexed in cases:
+        scan_ms, expected = timed(scan, args.repeats)
+        indexed_ms, actual = timed(indexed, args.repeats)
+        print(f"{name:<24}{len(actual):>8}{scan_ms:>11.2f}{indexed_ms:>14.3f}"
+              f"{scan_ms / max(indexed_ms, 1e-9):>9.0f}x{str(actual == expected):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Local Index Rescan Benchmark
+============================
+
+Indexes a directory of small generated documents with LocalFileSearchEngine,
+then times rescanning the unchanged directory:
+
+- previous rescan: read and SHA-256 hash every file, then rewrite the full
+  JSON index (what index_directory did before the stat check)
+- stat rescan: index_directory with the size/mtime/inode check, in a fresh
+  engine that loads the SQLite index first
+
+Also reports the bytes read by the process during each rescan (Linux
+/proc/self/io) and the cost of rescanning after one file changed.
+
+Usage:
+    python scripts/benchmark_local_rescan.py
+    python scripts/benchmark_local_rescan.py --files 10000
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from dataclasses import asdict
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from multimodal.local_search import LocalFileSearchEngine
+
+WORDS = ("index", "search", "memory", "vector", "graph", "report", "table", "capsule", "query", "document",
+         "reasoning", "planner", "tool", "agent", "summary", "result", "section", "source", "evidence")
+
+
+def bytes_read() -> int:
+    """Bytes read by this process so far (0 where /proc/self/io is unavailable)."""
+    try:
+        with open("/proc/self/io") as f:
+            return int(next(line for line in f if line.startswith("rchar")).split()[1])
+    except (OSError, StopIteration):
+        return 0
+
+
+def measure(function):
+    """Return (seconds, megabytes read, result) for one call."""
+    start_bytes, start = bytes_read(), time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, (bytes_read() - start_bytes) / 1e6, result
+
+
+def previous_rescan(knowledge_dir: Path, engine: LocalFileSearchEngine, index_file: Path) -> None:
+    """Hash every file and rewrite the whole JSON index, as before."""
+    for file_path in knowledge_dir.rglob("*"):
+        if file_path.is_file():
+            with open(file_path, 'rb') as f:
+                hashlib.sha256(f.read()).hexdigest()
+    with open(index_file, 'w', encoding='utf-8') as f:
+        json.dump({'indices': [asdict(entry) for entry in engine.search_index.values()]}, f,
+                  indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark no-op rescans of the local search index")
+    parser.add_argument("--files", type=int, default=50000, help="Number of generated files")
+    parser.add_argument("--words", type=int, default=120, help="Words per file")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        knowledge_dir = Path(temp_dir) / "knowledge"
+        for i in range(args.files):
+            subdir = knowledge_dir / f"batch_{i // 1000:03d}"
+            subdir.mkdir(parents=True, exist_ok=True)
+            (subdir / f"note_{i:06d}.txt").write_text(
+                " ".join(rng.choice(WORDS) for _ in range(args.words)), encoding="utf-8")
+
+        index_file = Path(temp_dir) / "search_index.json"
+        engine = LocalFileSearchEngine(knowledge_directory=str(knowledge_dir), index_file=str(index_file))
+        initial_seconds, _, indexed = measure(engine.index_directory)
+        print(f"Initial index: {indexed} files in {initial_seconds:.1f}s")
+
+        previous = measure(lambda: previous_rescan(knowledge_dir, engine, Path(temp_dir) / "previous.json"))
+
+        load_seconds, _, fresh = measure(lambda: LocalFileSearchEngine(knowledge_directory=str(knowledge_dir),
+                                                                       index_file=str(index_file)))
+        stat_rescan = measure(fresh.index_directory)
+
+        changed = knowledge_dir / "batch_000" / "note_000000.txt"
+        changed.write_text("a freshly edited note about rescans", encoding="utf-8")
+        one_changed = measure(fresh.index_directory)
+
+    print(f"Loading the SQLite index: {load_seconds:.1f}s")
+    print(f"\n{'rescan':<26}{'time (s)':>10}{'read (MB)':>11}{'reindexed':>11}")
+    print(f"{'previous (hash all)':<26}{previous[0]:>10.2f}{previous[1]:>11.1f}{'-':>11}")
+    print(f"{'stat check, unchanged':<26}{stat_rescan[0]:>10.2f}{stat_rescan[1]:>11.1f}{stat_rescan[2]:>11}")
+    print(f"{'stat check, one changed':<26}{one_changed[0]:>10.2f}{one_changed[1]:>11.1f}{one_changed[2]:>11}")
+
+
+if __name__ == "__main__":
+    main()
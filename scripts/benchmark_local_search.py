@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Local File Search Benchmark
+===========================
+
+Indexes generated text documents with LocalFileSearchEngine and runs random
+one- to three-word queries, comparing:
+
+- substring scorer: the previous search, calling _calculate_relevance on
+  every indexed document
+- BM25: the inverted index, reading only the postings of the query terms
+
+Reports P50/P95 query latency and the recall of the BM25 results against
+the substring scorer: the share of its top-k results that BM25 also ranks
+in the top k (also counting documents tied with its k-th result, since its
+coarse scores tie many documents), and the share of all documents it
+matches that BM25 matches.
+
+Usage:
+    python scripts/benchmark_local_search.py
+    python scripts/benchmark_local_search.py --documents 20000 --queries 500
+"""
+
+import sys
+import time
+import random
+import logging
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from multimodal.local_search import LocalFileSearchEngine
+
+
+def make_vocabulary(size: int, rng: random.Random):
+    """Build distinct pronounceable pseudo-words."""
+    consonants, vowels = "bcdfghklmnprstvz", "aeiou"
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def write_corpus(directory: Path, documents: int, vocabulary, rng: random.Random) -> None:
+    """Write documents whose words follow a Zipf-like distribution."""
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    for i in range(documents):
+        words = rng.choices(vocabulary, weights=weights, k=rng.randint(100, 400))
+        paragraphs = [" ".join(words[start:start + 60]) for start in range(0, len(words), 60)]
+        (directory / f"doc_{i:05d}.txt").write_text(f"Document {i}\n\n" + "\n\n".join(paragraphs),
+                                                   encoding="utf-8")
+
+
+def substring_search(engine: LocalFileSearchEngine, query: str, max_results: int):
+    """The previous search: score every document with the substring scorer."""
+    query_lower = query.lower()
+    scored = [(index_id, engine._calculate_relevance(query_lower, search_index))
+              for index_id, search_index in engine.search_index.items()]
+    matches = [(index_id, score) for index_id, score in scored if score > 0.1]
+    matches.sort(key=lambda item: item[1], reverse=True)
+    return matches[:max_results], dict(matches)
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BM25 local file search")
+    parser.add_argument("--documents", type=int, default=10000, help="Number of generated documents")
+    parser.add_argument("--vocabulary", type=int, default=5000, help="Distinct words in the corpus")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(0)
+    vocabulary = make_vocabulary(args.vocabulary, rng)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        knowledge_dir = Path(temp_dir) / "knowledge"
+        knowledge_dir.mkdir()
+        write_corpus(knowledge_dir, args.documents, vocabulary, rng)
+
+        engine = LocalFileSearchEngine(knowledge_directory=str(knowledge_dir),
+                                       index_file=str(Path(temp_dir) / "search_index.json"))
+        start = time.perf_counter()
+        engine.index_directory()
+        print(f"Indexed {len(engine.search_index)} documents in {time.perf_counter() - start:.1f}s "
+              f"({len(engine.bm25_index.postings)} terms)")
+
+        # Skip the most frequent words, which appear in nearly every document
+        query_words = vocabulary[len(vocabulary) // 50:]
+        queries = [" ".join(rng.sample(query_words, rng.randint(1, 3))) for _ in range(args.queries)]
+
+        substring_ms, bm25_ms, top_recall, tie_recall, match_recall = [], [], [], [], []
+        for query in queries:
+            start = time.perf_counter()
+            expected_top, expected_matches = substring_search(engine, query, args.top_k)
+            substring_ms.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            results = engine.search(query, max_results=args.top_k)
+            bm25_ms.append((time.perf_counter() - start) * 1000)
+
+            found = [result.result_id[len("result_"):] for result in results]
+            bm25_matches = {index_id for index_id, score in engine.bm25_index.search(query) if score > 0.1}
+            if expected_top:
+                top_recall.append(len(set(found) & {index_id for index_id, _ in expected_top}) / len(expected_top))
+                # The substring scorer ties many documents at its k-th score; any of them counts as a hit
+                kth_score = expected_top[-1][1]
+                tie_recall.append(sum(expected_matches.get(index_id, 0) >= kth_score for index_id in found)
+                                  / len(expected_top))
+                match_recall.append(len(bm25_matches & expected_matches.keys()) / len(expected_matches))
+
+    print(f"\n{'scorer':<18}{'P50 (ms)':>10}{'P95 (ms)':>10}")
+    for name, timings in (("substring", substring_ms), ("BM25", bm25_ms)):
+        print(f"{name:<18}{percentile(timings, 0.5):>10.2f}{percentile(timings, 0.95):>10.2f}")
+    print(f"\nP95 speedup: {percentile(substring_ms, 0.95) / percentile(bm25_ms, 0.95):.1f}x")
+    print(f"Recall@{args.top_k} vs substring scorer:            {statistics.mean(top_recall):.3f}")
+    print(f"Recall@{args.top_k} counting substring-scorer ties: {statistics.mean(tie_recall):.3f}")
+    print(f"Match recall vs substring scorer:              {statistics.mean(match_recall):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+PDF Parsing Benchmark
+=====================
+
+Parses large synthetic PDFs (text plus a ruled table on every page) with
+the multimodal document parser.
+
+Streaming section, comparing:
+
+- list: parse_document, which returns every content block at once
+- streaming: iter_content_blocks, which yields blocks page by page
+
+Each mode runs in a fresh interpreter and reports the time to the first
+content block, the total time and the peak RSS growth while parsing.
+
+Parallel section: extracts page ranges in 1, 2, 4 and 8 worker processes,
+reporting the first run (including worker startup) and a warm second run,
+and checking that the blocks match the serial parse.
+
+Usage:
+    python scripts/benchmark_pdf_parsing.py
+    python scripts/benchmark_pdf_parsing.py --pages 500 --only streaming
+    python scripts/benchmark_pdf_parsing.py --parallel-pages 300 --parser pdfplumber --only parallel
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def write_synthetic_pdf(path, pages: int, lines_per_page: int = 40,
+                        table_rows: int = 6, table_cols: int = 4) -> None:
+    """Write a text PDF with a ruled table on every page (no PDF library needed)."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in range(1, pages + 1):
+        ops = ["BT /F1 9 Tf 50 780 Td 11 TL"]
+        for line in range(lines_per_page):
+            ops.append(f"(Page {page} line {line}: synthetic paragraph text about measurement {page * line % 97}.) '")
+        ops.append("ET")
+        top, left, cell_w, cell_h = 300, 50, 120, 18
+        for row in range(table_rows + 1):
+            y = top - row * cell_h
+            ops.append(f"{left} {y} m {left + table_cols * cell_w} {y} l S")
+        for col in range(table_cols + 1):
+            x = left + col * cell_w
+            ops.append(f"{x} {top} m {x} {top - table_rows * cell_h} l S")
+        for row in range(table_rows):
+            for col in range(table_cols):
+                ops.append(f"BT /F1 8 Tf {left + col * cell_w + 4} {top - (row + 1) * cell_h + 5} Td "
+                           f"(R{row}C{col} {page * (row + 1) * (col + 1)}) Tj ET")
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % pages
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b"%010d 00000 n \n" % offset)
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+class RSSSampler:
+    """Samples the process RSS in a background thread and keeps the peak."""
+
+    def __init__(self, interval: float = 0.005):
+        import psutil
+        self._process = psutil.Process(os.getpid())
+        self._interval = interval
+        self._stop = threading.Event()
+        self.baseline = self._process.memory_info().rss
+        self.peak = self.baseline
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._process.memory_info().rss)
+            time.sleep(self._interval)
+
+    def stop(self) -> float:
+        """Stop sampling and return the peak growth in MB."""
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._process.memory_info().rss)
+        return (self.peak - self.baseline) / 1e6
+
+
+def run_mode(mode: str, pdf_path: str) -> dict:
+    """Parse the PDF in the given mode (called in a fresh interpreter)."""
+    from multimodal_processing.document_parser import MultimodalDocumentParser
+
+    parser = MultimodalDocumentParser()
+
+    # Warm up imports (the text chunker loads its models lazily) on a one-page PDF
+    warmup_path = Path(pdf_path).with_name("warmup.pdf")
+    write_synthetic_pdf(warmup_path, 1)
+    parser.parse_document(warmup_path)
+
+    sampler = RSSSampler()
+    start = time.perf_counter()
+    first_block = None
+    blocks = 0
+
+    if mode == "list":
+        parsed = parser.parse_document(pdf_path)
+        first_block = time.perf_counter() - start
+        blocks = len(parsed.content_blocks)
+    else:
+        for _ in parser.iter_content_blocks(pdf_path):
+            if first_block is None:
+                first_block = time.perf_counter() - start
+            blocks += 1
+
+    seconds = time.perf_counter() - start
+    return {"mode": mode, "blocks": blocks, "first_block": first_block or seconds,
+            "seconds": seconds, "peak_rss_mb": sampler.stop()}
+
+
+def run_streaming(pages: int, temp_dir: str) -> None:
+    """Compare list and streaming parsing, each in a fresh interpreter."""
+    pdf_path = Path(temp_dir) / "streaming.pdf"
+    write_synthetic_pdf(pdf_path, pages)
+    print(f"Streaming: {pages} pages, {pdf_path.stat().st_size / 1e6:.1f} MB")
+
+    results = []
+    for mode in ("list", "streaming"):
+        output = subprocess.run([sys.executable, __file__, "--mode", mode, "--pdf", str(pdf_path)],
+                                capture_output=True, text=True, check=True).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    print(f"\n{'mode':<12}{'blocks':>8}{'first block (s)':>17}{'total (s)':>11}{'peak RSS (MB)':>15}")
+    for result in results:
+        print(f"{result['mode']:<12}{result['blocks']:>8}{result['first_block']:>17.3f}"
+              f"{result['seconds']:>11.2f}{result['peak_rss_mb']:>15.1f}")
+
+
+def run_parallel(pages: int, worker_counts, pdf_parser: str, pages_per_task: int, temp_dir: str) -> None:
+    """Time page-range extraction for each worker count."""
+    from multimodal_processing.document_parser import MultimodalDocumentParser
+
+    pdf_path = Path(temp_dir) / "parallel.pdf"
+    write_synthetic_pdf(pdf_path, pages)
+    print(f"\nParallel extraction: {pages} pages with {pdf_parser}, {pages_per_task} pages per task, "
+          f"{os.cpu_count()} CPUs")
+
+    def extract(parser):
+        if parser.pdf_workers > 1:
+            blocks = parser._iter_pdf_parallel(pdf_path, pdf_parser)
+        elif pdf_parser == 'pdfplumber':
+            blocks = parser._iter_pdf_with_pdfplumber(pdf_path)
+        else:
+            blocks = parser._iter_pdf_with_pypdf2(pdf_path)
+        return [(block.source_location, block.content) for block in blocks]
+
+    # Warm up the serial parser's lazy imports so every row pays the same costs
+    serial_parser = MultimodalDocumentParser()
+    warmup_path = Path(temp_dir) / "warmup.pdf"
+    write_synthetic_pdf(warmup_path, 1)
+    serial_parser.parse_document(warmup_path)
+
+    rows = []
+    serial_blocks = None
+    for workers in worker_counts:
+        parser = MultimodalDocumentParser(pdf_workers=workers, pdf_pages_per_task=pages_per_task) \
+            if workers > 1 else serial_parser
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            blocks = extract(parser)
+            timings.append(time.perf_counter() - start)
+        parser.shutdown()
+
+        if serial_blocks is None:
+            serial_blocks = blocks
+        rows.append((workers, len(blocks), timings[0], timings[1], blocks == serial_blocks))
+
+    baseline = rows[0][3]
+    print(f"\n{'workers':>8}{'blocks':>8}{'first run (s)':>15}{'warm run (s)':>14}{'speedup':>10}{'same blocks':>12}")
+    for workers, blocks, cold, warm, same in rows:
+        print(f"{workers:>8}{blocks:>8}{cold:>15.2f}{warm:>14.2f}{baseline / max(warm, 1e-9):>9.2f}x{str(same):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming and parallel PDF parsing")
+    parser.add_argument("--pages", type=int, default=2000, help="Pages in the streaming benchmark PDF")
+    parser.add_argument("--parallel-pages", type=int, default=300, help="Pages in the parallel benchmark PDF")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    parser.add_argument("--pages-per-task", type=int, default=25, help="Pages per worker task")
+    parser.add_argument("--parser", choices=["PyPDF2", "pdfplumber"], default="PyPDF2",
+                        help="PDF library for the parallel benchmark")
+    parser.add_argument("--only", choices=["streaming", "parallel"], help="Run a single section")
+    parser.add_argument("--mode", choices=["list", "streaming"], help=argparse.SUPPRESS)
+    parser.add_argument("--pdf", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.pdf)))
+        return
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.only != "parallel":
+            run_streaming(args.pages, temp_dir)
+        if args.only != "streaming":
+            worker_counts = [int(count) for count in args.workers.split(",")]
+            run_parallel(args.parallel_pages, worker_counts, args.parser, args.pages_per_task, temp_dir)
+
+
+if __name__ == "__main__":
+    main()
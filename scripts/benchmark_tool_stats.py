@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tool Usage Statistics Benchmark
+===============================
+
+Records tool executions from several threads into a ToolRegistry and
+compares:
+
+- per-update save: flush_interval=0, rewriting the registry JSON after
+  every execution (the previous behaviour)
+- batched: statistics kept in memory and flushed once on close
+
+Reports wall time, registry writes and whether the stored usage counts
+match the number of recorded executions.
+
+Usage:
+    python scripts/benchmark_tool_stats.py
+    python scripts/benchmark_tool_stats.py --threads 32 --updates 1000
+"""
+
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+import threading
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Load the registry module on its own; the tools package also imports the executors
+_spec = importlib.util.spec_from_file_location("tool_registry",
+                                               Path(__file__).parent.parent / "tools" / "tool_registry.py")
+tool_registry = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tool_registry)
+
+
+def run(registry_file: Path, flush_interval: float, threads: int, updates: int):
+    """Return (seconds, writes, counts match) for one configuration."""
+    registry = tool_registry.ToolRegistry(registry_file=str(registry_file), flush_interval=flush_interval)
+    initial = registry.get_tool("python_interpreter").usage_count
+
+    def worker():
+        for i in range(updates):
+            registry.update_tool_stats("python_interpreter", success=i % 5 != 0, execution_time=0.5)
+
+    with mock.patch.object(tool_registry.os, "replace", wraps=tool_registry.os.replace) as replace:
+        start = time.perf_counter()
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        registry.close()
+        seconds = time.perf_counter() - start
+
+    stored = json.loads(registry_file.read_text(encoding="utf-8"))
+    count = next(tool['usage_count'] for tool in stored['tools'] if tool['tool_id'] == "python_interpreter")
+    return seconds, replace.call_count, count == initial + threads * updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched tool usage statistics")
+    parser.add_argument("--threads", type=int, default=16, help="Recording threads")
+    parser.add_argument("--updates", type=int, default=500, help="Executions recorded per thread")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        results = {
+            "per-update save": run(Path(temp_dir) / "per_update.json", 0, args.threads, args.updates),
+            "batched": run(Path(temp_dir) / "batched.json", 30.0, args.threads, args.updates),
+        }
+
+    print(f"{args.threads * args.updates} executions from {args.threads} threads\n")
+    print(f"{'mode':<18}{'time (s)':>10}{'writes':>10}{'exact':>8}")
+    for name, (seconds, writes, exact) in results.items():
+        print(f"{name:<18}{seconds:>10.3f}{writes:>10}{str(exact):>8}")
+
+
+if __name__ == "__main__":
+    main()
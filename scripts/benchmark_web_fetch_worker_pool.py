@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Web Fetch Worker Pool Benchmark
+===============================
+
+Fetches pages from a local HTTP server through WebFetcher, comparing:
+
+- subprocess per URL: a new interpreter per fetch (the previous behaviour)
+- worker pool: warm isolated workers receiving jobs over a pipe
+
+Both modes are run with the same number of concurrent callers.
+
+Usage:
+    python scripts/benchmark_web_fetch_worker_pool.py
+    python scripts/benchmark_web_fetch_worker_pool.py --fetches 100 --concurrency 4
+"""
+
+import sys
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from web_retrieval.web_fetcher import WebFetcher
+from web_retrieval.fetch_worker_pool import get_fetch_worker_pool
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves a small article page for every path."""
+
+    body = ("<html><head><style>p {}</style></head><body>" +
+            "".join(f"<p>Paragraph {i} of the benchmark article.</p>" for i in range(50)) +
+            "</body></html>").encode()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(mode: str, fetcher: WebFetcher, urls, concurrency: int) -> dict:
+    """Fetch every URL and time the batch."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(fetcher.fetch_url_content, urls))
+    seconds = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "seconds": seconds,
+        "ok": sum(1 for result in results if result.success),
+        "throughput": len(urls) / seconds
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the web fetch worker pool")
+    parser.add_argument("--fetches", type=int, default=100, help="Number of URLs to fetch")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent fetches (and pool size)")
+    parser.add_argument("--max-jobs", type=int, default=50, help="Jobs per worker before recycling")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base_url}/article/{i}" for i in range(args.fetches)]
+    print(f"{args.fetches} fetches from a local HTTP server, concurrency {args.concurrency}")
+
+    results = [
+        run("subprocess per URL", WebFetcher(timeout=10, use_worker_pool=False), urls, args.concurrency),
+        run("worker pool", WebFetcher(timeout=10, pool_size=args.concurrency,
+                                      max_jobs_per_worker=args.max_jobs), urls, args.concurrency)
+    ]
+    pool_stats = get_fetch_worker_pool().get_stats()
+    server.shutdown()
+
+    print(f"\n{'mode':<20}{'time (s)':>10}{'ok':>6}{'fetches/s':>11}{'speedup':>10}")
+    baseline = results[0]['seconds']
+    for result in results:
+        print(f"{result['mode']:<20}{result['seconds']:>10.2f}{result['ok']:>6}{result['throughput']:>11.1f}"
+              f"{baseline / max(result['seconds'], 1e-9):>9.1f}x")
+    print(f"\nWorker pool: {pool_stats['workers_started']} workers started, "
+          f"{pool_stats['workers_recycled']} recycled")
+
+
+if __name__ == "__main__":
+    main()
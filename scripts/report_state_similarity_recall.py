@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+State Similarity Index Recall Report
+====================================
+
+Builds a synthetic planning session trace (one bounded-depth A* search tree
+per task, tasks built from shared templates, actions from a shared tool
+vocabulary) and compares StateSimilarityDetector's
+LSH-indexed find_similar_states against the exact full scan:
+
+- recall: share of the exact scan's similar states also found via the index
+- candidates: exact similarity computations per query
+- time per query for both paths
+
+Usage:
+    python scripts/report_state_similarity_recall.py
+    python scripts/report_state_similarity_recall.py --states 20000 --queries 300 --num-perm 96 --bands 32
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add SAM to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sam.agent_zero.planning.state import PlanningState
+from sam.agent_zero.planning.state_similarity import StateSimilarityDetector
+
+VERBS = ["Analyze", "Summarize", "Compare", "Research", "Audit", "Explain", "Review", "Forecast"]
+SUBJECTS = ["the quarterly revenue report", "recent retrieval augmented generation papers",
+            "the security audit findings", "customer churn in the uploaded spreadsheet",
+            "the vendor contract terms", "model evaluation results", "the incident postmortem",
+            "competitor pricing pages", "the onboarding conversation", "hiring pipeline metrics"]
+QUALIFIERS = ["and list the key risks", "for the board meeting", "with citations", "in a short memo"]
+ACTIONS = ["web_search", "document_search", "memory_search", "summarize", "extract_tables",
+           "compare_sources", "apply_logical_reasoning", "validate_conclusions", "arxiv_search",
+           "create_structured_response", "calculate_metrics", "cite_sources", "news_search",
+           "analyze_document_structure", "identify_key_entities", "synthesize_findings"]
+
+
+def build_trace(num_states: int, branching: int, max_depth: int, seed: int):
+    """Grow one bounded-depth search tree per task, expanding random frontier nodes."""
+    rng = random.Random(seed)
+    tasks = [f"{verb} {subject} {qualifier}" for verb in VERBS for subject in SUBJECTS for qualifier in QUALIFIERS]
+    rng.shuffle(tasks)
+    tasks = tasks[:max(1, num_states // 50)]
+    per_task = num_states // len(tasks)
+    states = []
+
+    for task in tasks:
+        root = PlanningState(task_description=task)
+        tree = [root]
+        frontier = [root]
+        while len(tree) < per_task and frontier:
+            parent = frontier.pop(rng.randrange(len(frontier)))
+            for action in rng.sample(ACTIONS, branching):
+                child = parent.add_action(action, f"Executed {action}")
+                tree.append(child)
+                if child.depth < max_depth:
+                    frontier.append(child)
+        states.extend(tree[:per_task])
+
+    return states
+
+
+def run_queries(detector: StateSimilarityDetector, queries, states):
+    detector.clear_cache()
+    detector._exact_comparisons = 0
+    if detector.use_index:
+        for state in states:
+            detector.index_state(state)
+
+    results = []
+    start = time.perf_counter()
+    for query in queries:
+        # The candidate list is the whole session, as the planner would pass it
+        results.append({state.state_id for state, _ in detector.find_similar_states(query, states)})
+    elapsed = time.perf_counter() - start
+    return results, elapsed, detector.get_cache_stats()['exact_comparisons']
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report recall of the indexed state similarity lookup")
+    parser.add_argument("--states", type=int, default=5000, help="States in the synthetic trace")
+    parser.add_argument("--queries", type=int, default=200, help="Number of query states")
+    parser.add_argument("--branching", type=int, default=5, help="Children per expansion")
+    parser.add_argument("--max-depth", type=int, default=8, help="Maximum plan length")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Similarity threshold")
+    parser.add_argument("--num-perm", type=int, default=144, help="MinHash values per state")
+    parser.add_argument("--bands", type=int, default=48, help="LSH bands")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    states = build_trace(args.states, args.branching, args.max_depth, args.seed)
+    queries = random.Random(args.seed).sample(states, args.queries)
+
+    exact = StateSimilarityDetector(args.threshold, use_index=False)
+    indexed = StateSimilarityDetector(args.threshold, lsh_num_perm=args.num_perm, lsh_bands=args.bands)
+
+    start = time.perf_counter()
+    for state in states:
+        indexed.index_state(state)
+    index_seconds = time.perf_counter() - start
+
+    exact_results, exact_seconds, exact_comparisons = run_queries(exact, queries, states)
+    indexed_results, indexed_seconds, indexed_comparisons = run_queries(indexed, queries, states)
+
+    true_total = sum(len(result) for result in exact_results)
+    found_total = sum(len(e & i) for e, i in zip(exact_results, indexed_results))
+    recall = found_total / true_total if true_total else 1.0
+    full_recall_queries = sum(1 for e, i in zip(exact_results, indexed_results) if e <= i)
+
+    num_tasks = len({state.task_description for state in states})
+    print(f"Synthetic trace: {len(states):,} states over {num_tasks} tasks, {len(queries)} queries, "
+          f"threshold {args.threshold}, {args.num_perm} perms / {args.bands} bands")
+    print(f"Index build: {index_seconds:.2f} s ({index_seconds / len(states) * 1e6:.0f} us/state)")
+    print(f"\n{'path':<10}{'comparisons/query':>19}{'ms/query':>11}{'similar found':>15}")
+    print(f"{'scan':<10}{exact_comparisons / len(queries):>19.1f}{exact_seconds / len(queries) * 1000:>11.2f}"
+          f"{true_total:>15}")
+    print(f"{'indexed':<10}{indexed_comparisons / len(queries):>19.1f}{indexed_seconds / len(queries) * 1000:>11.2f}"
+          f"{found_total:>15}")
+    print(f"\nRecall vs scan: {recall:.4f} ({full_recall_queries}/{len(queries)} queries with full recall), "
+          f"speedup {exact_seconds / max(indexed_seconds, 1e-9):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Batched A* Heuristic Estimation
+==============================================
+
+Tests that the heuristic estimator scores child states together, memoizes
+estimates by state fingerprint, and that the A* planner expands nodes with
+a single batched heuristic request.
+"""
+
+import re
+import sys
+import time
+import threading
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.agent_zero.planning.a_star_planner import AStarPlanner
+from sam.agent_zero.planning.heuristic_estimator import HeuristicEstimator
+from sam.agent_zero.planning.search_node import SearchNodeFactory
+from sam.agent_zero.planning.state import PlanningState
+
+
+class FakeLLM:
+    """LLM stand-in with fixed latency that records prompts and peak concurrency."""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.prompts = []
+        self.active = 0
+        self.peak_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+
+        states = re.findall(r'^State (\d+):', prompt, re.MULTILINE)
+        if states:
+            return "\n".join(f"{index}: {int(index) + 10}" for index in states)
+        return "7"
+
+
+def make_children(count=6):
+    root = PlanningState(task_description="Summarize the quarterly report")
+    return [root.add_action(f"action_{i}", f"Executed action_{i}") for i in range(count)]
+
+
+class TestHeuristicBatching(unittest.TestCase):
+    """Test suite for HeuristicEstimator batch scoring."""
+
+    def test_concurrent_batch_overlaps_calls(self):
+        """Child states are scored with bounded concurrent LLM calls."""
+        llm = FakeLLM(latency=0.1)
+        estimator = HeuristicEstimator(llm_interface=llm, max_concurrent_estimates=3)
+
+        start = time.perf_counter()
+        costs = estimator.estimate_costs_to_go(make_children(6))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(costs, [7] * 6)
+        self.assertEqual(len(llm.prompts), 6)
+        self.assertEqual(llm.peak_active, 3)
+        self.assertLess(elapsed, 0.5)
+
+    def test_batch_prompt_uses_one_call(self):
+        """A combined prompt scores every state and keeps the input order."""
+        llm = FakeLLM()
+        estimator = HeuristicEstimator(llm_interface=llm, use_batch_prompt=True)
+
+        costs = estimator.estimate_costs_to_go(make_children(4))
+
+        self.assertEqual(costs, [11, 12, 13, 14])
+        self.assertEqual(len(llm.prompts), 1)
+        self.assertEqual(estimator.get_estimation_stats()['llm_calls'], 1)
+
+    def test_batch_prompt_falls_back_for_missing_lines(self):
+        """States missing from the batched answer are scored individually."""
+        estimator = HeuristicEstimator(llm_interface=lambda prompt: "1: 4\n3: 9" if "State 1:" in prompt else "5",
+                                       use_batch_prompt=True)
+
+        self.assertEqual(estimator.estimate_costs_to_go(make_children(3)), [4, 5, 9])
+
+    def test_memoized_by_state_fingerprint(self):
+        """Equivalent states, within and across batches, cost no further LLM calls."""
+        llm = FakeLLM(latency=0)
+        estimator = HeuristicEstimator(llm_interface=llm)
+        children = make_children(3)
+        duplicate = PlanningState(task_description=children[0].task_description,
+                                  action_history=list(children[0].action_history),
+                                  current_observation=children[0].current_observation)
+
+        estimator.estimate_costs_to_go(children + [duplicate])
+        self.assertEqual(len(llm.prompts), 3)
+
+        estimator.estimate_costs_to_go(make_children(3))
+        estimator.estimate_cost_to_go(duplicate)
+        self.assertEqual(len(llm.prompts), 3)
+
+        # Same history length but different actions must not share an estimate
+        other = PlanningState(task_description=children[0].task_description).add_action("other", "Executed other")
+        self.assertNotEqual(estimator.state_fingerprint(other), estimator.state_fingerprint(children[0]))
+
+
+class TestPlannerExpansion(unittest.TestCase):
+    """Test that node expansion issues one batched heuristic request."""
+
+    def test_expand_node_batches_children(self):
+        planner = AStarPlanner(enable_tpv_control=False, enable_episodic_learning=False,
+                               enable_meta_reasoning_validation=False)
+        batches = []
+        original = planner.heuristic_estimator.estimate_costs_to_go
+        planner.heuristic_estimator.estimate_costs_to_go = lambda states: batches.append(len(states)) or original(states)
+
+        root = SearchNodeFactory.create_root_node("Summarize the quarterly report")
+        planner._expand_node(root)
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(len(planner.frontier), batches[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Parallel Skill Execution in the CoordinatorEngine
+================================================================
+
+Runs plans of sleeping stub skills sequentially and as a dependency DAG,
+checking that the final UIF is the same and that independent skills overlap.
+"""
+
+import re
+import sys
+import time
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.orchestration.uif import SAM_UIF
+from sam.orchestration.skills.base import BaseSkillModule, SkillExecutionError
+from sam.orchestration.coordinator import CoordinatorEngine, ExecutionResult
+from sam.orchestration.skill_scheduler import copy_uif, diff_uif, apply_uif_delta
+
+
+class SleepySkill(BaseSkillModule):
+    """Stub skill that sleeps, then writes outputs derived from its inputs."""
+
+    skill_description = "Sleeping stub skill"
+
+    def __init__(self, name, reads=(), writes=(), delay=0.2, fail=False):
+        self.skill_name = name
+        self.optional_inputs = list(reads)
+        self.output_keys = list(writes)
+        self.delay = delay
+        self.fail = fail
+        self.runs = 0
+        super().__init__()
+
+    def execute(self, uif):
+        self.runs += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise SkillExecutionError(f"{self.skill_name} failed")
+
+        seen = {key: uif.intermediate_data.get(key) for key in self.optional_inputs}
+        for key in self.output_keys:
+            uif.intermediate_data[key] = f"{self.skill_name}:{key}<-{seen}"
+        uif.set_skill_output(self.skill_name, sorted(seen))
+        return uif
+
+
+def build_skills(fail_news=False):
+    return [
+        SleepySkill("MemoryStub", writes=["memory_results"]),
+        SleepySkill("NewsStub", writes=["news_articles"], fail=fail_news),
+        SleepySkill("CalculatorStub", writes=["calculation_result"]),
+        SleepySkill("ConflictStub", reads=["memory_results", "news_articles"], writes=["conflict_analysis"]),
+        SleepySkill("ResponseStub", reads=["memory_results", "news_articles", "calculation_result",
+                                           "conflict_analysis"], writes=["final_response"], delay=0.1),
+    ]
+
+
+def run_plan(parallel, skills=None, continue_on_failure=False, loss_balancing=False):
+    coordinator = CoordinatorEngine(enable_dynamic_planning=False, enable_loss_balancing=loss_balancing,
+                                    enable_domain_constraints=False)
+    coordinator._config = replace(coordinator._config, enable_parallel_execution=parallel,
+                                  max_parallel_skills=4, enable_plan_validation=True,
+                                  continue_on_skill_failure=continue_on_failure,
+                                  enable_fallback_plans=False)
+    skills = skills or build_skills()
+    coordinator.register_skills(skills)
+
+    uif = SAM_UIF(input_query="What changed in the markets today?", task_id="task", session_id="s1")
+    start = time.perf_counter()
+    result = coordinator._execute_validated_plan([skill.skill_name for skill in skills], uif)
+    return result, uif, time.perf_counter() - start
+
+
+def normalized(uif):
+    """UIF contents without timestamps and timing values."""
+    data = uif.model_dump()
+    data['log_trace'] = [re.sub(r'^\[[^\]]+\] ', '', entry) for entry in data['log_trace']]
+    data['skill_timings'] = sorted(data['skill_timings'])
+    for key in ('created_at', 'updated_at'):
+        data.pop(key)
+    return data
+
+
+class TestParallelExecution(unittest.TestCase):
+    """Test DAG execution against the sequential coordinator."""
+
+    def test_parallel_matches_sequential_and_follows_critical_path(self):
+        """The final UIF is identical while latency drops to the critical path."""
+        seq_result, seq_uif, seq_time = run_plan(parallel=False)
+        par_result, par_uif, par_time = run_plan(parallel=True)
+
+        self.assertEqual(seq_result, ExecutionResult.SUCCESS)
+        self.assertEqual(par_result, ExecutionResult.SUCCESS)
+        self.assertEqual(normalized(par_uif), normalized(seq_uif))
+
+        # Sequential: 4 x 0.2 + 0.1 s; critical path: memory/news -> conflict -> response = 0.5 s
+        self.assertGreater(seq_time, 0.85)
+        self.assertLess(par_time, 0.75)
+
+    def test_failure_discards_later_results(self):
+        """Without continue_on_skill_failure, skills after the failure leave no trace."""
+        seq_result, seq_uif, _ = run_plan(parallel=False, skills=build_skills(fail_news=True))
+        par_result, par_uif, _ = run_plan(parallel=True, skills=build_skills(fail_news=True))
+
+        self.assertEqual(seq_result, ExecutionResult.FAILURE)
+        self.assertEqual(par_result, ExecutionResult.FAILURE)
+        self.assertNotIn("calculation_result", par_uif.intermediate_data)
+        self.assertEqual(normalized(par_uif), normalized(seq_uif))
+
+    def test_continue_on_failure_matches_sequential(self):
+        """Tolerated failures are committed in plan order like a sequential run."""
+        seq_result, seq_uif, _ = run_plan(parallel=False, skills=build_skills(fail_news=True),
+                                          continue_on_failure=True)
+        par_result, par_uif, _ = run_plan(parallel=True, skills=build_skills(fail_news=True),
+                                          continue_on_failure=True)
+
+        self.assertEqual(par_result, ExecutionResult.PARTIAL_SUCCESS)
+        self.assertEqual(par_result, seq_result)
+        self.assertEqual(normalized(par_uif), normalized(seq_uif))
+
+    def test_failure_stops_dispatching_later_skills(self):
+        """Skills after a fatal failure are never started, even if they are ready."""
+        skills = [
+            SleepySkill("MemoryStub", writes=["memory_results"], delay=0.4),
+            SleepySkill("NewsStub", writes=["news_articles"], delay=0.05, fail=True),
+            SleepySkill("ConflictStub", reads=["news_articles"], writes=["conflict_analysis"], delay=0.05),
+        ]
+        result, uif, _ = run_plan(parallel=True, skills=skills)
+
+        self.assertEqual(result, ExecutionResult.FAILURE)
+        self.assertEqual([skill.runs for skill in skills], [1, 1, 0])
+        self.assertIn("MemoryStub", uif.skill_outputs)
+
+    def test_loss_balancing_runs_sequentially(self):
+        """Effort is adapted after every skill, so plans with loss balancing do not overlap skills."""
+        _, seq_uif, _ = run_plan(parallel=False, loss_balancing=True)
+        _, par_uif, par_time = run_plan(parallel=True, loss_balancing=True)
+
+        self.assertEqual(normalized(par_uif), normalized(seq_uif))
+        self.assertGreater(par_time, 0.85)
+
+
+class TestUIFDeltas(unittest.TestCase):
+    """Test the UIF copies and change records used by the scheduler."""
+
+    def test_nested_changes_are_isolated_and_recorded(self):
+        base = SAM_UIF(input_query="q", task_id="task", session_id="s1")
+        base.intermediate_data['shared'] = {'items': ['a'], 'meta': {'count': 1}}
+
+        skill_uif = copy_uif(base)
+        before = copy_uif(skill_uif)
+        skill_uif.intermediate_data['shared']['items'].append('b')
+        skill_uif.intermediate_data['shared']['meta']['count'] = 2
+
+        # The skill's in-place changes do not leak into the UIF it was copied from
+        self.assertEqual(base.intermediate_data['shared'], {'items': ['a'], 'meta': {'count': 1}})
+
+        delta = diff_uif(before, skill_uif)
+        self.assertIn('intermediate_data', delta)
+
+        apply_uif_delta(base, delta)
+        self.assertEqual(base.intermediate_data['shared'], {'items': ['a', 'b'], 'meta': {'count': 2}})
+        self.assertIsNot(base.intermediate_data['shared'], skill_uif.intermediate_data['shared'])
+
+
+class TestExecutionGraph(unittest.TestCase):
+    """Test the dependency graph built from declared skill inputs and outputs."""
+
+    def test_graph_orders_readers_writers_and_barriers(self):
+        coordinator = CoordinatorEngine(enable_dynamic_planning=False, enable_loss_balancing=False,
+                                        enable_domain_constraints=False)
+        barrier = SleepySkill("BarrierStub", writes=["audit"])
+        barrier.can_run_parallel = False
+        coordinator.register_skills(build_skills() + [barrier])
+
+        graph = coordinator._validator.build_execution_graph(
+            ["MemoryStub", "NewsStub", "ConflictStub", "MemoryStub", "BarrierStub", "CalculatorStub"])
+
+        self.assertEqual(graph, [set(), set(), {0, 1}, {0}, {0, 1, 2, 3}, {4}])
+
+
+if __name__ == '__main__':
+    unittest.main()
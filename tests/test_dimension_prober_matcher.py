@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Precompiled Dimension Profile Matcher
+========================================================
+
+Checks that ProfileMatcher scores every dimension exactly like scoring each
+pattern and keyword with its own regex, and that profile updates recompile
+the matcher.
+"""
+
+import sys
+import random
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from multimodal_processing.dimension_prober_v2 import EnhancedDimensionProberV2, ProfileMatcher
+
+EDGE_CASE_PROFILE = {
+    'name': 'edge_cases',
+    'dimensions': {
+        'risk': {'patterns': ['risk', 'risk assessment', 'Risk', ' risk', 'very very', 'cost-benefit', 'c++', ''],
+                 'boost_keywords': ['case law', 'risk', 'risk', 'c++', 'x.'], 'weight': 1.4},
+        'accents': {'patterns': ['état', 'straße'], 'boost_keywords': ['ÉTAT']},
+        'empty': {'patterns': [], 'boost_keywords': []}
+    }
+}
+
+
+def score_per_pattern(prober, text, profile_config):
+    """Score dimensions with one regex per pattern and keyword."""
+    text_lower = text.lower()
+    scores = {}
+    for dim_name, dim_config in profile_config.get('dimensions', {}).items():
+        base_score = prober._score_patterns_enhanced(text_lower, dim_config.get('patterns', []))
+        keyword_boost = prober._score_keywords(text_lower, dim_config.get('boost_keywords', []))
+        scores[dim_name] = min(1.0, (base_score + keyword_boost * 0.3) * dim_config.get('weight', 1.0))
+    return scores
+
+
+class TestProfileMatcher(unittest.TestCase):
+    """Test the single-pass profile matcher against per-pattern scoring."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.prober = EnhancedDimensionProberV2({'enable_spose': False})
+        cls.profiles = [cls.prober.profile_manager.get_profile(name)
+                        for name in cls.prober.profile_manager.list_profiles()] + [EDGE_CASE_PROFILE]
+
+    def test_scores_match_per_pattern_scoring(self):
+        vocabulary = ['the', 'data', 'very', 'x', 'ſtate', 'rısk', 'ÉTAT', 'STRASSE']
+        for profile_config in self.profiles:
+            for dim_config in profile_config.get('dimensions', {}).values():
+                vocabulary += dim_config.get('patterns', []) + dim_config.get('boost_keywords', [])
+        separators = [' ', '  ', '-', ', ', '\n', '(', '.', '—', '_', '']
+
+        rng = random.Random(7)
+        for _ in range(500):
+            text = ''.join(rng.choice(vocabulary) + rng.choice(separators) for _ in range(rng.randint(0, 40)))
+            if rng.random() < 0.3:
+                text = text.upper()
+            for profile_config in self.profiles:
+                self.assertEqual(self.prober._enhanced_pattern_probing(text, profile_config),
+                                 score_per_pattern(self.prober, text, profile_config), text)
+
+    def test_overlapping_and_repeated_matches_are_counted_like_findall(self):
+        matcher = ProfileMatcher(EDGE_CASE_PROFILE)
+        text = "very very very risk assessment. risk-assessment risks c++ case law"
+        counts = matcher.count_matches(text)
+
+        pattern_ids = matcher.dimensions[0][1]
+        # 'risk' and 'Risk' share one expression, ' risk' needs a word character before the
+        # space and 'very very' does not overlap itself
+        self.assertEqual([counts[i] for i in pattern_ids[:6]], [2, 2, 2, 1, 1, 0])
+
+    def test_update_profile_recompiles_matcher(self):
+        manager = self.prober.profile_manager
+        original = manager.get_profile('general')
+        self.assertIs(manager.get_matcher(original), manager.get_matcher(original))
+
+        updated = {'name': 'general', 'dimensions': {'novelty': {'patterns': ['zeitgeist']}}}
+        try:
+            manager.update_profile('general', updated)
+            scores = self.prober._enhanced_pattern_probing("A zeitgeist shift", manager.get_profile('general'))
+            self.assertEqual(list(scores), ['novelty'])
+            self.assertGreater(scores['novelty'], 0.6)
+            self.assertIs(manager.get_matcher(updated).profile_config, updated)
+        finally:
+            manager.update_profile('general', original)
+
+
+if __name__ == '__main__':
+    unittest.main()
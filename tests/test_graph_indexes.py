@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Test Suite for NetworkXDatabase Query Indexes
+=============================================
+
+Compares label, property and typed-relationship queries answered from the
+GraphIndex with the same queries answered by scanning the whole graph,
+after random writes that also relabel nodes and retype relationships.
+"""
+
+import sys
+import random
+import shutil
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.memory.graph.graph_database import NetworkXDatabase, NodeData, RelationshipData
+from sam.memory.graph.graph_index import parse_match_query
+
+LABELS = ["Concept", "Entity", "Document", "Person"]
+TYPES = ["RELATES_TO", "MENTIONS", "CITES"]
+
+
+async def build_random_graph(db, rng, nodes=400, edges=2000):
+    for i in range(nodes):
+        await db.create_node(NodeData(id=f"node_{i}", labels=rng.sample(LABELS, rng.randint(0, 2)),
+                                      properties={"category": rng.choice("abcd"), "rank": i % 7,
+                                                  "tags": ["x", rng.choice("yz")]}))
+    for i in range(edges):
+        await db.create_relationship(RelationshipData(
+            id=f"rel_{i}", type=rng.choice(TYPES), start_node=f"node_{rng.randrange(nodes + 20)}",
+            end_node=f"node_{rng.randrange(nodes)}", properties={"weight": i % 5}))
+    # Rewrites: relabel nodes, change properties and retype existing relationships
+    for i in range(nodes // 2):
+        await db.create_node(NodeData(id=f"node_{rng.randrange(nodes)}", labels=rng.sample(LABELS, 1),
+                                      properties={"category": rng.choice("abcde")}))
+    for i in range(edges // 4):
+        u, v, key = rng.choice(list(db.graph.edges(keys=True)))
+        await db.create_relationship(RelationshipData(id=key, type=rng.choice(TYPES),
+                                                      start_node=u, end_node=v, properties={}))
+
+
+def scan_nodes(graph, labels=(), properties=None):
+    """Scan every node for labels and property equality."""
+    matches = []
+    for node_id, data in graph.nodes(data=True):
+        node_labels = data.get("labels", [])
+        if all(label in node_labels for label in labels) and all(
+                node_id == value if key == "id" else data.get(key, object()) == value
+                for key, value in (properties or {}).items()):
+            matches.append(node_id)
+    return matches
+
+
+def scan_neighbors(graph, node_id, relationship_type, direction="out"):
+    """Scan a node's edges for neighbors over relationships of one type."""
+    edges = []
+    if direction in ("out", "both"):
+        edges += [(v, data) for _, v, data in graph.out_edges(node_id, data=True)]
+    if direction in ("in", "both"):
+        edges += [(u, data) for u, _, data in graph.in_edges(node_id, data=True)]
+    return {v for v, data in edges if relationship_type is None or data.get("type") == relationship_type}
+
+
+class TestGraphIndexes(unittest.TestCase):
+    """Test indexed NetworkX queries against full scans."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = NetworkXDatabase(str(Path(self.temp_dir) / "networkx_graph.db"))
+        asyncio.run(self.db.connect())
+        asyncio.run(build_random_graph(self.db, random.Random(3)))
+
+    def tearDown(self):
+        asyncio.run(self.db.disconnect())
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def query_ids(self, query, parameters=None, column="n"):
+        result = asyncio.run(self.db.query(query, parameters))
+        self.assertTrue(result.success, result.error_message)
+        return sorted(record[column]["id"] for record in result.data)
+
+    def assert_queries_match_scan(self):
+        graph = self.db.graph
+        for label in LABELS + ["Missing"]:
+            self.assertEqual(self.query_ids(f"MATCH (n:{label}) RETURN n"), sorted(scan_nodes(graph, [label])))
+
+        for category in "abcdef":
+            self.assertEqual(self.query_ids("MATCH (n {category: $category}) RETURN n", {"category": category}),
+                             sorted(scan_nodes(graph, properties={"category": category})))
+            self.assertEqual(
+                self.query_ids(f"MATCH (n:Concept) WHERE n.category = '{category}' AND n.rank = 3 RETURN n"),
+                sorted(scan_nodes(graph, ["Concept"], {"category": category, "rank": 3})))
+
+        # Unhashable values are not indexed and are checked node by node
+        self.assertEqual(self.query_ids("MATCH (n:Entity {tags: $tags}) RETURN n", {"tags": ["x", "y"]}),
+                         sorted(scan_nodes(graph, ["Entity"], {"tags": ["x", "y"]})))
+
+        for node_id in ["node_0", "node_5", "node_410", "missing"]:
+            for relationship_type in TYPES:
+                neighbors = asyncio.run(self.db.get_neighbors(node_id, relationship_type))
+                self.assertEqual({neighbor.id for neighbor in neighbors},
+                                 scan_neighbors(graph, node_id, relationship_type) if node_id in graph else set())
+
+                for arrow, direction in (("-[:{t}]->", "out"), ("<-[:{t}]-", "in"), ("-[:{t}]-", "both")):
+                    pattern = arrow.format(t=relationship_type)
+                    self.assertEqual(
+                        set(self.query_ids(f"MATCH (n {{id: $id}}){pattern}(m) RETURN m", {"id": node_id}, "m")),
+                        scan_neighbors(graph, node_id, relationship_type, direction) if node_id in graph else set())
+
+        # Only the far end is constrained: the match starts from the Person nodes
+        result = asyncio.run(self.db.query("MATCH (n)-[:CITES]->(m:Person) RETURN n, m"))
+        expected = {(u, v) for u, v, data in graph.edges(data=True)
+                    if data["type"] == "CITES" and "Person" in graph.nodes[v].get("labels", [])}
+        self.assertEqual({(record["n"]["id"], record["m"]["id"]) for record in result.data}, expected)
+
+    def test_indexed_queries_match_scan(self):
+        self.assert_queries_match_scan()
+
+    def test_indexes_are_rebuilt_on_connect(self):
+        asyncio.run(self.db.disconnect())
+        self.db = NetworkXDatabase(str(Path(self.temp_dir) / "networkx_graph.db"))
+        asyncio.run(self.db.connect())
+        self.assert_queries_match_scan()
+
+    def test_record_format_and_limit(self):
+        result = asyncio.run(self.db.query("MATCH (n {id: $node_id}) RETURN n, labels(n) as labels",
+                                           {"node_id": "node_1"}))
+        node_data = self.db.graph.nodes["node_1"]
+        self.assertEqual(result.data, [{"n": {"id": "node_1", **node_data}, "labels": node_data["labels"]}])
+
+        self.assertEqual(len(self.query_ids("MATCH (n) RETURN n LIMIT 5")), 5)
+        self.assertFalse(asyncio.run(self.db.query("MATCH (n {id: $node_id}) RETURN n")).success)
+
+    def test_unsupported_queries_keep_previous_behaviour(self):
+        query = ("MATCH (n) WHERE toLower(n.name) CONTAINS toLower('risk') "
+                 "OPTIONAL MATCH (n)-[r]-(connected) RETURN n, r, connected LIMIT 10")
+        self.assertIsNone(parse_match_query(query))
+        self.assertEqual(len(self.query_ids(query)), self.db.graph.number_of_nodes())
+
+
+if __name__ == '__main__':
+    unittest.main()
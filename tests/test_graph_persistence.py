@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test Suite for NetworkXDatabase SQLite Persistence
+==================================================
+
+Tests that graph mutations are persisted incrementally, that a 100k-edge
+graph reloads unchanged, that every committed mutation survives a killed
+process, and that graphs saved as GML are migrated once.
+"""
+
+import sys
+import shutil
+import signal
+import asyncio
+import tempfile
+import unittest
+import subprocess
+from pathlib import Path
+
+import networkx as nx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.memory.graph.graph_database import NetworkXDatabase, NodeData, RelationshipData
+
+NODES = 20_000
+EDGES = 100_000
+
+# Builds the 100k-edge test graph; the crash test runs it in a child process
+BUILD_GRAPH = """
+async def build_graph(db, nodes, edges):
+    for i in range(nodes):
+        await db.create_node(NodeData(id=f"concept_{i}", labels=["Concept"], properties={"rank": i}))
+    for i in range(edges):
+        await db.create_relationship(RelationshipData(
+            id=f"rel_{i}", type="RELATES_TO" if i % 3 else "MENTIONS",
+            start_node=f"concept_{i % nodes}", end_node=f"concept_{(i * 7 + 1) % nodes}",
+            properties={"weight": i % 10}))
+"""
+exec(BUILD_GRAPH)
+
+CRASH_SCRIPT = """
+import os, sys, signal, asyncio
+sys.path.insert(0, {root!r})
+from sam.memory.graph.graph_database import NetworkXDatabase, NodeData, RelationshipData
+{build_graph}
+async def main():
+    db = NetworkXDatabase({path!r})
+    await db.connect()
+    await build_graph(db, {nodes}, {edges})
+    await db.create_node(NodeData(id="concept_0", labels=["Concept", "Root"], properties={{"pinned": True}}))
+    os.kill(os.getpid(), signal.SIGKILL)
+asyncio.run(main())
+"""
+
+
+def graph_snapshot(graph):
+    return list(graph.nodes(data=True)), list(graph.edges(keys=True, data=True))
+
+
+class TestGraphPersistence(unittest.TestCase):
+    """Test incremental SQLite persistence of the NetworkX graph."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.persist_path = str(Path(self.temp_dir) / "networkx_graph.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def connect(self, persist_path=None):
+        db = NetworkXDatabase(persist_path or self.persist_path)
+        self.assertTrue(asyncio.run(db.connect()))
+        return db
+
+    def test_mutations_round_trip(self):
+        async def mutate(db):
+            await db.create_node(NodeData(id="doc", labels=["Document"], properties={"title": "Q3", "pages": 4}))
+            await db.create_node(NodeData(id="doc", labels=["Document", "Report"], properties={"pages": 5}))
+            await db.create_relationship(RelationshipData(id="r1", type="CITES", start_node="doc",
+                                                          end_node="paper", properties={"count": 2}))
+            await db.create_relationship(RelationshipData(id="r2", type="MENTIONS", start_node="doc",
+                                                          end_node="paper", properties={}))
+            await db.create_relationship(RelationshipData(id="r1", type="CITES", start_node="doc",
+                                                          end_node="paper", properties={"page": 3}))
+            await db.create_relationship(RelationshipData(id="loop", type="SELF", start_node="note",
+                                                          end_node="note", properties={}))
+
+        db = self.connect()
+        asyncio.run(mutate(db))
+        expected = graph_snapshot(db.graph)
+        asyncio.run(db.disconnect())
+
+        reloaded = self.connect()
+        self.assertEqual(graph_snapshot(reloaded.graph), expected)
+        self.assertEqual(reloaded.graph.nodes["doc"],
+                         {"labels": ["Document", "Report"], "title": "Q3", "pages": 5})
+        self.assertEqual(reloaded.graph.edges["doc", "paper", "r1"], {"type": "CITES", "count": 2, "page": 3})
+        self.assertEqual(reloaded.graph.nodes["paper"], {})
+        asyncio.run(reloaded.disconnect())
+
+    def test_large_graph_save_and_load(self):
+        db = self.connect()
+        asyncio.run(build_graph(db, NODES, EDGES))
+        expected = graph_snapshot(db.graph)
+        asyncio.run(db.disconnect())
+
+        reloaded = self.connect()
+        self.assertEqual(reloaded.graph.number_of_edges(), EDGES)
+        self.assertEqual(graph_snapshot(reloaded.graph), expected)
+        asyncio.run(reloaded.disconnect())
+
+    def test_committed_mutations_survive_killed_process(self):
+        script = CRASH_SCRIPT.format(root=str(project_root), build_graph=BUILD_GRAPH,
+                                     path=self.persist_path, nodes=NODES, edges=EDGES)
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+        self.assertEqual(result.returncode, -signal.SIGKILL, result.stderr)
+
+        expected = NetworkXDatabase()
+        asyncio.run(expected.connect())
+        asyncio.run(build_graph(expected, NODES, EDGES))
+        asyncio.run(expected.create_node(NodeData(id="concept_0", labels=["Concept", "Root"],
+                                                  properties={"pinned": True})))
+
+        recovered = self.connect()
+        self.assertEqual(graph_snapshot(recovered.graph), graph_snapshot(expected.graph))
+        self.assertEqual(recovered.graph.nodes["concept_0"],
+                         {"labels": ["Concept", "Root"], "rank": 0, "pinned": True})
+        asyncio.run(recovered.disconnect())
+
+    def test_legacy_gml_is_migrated_once(self):
+        legacy = nx.MultiDiGraph()
+        legacy.add_node("a", labels=["Concept"], name="alpha")
+        legacy.add_edge("a", "b", key="r1", type="RELATES_TO")
+        gml_path = Path(self.temp_dir) / "networkx_graph.gml"
+        nx.write_gml(legacy, gml_path)
+
+        db = self.connect(str(gml_path))
+        self.assertEqual(db.graph.nodes["a"], {"labels": ["Concept"], "name": "alpha"})
+        self.assertEqual(list(db.graph.edges(keys=True)), [("a", "b", "r1")])
+        asyncio.run(db.create_node(NodeData(id="a", labels=["Concept"], properties={"name": "renamed"})))
+        asyncio.run(db.disconnect())
+
+        # The store is no longer empty, so the stale GML file is not imported again
+        reloaded = self.connect(str(gml_path))
+        self.assertEqual(reloaded.graph.nodes["a"]["name"], "renamed")
+        self.assertTrue(Path(self.persist_path).exists())
+        asyncio.run(reloaded.disconnect())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Hedged Tool Execution in the IntelligentWebSystem
+================================================================
+
+Runs queries against stub tools with scripted delays and failures, checking
+that hedged execution bounds tail latency, returns the first good result and
+cancels the losing tools.
+"""
+
+import sys
+import time
+import asyncio
+import threading
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from web_retrieval.intelligent_web_system import IntelligentWebSystem, get_tool_event_loop
+
+GOOD_RESULT = {'success': True, 'chunks': [{'content': 'x' * 300}]}
+
+
+class StubRouter:
+    """Routes every query to a fixed primary tool and fallback chain."""
+
+    def __init__(self, primary, fallbacks):
+        self.decision = {'primary_tool': primary, 'fallback_chain': fallbacks, 'parameters': {}}
+
+    def route_query(self, query):
+        return dict(self.decision)
+
+
+class ScriptedWebSystem(IntelligentWebSystem):
+    """IntelligentWebSystem whose tools sleep, then succeed, fail or return too little."""
+
+    def __init__(self, script, primary, fallbacks, **config):
+        super().__init__(config=config)
+        self.router = StubRouter(primary, fallbacks)
+        self.script = script
+        self.started = []
+        self.cancelled = []
+
+    async def _execute_tool_async(self, tool_name, query, parameters):
+        delay, outcome = self.script[tool_name]
+        self.started.append(tool_name)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(tool_name)
+            raise
+        if outcome == "ok":
+            return dict(GOOD_RESULT, tool=tool_name)
+        if outcome == "thin":
+            return {'success': True, 'chunks': [{'content': 'short'}]}
+        return {'success': False, 'error': f'{tool_name} failed'}
+
+
+def timed_query(system):
+    start = time.perf_counter()
+    result = system.process_query("latest technology news")
+    return result, time.perf_counter() - start
+
+
+class TestHedgedExecution(unittest.TestCase):
+    """Test hedged fallback racing against sequential fallback."""
+
+    def make_system(self, script, hedged=True, **config):
+        return ScriptedWebSystem(script, "search_api_tool", ["news_api_tool", "rss_reader_tool"],
+                                 hedged_execution=hedged, **config)
+
+    def test_slow_failing_primary_is_hedged(self):
+        script = {"search_api_tool": (1.0, "fail"), "news_api_tool": (0.1, "ok"), "rss_reader_tool": (0.1, "ok")}
+
+        _, sequential_time = timed_query(self.make_system(script, hedged=False))
+        system = self.make_system(script, hedge_delay_seconds=0.2)
+        result, hedged_time = timed_query(system)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['tool_used'], "news_api_tool")
+        self.assertEqual(result['data']['tool'], "news_api_tool")
+        self.assertGreater(sequential_time, 1.0)
+        self.assertLess(hedged_time, 0.6)
+        self.assertEqual(system.cancelled, ["search_api_tool"])
+        self.assertEqual(system.started, ["search_api_tool", "news_api_tool"])
+
+    def test_fast_primary_starts_no_fallbacks(self):
+        script = {"search_api_tool": (0.05, "ok"), "news_api_tool": (0.1, "ok"), "rss_reader_tool": (0.1, "ok")}
+        system = self.make_system(script, hedge_delay_seconds=0.5)
+        result, _ = timed_query(system)
+
+        self.assertEqual(result['tool_used'], "search_api_tool")
+        self.assertEqual(system.started, ["search_api_tool"])
+
+    def test_failure_releases_next_fallback_immediately(self):
+        script = {"search_api_tool": (0.05, "thin"), "news_api_tool": (0.05, "fail"), "rss_reader_tool": (0.05, "ok")}
+        system = self.make_system(script, hedge_delay_seconds=5.0)
+        result, elapsed = timed_query(system)
+
+        self.assertEqual(result['tool_used'], "rss_reader_tool")
+        self.assertLess(elapsed, 1.0)
+
+    def test_flaky_tool_is_hedged_immediately(self):
+        script = {"search_api_tool": (0.5, "ok"), "news_api_tool": (0.1, "ok"), "rss_reader_tool": (0.1, "ok")}
+        system = self.make_system(script, hedge_delay_seconds=5.0, flaky_tools=["search_api_tool"])
+        result, elapsed = timed_query(system)
+
+        self.assertEqual(result['tool_used'], "news_api_tool")
+        self.assertLess(elapsed, 0.4)
+        self.assertEqual(system.cancelled, ["search_api_tool"])
+
+    def test_all_tools_failing(self):
+        script = {name: (0.05, "fail") for name in ("search_api_tool", "news_api_tool", "rss_reader_tool")}
+        system = self.make_system(script, hedge_delay_seconds=0.1)
+        result, _ = timed_query(system)
+
+        self.assertFalse(result['success'])
+        self.assertEqual(result['tools_attempted'], ["search_api_tool", "news_api_tool", "rss_reader_tool"])
+
+    def test_instances_share_one_loop_thread(self):
+        """Systems created per search reuse one event loop thread."""
+        script = {"search_api_tool": (0.05, "fail"), "news_api_tool": (0.05, "ok"), "rss_reader_tool": (0.05, "ok")}
+        loop = get_tool_event_loop()
+
+        for hedged in (False, True, False):
+            result, _ = timed_query(self.make_system(script, hedged=hedged, hedge_delay_seconds=0.2))
+            self.assertEqual(result['tool_used'], "news_api_tool")
+
+        self.assertIs(get_tool_event_loop(), loop)
+        self.assertEqual([t.name for t in threading.enumerate()].count("sam-web-tools"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Lazy Chroma Chunk Table
+==========================================
+
+Tests that LazyChromaChunkMap keeps only compact records resident, fetches
+content and embeddings on demand through a bounded LRU, and loads records
+page by page. Uses a small in-memory collection with the ChromaDB get() API.
+"""
+
+import sys
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from memory.lazy_chunk_store import ChunkRecordIndex, LazyChromaChunkMap, ChunkRecord
+from memory.memory_vectorstore import MemoryChunk, MemoryType, MemoryVectorStore, VectorStoreType
+
+CHROMA_AVAILABLE = importlib.util.find_spec("chromadb") is not None
+
+
+class InMemoryCollection:
+    """Minimal collection implementing the subset of chromadb's get() used by the store."""
+
+    def __init__(self, count):
+        self.ids = [f"mem_{i:04d}" for i in range(count)]
+        self.data = {
+            chunk_id: {
+                'document': f"content of chunk {i}",
+                'embedding': [float(i), 1.0],
+                'metadata': {
+                    'memory_type': 'fact' if i % 2 else 'document',
+                    'source_path': f"uploads/doc_{i // 10}.pdf",
+                    'content_hash': f"hash_{i}",
+                    'importance_score': 0.5,
+                    'access_count': i,
+                    'created_at': 1700000000 + i,
+                    'last_accessed': '2025-01-01T00:00:00',
+                    'tags': 'a,b'
+                }
+            }
+            for i, chunk_id in enumerate(self.ids)
+        }
+        self.requests = []
+
+    def get(self, ids=None, where=None, include=None, limit=None, offset=None):
+        self.requests.append({'ids': ids, 'where': where, 'include': list(include or []),
+                              'limit': limit, 'offset': offset})
+        selected = ids if ids is not None else self.ids
+        if where:
+            key, value = next(iter(where.items()))
+            selected = [cid for cid in selected if self.data[cid]['metadata'].get(key) == value]
+        start = offset or 0
+        selected = [cid for cid in selected[start:] if cid in self.data]
+        if limit is not None:
+            selected = selected[:limit]
+
+        include = include or []
+        result = {'ids': selected}
+        if 'documents' in include:
+            result['documents'] = [self.data[cid]['document'] for cid in selected]
+        if 'embeddings' in include:
+            result['embeddings'] = [self.data[cid]['embedding'] for cid in selected]
+        if 'metadatas' in include:
+            result['metadatas'] = [self.data[cid]['metadata'] for cid in selected]
+        return result
+
+
+def build_chunk(chunk_id, document, embedding, metadata):
+    """Chunk builder equivalent to MemoryVectorStore._chunk_from_chroma for the test data."""
+    return MemoryChunk(
+        chunk_id=chunk_id, content=document, content_hash=metadata['content_hash'],
+        embedding=embedding, memory_type=MemoryType(metadata['memory_type']),
+        source=metadata['source_path'], timestamp=str(metadata['created_at']),
+        tags=metadata['tags'].split(','), importance_score=metadata['importance_score'],
+        access_count=metadata['access_count'], last_accessed=metadata['last_accessed'],
+        metadata=metadata
+    )
+
+
+class TestLazyChromaChunkMap(unittest.TestCase):
+    """Test suite for LazyChromaChunkMap."""
+
+    def setUp(self):
+        self.collection = InMemoryCollection(25)
+        self.chunks = LazyChromaChunkMap(self.collection, build_chunk, cache_size=4, fetch_batch_size=10)
+
+    def test_paged_load_requests_metadata_only(self):
+        """Startup loads every id in pages without documents or embeddings."""
+        loaded = self.chunks.load_records(page_size=10)
+
+        self.assertEqual(loaded, 25)
+        self.assertEqual(len(self.chunks), 25)
+        self.assertEqual([r['offset'] for r in self.collection.requests], [0, 10, 20])
+        for request in self.collection.requests:
+            self.assertEqual(request['include'], ['metadatas'])
+
+        record = self.chunks.records['mem_0003']
+        self.assertIsInstance(record, ChunkRecord)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertIs(record.source, self.chunks.records['mem_0004'].source)
+
+    def test_on_demand_fetch_and_bounded_cache(self):
+        """Chunks are fetched on access and the cache never exceeds its size."""
+        self.chunks.load_records(page_size=100)
+
+        chunk = self.chunks['mem_0007']
+        self.assertEqual(chunk.content, "content of chunk 7")
+        self.assertEqual(chunk.memory_type, MemoryType.FACT)
+        self.assertIs(self.chunks['mem_0007'], chunk)
+        self.assertEqual(self.chunks.stats['cache_hits'], 1)
+
+        for i in range(10):
+            self.chunks.get(f"mem_{i:04d}")
+        self.assertEqual(self.chunks.cache_info()['cached_chunks'], 4)
+        self.assertIsNone(self.chunks.get('mem_missing'))
+
+    def test_evicted_chunks_keep_access_tracking(self):
+        """Light field edits survive eviction from the cache."""
+        self.chunks.load_records()
+        chunk = self.chunks['mem_0001']
+        chunk.access_count = 99
+        chunk.tags = ['edited']
+
+        for i in range(2, 8):
+            self.chunks.get(f"mem_{i:04d}")
+
+        reloaded = self.chunks['mem_0001']
+        self.assertIsNot(reloaded, chunk)
+        self.assertEqual(reloaded.access_count, 99)
+        self.assertEqual(reloaded.tags, ['edited'])
+
+    def test_prefetch_and_iteration_are_batched(self):
+        """Prefetch and values() fetch in batches rather than per chunk."""
+        self.chunks.load_records(page_size=100)
+        self.collection.requests.clear()
+
+        self.chunks.prefetch(['mem_0001', 'mem_0002', 'mem_0003'])
+        self.assertEqual(len(self.collection.requests), 1)
+
+        self.collection.requests.clear()
+        contents = [chunk.content for chunk in self.chunks.values()]
+        self.assertEqual(len(contents), 25)
+        self.assertEqual(len(self.collection.requests), 3)
+        self.assertLessEqual(self.chunks.cache_info()['cached_chunks'], 4)
+
+    def test_set_delete_and_hash_lookup(self):
+        """New chunks are resident immediately; content hash lookups use the where filter."""
+        self.chunks.load_records()
+        new_chunk = build_chunk('mem_new', 'fresh', [0.0, 1.0], {
+            'memory_type': 'insight', 'source_path': 'chat', 'content_hash': 'hash_new',
+            'importance_score': 0.9, 'access_count': 0, 'created_at': 1, 'last_accessed': '', 'tags': 'x'
+        })
+        self.chunks['mem_new'] = new_chunk
+
+        self.assertIs(self.chunks['mem_new'], new_chunk)
+        self.assertEqual(self.chunks.find_by_content_hash('hash_new'), 'mem_new')
+        self.assertEqual(self.chunks.find_by_content_hash('hash_12'), 'mem_0012')
+        self.assertIsNone(self.chunks.find_by_content_hash('hash_unknown'))
+
+        del self.chunks['mem_0012']
+        self.assertNotIn('mem_0012', self.chunks)
+        self.assertIsNone(self.chunks.find_by_content_hash('hash_12'))
+
+    def test_record_index_replaces_metadata_paging(self):
+        """With a record index, a restart reads only ids from the collection."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        db_path = Path(temp_dir) / "records.db"
+
+        def open_chunks():
+            index = ChunkRecordIndex(db_path, "sam_memory_store")
+            self.addCleanup(index.close)
+            return LazyChromaChunkMap(self.collection, build_chunk, cache_size=4, record_index=index)
+
+        # First start backfills the index from metadata fetched by id
+        self.assertEqual(open_chunks().load_records(page_size=10), 25)
+        self.assertEqual(self.collection.requests[0]['include'], [])
+        self.assertTrue(all(r['include'] == ['metadatas'] and r['ids'] for r in self.collection.requests[1:]))
+
+        chunks = open_chunks()
+        chunks.load_records()
+        chunks['mem_0003'].tags = ['edited']
+        chunks['mem_0003'] = chunks['mem_0003']
+        del chunks['mem_0004']
+        self.assertNotIn('mem_0004', [row[0] for row in chunks.record_index.load()])
+        for chunk_id in ('mem_0004', 'mem_0005'):
+            del self.collection.data[chunk_id]
+            self.collection.ids.remove(chunk_id)
+
+        self.collection.requests.clear()
+        restarted = open_chunks()
+        self.assertEqual(restarted.load_records(), 23)
+        self.assertEqual([r['include'] for r in self.collection.requests], [[]])
+        self.assertEqual(restarted.records['mem_0003'].tags, ('edited',))
+        self.assertEqual(restarted.records['mem_0007'].access_count, 7)
+        self.assertNotIn('mem_0005', restarted.records)
+        self.assertNotIn('mem_0005', [row[0] for row in restarted.record_index.load()])
+
+
+class SmallCacheChromaStore(MemoryVectorStore):
+    """Chroma-backed store with a two-chunk LRU so edits are evicted quickly."""
+
+    def _load_chroma_config(self):
+        config = super()._load_chroma_config()
+        config.update(collection_name="sam_lazy_test", lazy_loading=True, chunk_cache_size=2)
+        return config
+
+
+@unittest.skipUnless(CHROMA_AVAILABLE, "ChromaDB is an optional dependency")
+class TestLazyChromaWriteThrough(unittest.TestCase):
+    """Test that memory updates survive eviction from the lazy chunk cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = SmallCacheChromaStore(store_type=VectorStoreType.CHROMA, storage_directory=self.temp_dir,
+                                           embedding_dimension=8)
+        self.chunk_ids = [self.store.add_memory(f"original note {i}", MemoryType.DOCUMENT, f"test:note_{i}",
+                                                metadata={'reviewed': 'no'})
+                          for i in range(4)]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def evict(self, chunk_id):
+        for other_id in self.chunk_ids:
+            if other_id != chunk_id:
+                self.store.get_memory(other_id)
+        self.assertNotIn(chunk_id, self.store.memory_chunks._cache)
+
+    def test_content_and_metadata_updates_survive_eviction(self):
+        chunk_id = self.chunk_ids[0]
+        self.assertTrue(self.store.update_memory(chunk_id, content="edited note", metadata={'reviewed': 'yes'}))
+        self.evict(chunk_id)
+
+        reloaded = self.store.get_memory(chunk_id)
+        self.assertEqual(reloaded.content, "edited note")
+        self.assertEqual(reloaded.metadata['extra_reviewed'], 'yes')
+        # ChromaDB stores float32 embeddings
+        for stored, expected in zip(reloaded.embedding, self.store._generate_embedding("edited note")):
+            self.assertAlmostEqual(stored, expected, places=6)
+
+        # A second edit of the reloaded chunk replaces the stored field instead of nesting it
+        self.assertTrue(self.store.update_memory(chunk_id, metadata={'reviewed': 'twice'}))
+        self.evict(chunk_id)
+        metadata = self.store.get_memory(chunk_id).metadata
+        self.assertEqual(metadata['extra_reviewed'], 'twice')
+        self.assertNotIn('extra_extra_reviewed', metadata)
+
+    def test_restart_loads_updated_records_from_index(self):
+        chunk_id = self.chunk_ids[1]
+        self.assertTrue(self.store.update_memory(chunk_id, tags=['reviewed'], importance_score=0.9))
+
+        restarted = SmallCacheChromaStore(store_type=VectorStoreType.CHROMA, storage_directory=self.temp_dir,
+                                          embedding_dimension=8)
+        record = restarted.memory_chunks.records[chunk_id]
+        self.assertEqual(record.tags, ('reviewed',))
+        self.assertEqual(record.importance_score, 0.9)
+        self.assertEqual(len(restarted.memory_chunks), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Test Suite for BM25 Local File Search
+=====================================
+
+Tests BM25 scoring against the formula, that only query-term postings are
+read at search time, that the inverted index follows re-indexed files, and
+that entries are persisted in SQLite, where rescans only check file stats
+and only changed entries are written.
+"""
+
+import sys
+import os
+import math
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from contextlib import contextmanager
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from multimodal.bm25_index import BM25Index, tokenize, count_terms
+from multimodal.local_search import LocalFileSearchEngine
+
+
+class RecordingPostings(dict):
+    """Postings dict that records which terms are looked up."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.lookups = []
+
+    def get(self, term, default=None):
+        self.lookups.append(term)
+        return super().get(term, default)
+
+
+class TestBM25Index(unittest.TestCase):
+    """Test the inverted index on its own."""
+
+    def setUp(self):
+        self.index = BM25Index()
+        self.documents = {
+            "a": "solar panels convert solar energy",
+            "b": "wind turbines and solar farms",
+            "c": "battery storage for the grid",
+        }
+        for doc_id, text in self.documents.items():
+            self.index.add_document(doc_id, count_terms(text))
+
+    def test_scores_follow_bm25_formula(self):
+        k1, b = self.index.k1, self.index.b
+        lengths = {doc_id: len(tokenize(text)) for doc_id, text in self.documents.items()}
+        average_length = sum(lengths.values()) / len(lengths)
+
+        def idf(df):
+            return math.log(1 + (len(lengths) - df + 0.5) / (df + 0.5))
+
+        def term_score(doc_id, term, df):
+            tf = tokenize(self.documents[doc_id]).count(term)
+            return idf(df) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[doc_id] / average_length))
+
+        max_score = (idf(2) + idf(1)) * (k1 + 1)
+        expected = {"a": term_score("a", "solar", 2) / max_score,
+                    "b": (term_score("b", "solar", 2) + term_score("b", "wind", 1)) / max_score}
+
+        results = self.index.search("Solar wind")
+        self.assertEqual([doc_id for doc_id, _ in results], ["b", "a"])
+        for doc_id, score in results:
+            self.assertAlmostEqual(score, expected[doc_id])
+
+    def test_search_reads_only_query_term_postings(self):
+        self.index.postings = RecordingPostings(self.index.postings)
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("grid grid storage")], ["c"])
+        self.assertEqual(sorted(self.index.postings.lookups), ["grid", "storage"])
+
+    def test_replacing_a_document_updates_postings(self):
+        self.index.add_document("c", count_terms("geothermal heat"), previous_terms=count_terms(self.documents["c"]))
+
+        self.assertEqual(self.index.search("battery"), [])
+        self.assertEqual([doc_id for doc_id, _ in self.index.search("geothermal")], ["c"])
+        self.assertNotIn("battery", self.index.postings)
+        self.assertEqual(self.index.total_length, sum(self.index.doc_lengths.values()))
+
+
+class TestLocalSearchBM25(unittest.TestCase):
+    """Test BM25 search through LocalFileSearchEngine."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.knowledge_dir = Path(self.temp_dir) / "knowledge"
+        self.knowledge_dir.mkdir()
+        self.index_file = Path(self.temp_dir) / "search_index.json"
+
+        files = {
+            "machine_learning.md": "# Machine Learning\n\nMachine learning is a subset of artificial intelligence.",
+            "data_science.txt": "Data science combines statistics, programming, and domain expertise.",
+            "ai_overview.md": "# Artificial Intelligence\n\nAI is the simulation of human intelligence in machines.",
+            "gardening.txt": "Tomatoes need sunlight, water and well drained soil to grow.",
+        }
+        for filename, content in files.items():
+            (self.knowledge_dir / filename).write_text(content, encoding="utf-8")
+
+        self.engine = self.make_engine()
+        self.engine.index_directory()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_engine(self):
+        return LocalFileSearchEngine(knowledge_directory=str(self.knowledge_dir), index_file=str(self.index_file))
+
+    def test_search_ranks_matching_documents(self):
+        results = self.engine.search("machine learning", max_results=5)
+
+        self.assertEqual(results[0].filename, "machine_learning.md")
+        self.assertEqual(results[0].title, "Machine Learning")
+        self.assertTrue(all(0.1 < result.confidence_score <= 1.0 for result in results))
+        self.assertNotIn("gardening.txt", [result.filename for result in results])
+        self.assertEqual([r.confidence_score for r in results],
+                         sorted((r.confidence_score for r in results), reverse=True))
+
+    def test_max_results_and_missing_terms(self):
+        self.assertEqual(len(self.engine.search("intelligence", max_results=1)), 1)
+        self.assertEqual(self.engine.search("quantum chromodynamics"), [])
+        self.assertEqual(self.engine.search("   "), [])
+
+    def test_reindexed_file_replaces_postings(self):
+        (self.knowledge_dir / "gardening.txt").write_text("Composting turns kitchen scraps into humus.",
+                                                         encoding="utf-8")
+        self.engine.index_directory()
+
+        self.assertEqual(self.engine.search("tomatoes"), [])
+        self.assertEqual([result.filename for result in self.engine.search("composting")], ["gardening.txt"])
+
+    def test_index_is_persisted_in_sqlite(self):
+        self.assertTrue((Path(self.temp_dir) / "search_index.db").exists())
+        expected = [(r.filename, r.confidence_score) for r in self.engine.search("artificial intelligence")]
+
+        reloaded = self.make_engine()
+        self.assertEqual(reloaded.bm25_index.postings, self.engine.bm25_index.postings)
+        self.assertEqual([(r.filename, r.confidence_score) for r in reloaded.search("artificial intelligence")],
+                         expected)
+
+    def test_json_index_is_migrated(self):
+        legacy_dir = Path(self.temp_dir) / "legacy"
+        legacy_dir.mkdir()
+        entries = [dict(vars(entry), index_id=f"legacy_{i}") for i, entry in enumerate(self.engine.search_index.values())]
+        (legacy_dir / "search_index.json").write_text(json.dumps({'indices': entries}), encoding="utf-8")
+
+        migrated = LocalFileSearchEngine(knowledge_directory=str(self.knowledge_dir),
+                                         index_file=str(legacy_dir / "search_index.json"))
+        self.assertEqual(len(migrated.search_index), len(entries))
+        self.assertEqual(migrated.search("tomatoes")[0].filename, "gardening.txt")
+
+        reloaded = LocalFileSearchEngine(knowledge_directory=str(self.knowledge_dir),
+                                         index_file=str(legacy_dir / "search_index.json"))
+        self.assertEqual(list(reloaded.search_index), list(migrated.search_index))
+
+    def test_unchanged_rescan_does_no_content_io_or_writes(self):
+        engine = self.make_engine()
+        with mock.patch("builtins.open", side_effect=AssertionError("file content was read")), \
+                self.record_writes(engine) as writes:
+            self.assertEqual(engine.index_directory(), 0)
+        self.assertEqual(writes, [])
+
+    def test_touched_file_is_hashed_but_not_reindexed(self):
+        path = self.knowledge_dir / "data_science.txt"
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10 ** 9))
+
+        engine = self.make_engine()
+        with self.record_writes(engine) as writes:
+            self.assertEqual(engine.index_directory(), 0)
+        self.assertEqual([statement.split()[0] for statement in writes], ["UPDATE"])
+
+        # The new signature was saved, so the next rescan skips the file again
+        with mock.patch("builtins.open", side_effect=AssertionError("file content was read")):
+            self.assertEqual(self.make_engine().index_directory(), 0)
+
+    def test_only_changed_entries_are_written(self):
+        (self.knowledge_dir / "gardening.txt").write_text("Mulch keeps the soil moist during dry summers.",
+                                                         encoding="utf-8")
+        engine = self.make_engine()
+        with self.record_writes(engine) as writes:
+            self.assertEqual(engine.index_directory(), 1)
+
+        self.assertEqual(len(writes), 1)
+        self.assertTrue(writes[0].startswith("INSERT") and "gardening.txt" in writes[0])
+        self.assertEqual([r.filename for r in self.make_engine().search("mulch")], ["gardening.txt"])
+
+    @contextmanager
+    def record_writes(self, engine):
+        """Record INSERT and UPDATE statements issued through the engine's connections."""
+        writes = []
+        connect = engine._connect
+
+        @contextmanager
+        def recording_connect():
+            with connect() as conn:
+                conn.set_trace_callback(lambda statement: writes.append(statement.strip())
+                                        if statement.strip().split()[0] in ("INSERT", "UPDATE") else None)
+                yield conn
+
+        with mock.patch.object(engine, "_connect", recording_connect):
+            yield writes
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Memory Search Filter Pushdown
+============================================
+
+Tests that memory type, tag and indexed metadata filters are applied before
+top-k selection, so selective filtered searches return exactly the requested
+number of results, and that the posting lists stay aligned with index rows.
+"""
+
+import sys
+import json
+import hashlib
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from memory.filter_postings import FilterPostings
+from memory.memory_vectorstore import MemoryVectorStore, VectorStoreType, MemoryType
+from sam.cognition.table_processing.sam_integration import TableAwareRetrieval
+from sam.cognition.table_processing.table_store import TableStore
+
+CHROMA_AVAILABLE = importlib.util.find_spec("chromadb") is not None
+
+
+def deterministic_embedding(text, dimension=32):
+    """Unit-norm embedding seeded from the text."""
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+    vector = np.random.default_rng(seed).standard_normal(dimension)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestFilterPostings(unittest.TestCase):
+    """Test suite for FilterPostings posting lists."""
+
+    def test_candidate_rows_semantics(self):
+        """Types and tags are OR-ed within a filter and AND-ed across filters."""
+        postings = FilterPostings()
+        postings.add_row(0, "document", ["table"])
+        postings.add_row(1, "fact", ["table", "finance"])
+        postings.add_row(2, "document", [])
+        postings.add_row(3, "fact", ["finance"])
+
+        self.assertIsNone(postings.candidate_rows())
+        self.assertEqual(postings.candidate_rows(["document"]).tolist(), [0, 2])
+        self.assertEqual(postings.candidate_rows(tags=["table"]).tolist(), [0, 1])
+        self.assertEqual(postings.candidate_rows(tags=["table", "finance"]).tolist(), [0, 1, 3])
+        self.assertEqual(postings.candidate_rows(["fact"], ["table"]).tolist(), [1])
+        self.assertEqual(postings.candidate_rows(["insight"]).tolist(), [])
+
+    def test_remove_row_shifts_like_list_pop(self):
+        """Removing a row keeps later rows aligned with chunk_ids.pop()."""
+        postings = FilterPostings()
+        for row, tag in enumerate(["a", "b", "a", "b", "a"]):
+            postings.add_row(row, "document", [tag])
+
+        postings.remove_row(1)
+        self.assertEqual(postings.num_rows, 4)
+        self.assertEqual(postings.candidate_rows(tags=["a"]).tolist(), [0, 1, 3])
+        self.assertEqual(postings.candidate_rows(tags=["b"]).tolist(), [2])
+
+        postings.update_tags(2, ["b"], ["a"])
+        self.assertEqual(postings.candidate_rows(tags=["b"]).tolist(), [])
+        self.assertEqual(postings.candidate_rows(tags=["a"]).tolist(), [0, 1, 2, 3])
+
+        postings.add_row(4, "fact", ["b"])
+        self.assertEqual(postings.candidate_rows(["fact"], ["b"]).tolist(), [4])
+
+    def test_deletes_are_compacted_lazily(self):
+        """Posting lists keep dead rows until half the ids are dead, then shrink to the live rows."""
+        postings = FilterPostings()
+        for row in range(10):
+            postings.add_row(row, "document", ["even" if row % 2 == 0 else "odd"])
+
+        for _ in range(5):
+            postings.remove_row(0)
+        self.assertEqual(len(postings.tag_postings["even"]), 5)
+        self.assertEqual(postings.candidate_rows(tags=["even"]).tolist(), [1, 3])
+
+        postings.remove_row(0)
+        self.assertEqual(postings.num_rows, 4)
+        self.assertEqual(postings.tag_postings["even"].view().tolist(), [0, 2])
+        self.assertEqual(postings.candidate_rows(tags=["odd"]).tolist(), [1, 3])
+
+        postings.add_row(4, "document", ["odd"])
+        self.assertEqual(postings.candidate_rows(tags=["odd"]).tolist(), [1, 3, 4])
+
+    def test_matches_a_list_model_under_random_edits(self):
+        """Appends, removals and tag changes agree with filtering a plain list."""
+        rng = np.random.default_rng(7)
+        postings = FilterPostings()
+        rows = []
+        for _ in range(2000):
+            action = rng.random()
+            if action < 0.6 or not rows:
+                tags = {f"t{i}" for i in rng.choice(5, size=rng.integers(0, 3), replace=False)}
+                postings.add_row(len(rows), "document", tags)
+                rows.append(tags)
+            elif action < 0.85:
+                row = int(rng.integers(len(rows)))
+                postings.remove_row(row)
+                rows.pop(row)
+            else:
+                row = int(rng.integers(len(rows)))
+                new_tags = {f"t{i}" for i in rng.choice(5, size=rng.integers(0, 3), replace=False)}
+                postings.update_tags(row, rows[row], new_tags)
+                rows[row] = new_tags
+
+        self.assertEqual(postings.num_rows, len(rows))
+        for tag in ("t0", "t3"):
+            self.assertEqual(postings.candidate_rows(tags=[tag]).tolist(),
+                             [row for row, tags in enumerate(rows) if tag in tags])
+
+    def test_metadata_postings(self):
+        """Indexed metadata fields are AND-ed; other fields are left to the caller."""
+        postings = FilterPostings()
+        postings.add_row(0, "document", ["table"], {"table_id": "t1", "cell_row": 0, "cell_column": 0})
+        postings.add_row(1, "document", ["table"], {"table_id": "t1", "cell_row": 1, "cell_column": 0})
+        postings.add_row(2, "document", ["table"], {"table_id": "t2", "cell_row": 1, "cell_column": 0})
+        postings.add_row(3, "document", ["note"], {"source_note": "x"})
+
+        self.assertEqual(postings.candidate_rows(metadata_filter={"table_id": "t1"}).tolist(), [0, 1])
+        self.assertEqual(postings.candidate_rows(tags=["table"], metadata_filter={"cell_row": 1}).tolist(), [1, 2])
+        self.assertIsNone(postings.candidate_rows(metadata_filter={"source_note": "x"}))
+
+        postings.remove_row(0)
+        postings.update_metadata(1, {"table_id": "t2"}, {"table_id": "t3"})
+        self.assertNotIn("t2", postings.field_postings["table_id"])
+        self.assertEqual(postings.candidate_rows(metadata_filter={"table_id": "t1"}).tolist(), [0])
+        self.assertEqual(postings.candidate_rows(metadata_filter={"table_id": "t3"}).tolist(), [1])
+
+
+class TestSearchFilterPushdown(unittest.TestCase):
+    """Test filtered search_memories on the SIMPLE backend."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.memory_store = MemoryVectorStore(
+            store_type=VectorStoreType.SIMPLE,
+            storage_directory=self.test_dir,
+            embedding_dimension=32
+        )
+        self.memory_store._generate_embedding = deterministic_embedding
+        self.memory_store.config['similarity_threshold'] = -1.0
+
+        # 200 plain memories and only 6 table memories
+        for i in range(200):
+            self.memory_store.add_memory(f"general note {i}", MemoryType.DOCUMENT, "notes", tags=["note"])
+        self.table_ids = [
+            self.memory_store.add_memory(f"table cell {i}", MemoryType.FACT, "sheet", tags=["table"])
+            for i in range(6)
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_selective_tag_filter_returns_exactly_k(self):
+        """A rare tag still yields max_results results."""
+        results = self.memory_store.search_memories("general note", max_results=5, tags=["table"])
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all("table" in r.chunk.tags for r in results))
+        scores = [r.similarity_score for r in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_filtered_results_match_brute_force(self):
+        """Pushed-down filtering returns the true top-k among matching chunks."""
+        query = "table cell 3"
+        query_embedding = np.array(deterministic_embedding(query))
+        expected = sorted(
+            self.table_ids,
+            key=lambda cid: -float(np.dot(self.memory_store.memory_chunks[cid].embedding, query_embedding))
+        )[:4]
+
+        results = self.memory_store.search_memories(query, max_results=4, memory_types=[MemoryType.FACT])
+        self.assertEqual([r.chunk.chunk_id for r in results], expected)
+
+    def test_min_similarity_and_deletion(self):
+        """Similarity thresholds and deletions are honoured by the masked search."""
+        results = self.memory_store.search_memories("table cell 0", max_results=3,
+                                                    tags=["table"], min_similarity=0.99)
+        self.assertEqual([r.chunk.chunk_id for r in results], [self.table_ids[0]])
+
+        self.memory_store.delete_memory(self.table_ids[0])
+        results = self.memory_store.search_memories("table cell 0", max_results=10, tags=["table"])
+        self.assertEqual(len(results), 5)
+        self.assertNotIn(self.table_ids[0], [r.chunk.chunk_id for r in results])
+
+    def test_tag_updates_move_postings(self):
+        """Re-tagging a memory changes which filtered searches return it."""
+        note_id = self.memory_store.chunk_ids[0]
+        self.memory_store.update_memory(note_id, tags=["table"])
+
+        results = self.memory_store.search_memories("general note 0", max_results=10, tags=["table"])
+        self.assertIn(note_id, [r.chunk.chunk_id for r in results])
+        self.assertEqual(len(results), 7)
+
+
+class FilterTestChromaStore(MemoryVectorStore):
+    """Chroma-backed store using its own collection."""
+
+    def _load_chroma_config(self):
+        config = super()._load_chroma_config()
+        config.update(collection_name="sam_filter_test")
+        return config
+
+
+@unittest.skipUnless(CHROMA_AVAILABLE, "ChromaDB is an optional dependency")
+class TestChromaFilterUpdates(unittest.TestCase):
+    """Test that tag and metadata updates reach the fields used in Chroma where clauses."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.memory_store = FilterTestChromaStore(store_type=VectorStoreType.CHROMA,
+                                                  storage_directory=self.test_dir, embedding_dimension=32)
+        self.memory_store._generate_embedding = deterministic_embedding
+        # Similarity is 1 - squared L2 distance, which is at least -3 for unit vectors
+        self.memory_store.config['similarity_threshold'] = -3.0
+        self.chunk_ids = [
+            self.memory_store.add_memory(f"sheet cell {i}", MemoryType.DOCUMENT, "sheet.csv", tags=["note"],
+                                         metadata={"table_id": "t1", "cell_coordinates": (i, 0)})
+            for i in range(4)
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def search_ids(self, **filters):
+        return {r.chunk.chunk_id for r in self.memory_store.search_memories("sheet cell", max_results=10,
+                                                                            **filters)}
+
+    def test_tag_updates_change_where_clause_matches(self):
+        chunk_id = self.chunk_ids[0]
+        self.assertTrue(self.memory_store.update_memory(chunk_id, tags=["table"]))
+
+        self.assertEqual(self.search_ids(tags=["table"]), {chunk_id})
+        self.assertEqual(self.search_ids(tags=["note"]), set(self.chunk_ids[1:]))
+
+    def test_metadata_updates_change_where_clause_matches(self):
+        chunk_id = self.chunk_ids[1]
+        self.assertTrue(self.memory_store.update_memory(chunk_id, metadata={"table_id": "t2",
+                                                                            "cell_coordinates": (7, 3)}))
+
+        self.assertEqual([c.chunk_id for c in self.memory_store.get_memories_by_metadata({"table_id": "t2"})],
+                         [chunk_id])
+        self.assertEqual(len(self.memory_store.get_memories_by_metadata({"table_id": "t1"})), 3)
+        self.assertEqual([c.chunk_id for c in self.memory_store.get_memories_by_metadata({"cell_row": 7})],
+                         [chunk_id])
+        self.assertEqual(self.memory_store.get_memories_by_metadata({"cell_row": 1}), [])
+
+    def test_legacy_cell_chunks_are_post_filtered(self):
+        """Records with only a cell_coordinates string still match row and column filters."""
+        collection = self.memory_store.chroma_collection
+        collection.update(ids=self.chunk_ids,
+                          metadatas=[{"extra_cell_row": None, "extra_cell_column": None}] * len(self.chunk_ids))
+        flag_file = next(Path(self.test_dir).rglob("sam_collection_features.json"))
+        flag_file.write_text(json.dumps({collection.name: {"tag_fields": True}}))
+
+        reopened = FilterTestChromaStore(store_type=VectorStoreType.CHROMA, storage_directory=self.test_dir,
+                                         embedding_dimension=32)
+        reopened._generate_embedding = deterministic_embedding
+        reopened.config['similarity_threshold'] = -3.0
+        self.assertFalse(reopened.chroma_cell_fields)
+        self.assertEqual(reopened.get_memory(self.chunk_ids[2]).metadata["extra_cell_coordinates"], "(2, 0)")
+
+        self.assertEqual([c.chunk_id for c in reopened.get_memories_by_metadata({"table_id": "t1", "cell_row": 2})],
+                         [self.chunk_ids[2]])
+        results = reopened.search_memories("sheet cell", max_results=10, metadata_filter={"cell_row": 3})
+        self.assertEqual([r.chunk.chunk_id for r in results], [self.chunk_ids[3]])
+        self.assertEqual(len(reopened.get_memories_by_metadata({"cell_column": 0})), 4)
+
+
+
+class TestTableMetadataPushdown(unittest.TestCase):
+    """Test table_id and coordinate filters pushed down from TableAwareRetrieval."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.memory_store = MemoryVectorStore(
+            store_type=VectorStoreType.SIMPLE,
+            storage_directory=self.test_dir,
+            embedding_dimension=32
+        )
+        self.memory_store._generate_embedding = deterministic_embedding
+        self.memory_store.config['similarity_threshold'] = -1.0
+
+        # Three tables of 12 x 6 cells each, more than the 50-result search cap
+        for table in ("t1", "t2", "t3"):
+            for row in range(12):
+                for col in range(6):
+                    self.memory_store.add_memory(
+                        f"{table} value {row}-{col}", MemoryType.DOCUMENT, "sheet.csv",
+                        tags=["table", "structured_data"],
+                        metadata={"is_table_part": True, "table_id": table,
+                                  "cell_coordinates": (row, col), "cell_role": "HEADER" if row == 0 else "DATA"}
+                    )
+        self.retrieval = TableAwareRetrieval(self.memory_store,
+                                             table_store=TableStore(str(Path(self.test_dir) / "tables.db")))
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_whole_table_lookup_is_not_capped(self):
+        cells = self.retrieval.search_table_content("", table_id_filter="t2")
+
+        self.assertEqual(len(cells), 72)
+        self.assertTrue(all(cell["metadata"]["table_id"] == "t2" for cell in cells))
+        self.assertEqual(self.retrieval.reconstruct_table("t2").dimensions, (12, 6))
+
+    def test_ranked_search_within_one_table(self):
+        results = self.retrieval.search_table_content("t1 value 3-4", table_id_filter="t3", max_results=10)
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(result["metadata"]["table_id"] == "t3" for result in results))
+
+    def test_coordinate_and_role_filters(self):
+        column = self.retrieval.search_table_content("", table_id_filter="t1", column_filter=2)
+        self.assertEqual(sorted(cell["content"] for cell in column), sorted(f"t1 value {r}-2" for r in range(12)))
+
+        headers = self.retrieval.search_table_content("value", role_filter="HEADER", table_id_filter="t1",
+                                                      row_filter=0)
+        self.assertEqual(len(headers), 6)
+
+    def test_residual_metadata_filter(self):
+        """Non-indexed metadata fields are still matched exactly."""
+        chunks = self.memory_store.get_memories_by_metadata({"table_id": "t1", "cell_role": "HEADER"})
+        self.assertEqual(len(chunks), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
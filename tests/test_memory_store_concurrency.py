@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Memory Store Concurrency
+=======================================
+
+Tests the reader/writer lock and runs concurrent searches against concurrent
+inserts, updates and deletes on a SIMPLE memory store, checking that the
+vector index, chunk ids and filter postings stay aligned.
+"""
+
+import sys
+import hashlib
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from memory import memory_vectorstore
+from memory.memory_vectorstore import MemoryVectorStore, VectorStoreType, MemoryType
+from memory.rw_lock import ReadWriteLock
+
+
+def deterministic_embedding(text, dimension=32):
+    """Unit-norm embedding seeded from the text."""
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+    vector = np.random.default_rng(seed).standard_normal(dimension)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+class TestReadWriteLock(unittest.TestCase):
+    """Test suite for ReadWriteLock."""
+
+    def test_readers_share_the_lock(self):
+        """Several readers hold the lock at the same time."""
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=5)
+        errors = []
+
+        def reader():
+            try:
+                with lock.read_lock():
+                    barrier.wait()
+            except threading.BrokenBarrierError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(errors, [])
+
+    def test_writer_excludes_readers(self):
+        """A reader waits until the writer releases."""
+        lock = ReadWriteLock()
+        events = []
+
+        lock.acquire_write()
+        reader = threading.Thread(target=lambda: (lock.acquire_read(), events.append("read"), lock.release_read()))
+        reader.start()
+        time.sleep(0.1)
+        events.append("write done")
+        lock.release_write()
+        reader.join(timeout=5)
+
+        self.assertEqual(events, ["write done", "read"])
+
+    def test_reentrancy_and_upgrade(self):
+        """Nested reads and writes succeed; upgrading a read lock is refused."""
+        lock = ReadWriteLock()
+
+        with lock.write_lock():
+            with lock.read_lock():
+                with lock.write_lock():
+                    pass
+
+        with lock.read_lock():
+            with lock.read_lock():
+                with self.assertRaises(RuntimeError):
+                    lock.acquire_write()
+
+        # Fully released: another thread can now write
+        acquired = []
+        writer = threading.Thread(target=lambda: (lock.acquire_write(), acquired.append(True), lock.release_write()))
+        writer.start()
+        writer.join(timeout=5)
+        self.assertEqual(acquired, [True])
+
+
+class TestMemoryStoreConcurrency(unittest.TestCase):
+    """Concurrent readers and writers on a SIMPLE memory store."""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.memory_store = MemoryVectorStore(
+            store_type=VectorStoreType.SIMPLE,
+            storage_directory=self.test_dir,
+            embedding_dimension=32
+        )
+        self.memory_store._generate_embedding = deterministic_embedding
+        self.memory_store.config['similarity_threshold'] = -1.0
+
+        for i in range(20):
+            self.memory_store.add_memory(f"seed memory {i}", MemoryType.DOCUMENT, f"seed_{i}.txt",
+                                         tags=["seed"])
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def assert_index_consistent(self):
+        store = self.memory_store
+        self.assertEqual(len(store.chunk_ids), len(store.embeddings_matrix))
+        self.assertEqual(len(store.chunk_ids), store.filter_postings.num_rows)
+        self.assertEqual(set(store.chunk_ids), set(store.memory_chunks))
+
+    def test_concurrent_search_and_mutation(self):
+        """Searches keep returning results while writers insert, update and delete."""
+        errors = []
+        empty_searches = []
+        stop = threading.Event()
+
+        def reader(worker):
+            try:
+                while not stop.is_set():
+                    results = self.memory_store.search_memories(f"query {worker}", max_results=5)
+                    if not results:
+                        empty_searches.append(worker)
+                    for result in results:
+                        self.memory_store.get_memory(result.chunk.chunk_id)
+                    self.memory_store.search_memories("seed", max_results=3, tags=["seed"])
+            except Exception as e:
+                errors.append(e)
+
+        def writer(worker):
+            try:
+                for i in range(40):
+                    chunk_id = self.memory_store.add_memory(
+                        f"writer {worker} memory {i}", MemoryType.CONVERSATION, f"writer_{worker}.txt",
+                        tags=[f"writer_{worker}"])
+                    if i % 3 == 0:
+                        self.memory_store.update_memory(chunk_id, tags=["updated"])
+                    if i % 2 == 0:
+                        self.memory_store.delete_memory(chunk_id)
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=reader, args=(n,)) for n in range(4)]
+        writers = [threading.Thread(target=writer, args=(n,)) for n in range(3)]
+        for thread in readers + writers:
+            thread.start()
+        for thread in writers:
+            thread.join(timeout=60)
+        stop.set()
+        for thread in readers:
+            thread.join(timeout=60)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(empty_searches, [])
+        self.assert_index_consistent()
+        self.assertEqual(len(self.memory_store.chunk_ids), 20 + 3 * 20)
+
+        updated = self.memory_store.search_memories("writer", max_results=100, tags=["updated"])
+        self.assertTrue(updated)
+        self.assertTrue(all("updated" in result.chunk.tags for result in updated))
+
+    def test_concurrent_duplicate_adds_store_one_chunk(self):
+        """Racing adds of identical content produce a single chunk."""
+        barrier = threading.Barrier(4, timeout=5)
+        chunk_ids = []
+
+        def add():
+            barrier.wait()
+            chunk_ids.append(self.memory_store.add_memory("same content", MemoryType.FACT, "dup.txt"))
+
+        threads = [threading.Thread(target=add) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        self.assertEqual(len(set(chunk_ids)), 1)
+        self.assert_index_consistent()
+
+    def test_get_memory_store_singleton_across_threads(self):
+        """Concurrent first calls to get_memory_store share one instance."""
+        original = memory_vectorstore._memory_store
+        memory_vectorstore._memory_store = None
+        stores = []
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_store():
+            barrier.wait()
+            stores.append(memory_vectorstore.get_memory_store(storage_directory=self.test_dir,
+                                                              embedding_dimension=32))
+
+        try:
+            threads = [threading.Thread(target=get_store) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=30)
+
+            self.assertEqual(len(stores), 4)
+            self.assertTrue(all(store is stores[0] for store in stores))
+        finally:
+            memory_vectorstore._memory_store = original
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Streaming PDF Parsing
+====================================
+
+Tests that iter_content_blocks yields the same blocks as parse_document,
+page by page, that page ranges extracted in worker processes merge back
+into the serial result, and that the multimodal pipeline stores streamed
+blocks in memory as they arrive, for large PDFs from process_document.
+"""
+
+import sys
+import shutil
+import tempfile
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from multimodal_processing.document_parser import MultimodalDocumentParser
+
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+
+def write_pdf(path, pages, pages_per_node=None, loop_back=False):
+    """
+    Write a PDF with a few text lines and a 2x2 ruled table per page.
+
+    With pages_per_node, pages are grouped under intermediate /Pages nodes
+    that hold the pages' /Resources and /MediaBox for them to inherit. With
+    loop_back, the first of those nodes also lists the root as its first kid.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in range(1, pages + 1):
+        ops = ["BT /F1 10 Tf 50 760 Td 12 TL"]
+        ops += [f"(Page {page} paragraph line {line}.) '" for line in range(5)]
+        ops.append("ET")
+        ops += [f"50 {y} m 290 {y} l S" for y in (400, 380, 360)]
+        ops += [f"{x} 400 m {x} 360 l S" for x in (50, 170, 290)]
+        ops += [f"BT /F1 8 Tf {54 + col * 120} {385 - row * 20} Td (P{page}R{row}C{col}) Tj ET"
+                for row in range(2) for col in range(2)]
+        stream = "\n".join(ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        page_attributes = b"" if pages_per_node else b"/MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> "
+        objects.append(b"<< /Type /Page /Parent 2 0 R " + page_attributes + b"/Contents %d 0 R >>" % len(objects))
+        page_ids.append(len(objects))
+
+    def kids(ids):
+        return b"[" + " ".join(f"{i} 0 R" for i in ids).encode() + b"]"
+
+    if pages_per_node:
+        node_ids = []
+        for start in range(0, pages, pages_per_node):
+            node_pages = page_ids[start:start + pages_per_node]
+            if loop_back and not start:
+                node_pages = [2] + node_pages
+            objects.append(b"<< /Type /Pages /Parent 2 0 R /Kids " + kids(node_pages) + b" /Count %d "
+                           b"/MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0 R >> >> >>"
+                           % len(page_ids[start:start + pages_per_node]))
+            node_ids.append(len(objects))
+        page_ids = node_ids
+    objects[1] = b"<< /Type /Pages /Kids " + kids(page_ids) + b" /Count %d >>" % pages
+
+    with open(path, "wb") as f:
+        f.write(b"%PDF-1.4\n")
+        offsets = []
+        for number, body in enumerate(objects, 1):
+            offsets.append(f.tell())
+            f.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+        xref = f.tell()
+        f.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+        f.write(b"".join(b"%010d 00000 n \n" % offset for offset in offsets))
+        f.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+
+
+def block_key(block):
+    return block.content_type, block.source_location, block.content
+
+
+class RecordingMemoryStore:
+    """Memory store stand-in that records add_memory calls."""
+
+    def __init__(self):
+        self.memories = []
+
+    def add_memory(self, content, memory_type, source, tags, importance_score, metadata):
+        self.memories.append({"content": content, "source": source, "tags": tags,
+                              "importance_score": importance_score, "metadata": metadata})
+        return f"mem_{len(self.memories)}"
+
+
+class TestStreamingPDFParsing(unittest.TestCase):
+    """Test page-by-page PDF parsing."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.pdf_path = Path(cls.temp_dir) / "report.pdf"
+        write_pdf(cls.pdf_path, pages=4)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def setUp(self):
+        self.parser = MultimodalDocumentParser()
+
+    def test_stream_matches_parse_document(self):
+        parsed = self.parser.parse_document(self.pdf_path)
+        streamed = list(self.parser.iter_content_blocks(self.pdf_path))
+
+        self.assertTrue(streamed)
+        self.assertEqual([block_key(block) for block in streamed],
+                         [block_key(block) for block in parsed.content_blocks])
+
+    def test_pdfplumber_stream_yields_text_and_tables_in_page_order(self):
+        streamed = list(self.parser._iter_pdf_with_pdfplumber(self.pdf_path))
+
+        self.assertEqual([block_key(block) for block in streamed],
+                         [block_key(block) for block in self.parser._parse_pdf_with_pdfplumber(self.pdf_path)])
+        tables = [block for block in streamed if block.content_type == 'table']
+        self.assertEqual([block.source_location for block in tables],
+                         [f"page_{page}_table_1" for page in range(1, 5)])
+        self.assertEqual(tables[2].content, [["P3R0C0", "P3R0C1"], ["P3R1C0", "P3R1C1"]])
+
+    def test_blocks_are_yielded_before_later_pages_are_parsed(self):
+        pages_processed = []
+        process_text_content = self.parser._process_text_content
+
+        def recording_process_text_content(text, location):
+            pages_processed.append(location)
+            return process_text_content(text, location)
+
+        self.parser._process_text_content = recording_process_text_content
+        blocks = self.parser.iter_content_blocks(self.pdf_path)
+
+        first = next(blocks)
+        self.assertTrue(first.source_location.startswith("page_1"))
+        self.assertEqual(pages_processed, ["page_1"])
+        blocks.close()
+
+    def test_missing_file_yields_nothing(self):
+        self.assertEqual(list(self.parser.iter_content_blocks(Path(self.temp_dir) / "missing.pdf")), [])
+
+
+class TestParallelPDFExtraction(unittest.TestCase):
+    """Test page-range extraction in worker processes."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.pdf_path = Path(cls.temp_dir) / "report.pdf"
+        write_pdf(cls.pdf_path, pages=7)
+        cls.serial = MultimodalDocumentParser()
+        cls.parallel = MultimodalDocumentParser(pdf_workers=2, pdf_pages_per_task=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.parallel.shutdown()
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def test_parallel_parse_matches_serial(self):
+        serial_blocks = self.serial.parse_document(self.pdf_path).content_blocks
+        parallel_blocks = self.parallel.parse_document(self.pdf_path).content_blocks
+
+        self.assertEqual([block_key(block) for block in parallel_blocks],
+                         [block_key(block) for block in serial_blocks])
+
+    def test_parallel_pdfplumber_matches_serial(self):
+        serial_blocks = list(self.serial._iter_pdf_with_pdfplumber(self.pdf_path))
+        parallel_blocks = list(self.parallel._iter_pdf_parallel(self.pdf_path, 'pdfplumber'))
+
+        self.assertEqual([block_key(block) for block in parallel_blocks],
+                         [block_key(block) for block in serial_blocks])
+        self.assertEqual(parallel_blocks[-1].source_location, "page_7_table_1")
+
+    def test_page_ranges_keep_page_numbers(self):
+        for iter_pages in (self.serial._iter_pdf_with_pypdf2, self.serial._iter_pdf_with_pdfplumber):
+            locations = [block.source_location for block in iter_pages(self.pdf_path, (3, 4))]
+            self.assertTrue(locations)
+            self.assertEqual({location.split("_")[1] for location in locations}, {"3", "4"})
+
+    def test_nested_page_tree_is_walked_in_order(self):
+        nested_path = Path(self.temp_dir) / "nested.pdf"
+        write_pdf(nested_path, pages=7, pages_per_node=3)
+
+        flat_blocks = list(self.serial._iter_pdf_with_pypdf2(self.pdf_path))
+        nested_blocks = list(self.serial._iter_pdf_with_pypdf2(nested_path))
+        self.assertTrue(nested_blocks)
+        self.assertEqual([block_key(block) for block in nested_blocks],
+                         [block_key(block) for block in flat_blocks])
+
+        # Ranges skip whole subtrees and still count pages across them
+        ranged = [block_key(block) for block in self.serial._iter_pdf_with_pypdf2(nested_path, (4, 5))]
+        self.assertEqual(ranged, [block_key(block) for block in self.serial._iter_pdf_with_pypdf2(self.pdf_path, (4, 5))])
+        self.assertEqual(self.serial._count_pdf_pages(nested_path, 'PyPDF2'), 7)
+        self.assertEqual(self.serial.count_pdf_pages(nested_path), 7)
+        self.assertEqual(self.serial.count_pdf_pages(Path(self.temp_dir) / "missing.pdf"), 0)
+
+    def test_page_tree_cycle_is_not_followed(self):
+        cyclic_path = Path(self.temp_dir) / "cyclic.pdf"
+        write_pdf(cyclic_path, pages=7, pages_per_node=3, loop_back=True)
+
+        with self.assertLogs('multimodal_processing.document_parser', level='WARNING'):
+            cyclic_blocks = list(self.serial._iter_pdf_with_pypdf2(cyclic_path))
+        self.assertEqual([block_key(block) for block in cyclic_blocks],
+                         [block_key(block) for block in self.serial._iter_pdf_with_pypdf2(self.pdf_path)])
+
+    def test_invalid_worker_count(self):
+        with self.assertRaises(ValueError):
+            MultimodalDocumentParser(pdf_workers=0)
+
+
+@unittest.skipUnless(SENTENCE_TRANSFORMERS_AVAILABLE, "the multimodal pipeline requires sentence_transformers")
+class TestStreamDocumentToMemory(unittest.TestCase):
+    """Test storing streamed blocks in the memory system."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.pdf_path = Path(cls.temp_dir) / "report.pdf"
+        write_pdf(cls.pdf_path, pages=3)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir, ignore_errors=True)
+
+    def make_pipeline(self):
+        from multimodal_processing.multimodal_pipeline import MultimodalProcessingPipeline
+
+        pipeline = MultimodalProcessingPipeline.__new__(MultimodalProcessingPipeline)
+        pipeline.document_parser = MultimodalDocumentParser()
+        pipeline.memory_store = RecordingMemoryStore()
+        pipeline.processing_stats = {'documents_processed': 0, 'total_content_blocks': 0,
+                                     'memory_store_additions': 0, 'processing_errors': 0}
+        return pipeline
+
+    def test_every_block_is_stored(self):
+        pipeline = self.make_pipeline()
+        expected = pipeline.document_parser.parse_document(self.pdf_path).content_blocks
+
+        result = pipeline.stream_document_to_memory(self.pdf_path)
+
+        self.assertTrue(result["completed"])
+        self.assertEqual(result["total_chunks_stored"], len(expected))
+        self.assertEqual(len(pipeline.memory_store.memories), len(expected))
+        first = pipeline.memory_store.memories[0]
+        self.assertIn(expected[0].content.strip(), first["content"])
+        self.assertEqual(first["metadata"]["block_index"], 0)
+        self.assertEqual(first["source"], f"document:{self.pdf_path}:block_1")
+        self.assertEqual(pipeline.processing_stats["documents_processed"], 1)
+        self.assertEqual(pipeline.processing_stats["memory_store_additions"], len(expected))
+
+    def test_progress_callback_can_stop_streaming(self):
+        pipeline = self.make_pipeline()
+
+        result = pipeline.stream_document_to_memory(self.pdf_path, progress_callback=lambda stored: stored < 2)
+
+        self.assertFalse(result["completed"])
+        self.assertEqual(len(pipeline.memory_store.memories), 2)
+        self.assertEqual(pipeline.processing_stats["documents_processed"], 0)
+
+    def test_large_pdfs_are_streamed_by_process_document(self):
+        from multimodal_processing import multimodal_pipeline
+
+        pipeline = self.make_pipeline()
+        pipeline.document_parser.parse_document = Mock(side_effect=AssertionError("parsed whole"))
+        stages = []
+
+        with patch.object(multimodal_pipeline, 'STREAM_PDF_MIN_PAGES', 3):
+            result = pipeline.process_document(self.pdf_path,
+                                               progress_callback=lambda stage, progress: stages.append(stage))
+
+        self.assertTrue(result["streamed"])
+        self.assertEqual(stages, ["parsing", "memory_storage"])
+        self.assertIn("consolidation", result["skipped_steps"])
+        self.assertEqual(result["memory_storage"]["total_chunks_stored"], len(pipeline.memory_store.memories))
+        self.assertEqual(result["content_blocks"], len(pipeline.memory_store.memories))
+        self.assertEqual(result["enrichment_score"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the DynamicPlanner Plan Cache
+============================================
+
+Tests the bounded LRU plan cache: recency-based eviction, TTL expiry,
+skill registry fingerprint invalidation and the monitoring counters.
+"""
+
+import sys
+import time
+import unittest
+from collections import deque
+from dataclasses import replace
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.orchestration.uif import SAM_UIF
+from sam.orchestration.skills.base import BaseSkillModule
+from sam.orchestration.planner import DynamicPlanner, PlanGenerationResult
+
+
+class StubSkill(BaseSkillModule):
+    """Minimal skill for registry fingerprints."""
+
+    skill_description = "Stub skill"
+
+    def __init__(self, name, version="1.0.0"):
+        self.skill_name = name
+        self.skill_version = version
+        super().__init__()
+
+    def execute(self, uif):
+        return uif
+
+
+def make_planner(max_entries=3, ttl=3600):
+    planner = DynamicPlanner(enable_curriculum=False)
+    planner._config = replace(planner._config, plan_cache_max_entries=max_entries, plan_cache_ttl=ttl)
+    planner.register_skills([StubSkill("MemoryRetrievalSkill"), StubSkill("ResponseGenerationSkill")])
+    return planner
+
+
+def cache_plan(planner, query):
+    result = PlanGenerationResult(plan=["MemoryRetrievalSkill", "ResponseGenerationSkill"], confidence=0.8,
+                                  reasoning="test", cache_hit=False, generation_time=0.0, fallback_used=False)
+    planner._cache_plan(SAM_UIF(input_query=query), result)
+
+
+def lookup(planner, query):
+    return planner._check_plan_cache(SAM_UIF(input_query=query))
+
+
+class TestPlanCache(unittest.TestCase):
+    """Test suite for the DynamicPlanner plan cache."""
+
+    def test_least_recently_used_plan_is_evicted(self):
+        planner = make_planner(max_entries=3)
+        for query in ("q1", "q2", "q3"):
+            cache_plan(planner, query)
+
+        self.assertIsNotNone(lookup(planner, "q1"))  # q2 is now least recently used
+        cache_plan(planner, "q4")
+
+        self.assertIsNone(lookup(planner, "q2"))
+        for query in ("q1", "q3", "q4"):
+            self.assertIsNotNone(lookup(planner, query))
+
+        stats = planner.get_cache_stats()
+        self.assertEqual(stats["total_entries"], 3)
+        self.assertEqual(stats["evictions"], 1)
+        self.assertEqual(stats["hits"], 4)
+        self.assertEqual(stats["misses"], 1)
+
+    def test_expired_plans_are_dropped(self):
+        planner = make_planner(max_entries=100, ttl=60)
+        for query in ("q1", "q2"):
+            cache_plan(planner, query)
+        # Age both entries past their TTL
+        expired_at = time.time() - 1
+        for entry in planner._plan_cache.values():
+            entry.expires_at = expired_at
+        planner._cache_expiry_queue = deque((expired_at, key, entry) for _, key, entry in planner._cache_expiry_queue)
+
+        self.assertIsNone(lookup(planner, "q1"))
+        cache_plan(planner, "q3")  # Insertion drops the remaining expired entry
+
+        self.assertEqual(list(planner._plan_cache), [planner._generate_query_hash(SAM_UIF(input_query="q3"))])
+        self.assertEqual(planner.get_cache_stats()["expirations"], 2)
+
+    def test_skill_registry_change_invalidates_plans(self):
+        planner = make_planner()
+        cache_plan(planner, "q1")
+        entry = lookup(planner, "q1")
+
+        planner.register_skill(StubSkill("ResponseGenerationSkill", version="2.0.0"))
+
+        self.assertNotEqual(entry.skill_fingerprint, planner._skill_fingerprint)
+        self.assertFalse(planner._is_cache_entry_valid(entry))
+        self.assertIsNone(lookup(planner, "q1"))
+
+    def test_cache_size_stays_bounded(self):
+        """Repeated re-caching keeps both the cache and the expiry queue bounded."""
+        planner = make_planner(max_entries=50)
+        for i in range(5000):
+            cache_plan(planner, f"q{i % 80}")
+
+        self.assertEqual(len(planner._plan_cache), 50)
+        self.assertLessEqual(len(planner._cache_expiry_queue), 2 * 50 + 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
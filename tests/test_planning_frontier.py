@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the A* Planning Frontier
+=======================================
+
+Property tests for the capacity-bounded Frontier: the best nodes are never
+evicted, pops come out in best-first order, and statistics stay bounded.
+"""
+
+import sys
+import random
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.agent_zero.planning.frontier import Frontier
+from sam.agent_zero.planning.search_node import SearchNode
+from sam.agent_zero.planning.state import PlanningState
+
+BASE_TIME = datetime(2025, 1, 1)
+
+
+def make_node(index, g_score, h_score):
+    state = PlanningState(task_description=f"task {index}", g_score=g_score,
+                          created_at=BASE_TIME + timedelta(seconds=index))
+    return SearchNode(state=state, h_score=h_score)
+
+
+def sort_key(node):
+    """Best-first order matching SearchNode.is_better_than (newer wins final ties)."""
+    return (node.f_score, node.state.g_score, -node.state.created_at.timestamp())
+
+
+class TestFrontierProperties(unittest.TestCase):
+    """Randomized property tests against a sorted-list reference model."""
+
+    def test_bounded_frontier_matches_reference(self):
+        """Across random add/pop sequences the frontier keeps exactly the best max_size nodes."""
+        for seed in range(30):
+            rng = random.Random(seed)
+            max_size = rng.randint(1, 12)
+            frontier = Frontier(max_size=max_size)
+            reference = []
+
+            for step in range(300):
+                if rng.random() < 0.7:
+                    node = make_node(step, rng.randint(0, 8), rng.randint(0, 8))
+                    added = frontier.add(node)
+
+                    if len(reference) < max_size:
+                        self.assertTrue(added)
+                        reference.append(node)
+                    else:
+                        worst = max(reference, key=sort_key)
+                        self.assertEqual(added, sort_key(node) < sort_key(worst), f"seed={seed} step={step}")
+                        if added:
+                            reference.remove(worst)
+                            reference.append(node)
+                            self.assertFalse(worst.in_frontier)
+                else:
+                    popped = frontier.pop()
+                    if reference:
+                        best = min(reference, key=sort_key)
+                        self.assertIs(popped, best, f"seed={seed} step={step}")
+                        reference.remove(best)
+                    else:
+                        self.assertIsNone(popped)
+
+                # The best node held so far is always still in the frontier
+                if reference:
+                    self.assertIs(frontier.peek(), min(reference, key=sort_key))
+                    self.assertIs(frontier.peek_worst(), max(reference, key=sort_key))
+                self.assertEqual(len(frontier), len(reference))
+
+    def test_heaps_stay_compact(self):
+        """Lazy-deleted entries are compacted so heap size tracks the live node count."""
+        frontier = Frontier(max_size=10)
+        for index in range(5000):
+            frontier.add(make_node(index, 0, 5000 - index))
+
+        self.assertEqual(len(frontier), 10)
+        self.assertLessEqual(len(frontier._heap), 4 * 10 + 64)
+        self.assertEqual(frontier.get_statistics()['total_evicted'], 4990)
+
+    def test_statistics_use_bounded_history(self):
+        """Size history is a fixed-size ring while aggregates cover the whole run."""
+        frontier = Frontier(history_size=50)
+        for index in range(500):
+            frontier.add(make_node(index, 1, index % 7))
+
+        stats = frontier.get_statistics()
+        self.assertEqual(len(frontier._size_history), 50)
+        self.assertEqual(stats['max_size_reached'], 500)
+        self.assertEqual(stats['best_f_score_ever'], 1)
+        self.assertAlmostEqual(stats['avg_size'], 250.5)
+
+    def test_prune_and_ordered_listing(self):
+        """Pruning removes high-cost nodes and listing returns the best nodes in order."""
+        frontier = Frontier()
+        nodes = [make_node(index, 0, index) for index in range(10)]
+        for node in nodes:
+            frontier.add(node)
+
+        self.assertEqual(frontier.prune_high_cost_nodes(4), 5)
+        self.assertEqual([n.h_score for n in frontier.get_nodes_by_f_score(3)], [0, 1, 2])
+        self.assertEqual([frontier.pop().h_score for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertTrue(frontier.is_empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Python Sandbox Pool
+======================================
+
+Runs python_interpreter code on the warm worker pool and checks per-job
+stdout capture under concurrency, timeout, CPU and memory enforcement,
+and worker replacement.
+"""
+
+import sys
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from reasoning.python_sandbox import PythonSandboxPool, RESOURCE_AVAILABLE
+from reasoning.tool_executor import ToolExecutor
+
+
+class TestPythonSandboxPool(unittest.TestCase):
+    """Test suite for PythonSandboxPool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = PythonSandboxPool(pool_size=2, max_jobs_per_worker=50, memory_limit_mb=100)
+        # Wait for the workers to finish starting
+        cls.pool.run("pass", timeout=30)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_runs_code_with_restricted_builtins(self):
+        result = self.pool.run("x = math.sqrt(16)\nprint('root', x)", timeout=5)
+        self.assertTrue(result['success'])
+        self.assertEqual(result['output'], "root 4.0\n")
+        self.assertEqual(result['variables'], {'x': '4.0'})
+
+        result = self.pool.run("open('/etc/passwd')", timeout=5)
+        self.assertFalse(result['success'])
+        self.assertIn("open", result['error'])
+
+    def test_concurrent_executions_capture_their_own_output(self):
+        code = "for i in range(200):\n    print('job-{job}', i)\ntotal = {job} * 1000"
+
+        def run(job):
+            return job, self.pool.run(code.format(job=job), timeout=10)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(run, range(12)))
+
+        for job, result in results:
+            self.assertTrue(result['success'])
+            lines = result['output'].splitlines()
+            self.assertEqual(lines, [f"job-{job} {i}" for i in range(200)])
+            self.assertEqual(result['variables']['total'], str(job * 1000))
+
+    def test_infinite_loop_times_out_within_limit(self):
+        start = time.perf_counter()
+        result = self.pool.run("while True:\n    pass", timeout=1)
+        elapsed = time.perf_counter() - start
+
+        self.assertFalse(result['success'])
+        self.assertTrue(result['timed_out'])
+        self.assertIn("timed out", result['error'])
+        self.assertLess(elapsed, 1.5)
+
+        # The killed worker was replaced
+        self.assertEqual(self.pool.run("print('after')", timeout=30)['output'], "after\n")
+        self.assertEqual(self.pool.get_stats()['live_workers'], 2)
+
+    @unittest.skipUnless(RESOURCE_AVAILABLE, "resource limits need the resource module")
+    def test_cpu_limit_stops_runaway_code(self):
+        result = self.pool.run("while True:\n    pass", timeout=30, cpu_seconds=1)
+        self.assertFalse(result['success'])
+        self.assertFalse(result['timed_out'])
+        self.assertIn("CPU time limit", result['error'])
+
+    @unittest.skipUnless(RESOURCE_AVAILABLE, "resource limits need the resource module")
+    def test_memory_limit(self):
+        result = self.pool.run("data = [0] * (200 * 1024 * 1024)", timeout=10)
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], "MemoryError")
+
+        self.assertTrue(self.pool.run("data = [0] * (1024 * 1024)", timeout=10)['success'])
+
+
+class TestToolExecutorSandbox(unittest.TestCase):
+    """Test the python_interpreter tool through ToolExecutor."""
+
+    def test_python_interpreter_uses_sandbox(self):
+        executor = ToolExecutor()
+        response = executor.execute_tool('python_interpreter', {'code': "print(6 * 7)"})
+
+        self.assertTrue(response.success)
+        self.assertTrue(response.output['execution_successful'])
+        self.assertEqual(response.output['output'], "42\n")
+
+    def test_python_interpreter_timeout(self):
+        executor = ToolExecutor(default_timeout=1)
+        response = executor.execute_tool('python_interpreter', {'code': "while True:\n    pass"})
+
+        self.assertFalse(response.output['execution_successful'])
+        self.assertIn("timed out", response.output['error'])
+        self.assertLess(response.execution_time_ms, 1500)
+
+
+if __name__ == '__main__':
+    unittest.main()
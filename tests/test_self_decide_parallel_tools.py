@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Concurrent Tool Execution in SELF-DECIDE
+=======================================================
+
+Runs step 6 with sleeping stub tools and checks that independent tools
+overlap, that results keep their selection order, and that a hung tool is
+reported as timed out without holding up the others.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from reasoning.self_decide_framework import (
+    SelfDecideFramework, SelfDecideSession, ReasoningStep, ReasoningStepResult
+)
+
+# Seconds each stub tool sleeps
+TOOL_DELAYS = {'web_search': 0.4, 'multimodal_query': 0.3, 'python_interpreter': 0.2}
+
+
+class SleepingToolFramework(SelfDecideFramework):
+    """Framework whose tools sleep for a fixed time and record their concurrency."""
+
+    def __init__(self, delays, **kwargs):
+        super().__init__(**kwargs)
+        self.delays = delays
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def _execute_single_tool(self, tool_name, input_params):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if self.delays[tool_name] is None:
+                raise RuntimeError(f"{tool_name} is unavailable")
+            time.sleep(self.delays[tool_name])
+            return {'success': True, 'output': f"{tool_name} output",
+                    'execution_time_ms': int(self.delays[tool_name] * 1000)}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+def make_session(tool_names):
+    """Build a session whose step 5 selected the given tools."""
+    session = SelfDecideSession(
+        session_id="test_session", original_query="test query", reasoning_steps=[], knowledge_gaps=[],
+        reasoning_plan=None, tool_executions=[], final_answer="", confidence_score=0.0,
+        total_duration_ms=0, created_at=datetime.now().isoformat()
+    )
+    selected_tools = [{'tool_name': name, 'input_params': {'query': 'test query'}} for name in tool_names]
+    session.reasoning_steps.append(ReasoningStepResult(
+        step=ReasoningStep.DECIDE_TOOLS, input_data={}, output_data={'selected_tools': selected_tools},
+        reasoning="", confidence=0.8, timestamp=datetime.now().isoformat(), duration_ms=0
+    ))
+    return session
+
+
+def run_step_6(framework, tool_names):
+    """Run step 6 and return (session, seconds)."""
+    session = make_session(tool_names)
+    start = time.perf_counter()
+    framework._step_6_execute_tools(session)
+    return session, time.perf_counter() - start
+
+
+class TestSelfDecideParallelTools(unittest.TestCase):
+    """Test concurrent execution of selected tools."""
+
+    def test_independent_tools_overlap(self):
+        tools = list(TOOL_DELAYS)
+        sequential, sequential_seconds = run_step_6(
+            SleepingToolFramework(TOOL_DELAYS, max_parallel_tools=1), tools)
+        framework = SleepingToolFramework(TOOL_DELAYS, max_parallel_tools=4)
+        concurrent, concurrent_seconds = run_step_6(framework, tools)
+
+        # Sum of delays vs the slowest tool
+        self.assertGreaterEqual(sequential_seconds, 0.9)
+        self.assertLess(concurrent_seconds, 0.6)
+        self.assertEqual(framework.max_running, 3)
+        self.assertEqual([e['result'] for e in concurrent.tool_executions],
+                         [e['result'] for e in sequential.tool_executions])
+
+        step = concurrent.reasoning_steps[-1]
+        self.assertEqual(step.step, ReasoningStep.EXECUTE_TOOLS)
+        self.assertEqual(step.output_data['successful_executions'], 3)
+
+    def test_results_keep_selection_order(self):
+        tools = ['web_search', 'python_interpreter', 'multimodal_query']
+        session, _ = run_step_6(SleepingToolFramework(TOOL_DELAYS), tools)
+
+        # python_interpreter finishes first but stays in its selected position
+        self.assertEqual([e['tool_name'] for e in session.tool_executions], tools)
+        self.assertEqual([e['tool_name'] for e in session.reasoning_steps[-1].output_data['tool_results']], tools)
+
+    def test_worker_count_is_bounded(self):
+        delays = {f"tool_{i}": 0.1 for i in range(6)}
+        framework = SleepingToolFramework(delays, max_parallel_tools=2)
+        session, seconds = run_step_6(framework, list(delays))
+
+        self.assertEqual(framework.max_running, 2)
+        self.assertGreaterEqual(seconds, 0.3)
+        self.assertTrue(all(e['success'] for e in session.tool_executions))
+
+    def test_hung_tool_times_out(self):
+        delays = {'web_search': 3.0, 'python_interpreter': 0.1, 'table_generator': None}
+        framework = SleepingToolFramework(delays, tool_timeout_seconds=0.5)
+        session, seconds = run_step_6(framework, list(delays))
+
+        self.assertLess(seconds, 1.0)
+        hung, fast, failing = session.tool_executions
+        self.assertFalse(hung['success'])
+        self.assertIn("timed out", hung['result']['error'])
+        self.assertTrue(fast['success'])
+        self.assertFalse(failing['success'])
+        self.assertIn("unavailable", failing['result']['error'])
+        self.assertEqual(session.reasoning_steps[-1].output_data['successful_executions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Planning State Similarity Index
+==================================================
+
+Tests the MinHash/LSH index used by StateSimilarityDetector to narrow
+near-duplicate candidates before the exact similarity comparison.
+"""
+
+import sys
+import random
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.agent_zero.planning.state import PlanningState
+from sam.agent_zero.planning.state_similarity import StateLSHIndex, StateSimilarityDetector
+
+ACTIONS = ["web_search", "document_search", "summarize", "extract_tables", "compare_sources",
+           "apply_logical_reasoning", "validate_conclusions", "cite_sources"]
+
+
+def build_states(count, seed=3):
+    """Random bounded-depth plans over a few tasks."""
+    rng = random.Random(seed)
+    tasks = [f"Task {name} about quarterly {topic}" for name in "ABCD" for topic in ("revenue", "risk")]
+    states = []
+    for _ in range(count):
+        state = PlanningState(task_description=rng.choice(tasks))
+        for _ in range(rng.randint(1, 6)):
+            action = rng.choice(ACTIONS)
+            state = state.add_action(action, f"Executed {action}")
+        states.append(state)
+    return states
+
+
+class TestStateLSHIndex(unittest.TestCase):
+    """Test suite for StateLSHIndex."""
+
+    def test_identical_content_always_collides(self):
+        """States with the same content share every band and are returned as candidates."""
+        index = StateLSHIndex()
+        state = PlanningState(task_description="Summarize the report").add_action("summarize", "Executed summarize")
+        twin = PlanningState(task_description="Summarize the report").add_action("summarize", "Executed summarize")
+        other = PlanningState(task_description="Plan a trip").add_action("web_search", "Executed web_search")
+
+        index.add(state)
+        index.add(other)
+
+        self.assertIn(state.state_id, index.query(twin))
+        self.assertNotIn(other.state_id, index.query(twin))
+
+        index.remove(state.state_id)
+        self.assertNotIn(state.state_id, index.query(twin))
+        self.assertEqual(len(index), 1)
+
+    def test_invalid_band_configuration(self):
+        with self.assertRaises(ValueError):
+            StateLSHIndex(num_perm=64, bands=10)
+
+
+class TestIndexedSimilarityLookup(unittest.TestCase):
+    """Test indexed find_similar_states against the exact scan."""
+
+    def test_indexed_lookup_matches_scan(self):
+        """Indexed results are a subset of the scan with high recall and fewer comparisons."""
+        states = build_states(600)
+        exact = StateSimilarityDetector(use_index=False)
+        indexed = StateSimilarityDetector()
+
+        true_total = found_total = 0
+        for query in states[:40]:
+            expected = {s.state_id for s, _ in exact.find_similar_states(query, states)}
+            found = {s.state_id for s, _ in indexed.find_similar_states(query, states)}
+            self.assertLessEqual(found, expected)
+            true_total += len(expected)
+            found_total += len(found)
+
+        # LSH is approximate; scripts/report_state_similarity_recall.py reports recall on a larger trace
+        self.assertGreater(true_total, 0)
+        self.assertGreaterEqual(found_total / true_total, 0.8)
+        self.assertLess(indexed.get_cache_stats()['exact_comparisons'],
+                        exact.get_cache_stats()['exact_comparisons'])
+
+    def test_query_indexed_states_without_candidate_list(self):
+        """Passing no candidate list searches every indexed state."""
+        detector = StateSimilarityDetector()
+        state = PlanningState(task_description="Audit the contract").add_action("document_search", "Executed document_search")
+        duplicate = PlanningState(task_description="Audit the contract").add_action("document_search", "Executed document_search")
+
+        detector.index_state(state)
+        results = detector.find_similar_states(duplicate)
+
+        self.assertEqual([s.state_id for s, _ in results], [state.state_id])
+        self.assertAlmostEqual(results[0][1], 1.0)
+
+        detector.remove_state(state.state_id)
+        self.assertEqual(detector.find_similar_states(duplicate), [])
+
+    def test_small_candidate_lists_are_scanned_exactly(self):
+        """Lists within exact_scan_limit skip the index and match the scan exactly."""
+        states = build_states(30)
+        detector = StateSimilarityDetector(exact_scan_limit=64)
+        exact = StateSimilarityDetector(use_index=False)
+
+        for query in states[:5]:
+            self.assertEqual(
+                [s.state_id for s, _ in detector.find_similar_states(query, states)],
+                [s.state_id for s, _ in exact.find_similar_states(query, states)]
+            )
+        self.assertEqual(detector.get_cache_stats()['indexed_states'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
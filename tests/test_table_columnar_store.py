@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Columnar Table Store
+=======================================
+
+Tests that tables are kept in the SQLite table store, that the chunker emits
+summary, header and row-group chunks instead of one chunk per cell, and that
+retrieval reconstructs tables from the store.
+"""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.cognition.table_processing.table_store import TableStore
+from sam.cognition.table_processing.sam_integration import TableAwareChunker, TableAwareRetrieval
+
+MARKDOWN_TABLE = "\n".join(
+    ["| Product | Units | Price |", "|---|---|---|"] +
+    [f"| Item {i} | {i * 3} | {i}.50 |" for i in range(1, 8)]
+)
+
+
+class TestTableStore(unittest.TestCase):
+    """Test the SQLite columnar table store."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = TableStore(str(Path(self.temp_dir) / "tables.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_preserves_cells_and_metadata(self):
+        data = [["Name", "Age"], ["Ann", "31"], ["Bob", ""]]
+        roles = [["HEADER", "HEADER"], ["DATA", "DATA"], ["DATA", "EMPTY"]]
+        self.assertTrue(self.store.put_table("t1", data, roles=roles, title="People",
+                                             table_structure={"dimensions": [3, 2]}))
+
+        stored = self.store.get_table("t1")
+        self.assertEqual(stored.data, data)
+        self.assertEqual(stored.roles, roles)
+        self.assertEqual(stored.data_types, [["text", "text"]] * 3)
+        self.assertEqual(stored.confidences, [[0.0, 0.0]] * 3)
+        self.assertEqual(stored.dimensions, (3, 2))
+        self.assertEqual(stored.title, "People")
+        self.assertEqual(stored.table_structure, {"dimensions": [3, 2]})
+
+    def test_ragged_rows_are_padded_and_tables_replaced(self):
+        self.store.put_table("t1", [["a", "b", "c"], ["d"]])
+        self.assertEqual(self.store.get_table("t1").data, [["a", "b", "c"], ["d", "", ""]])
+
+        self.store.put_table("t1", [["x"]])
+        self.assertEqual(self.store.get_table("t1").data, [["x"]])
+        self.assertEqual(self.store.get_stats()["total_tables"], 1)
+
+    def test_delete_and_missing_tables(self):
+        self.store.put_table("t1", [["a"]])
+        self.assertTrue(self.store.has_table("t1"))
+        self.assertTrue(self.store.delete_table("t1"))
+        self.assertFalse(self.store.has_table("t1"))
+        self.assertIsNone(self.store.get_table("t1"))
+        self.assertEqual(self.store.list_table_ids(), [])
+
+
+class TestColumnarChunking(unittest.TestCase):
+    """Test table chunking and retrieval backed by the table store."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = TableStore(str(Path(self.temp_dir) / "tables.db"))
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_chunker_emits_table_level_chunks(self):
+        chunker = TableAwareChunker(table_store=self.store, row_group_size=3)
+        result = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "sales.md")
+
+        chunk_types = [chunk["chunk_type"] for chunk in result.enhanced_chunks]
+        self.assertEqual(chunk_types, ["TABLE_SUMMARY", "TABLE_HEADER"] + ["TABLE_ROW_GROUP"] * 3)
+        self.assertEqual([chunk["row_range"] for chunk in result.enhanced_chunks[2:]], [(1, 4), (4, 7), (7, 8)])
+        self.assertTrue(all(chunk["columnar_store"] for chunk in result.enhanced_chunks))
+
+        table_id = result.enhanced_chunks[0]["table_id"]
+        self.assertEqual(self.store.get_table(table_id).dimensions, (8, 3))
+        self.assertIn("Item 4 | 12 | 4.50", result.enhanced_chunks[3]["content"])
+
+    def test_tables_from_different_documents_are_kept_apart(self):
+        chunker = TableAwareChunker(table_store=self.store)
+        other_table = MARKDOWN_TABLE.replace("Item", "Part")
+        first = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "Document: sales.md")
+        second = chunker.process_document_with_tables(other_table, "markdown", "Document: parts.md")
+
+        # Both documents' first table has the same parser ID
+        self.assertEqual(first.tables[0].table_id, second.tables[0].table_id)
+        first_id = first.enhanced_chunks[0]["table_id"]
+        second_id = second.enhanced_chunks[0]["table_id"]
+        self.assertNotEqual(first_id, second_id)
+        self.assertTrue(all(chunk["table_id"] == second_id for chunk in second.enhanced_chunks))
+
+        self.assertEqual(self.store.get_stats()["total_tables"], 2)
+        self.assertEqual(self.store.get_table(first_id).data[1][0], "Item 1")
+        self.assertEqual(self.store.get_table(second_id).data[1][0], "Part 1")
+
+    def test_reingesting_a_changed_document_keeps_both_versions(self):
+        chunker = TableAwareChunker(table_store=self.store)
+        revised_table = MARKDOWN_TABLE.replace("Item 1 ", "Item 1 (revised) ")
+        first = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "Document: sales.md")
+        second = chunker.process_document_with_tables(revised_table, "markdown", "Document: sales.md")
+        again = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "Document: sales.md")
+
+        first_id = first.enhanced_chunks[0]["table_id"]
+        second_id = second.enhanced_chunks[0]["table_id"]
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(again.enhanced_chunks[0]["table_id"], first_id)
+
+        self.assertEqual(self.store.get_stats()["total_tables"], 2)
+        self.assertEqual(self.store.get_table(first_id).data[1][0], "Item 1")
+        self.assertEqual(self.store.get_table(second_id).data[1][0], "Item 1 (revised)")
+
+    def test_chunker_without_store_creates_cell_chunks(self):
+        chunker = TableAwareChunker(use_columnar_store=False)
+        result = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "sales.md")
+
+        self.assertEqual(len(result.enhanced_chunks), 24)
+        self.assertTrue(all("cell_coordinates" in chunk for chunk in result.enhanced_chunks))
+
+    def test_retrieval_reconstructs_from_store(self):
+        chunker = TableAwareChunker(table_store=self.store)
+        result = chunker.process_document_with_tables(MARKDOWN_TABLE, "markdown", "sales.md")
+        table_id = result.enhanced_chunks[0]["table_id"]
+
+        retrieval = TableAwareRetrieval(memory_store=None, table_store=self.store)
+        table = retrieval.reconstruct_table(table_id)
+        self.assertEqual(table.dimensions, (8, 3))
+        self.assertEqual(table.headers, ["Product", "Units", "Price"])
+        self.assertEqual(table.data[7], ["Item 7", "21", "7.50"])
+
+        cells = retrieval.get_table_cells(table_id)
+        self.assertEqual(len(cells), 24)
+        self.assertEqual(cells[4]["metadata"]["cell_coordinates"], (1, 1))
+        self.assertEqual(cells[4]["metadata"]["cell_data_type"], "integer")
+
+        analysis = retrieval.get_table_data_for_analysis(table_id)
+        self.assertEqual(analysis["dimensions"], (8, 3))
+
+    def test_reconstruction_finds_header_below_a_title_row(self):
+        data = [["Quarterly sales", "", ""], ["Region", "Q1", "Q2"], ["North", "10", "12"]]
+        roles = [["DATA", "EMPTY", "EMPTY"], ["HEADER", "HEADER", "HEADER"], ["DATA", "DATA", "DATA"]]
+        self.store.put_table("t1", data, roles=roles)
+
+        retrieval = TableAwareRetrieval(memory_store=None, table_store=self.store)
+        self.assertEqual(retrieval.reconstruct_table("t1").headers, ["Region", "Q1", "Q2"])
+        self.assertEqual(retrieval.get_table_data_for_analysis("t1")["data"][0]["Region"], "North")
+
+
+if __name__ == '__main__':
+    unittest.main()
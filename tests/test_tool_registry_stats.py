@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Batched Tool Usage Statistics
+============================================
+
+Tests that ToolRegistry keeps exact usage counts under concurrent updates,
+writes them in a few atomic batches instead of once per execution, and
+flushes on its timer and on close.
+"""
+
+import sys
+import json
+import time
+import shutil
+import tempfile
+import threading
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Load the registry module on its own; the tools package also imports the executors
+_spec = importlib.util.spec_from_file_location("tool_registry", project_root / "tools" / "tool_registry.py")
+tool_registry = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(tool_registry)
+ToolRegistry = tool_registry.ToolRegistry
+
+THREADS = 16
+UPDATES_PER_THREAD = 500
+
+
+class TestToolRegistryStats(unittest.TestCase):
+    """Test batched, atomic persistence of tool usage statistics."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry_file = Path(self.temp_dir) / "tool_registry.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def stored_tool(self, tool_id):
+        data = json.loads(self.registry_file.read_text(encoding="utf-8"))
+        return next(tool for tool in data['tools'] if tool['tool_id'] == tool_id)
+
+    def test_concurrent_updates_keep_exact_counts_with_few_writes(self):
+        registry = ToolRegistry(registry_file=str(self.registry_file), flush_interval=60)
+        tool_ids = ["python_interpreter", "table_generator"]
+        initial = {tool_id: registry.get_tool(tool_id).usage_count for tool_id in tool_ids}
+
+        def worker(thread_index):
+            for i in range(UPDATES_PER_THREAD):
+                registry.update_tool_stats(tool_ids[(thread_index + i) % 2], success=i % 4 != 0,
+                                           execution_time=1.0)
+
+        with mock.patch.object(tool_registry.os, "replace", wraps=tool_registry.os.replace) as replace:
+            threads = [threading.Thread(target=worker, args=(index,)) for index in range(THREADS)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertTrue(registry.flush())
+
+        # One write instead of one per update
+        self.assertEqual(replace.call_count, 1)
+        expected_updates = THREADS * UPDATES_PER_THREAD // 2
+        for tool_id in tool_ids:
+            stored = self.stored_tool(tool_id)
+            self.assertEqual(stored['usage_count'], initial[tool_id] + expected_updates)
+            self.assertEqual(registry.get_tool(tool_id).usage_count, stored['usage_count'])
+
+        reloaded = ToolRegistry(registry_file=str(self.registry_file))
+        self.assertEqual(reloaded.get_tool("python_interpreter").usage_count,
+                         initial["python_interpreter"] + expected_updates)
+        self.assertEqual(list(Path(self.temp_dir).glob("*.tmp")), [])
+
+    def test_timer_flushes_pending_stats(self):
+        registry = ToolRegistry(registry_file=str(self.registry_file), flush_interval=0.05)
+        count = registry.get_tool("python_interpreter").usage_count
+        registry.update_tool_stats("python_interpreter", True, 0.5)
+
+        deadline = time.time() + 5
+        while self.stored_tool("python_interpreter")['usage_count'] != count + 1:
+            self.assertLess(time.time(), deadline, "stats were not flushed by the timer")
+            time.sleep(0.02)
+
+    def test_close_flushes_and_flush_without_changes_does_not_write(self):
+        registry = ToolRegistry(registry_file=str(self.registry_file), flush_interval=60)
+        count = registry.get_tool("table_generator").usage_count
+        registry.update_tool_stats("table_generator", False, 2.0)
+        self.assertEqual(self.stored_tool("table_generator")['usage_count'], count)
+
+        registry.close()
+        self.assertEqual(self.stored_tool("table_generator")['usage_count'], count + 1)
+
+        with mock.patch.object(tool_registry.os, "replace") as replace:
+            self.assertTrue(registry.flush())
+        replace.assert_not_called()
+
+    def test_zero_interval_writes_every_update(self):
+        registry = ToolRegistry(registry_file=str(self.registry_file), flush_interval=0)
+        count = registry.get_tool("python_interpreter").usage_count
+        registry.update_tool_stats("python_interpreter", True, 0.5)
+        self.assertEqual(self.stored_tool("python_interpreter")['usage_count'], count + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test Suite for TraceLogger Live Event Streaming
+===============================================
+
+Tests the pub/sub hook behind the /api/trace/<trace_id>/stream SSE endpoint:
+backlog replay, resume-from-sequence and slow subscriber handling.
+"""
+
+import sys
+import queue
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sam.cognition.trace_logger import TraceLogger, EventType, Severity
+
+
+class TestTraceStream(unittest.TestCase):
+    """Test suite for live trace event subscriptions."""
+
+    def setUp(self):
+        """Set up a fresh trace logger with one trace."""
+        self.trace_logger = TraceLogger()
+        self.trace_logger._check_breakpoints = lambda *args, **kwargs: None
+        self.trace_logger._store_trace_in_database = lambda trace_id: None
+        self.trace_id = self.trace_logger.start_trace("stream test query")
+
+    def _log(self, message):
+        return self.trace_logger.log_event(
+            trace_id=self.trace_id,
+            source_module="TestModule",
+            event_type=EventType.DECISION,
+            severity=Severity.INFO,
+            message=message
+        )
+
+    def test_backlog_then_live_events(self):
+        """Subscribers get the backlog once and then only new events."""
+        self._log("first")
+        subscriber, backlog = self.trace_logger.subscribe(self.trace_id)
+
+        self.assertEqual([seq for seq, _ in backlog], [1, 2])
+        self.assertTrue(subscriber.empty())
+
+        self._log("second")
+        sequence, event = subscriber.get_nowait()
+        self.assertEqual(sequence, 3)
+        self.assertEqual(event['message'], "second")
+        self.assertTrue(subscriber.empty())
+
+    def test_resume_from_sequence(self):
+        """Resuming skips events the client has already seen."""
+        for i in range(5):
+            self._log(f"event {i}")
+
+        _, backlog = self.trace_logger.subscribe(self.trace_id, since_sequence=4)
+        self.assertEqual([seq for seq, _ in backlog], [5, 6])
+        self.assertEqual(backlog[-1][1]['message'], "event 4")
+
+        since = self.trace_logger.get_trace_events_since(self.trace_id, 6)
+        self.assertEqual(since, [])
+
+    def test_unsubscribe_stops_delivery(self):
+        """Unsubscribed queues receive nothing further."""
+        subscriber, _ = self.trace_logger.subscribe(self.trace_id)
+        self.trace_logger.unsubscribe(self.trace_id, subscriber)
+        self._log("after unsubscribe")
+        self.assertTrue(subscriber.empty())
+        self.assertNotIn(self.trace_id, self.trace_logger._subscribers)
+
+    def test_slow_subscriber_gets_overflow_marker(self):
+        """A full subscriber queue is dropped and told to resync."""
+        subscriber, _ = self.trace_logger.subscribe(self.trace_id, max_queue_size=2)
+        for i in range(3):
+            self._log(f"burst {i}")
+
+        self.assertEqual(subscriber.get_nowait(), (None, None))
+        with self.assertRaises(queue.Empty):
+            subscriber.get_nowait()
+
+        # Logging continues to work for other subscribers
+        other, _ = self.trace_logger.subscribe(self.trace_id, since_sequence=4)
+        self._log("after overflow")
+        self.assertEqual(other.get_nowait()[0], 5)
+
+    def test_end_trace_publishes_end_event(self):
+        """The final end event is delivered and the trace becomes inactive."""
+        subscriber, _ = self.trace_logger.subscribe(self.trace_id)
+        self.trace_logger.end_trace(self.trace_id, success=True)
+
+        _, event = subscriber.get_nowait()
+        self.assertEqual(event['event_type'], 'end')
+        self.assertEqual(event['source_module'], 'TraceLogger')
+        self.assertFalse(self.trace_logger.is_trace_active(self.trace_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Web UI Background Upload Job Queue
+=====================================================
+
+Tests queueing, progress events, cancellation and the concurrency limit of
+UploadJobQueue using stub processors instead of the multimodal pipeline, and
+that cancelling a pipeline upload leaves nothing stored.
+"""
+
+import sys
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+import importlib.util
+from pathlib import Path
+from unittest.mock import Mock
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from web_ui.upload_jobs import UploadJobQueue, JobStatus, JobQueueFullError
+
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+
+MARKDOWN_TABLE = "\n".join(
+    ["| Product | Units | Price |", "|---|---|---|"] +
+    [f"| Item {i} | {i * 3} | {i}.50 |" for i in range(1, 8)]
+)
+
+
+def wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true or the timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestUploadJobQueue(unittest.TestCase):
+    """Test suite for UploadJobQueue."""
+
+    def tearDown(self):
+        if hasattr(self, 'job_queue'):
+            self.job_queue.shutdown(wait=True)
+
+    def test_job_completes_with_stage_events(self):
+        """Jobs report each stage and expose the processor result."""
+        def processor(file_path, filename, progress_callback):
+            progress_callback('parsing', 0.1)
+            progress_callback('memory_storage', 0.8)
+            return {'message': 'File processed successfully', 'filename': filename}
+
+        self.job_queue = UploadJobQueue(processor, max_workers=1)
+        job = self.job_queue.submit('/tmp/doc.pdf', 'doc.pdf')
+
+        self.assertTrue(wait_for(lambda: job.status == JobStatus.COMPLETED))
+        self.assertEqual(job.result['filename'], 'doc.pdf')
+
+        stages = [event['stage'] for event in self.job_queue.get_job_status(job.job_id)['events']]
+        self.assertEqual(stages, ['queued', 'started', 'parsing', 'memory_storage', 'completed'])
+        self.assertEqual(job.progress, 1.0)
+
+    def test_error_result_marks_job_failed(self):
+        """A processor error payload fails the job."""
+        self.job_queue = UploadJobQueue(lambda path, name, cb: {'error': 'parse failed'})
+        job = self.job_queue.submit('/tmp/bad.pdf', 'bad.pdf')
+
+        self.assertTrue(wait_for(lambda: job.status == JobStatus.FAILED))
+        self.assertEqual(job.error, 'parse failed')
+
+    def test_cancel_running_job(self):
+        """Running jobs stop at the next progress checkpoint after cancel."""
+        started = threading.Event()
+        stopped_early = threading.Event()
+
+        def processor(file_path, filename, progress_callback):
+            started.set()
+            while progress_callback('parsing', 0.1):
+                time.sleep(0.01)
+            stopped_early.set()
+            return None
+
+        self.job_queue = UploadJobQueue(processor, max_workers=1)
+        job = self.job_queue.submit('/tmp/big.pdf', 'big.pdf')
+
+        self.assertTrue(started.wait(5))
+        self.assertTrue(self.job_queue.cancel(job.job_id))
+        self.assertTrue(wait_for(lambda: job.status == JobStatus.CANCELLED))
+        self.assertTrue(stopped_early.is_set())
+        self.assertFalse(self.job_queue.cancel(job.job_id))
+
+    def test_cancel_after_storage_started_is_ignored(self):
+        """Once the document is being stored, the job completes despite a cancel."""
+        storing = threading.Event()
+        cancelled = threading.Event()
+        callback_results = []
+
+        def processor(file_path, filename, progress_callback):
+            callback_results.append(progress_callback('vector_indexing', 0.65))
+            storing.set()
+            cancelled.wait(5)
+            callback_results.append(progress_callback('memory_storage', 0.75))
+            return {'filename': filename}
+
+        self.job_queue = UploadJobQueue(processor, max_workers=1)
+        job = self.job_queue.submit('/tmp/doc.pdf', 'doc.pdf')
+
+        self.assertTrue(storing.wait(5))
+        self.assertFalse(self.job_queue.cancel(job.job_id))
+        cancelled.set()
+
+        self.assertTrue(wait_for(lambda: job.status == JobStatus.COMPLETED))
+        self.assertEqual(callback_results, [True, True])
+        self.assertEqual(job.result['filename'], 'doc.pdf')
+
+    def test_concurrency_and_pending_limits(self):
+        """No more than max_workers jobs run at once and the queue is bounded."""
+        release = threading.Event()
+        lock = threading.Lock()
+        running = {'current': 0, 'peak': 0}
+
+        def processor(file_path, filename, progress_callback):
+            with lock:
+                running['current'] += 1
+                running['peak'] = max(running['peak'], running['current'])
+            release.wait(5)
+            with lock:
+                running['current'] -= 1
+            return {'filename': filename}
+
+        self.job_queue = UploadJobQueue(processor, max_workers=2, max_pending=4)
+        jobs = [self.job_queue.submit(f'/tmp/{i}.pdf', f'{i}.pdf') for i in range(4)]
+
+        with self.assertRaises(JobQueueFullError):
+            self.job_queue.submit('/tmp/overflow.pdf', 'overflow.pdf')
+
+        # Queued jobs can be cancelled before they start
+        self.assertTrue(wait_for(lambda: running['current'] == 2))
+        self.assertTrue(self.job_queue.cancel(jobs[3].job_id))
+        self.assertEqual(jobs[3].status, JobStatus.CANCELLED)
+
+        release.set()
+        self.assertTrue(wait_for(lambda: all(job.status in (JobStatus.COMPLETED, JobStatus.CANCELLED)
+                                             for job in jobs)))
+        self.assertEqual(running['peak'], 2)
+        self.assertEqual(jobs[2].status, JobStatus.COMPLETED)
+
+
+@unittest.skipUnless(SENTENCE_TRANSFORMERS_AVAILABLE, "the multimodal pipeline requires sentence_transformers")
+class TestPipelineUploadCancellation(unittest.TestCase):
+    """Test cancelling multimodal pipeline uploads of documents with tables."""
+
+    def setUp(self):
+        from multimodal_processing.document_parser import MultimodalContent, ParsedDocument
+        from multimodal_processing.multimodal_pipeline import MultimodalProcessingPipeline
+        from sam.cognition.table_processing.sam_integration import TableAwareChunker
+        from sam.cognition.table_processing.table_store import TableStore
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.table_store = TableStore(str(Path(self.temp_dir) / "tables.db"))
+
+        parsed_doc = ParsedDocument(
+            document_id="sales", source_file="sales.md",
+            content_blocks=[MultimodalContent('text', "Quarterly sales\n\n" + MARKDOWN_TABLE, {})],
+            document_metadata={}, parsing_stats={}
+        )
+        self.pipeline = MultimodalProcessingPipeline.__new__(MultimodalProcessingPipeline)
+        self.pipeline.document_parser = Mock(parse_document=Mock(return_value=parsed_doc),
+                                             count_pdf_pages=Mock(return_value=0))
+        self.pipeline.knowledge_consolidator = Mock()
+        self.pipeline.knowledge_consolidator.consolidate_document.return_value = Mock(summary="Quarterly sales")
+        self.pipeline.enrichment_scorer = Mock()
+        self.pipeline.enrichment_scorer.score_consolidated_knowledge.return_value = Mock(
+            overall_score=0.5, priority_level="medium")
+        self.pipeline.vector_manager = Mock()
+        self.pipeline.memory_store = Mock()
+        self.pipeline.table_aware_chunker = TableAwareChunker(table_store=self.table_store)
+        # Whole-document storage and output files are covered elsewhere
+        self.pipeline._store_document_in_memory = Mock(return_value=None)
+        self.pipeline._save_processing_outputs = Mock(return_value={})
+        self.pipeline.processing_stats = {key: 0 for key in (
+            'documents_processed', 'total_content_blocks', 'consolidated_knowledge_items',
+            'vector_store_additions', 'memory_store_additions', 'processing_errors')}
+
+    def tearDown(self):
+        if hasattr(self, 'job_queue'):
+            self.job_queue.shutdown(wait=True)
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_upload(self, cancel_at=None):
+        """Process sales.md on the queue, cancelling the job when cancel_at is reached."""
+        submitted = threading.Event()
+        job_ids = []
+
+        def processor(file_path, filename, progress_callback):
+            submitted.wait(5)
+
+            def callback(stage, progress):
+                if stage == cancel_at:
+                    self.job_queue.cancel(job_ids[0])
+                return progress_callback(stage, progress)
+
+            return self.pipeline.process_document(file_path, progress_callback=callback)
+
+        self.job_queue = UploadJobQueue(processor, max_workers=1)
+        job = self.job_queue.submit(str(Path(self.temp_dir) / "sales.md"), 'sales.md')
+        job_ids.append(job.job_id)
+        submitted.set()
+
+        self.assertTrue(wait_for(lambda: job.status in (JobStatus.COMPLETED, JobStatus.CANCELLED,
+                                                        JobStatus.FAILED)))
+        return job
+
+    def test_cancel_at_consolidation_leaves_no_tables(self):
+        """No table chunks or stored tables remain after a cancel before storage."""
+        job = self.run_upload(cancel_at='consolidation')
+
+        self.assertEqual(job.status, JobStatus.CANCELLED)
+        self.assertEqual(self.table_store.list_table_ids(), [])
+        self.pipeline.memory_store.add_memory.assert_not_called()
+        self.pipeline.vector_manager.add_consolidated_knowledge.assert_not_called()
+
+    def test_tables_are_stored_once_storage_started(self):
+        """Table processing runs after vector indexing and cannot be cancelled."""
+        job = self.run_upload(cancel_at='table_processing')
+
+        self.assertEqual(job.status, JobStatus.COMPLETED)
+        stages = [event['stage'] for event in job.events]
+        self.assertLess(stages.index('vector_indexing'), stages.index('table_processing'))
+        self.assertTrue(self.table_store.list_table_ids())
+        self.assertTrue(any('table' in call.kwargs['tags']
+                            for call in self.pipeline.memory_store.add_memory.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
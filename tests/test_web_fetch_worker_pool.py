@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Web Fetch Worker Pool
+========================================
+
+Fetches pages from a local HTTP server through the warm worker pool and
+checks worker reuse, recycling, crash recovery and timeout enforcement.
+"""
+
+import sys
+import time
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from web_retrieval.fetch_worker_pool import FetchWorkerPool
+from web_retrieval.exceptions import ProcessIsolationError, TimeoutError
+from web_retrieval.web_fetcher import WebFetcher
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Serves a small HTML page; /slow sleeps first, /missing returns 404."""
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(3)
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+        body = f"<html><script>x=1</script><body><p>Page {self.path}</p></body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFetchWorkerPool(unittest.TestCase):
+    """Test suite for FetchWorkerPool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def setUp(self):
+        self.pool = FetchWorkerPool(pool_size=1, max_jobs_per_worker=3)
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def fetch(self, path, **kwargs):
+        return self.pool.fetch(f"{self.base_url}{path}", "SAM-test", timeout=5, **kwargs)
+
+    def test_fetch_extracts_text_and_reuses_worker(self):
+        first = self.fetch("/a")
+        second = self.fetch("/b")
+
+        self.assertEqual(first["content"], "Page /a")
+        self.assertIsNone(first["error"])
+        self.assertEqual(second["metadata"]["fetch_method"], "requests+beautifulsoup")
+        self.assertEqual(self.pool.get_stats()["workers_started"], 1)
+
+    def test_errors_are_returned_as_results(self):
+        result = self.fetch("/missing")
+        self.assertIsNone(result["content"])
+        self.assertIn("404", result["error"])
+
+    def test_workers_are_recycled_after_max_jobs(self):
+        for i in range(7):
+            self.fetch(f"/{i}")
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["jobs"], 7)
+        self.assertEqual(stats["workers_started"], 3)
+        self.assertEqual(stats["workers_recycled"], 2)
+
+    def test_crashed_worker_is_replaced(self):
+        self.fetch("/a")
+        worker = self.pool._idle[0]
+        worker.process.kill()
+        worker.process.join()
+
+        self.assertEqual(self.fetch("/b")["content"], "Page /b")
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["crashes"], 1)
+        self.assertEqual(stats["workers_started"], 2)
+
+    def test_timeout_kills_worker(self):
+        with self.assertRaises(TimeoutError):
+            self.fetch("/slow", hard_timeout=0.5)
+
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["live_workers"], 0)
+        self.assertEqual(self.fetch("/a")["content"], "Page /a")
+
+    def test_shutdown_rejects_new_jobs(self):
+        self.fetch("/a")
+        self.pool.shutdown()
+
+        self.assertEqual(self.pool.get_stats()["live_workers"], 0)
+        with self.assertRaises(ProcessIsolationError):
+            self.fetch("/b")
+
+    def test_web_fetcher_uses_pool(self):
+        fetcher = WebFetcher(timeout=5)
+        result = fetcher.fetch_url_content(f"{self.base_url}/fetcher")
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.content, "Page /fetcher")
+        self.assertGreaterEqual(fetcher.get_stats()["worker_pool"]["jobs"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test Suite for the Shared Spawn Worker Pool
+===========================================
+
+Tests SpawnWorkerPool with stdlib job runners: results, timeouts, crashes,
+keep-warm replacement, and that worker processes are started without the
+pool lock held.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.worker_pool import SpawnWorkerPool, WorkerCrashError, WorkerPoolError, WorkerTimeoutError
+
+
+class TestSpawnWorkerPool(unittest.TestCase):
+    """Test suite for SpawnWorkerPool."""
+
+    def make_pool(self, job_runner, **kwargs):
+        pool = SpawnWorkerPool(job_runner, **kwargs)
+        self.addCleanup(pool.shutdown)
+        return pool
+
+    def record_lock_state(self, pool):
+        """Wrap _start_worker to record whether another thread could take the pool lock."""
+        lock_free = []
+        start_worker = pool._start_worker
+
+        def probe():
+            acquired = pool._condition.acquire(timeout=1)
+            lock_free.append(acquired)
+            if acquired:
+                pool._condition.release()
+
+        def checked_start_worker():
+            probe_thread = threading.Thread(target=probe)
+            probe_thread.start()
+            probe_thread.join()
+            return start_worker()
+
+        pool._start_worker = checked_start_worker
+        return lock_free
+
+    def test_runs_jobs_and_recycles_workers(self):
+        pool = self.make_pool(abs, pool_size=1, max_jobs_per_worker=2)
+
+        self.assertEqual([pool.run(-n, timeout=30) for n in range(3)], [0, 1, 2])
+        stats = pool.get_stats()
+        self.assertEqual(stats['jobs'], 3)
+        self.assertEqual(stats['workers_started'], 2)
+        self.assertEqual(stats['workers_recycled'], 1)
+
+        pool.shutdown()
+        with self.assertRaises(WorkerPoolError):
+            pool.run(-1, timeout=30)
+
+    def test_timeout_and_crash_discard_the_worker(self):
+        pool = self.make_pool(time.sleep, pool_size=1)
+        pool.run(0, timeout=30)
+
+        with self.assertRaises(WorkerTimeoutError):
+            pool.run(5, timeout=0.2)
+        self.assertEqual(pool.get_stats()['live_workers'], 0)
+
+        pool.run(0, timeout=30)
+        worker = pool._idle[0]
+        threading.Timer(0.2, worker.process.kill).start()
+        with self.assertRaises(WorkerCrashError) as context:
+            pool.run(5, timeout=30)
+        self.assertEqual(context.exception.exitcode, -9)
+
+    def test_workers_start_outside_the_lock(self):
+        pool = self.make_pool(time.sleep, pool_size=2)
+        lock_free = self.record_lock_state(pool)
+
+        pool.run(0, timeout=30)
+        self.assertEqual(lock_free, [True])
+
+    def test_warm_replacement_starts_outside_the_lock(self):
+        pool = self.make_pool(time.sleep, pool_size=2, keep_warm=True)
+        lock_free = self.record_lock_state(pool)
+
+        with self.assertRaises(WorkerTimeoutError):
+            pool.run(5, timeout=0.2)
+
+        self.assertEqual(lock_free, [True])
+        stats = pool.get_stats()
+        self.assertEqual(stats['live_workers'], 2)
+        self.assertEqual(stats['idle_workers'], 2)
+        self.assertEqual(stats['workers_started'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
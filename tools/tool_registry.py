@@ -5,8 +5,11 @@ Intelligent tool discovery, planning, and sequencing based on query context.
 Sprint 8 Task 1: Dynamic Toolchain Selection
 """
 
+import os
+import atexit
 import logging
 import json
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
@@ -103,15 +106,24 @@ class ToolRegistry:
     Registry for managing tool metadata and capabilities.
     """
     
-    def __init__(self, registry_file: str = "tool_registry.json"):
+    def __init__(self, registry_file: str = "tool_registry.json", flush_interval: float = 30.0):
         """
         Initialize the tool registry.
         
         Args:
             registry_file: Path to tool registry storage file
+            flush_interval: Seconds usage statistics are held in memory before
+                being written (0 writes on every update)
         """
         self.registry_file = Path(registry_file)
         self.tools: Dict[str, ToolMetadata] = {}
+        self.flush_interval = flush_interval
+        
+        # Stats are updated under _lock; _write_lock keeps registry writes in snapshot order
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._stats_dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
         
         # Load existing registry
         self._load_registry()
@@ -133,7 +145,8 @@ class ToolRegistry:
             True if successful, False otherwise
         """
         try:
-            self.tools[tool_metadata.tool_id] = tool_metadata
+            with self._lock:
+                self.tools[tool_metadata.tool_id] = tool_metadata
             self._save_registry()
             
             logger.info(f"Registered tool: {tool_metadata.name} ({tool_metadata.tool_id})")
@@ -224,28 +237,38 @@ class ToolRegistry:
             True if successful, False otherwise
         """
         try:
-            tool = self.tools.get(tool_id)
-            if not tool:
-                return False
-            
-            # Update usage count
-            tool.usage_count += 1
-            
-            # Update success rate
-            total_successes = tool.success_rate * (tool.usage_count - 1)
-            if success:
-                total_successes += 1
-            tool.success_rate = total_successes / tool.usage_count
-            
-            # Update average execution time
-            total_time = tool.average_execution_time * (tool.usage_count - 1)
-            total_time += execution_time
-            tool.average_execution_time = total_time / tool.usage_count
-            
-            # Update timestamp
-            tool.last_updated = datetime.now().isoformat()
+            with self._lock:
+                tool = self.tools.get(tool_id)
+                if not tool:
+                    return False
+                
+                # Update usage count
+                tool.usage_count += 1
+                
+                # Update success rate
+                total_successes = tool.success_rate * (tool.usage_count - 1)
+                if success:
+                    total_successes += 1
+                tool.success_rate = total_successes / tool.usage_count
+                
+                # Update average execution time
+                total_time = tool.average_execution_time * (tool.usage_count - 1)
+                total_time += execution_time
+                tool.average_execution_time = total_time / tool.usage_count
+                
+                # Update timestamp
+                tool.last_updated = datetime.now().isoformat()
+                
+                # Written in batches by flush() instead of on every execution
+                self._stats_dirty = True
+                if self.flush_interval <= 0:
+                    flush_now = True
+                else:
+                    flush_now = False
+                    self._schedule_flush()
             
-            self._save_registry()
+            if flush_now:
+                self.flush()
             
             logger.debug(f"Updated stats for tool {tool_id}: success_rate={tool.success_rate:.2f}")
             return True
@@ -254,6 +277,33 @@ class ToolRegistry:
             logger.error(f"Error updating tool stats for {tool_id}: {e}")
             return False
     
+    def flush(self) -> bool:
+        """
+        Write pending usage statistics to the registry file.
+        
+        Returns:
+            True if nothing was pending or the write succeeded, False otherwise
+        """
+        with self._lock:
+            if self._flush_timer:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._stats_dirty:
+                return True
+        
+        return self._save_registry()
+    
+    def close(self):
+        """Flush pending usage statistics (call at shutdown)."""
+        self.flush()
+    
+    def _schedule_flush(self):
+        """Start the flush timer unless one is already pending (caller holds _lock)."""
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
     def _initialize_builtin_tools(self):
         """Initialize registry with built-in tools."""
         builtin_tools = [
@@ -386,37 +436,48 @@ class ToolRegistry:
         except Exception as e:
             logger.error(f"Error loading tool registry: {e}")
     
-    def _save_registry(self):
+    def _save_registry(self) -> bool:
         """Save tool registry to storage."""
         try:
-            tools_data = []
-            
-            for tool in self.tools.values():
-                tool_dict = asdict(tool)
-                # Convert enums to strings
-                tool_dict['category'] = tool.category.value
-                tool_dict['complexity'] = tool.complexity.value
-                tool_dict['input_types'] = [t.value for t in tool.input_types]
-                tool_dict['output_types'] = [t.value for t in tool.output_types]
-                tools_data.append(tool_dict)
-            
-            data = {
-                'tools': tools_data,
-                'last_updated': datetime.now().isoformat(),
-                'version': '1.0.0'
-            }
-            
-            # Ensure directory exists
-            self.registry_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Save to file
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self._write_lock:
+                with self._lock:
+                    tools_data = []
+                    
+                    for tool in self.tools.values():
+                        tool_dict = asdict(tool)
+                        # Convert enums to strings
+                        tool_dict['category'] = tool.category.value
+                        tool_dict['complexity'] = tool.complexity.value
+                        tool_dict['input_types'] = [t.value for t in tool.input_types]
+                        tool_dict['output_types'] = [t.value for t in tool.output_types]
+                        tools_data.append(tool_dict)
+                    
+                    # The snapshot includes every pending stats update
+                    self._stats_dirty = False
+                
+                data = {
+                    'tools': tools_data,
+                    'last_updated': datetime.now().isoformat(),
+                    'version': '1.0.0'
+                }
+                
+                # Ensure directory exists
+                self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Write to a temporary file and rename so readers never see a partial registry
+                temp_file = self.registry_file.with_name(f"{self.registry_file.name}.tmp")
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, self.registry_file)
             
-            logger.debug(f"Saved {len(self.tools)} tools to registry")
+            logger.debug(f"Saved {len(tools_data)} tools to registry")
+            return True
             
         except Exception as e:
+            with self._lock:
+                self._stats_dirty = True
             logger.error(f"Error saving tool registry: {e}")
+            return False
 
 class ToolPlanner:
     """
@@ -662,6 +723,7 @@ def get_tool_registry(registry_file: str = "tool_registry.json") -> ToolRegistry
     
     if _tool_registry is None:
         _tool_registry = ToolRegistry(registry_file=registry_file)
+        atexit.register(_tool_registry.close)
     
     return _tool_registry
 
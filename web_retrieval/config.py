@@ -29,6 +29,12 @@ class WebRetrievalConfig:
     timeout_seconds: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 1.0
+
+    # Hedged tool execution: fallbacks start after hedge_delay_seconds
+    # (immediately after tools listed as flaky) and the first good result wins
+    hedged_execution: bool = False
+    hedge_delay_seconds: float = 2.0
+    flaky_tools: list = None
     
     # Content settings
     max_content_length: int = 50000
@@ -48,6 +54,8 @@ class WebRetrievalConfig:
             self.allowed_domains = []
         if self.blocked_domains is None:
             self.blocked_domains = ['malware.com', 'spam.com']
+        if self.flaky_tools is None:
+            self.flaky_tools = []
 
 def load_web_config() -> Dict[str, Any]:
     """Load web retrieval configuration from environment and defaults."""
@@ -62,6 +70,9 @@ def load_web_config() -> Dict[str, Any]:
             'timeout_seconds': int(os.getenv('SAM_WEB_TIMEOUT', '30')),
             'max_retries': int(os.getenv('SAM_WEB_MAX_RETRIES', '3')),
             'rate_limit_delay': float(os.getenv('SAM_WEB_RATE_LIMIT', '1.0')),
+            'hedged_execution': os.getenv('SAM_WEB_HEDGED_EXECUTION', 'false').lower() == 'true',
+            'hedge_delay_seconds': float(os.getenv('SAM_WEB_HEDGE_DELAY', '2.0')),
+            'flaky_tools': [tool.strip() for tool in os.getenv('SAM_WEB_FLAKY_TOOLS', '').split(',') if tool.strip()],
             'max_content_length': int(os.getenv('SAM_WEB_MAX_CONTENT', '50000')),
             'min_content_length': int(os.getenv('SAM_WEB_MIN_CONTENT', '100')),
             'enable_caching': os.getenv('SAM_WEB_ENABLE_CACHE', 'true').lower() == 'true',
@@ -88,6 +99,9 @@ def load_web_config() -> Dict[str, Any]:
             'timeout_seconds': 30,
             'max_retries': 3,
             'rate_limit_delay': 1.0,
+            'hedged_execution': False,
+            'hedge_delay_seconds': 2.0,
+            'flaky_tools': [],
             'max_content_length': 50000,
             'min_content_length': 100,
             'enable_caching': True,
@@ -109,6 +123,9 @@ def get_web_config_object() -> WebRetrievalConfig:
         timeout_seconds=config_dict['timeout_seconds'],
         max_retries=config_dict['max_retries'],
         rate_limit_delay=config_dict['rate_limit_delay'],
+        hedged_execution=config_dict['hedged_execution'],
+        hedge_delay_seconds=config_dict['hedge_delay_seconds'],
+        flaky_tools=config_dict['flaky_tools'],
         max_content_length=config_dict['max_content_length'],
         min_content_length=config_dict['min_content_length'],
         allowed_domains=config_dict['allowed_domains'],
@@ -170,6 +187,9 @@ def get_default_web_config() -> Dict[str, Any]:
         'timeout_seconds': 30,
         'max_retries': 3,
         'rate_limit_delay': 1.0,
+        'hedged_execution': False,
+        'hedge_delay_seconds': 2.0,
+        'flaky_tools': [],
         'max_content_length': 50000,
         'min_content_length': 100,
         'enable_caching': True,
@@ -0,0 +1,164 @@
+"""
+FetchWorkerPool: Long-lived isolated worker processes for web fetching.
+
+Starting a fresh interpreter per URL pays interpreter startup and import
+costs before any network I/O. This module keeps a small pool of worker
+processes, each started with the "spawn" method so it shares no state with
+SAM, that receive fetch jobs over a pipe. The pool itself is the shared
+core.worker_pool.SpawnWorkerPool with run_fetch_job as its job runner.
+
+Isolation guarantees match the one-shot subprocess:
+- a job that exceeds its hard timeout gets its worker killed
+- a worker that crashes or exits is discarded and replaced
+- workers are recycled after a fixed number of jobs to bound leaks
+"""
+
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any
+
+from core.worker_pool import SpawnWorkerPool, WorkerCrashError, WorkerPoolError, WorkerTimeoutError
+
+from .exceptions import ProcessIsolationError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+
+def fetch_with_requests(url: str, user_agent: str, timeout: float) -> str:
+    """
+    Fetch a page with requests and extract its visible text with BeautifulSoup.
+
+    Args:
+        url: Target URL
+        user_agent: User agent header
+        timeout: Request timeout in seconds
+
+    Returns:
+        Whitespace-normalized page text
+    """
+    try:
+        import requests
+        from bs4 import BeautifulSoup
+
+        response = requests.get(url, headers={'User-Agent': user_agent}, timeout=timeout)
+        response.raise_for_status()
+
+        soup = BeautifulSoup(response.content, 'html.parser')
+
+        # Remove script and style elements
+        for script in soup(["script", "style"]):
+            script.decompose()
+
+        # Extract text content
+        text = soup.get_text()
+
+        # Clean up whitespace
+        lines = (line.strip() for line in text.splitlines())
+        chunks = (phrase.strip() for line in lines for phrase in str(line).split("  "))
+        return ' '.join(chunk for chunk in chunks if chunk)
+
+    except Exception as e:
+        raise Exception(f"Requests fetch failed: {e}")
+
+
+def run_fetch_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one fetch job, returning the same result payload as the fetch script.
+
+    Args:
+        job: Dictionary with url, user_agent and timeout
+
+    Returns:
+        Result dictionary with url, content, timestamp, error and metadata
+    """
+    url = job['url']
+    try:
+        content = fetch_with_requests(url, job['user_agent'], job['timeout'])
+        return {
+            "url": url,
+            "content": content,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "error": None,
+            "metadata": {
+                "content_length": len(content),
+                "fetch_method": "requests+beautifulsoup",
+                "user_agent": job['user_agent']
+            }
+        }
+    except Exception as e:
+        return {
+            "url": url,
+            "content": None,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "error": str(e),
+            "metadata": {
+                "error_type": type(e).__name__,
+                "fetch_method": "requests+beautifulsoup"
+            }
+        }
+
+
+class FetchWorkerPool(SpawnWorkerPool):
+    """
+    Pool of warm, isolated fetch worker processes.
+
+    Workers are started on demand up to pool_size and reused across jobs.
+    fetch() blocks while every worker is busy.
+    """
+
+    def __init__(self, pool_size: int = 2, max_jobs_per_worker: int = 50):
+        """
+        Initialize the pool.
+
+        Args:
+            pool_size: Maximum number of worker processes
+            max_jobs_per_worker: Jobs a worker runs before it is replaced
+        """
+        super().__init__(run_fetch_job, pool_size, max_jobs_per_worker, name="sam-fetch-worker")
+
+    def fetch(self, url: str, user_agent: str, timeout: float,
+              hard_timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run a fetch job on a pooled worker.
+
+        Args:
+            url: Target URL
+            user_agent: User agent header
+            timeout: Request timeout inside the worker (seconds)
+            hard_timeout: Time after which the worker is killed (default timeout + 10)
+
+        Returns:
+            Result dictionary from run_fetch_job
+
+        Raises:
+            TimeoutError: If the worker did not answer within hard_timeout
+            ProcessIsolationError: If the worker crashed or the pool is closed
+        """
+        hard_timeout = hard_timeout if hard_timeout is not None else timeout + 10
+        try:
+            return self.run({'url': url, 'user_agent': user_agent, 'timeout': timeout}, hard_timeout)
+        except WorkerTimeoutError:
+            raise TimeoutError(f"Web fetch timed out after {timeout} seconds",
+                               timeout_seconds=timeout, url=url)
+        except WorkerCrashError as e:
+            raise ProcessIsolationError(f"Fetch worker exited unexpectedly (exit code {e.exitcode})",
+                                        returncode=e.exitcode, url=url)
+        except WorkerPoolError as e:
+            raise ProcessIsolationError(str(e), url=url)
+
+
+# Global instance for easy access
+_fetch_worker_pool: Optional[FetchWorkerPool] = None
+_fetch_worker_pool_lock = threading.Lock()
+
+
+def get_fetch_worker_pool(pool_size: int = 2, max_jobs_per_worker: int = 50) -> FetchWorkerPool:
+    """Get global fetch worker pool instance."""
+    global _fetch_worker_pool
+    with _fetch_worker_pool_lock:
+        if _fetch_worker_pool is None:
+            _fetch_worker_pool = FetchWorkerPool(pool_size, max_jobs_per_worker)
+            atexit.register(_fetch_worker_pool.shutdown)
+        return _fetch_worker_pool
@@ -4,7 +4,11 @@ Intelligent Web Retrieval System - Main orchestrator for SAM's web intelligence
 Coordinates the router and tools for optimal web content retrieval
 """
 
+import asyncio
+import atexit
 import logging
+import threading
+import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -19,6 +23,43 @@ from .query_router import QueryRouter
 
 logger = logging.getLogger(__name__)
 
+# Event loop for tool execution, shared by all IntelligentWebSystem instances
+_tool_loop: Optional[asyncio.AbstractEventLoop] = None
+_tool_loop_lock = threading.Lock()
+
+
+def _run_event_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Run the shared event loop until shutdown, then close it."""
+    asyncio.set_event_loop(loop)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def get_tool_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared tool event loop, starting its thread on first use."""
+    global _tool_loop
+    with _tool_loop_lock:
+        if _tool_loop is None or _tool_loop.is_closed():
+            _tool_loop = asyncio.new_event_loop()
+            threading.Thread(target=_run_event_loop, args=(_tool_loop,), daemon=True,
+                             name="sam-web-tools").start()
+        return _tool_loop
+
+
+def shutdown_tool_event_loop() -> None:
+    """Stop the shared tool event loop."""
+    global _tool_loop
+    with _tool_loop_lock:
+        if _tool_loop is not None and not _tool_loop.is_closed():
+            _tool_loop.call_soon_threadsafe(_tool_loop.stop)
+        _tool_loop = None
+
+
+atexit.register(shutdown_tool_event_loop)
+
+
 class IntelligentWebSystem:
     """Main orchestrator for intelligent web content retrieval."""
     
@@ -45,6 +86,12 @@ class IntelligentWebSystem:
         # Initialize router
         self.router = QueryRouter()
 
+        # Hedged execution: fallbacks start after hedge_delay_seconds, or right
+        # away after tools known to be flaky, and the first good result wins
+        self.hedged_execution = self.config.get('hedged_execution', False)
+        self.hedge_delay = self.config.get('hedge_delay_seconds', 2.0)
+        self.flaky_tools = set(self.config.get('flaky_tools', []))
+
         # Tool mapping
         self.tools = {
             'cocoindex_tool': self.cocoindex_tool,
@@ -64,6 +111,9 @@ class IntelligentWebSystem:
             
             # Step 1: Route the query
             routing_decision = self.router.route_query(query)
+
+            if self.hedged_execution:
+                return self._run_coroutine(self._process_query_hedged(query, routing_decision))
             
             # Step 2: Execute primary tool
             primary_result = self._execute_tool(
@@ -109,19 +159,127 @@ class IntelligentWebSystem:
                 'timestamp': datetime.now().isoformat()
             }
     
+    async def _process_query_hedged(self, query: str, routing_decision: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Race the primary tool and its fallbacks on the shared event loop.
+
+        Each candidate starts when the previous one fails or returns too little
+        content, or when it has run for hedge_delay seconds (zero for flaky
+        tools). The first result with sufficient content wins and the other
+        running tools are cancelled.
+
+        Args:
+            query: User query
+            routing_decision: Routing decision from the query router
+
+        Returns:
+            Final result in the same format as sequential execution
+        """
+        primary_tool = routing_decision['primary_tool']
+        candidates = [(primary_tool, routing_decision.get('parameters', {}))]
+        candidates.extend((tool_name, {}) for tool_name in routing_decision['fallback_chain'])
+
+        pending: Dict[asyncio.Task, str] = {}
+        next_candidate = 0
+        next_start = 0.0
+        started_tools = []
+
+        try:
+            while pending or next_candidate < len(candidates):
+                # Start the next candidate once its hedge delay has passed
+                now = time.monotonic()
+                if next_candidate < len(candidates) and (not pending or now >= next_start):
+                    tool_name, parameters = candidates[next_candidate]
+                    next_candidate += 1
+                    started_tools.append(tool_name)
+                    task = asyncio.ensure_future(self._execute_tool_async(tool_name, query, parameters))
+                    pending[task] = tool_name
+                    delay = 0.0 if tool_name in self.flaky_tools else self.hedge_delay
+                    next_start = now + delay
+                    if next_candidate > 1:
+                        logger.info(f"Hedging with fallback tool {tool_name}")
+                    continue
+
+                timeout = max(0.0, next_start - now) if next_candidate < len(candidates) else None
+                done, _ = await asyncio.wait(list(pending), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    tool_name = pending.pop(task)
+                    result = task.result()
+                    if result.get('success') and self._has_sufficient_content(result):
+                        logger.info(f"Tool {tool_name} won the hedged race")
+                        actual_tool = tool_name if tool_name != primary_tool else None
+                        return self._format_final_result(result, routing_decision, query, actual_tool)
+
+                    logger.warning(f"Tool {tool_name} failed or returned insufficient content")
+                    # A failed tool releases the next candidate immediately
+                    next_start = time.monotonic()
+
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return {
+            'success': False,
+            'error': 'All tools in the fallback chain failed',
+            'query': query,
+            'routing_decision': routing_decision,
+            'tools_attempted': started_tools,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def _run_coroutine(self, coroutine) -> Any:
+        """Run a coroutine on the shared tool event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, get_tool_event_loop()).result()
+
     def _execute_tool(self, tool_name: str, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a specific tool with the given query and parameters."""
+        return self._run_coroutine(self._execute_tool_async(tool_name, query, parameters))
+
+    async def _execute_tool_async(self, tool_name: str, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute a specific tool on the shared event loop.
+
+        Async tools run as coroutines and are cancellable; blocking tools run in
+        the loop's thread pool, where cancellation only discards their result.
+
+        Args:
+            tool_name: Name of the tool
+            query: User query
+            parameters: Tool parameters
+
+        Returns:
+            Tool result dictionary
+        """
         try:
             tool = self.tools.get(tool_name)
             if not tool:
                 return {'success': False, 'error': f'Tool {tool_name} not found'}
-            
+
             logger.info(f"Executing tool: {tool_name}")
-            
-            # Execute based on tool type
+
             if tool_name == 'cocoindex_tool':
-                return self._execute_cocoindex_tool(tool, query, parameters)
-            elif tool_name == 'search_api_tool':
+                return await self._execute_cocoindex_tool(tool, query, parameters)
+            elif tool_name == 'firecrawl_tool':
+                return await self._execute_firecrawl_tool(tool, query, parameters)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._execute_blocking_tool, tool_name, tool, query, parameters)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Tool execution failed for {tool_name}: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def _execute_blocking_tool(self, tool_name: str, tool: Any, query: str,
+                               parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a tool with a blocking API."""
+        try:
+            # Execute based on tool type
+            if tool_name == 'search_api_tool':
                 return self._execute_search_tool(tool, query, parameters)
             elif tool_name == 'news_api_tool':
                 return self._execute_news_tool(tool, query, parameters)
@@ -129,8 +287,6 @@ class IntelligentWebSystem:
                 return self._execute_rss_tool(tool, query, parameters)
             elif tool_name == 'url_content_extractor':
                 return self._execute_url_tool(tool, query, parameters)
-            elif tool_name == 'firecrawl_tool':
-                return self._execute_firecrawl_tool(tool, query, parameters)
             else:
                 return {'success': False, 'error': f'Unknown tool: {tool_name}'}
                 
@@ -159,18 +315,11 @@ class IntelligentWebSystem:
         
         return result
 
-    def _execute_cocoindex_tool(self, tool: CocoIndexTool, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_cocoindex_tool(self, tool: CocoIndexTool, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute CocoIndex tool for intelligent web search."""
         try:
-            import asyncio
-
             # Run the async search
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(tool.intelligent_search(query))
-            finally:
-                loop.close()
+            result = await tool.intelligent_search(query)
 
             if result['success']:
                 return {
@@ -186,6 +335,8 @@ class IntelligentWebSystem:
                 # CocoIndex failed, return the error for potential fallback
                 return result
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"CocoIndex tool execution failed: {e}")
             return {
@@ -285,48 +436,33 @@ class IntelligentWebSystem:
         
         return result
 
-    def _execute_firecrawl_tool(self, tool: FirecrawlTool, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_firecrawl_tool(self, tool: FirecrawlTool, query: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Execute Firecrawl tool for advanced web crawling and extraction."""
         try:
-            import asyncio
-
             # Determine operation mode based on parameters
             operation_mode = parameters.get('operation_mode', 'crawl')
 
             # Run the appropriate Firecrawl operation
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                if operation_mode == 'crawl':
-                    # Full website crawling
-                    url = parameters.get('url', query)
-                    max_pages = parameters.get('max_pages', 10)
-                    include_subdomains = parameters.get('include_subdomains', False)
-                    result = loop.run_until_complete(
-                        tool.intelligent_crawl(url, max_pages, include_subdomains)
-                    )
-                elif operation_mode == 'interactive':
-                    # Interactive extraction with actions
-                    url = parameters.get('url', query)
-                    actions = parameters.get('actions', [])
-                    result = loop.run_until_complete(
-                        tool.extract_with_actions(url, actions)
-                    )
-                elif operation_mode == 'batch':
-                    # Batch processing multiple URLs
-                    urls = parameters.get('urls', [query])
-                    max_concurrent = parameters.get('max_concurrent', 5)
-                    result = loop.run_until_complete(
-                        tool.batch_scrape(urls, max_concurrent)
-                    )
-                else:
-                    # Default to single URL scraping
-                    url = parameters.get('url', query)
-                    result = loop.run_until_complete(
-                        tool.intelligent_crawl(url, 1, False)  # Single page crawl
-                    )
-            finally:
-                loop.close()
+            if operation_mode == 'crawl':
+                # Full website crawling
+                url = parameters.get('url', query)
+                max_pages = parameters.get('max_pages', 10)
+                include_subdomains = parameters.get('include_subdomains', False)
+                result = await tool.intelligent_crawl(url, max_pages, include_subdomains)
+            elif operation_mode == 'interactive':
+                # Interactive extraction with actions
+                url = parameters.get('url', query)
+                actions = parameters.get('actions', [])
+                result = await tool.extract_with_actions(url, actions)
+            elif operation_mode == 'batch':
+                # Batch processing multiple URLs
+                urls = parameters.get('urls', [query])
+                max_concurrent = parameters.get('max_concurrent', 5)
+                result = await tool.batch_scrape(urls, max_concurrent)
+            else:
+                # Default to single URL scraping
+                url = parameters.get('url', query)
+                result = await tool.intelligent_crawl(url, 1, False)  # Single page crawl
 
             if result['success']:
                 # Format result for SAM's vetting pipeline
@@ -348,6 +484,8 @@ class IntelligentWebSystem:
                 logger.warning(f"Firecrawl tool failed: {result.get('error', 'Unknown error')}")
                 return result
 
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             logger.error(f"Firecrawl tool execution failed: {e}")
             return {
@@ -455,6 +593,7 @@ class IntelligentWebSystem:
             'capabilities': [
                 'Intelligent query routing',
                 'Multi-tool fallback chains',
+                'Hedged fallback execution',
                 'Content quality assessment',
                 'CocoIndex intelligent search (Phase 8.5)',
                 'Firecrawl advanced web crawling (NEW)',
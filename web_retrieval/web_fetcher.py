@@ -17,6 +17,7 @@ from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
 from .data_contracts import WebContentData, create_timestamp
+from .fetch_worker_pool import get_fetch_worker_pool
 from .exceptions import (
     WebRetrievalError,
     ProcessIsolationError,
@@ -62,13 +63,18 @@ class WebFetcher:
     
     This class provides isolated web content retrieval using browser automation
     technologies. All browser operations run in separate processes to prevent
-    crashes or instability from affecting the main SAM application.
+    crashes or instability from affecting the main SAM application. By default
+    fetches run on a shared pool of warm worker processes; with
+    use_worker_pool=False each fetch starts a new interpreter.
     """
     
     def __init__(self, 
                  timeout: int = 30,
                  max_content_length: int = 1000000,
-                 user_agent: str = None):
+                 user_agent: str = None,
+                 use_worker_pool: bool = True,
+                 pool_size: int = 2,
+                 max_jobs_per_worker: int = 50):
         """
         Initialize WebFetcher.
         
@@ -76,10 +82,17 @@ class WebFetcher:
             timeout: Maximum time to wait for page load (seconds)
             max_content_length: Maximum content size to retrieve (bytes)
             user_agent: Custom user agent string
+            use_worker_pool: Run fetches on the shared warm worker pool
+            pool_size: Worker processes in the shared pool (used when it is created)
+            max_jobs_per_worker: Jobs per worker before it is recycled (used when
+                the shared pool is created)
         """
         self.timeout = timeout
         self.max_content_length = max_content_length
         self.user_agent = user_agent or self._get_default_user_agent()
+        self.use_worker_pool = use_worker_pool
+        self.pool_size = pool_size
+        self.max_jobs_per_worker = max_jobs_per_worker
         self.logger = logging.getLogger(__name__)
         
         # Validate configuration
@@ -158,7 +171,16 @@ class WebFetcher:
         # e.g., blacklist certain domains, check for suspicious patterns
     
     def _execute_isolated_fetch(self, url: str) -> Dict[str, Any]:
-        """Execute web fetch in isolated subprocess."""
+        """Execute web fetch in an isolated worker process."""
+        if not self.use_worker_pool:
+            return self._execute_subprocess_fetch(url)
+
+        self.logger.debug(f"Executing isolated fetch on worker pool for {url}")
+        pool = get_fetch_worker_pool(self.pool_size, self.max_jobs_per_worker)
+        return pool.fetch(url, self.user_agent, self.timeout, hard_timeout=self.timeout + 10)
+
+    def _execute_subprocess_fetch(self, url: str) -> Dict[str, Any]:
+        """Execute web fetch in a new interpreter started for this URL."""
         # Create the subprocess script
         script_content = self._create_fetch_script(url)
         
@@ -295,8 +317,12 @@ if __name__ == "__main__":
     
     def get_stats(self) -> Dict[str, Any]:
         """Get fetcher statistics and configuration."""
-        return {
+        stats = {
             'timeout': self.timeout,
             'max_content_length': self.max_content_length,
-            'user_agent': self.user_agent
+            'user_agent': self.user_agent,
+            'use_worker_pool': self.use_worker_pool
         }
+        if self.use_worker_pool:
+            stats['worker_pool'] = get_fetch_worker_pool(self.pool_size, self.max_jobs_per_worker).get_stats()
+        return stats
@@ -13,6 +13,7 @@ from pathlib import Path
 from flask import Flask, render_template, request, jsonify, session, send_from_directory
 from werkzeug.utils import secure_filename
 import uuid
+import threading
 
 # Configure logging first
 import logging
@@ -62,11 +63,16 @@ except ImportError as e:
     inject_security_context = lambda: {}
     vetting_bp = None
 
+# Import background upload job queue
+from web_ui.upload_jobs import UploadJobQueue, JobQueueFullError, JobStatus
+
 # Flask app configuration
 app = Flask(__name__)
 app.secret_key = 'sam_multimodal_secret_key_2024'
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
 app.config['UPLOAD_FOLDER'] = 'uploads'
+app.config['UPLOAD_JOB_WORKERS'] = int(os.getenv('SAM_UPLOAD_JOB_WORKERS', '2'))
+app.config['UPLOAD_JOB_MAX_PENDING'] = int(os.getenv('SAM_UPLOAD_JOB_MAX_PENDING', '20'))
 
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {
@@ -87,6 +93,10 @@ tool_selector = None
 tool_executor = None
 answer_synthesizer = None
 
+# Background upload processing
+upload_job_queue = None
+upload_job_queue_lock = threading.Lock()
+
 def allowed_file(filename):
     """Check if file extension is allowed."""
     return '.' in filename and \
@@ -1622,7 +1632,7 @@ def generate_simple_response(message):
 @app.route('/api/upload', methods=['POST'])
 @require_unlock
 def upload_file():
-    """Handle file uploads for processing with encryption."""
+    """Handle file uploads by queueing them for background processing."""
     try:
         logger.info("File upload request received")
 
@@ -1649,59 +1659,20 @@ def upload_file():
 
         logger.info(f"File saved: {file_path} ({file_path.stat().st_size:,} bytes)")
 
-        # Process the file
-        result = process_uploaded_file(file_path)
-
-        # Check if processing was successful
-        if 'error' in result:
-            logger.error(f"File processing failed: {result['error']}")
-            return jsonify({
-                'error': f"Failed to process document: {result['error']}",
-                'filename': filename
-            }), 500
-
-        # ENHANCED: Add knowledge consolidation confirmation
-        consolidation_status = confirm_knowledge_consolidation(result, filename)
-        result['knowledge_consolidation'] = consolidation_status
-
-        # CRITICAL: Inject learned knowledge into web UI model for true learning
-        if consolidation_status['status'] == 'successful':
-            try:
-                # Extract knowledge from processing result
-                if 'summary_length' in result or 'key_concepts' in result:
-                    # Get summary from memory storage if available
-                    summary = f"Document processed: {filename}"
-                    if 'memory_storage' in result:
-                        summary = f"Document: {filename} - Successfully processed with {result.get('content_blocks', 0)} content blocks"
-
-                    # Handle key_concepts which might be an integer count
-                    key_concepts_data = result.get('key_concepts', [])
-                    if isinstance(key_concepts_data, int):
-                        # If it's just a count, create placeholder concepts
-                        key_concepts = [f"concept_{i+1}" for i in range(min(key_concepts_data, 5))]
-                    elif isinstance(key_concepts_data, list):
-                        key_concepts = key_concepts_data
-                    else:
-                        key_concepts = []
-
-                    # Inject into web UI model
-                    if hasattr(sam_model, 'inject_learned_knowledge'):
-                        sam_model.inject_learned_knowledge(summary, key_concepts)
-                        logger.info(f"🎓 WEB UI MODEL LEARNING: Injected knowledge from {filename}")
-                    else:
-                        logger.warning("Web UI model does not support knowledge injection")
-
-            except Exception as e:
-                logger.error(f"Failed to inject knowledge into web UI model: {e}")
-
-        logger.info(f"File processing successful: {filename}")
-        logger.info(f"Knowledge consolidation status: {consolidation_status['status']}")
+        # Queue the file for processing
+        try:
+            job = get_upload_job_queue().submit(str(file_path), filename)
+        except JobQueueFullError as e:
+            logger.warning(f"Upload rejected: {e}")
+            return jsonify({'error': str(e), 'filename': filename}), 503
 
         return jsonify({
-            'message': 'File processed successfully',
+            'message': 'File queued for processing',
             'filename': filename,
-            'result': result
-        })
+            'job_id': job.job_id,
+            'status_url': f'/api/jobs/{job.job_id}',
+            'result_url': f'/api/jobs/{job.job_id}/result'
+        }), 202
 
     except Exception as e:
         logger.error(f"Error uploading file: {e}")
@@ -1709,7 +1680,123 @@ def upload_file():
         logger.error(f"Full traceback: {traceback.format_exc()}")
         return jsonify({'error': str(e)}), 500
 
-def process_uploaded_file(file_path):
+def run_upload_job(file_path, filename, progress_callback=None):
+    """Process an uploaded file and consolidate its knowledge (runs on a job worker)."""
+    # Process the file
+    result = process_uploaded_file(file_path, progress_callback)
+
+    # Check if processing was successful
+    if 'error' in result:
+        logger.error(f"File processing failed: {result['error']}")
+        return {'error': f"Failed to process document: {result['error']}"}
+
+    # ENHANCED: Add knowledge consolidation confirmation
+    consolidation_status = confirm_knowledge_consolidation(result, filename)
+    result['knowledge_consolidation'] = consolidation_status
+
+    # CRITICAL: Inject learned knowledge into web UI model for true learning
+    if consolidation_status['status'] == 'successful':
+        try:
+            # Extract knowledge from processing result
+            if 'summary_length' in result or 'key_concepts' in result:
+                # Get summary from memory storage if available
+                summary = f"Document processed: {filename}"
+                if 'memory_storage' in result:
+                    summary = f"Document: {filename} - Successfully processed with {result.get('content_blocks', 0)} content blocks"
+
+                # Handle key_concepts which might be an integer count
+                key_concepts_data = result.get('key_concepts', [])
+                if isinstance(key_concepts_data, int):
+                    # If it's just a count, create placeholder concepts
+                    key_concepts = [f"concept_{i+1}" for i in range(min(key_concepts_data, 5))]
+                elif isinstance(key_concepts_data, list):
+                    key_concepts = key_concepts_data
+                else:
+                    key_concepts = []
+
+                # Inject into web UI model
+                if hasattr(sam_model, 'inject_learned_knowledge'):
+                    sam_model.inject_learned_knowledge(summary, key_concepts)
+                    logger.info(f"🎓 WEB UI MODEL LEARNING: Injected knowledge from {filename}")
+                else:
+                    logger.warning("Web UI model does not support knowledge injection")
+
+        except Exception as e:
+            logger.error(f"Failed to inject knowledge into web UI model: {e}")
+
+    logger.info(f"File processing successful: {filename}")
+    logger.info(f"Knowledge consolidation status: {consolidation_status['status']}")
+
+    return {
+        'message': 'File processed successfully',
+        'filename': filename,
+        'result': result
+    }
+
+def get_upload_job_queue():
+    """Get or create the background upload job queue."""
+    global upload_job_queue
+
+    if upload_job_queue is None:
+        with upload_job_queue_lock:
+            if upload_job_queue is None:
+                upload_job_queue = UploadJobQueue(
+                    run_upload_job,
+                    max_workers=app.config['UPLOAD_JOB_WORKERS'],
+                    max_pending=app.config['UPLOAD_JOB_MAX_PENDING']
+                )
+
+    return upload_job_queue
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+@require_unlock
+def get_upload_job_status(job_id):
+    """Get status and per-stage progress events of an upload job."""
+    status = get_upload_job_queue().get_job_status(job_id)
+    if not status:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+
+    return jsonify(status)
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+@require_unlock
+def get_upload_job_result(job_id):
+    """Get the processing result of a finished upload job."""
+    job = get_upload_job_queue().get_job(job_id)
+    if not job:
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+
+    if job.status == JobStatus.COMPLETED:
+        return jsonify(job.result)
+
+    if job.status == JobStatus.FAILED:
+        return jsonify({'error': job.error, 'filename': job.filename, 'job_id': job_id}), 500
+
+    if job.status == JobStatus.CANCELLED:
+        return jsonify({'error': 'Job was cancelled', 'filename': job.filename, 'job_id': job_id}), 410
+
+    return jsonify({
+        'message': 'Job still in progress',
+        'job_id': job_id,
+        'status': job.status.value,
+        'stage': job.stage,
+        'progress': job.progress
+    }), 202
+
+@app.route('/api/jobs/<job_id>/cancel', methods=['POST'])
+@require_unlock
+def cancel_upload_job(job_id):
+    """Cancel a queued or running upload job."""
+    job_queue = get_upload_job_queue()
+    if not job_queue.get_job(job_id):
+        return jsonify({'error': 'Job not found', 'job_id': job_id}), 404
+
+    if not job_queue.cancel(job_id):
+        return jsonify({'error': 'Job already finished', 'job_id': job_id}), 409
+
+    return jsonify({'message': 'Cancellation requested', 'job_id': job_id})
+
+def process_uploaded_file(file_path, progress_callback=None):
     """Process uploaded file through multimodal pipeline."""
     try:
         logger.info(f"Starting file processing: {file_path}")
@@ -1721,7 +1808,7 @@ def process_uploaded_file(file_path):
         logger.info("Multimodal pipeline available, processing document...")
 
         # Process the document
-        result = multimodal_pipeline.process_document(file_path)
+        result = multimodal_pipeline.process_document(file_path, progress_callback=progress_callback)
 
         logger.info(f"Processing result: {result is not None}")
 
@@ -1738,6 +1825,11 @@ def process_uploaded_file(file_path):
                 'key_concepts': result['key_concepts']
             }
 
+            # Large PDFs are streamed into memory without the whole-document steps
+            if result.get('streamed'):
+                response_data['streamed'] = True
+                response_data['skipped_steps'] = result['skipped_steps']
+
             # Add memory storage information if available
             if 'memory_storage' in result:
                 memory_info = result['memory_storage']
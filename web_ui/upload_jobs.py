@@ -0,0 +1,253 @@
+"""
+Upload Job Queue for SAM Web UI
+
+Runs document processing for uploaded files on a bounded local worker pool so
+the upload request can return immediately with a job id. Clients follow the
+job through /api/jobs/<job_id> and fetch the final payload from
+/api/jobs/<job_id>/result.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(Enum):
+    """Lifecycle states of an upload job."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+# Processing stages that write the document to the stores; once one has
+# started, the job can no longer be cancelled
+STORAGE_STAGES = {"vector_indexing", "table_processing", "memory_storage", "saving_outputs"}
+
+
+class JobQueueFullError(Exception):
+    """Raised when the queue already holds the maximum number of pending jobs."""
+    pass
+
+
+@dataclass
+class UploadJob:
+    """State of a single document upload job."""
+    job_id: str
+    filename: str
+    file_path: str
+    status: JobStatus = JobStatus.QUEUED
+    stage: str = "queued"
+    progress: float = 0.0
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    storage_started: bool = False
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert job status to a JSON-serializable dictionary (without the result)."""
+        return {
+            'job_id': self.job_id,
+            'filename': self.filename,
+            'status': self.status.value,
+            'stage': self.stage,
+            'progress': round(self.progress, 3),
+            'events': list(self.events),
+            'error': self.error,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'cancel_requested': self.cancel_event.is_set()
+        }
+
+
+class UploadJobQueue:
+    """
+    Bounded background queue for upload processing jobs.
+
+    At most ``max_workers`` jobs run concurrently and at most ``max_pending``
+    jobs may wait or run at once. Finished jobs are retained for inspection up
+    to ``max_finished_jobs``, oldest dropped first.
+    """
+
+    def __init__(self, processor: Callable[[str, str, Callable[[str, float], bool]], Dict[str, Any]],
+                 max_workers: int = 2, max_pending: int = 20, max_finished_jobs: int = 200):
+        """
+        Initialize the job queue.
+
+        Args:
+            processor: Callable(file_path, filename, progress_callback) returning
+                the result payload; it should stop early when the progress
+                callback returns False
+            max_workers: Maximum number of concurrently running jobs
+            max_pending: Maximum number of queued plus running jobs
+            max_finished_jobs: Number of finished jobs kept for status queries
+        """
+        self.processor = processor
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_finished_jobs = max_finished_jobs
+
+        self._jobs: "OrderedDict[str, UploadJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix="sam-upload-job")
+
+        logger.info(f"Upload job queue initialized with {max_workers} workers")
+
+    def submit(self, file_path: str, filename: str) -> UploadJob:
+        """
+        Enqueue a processing job for an uploaded file.
+
+        Args:
+            file_path: Path of the saved upload
+            filename: Original (sanitized) filename
+
+        Returns:
+            The created job
+
+        Raises:
+            JobQueueFullError: If max_pending jobs are already queued or running
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if job.status not in FINISHED_STATUSES)
+            if active >= self.max_pending:
+                raise JobQueueFullError(f"Upload queue is full ({active} jobs pending)")
+
+            job = UploadJob(job_id=str(uuid.uuid4()), filename=filename, file_path=str(file_path))
+            self._jobs[job.job_id] = job
+            self._record_event(job, "queued", 0.0)
+            self._prune_finished_jobs()
+
+        self._executor.submit(self._run_job, job)
+        logger.info(f"Queued upload job {job.job_id} for {filename}")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[UploadJob]:
+        """Get a job by id."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a consistent snapshot of a job's status."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.to_dict() if job else None
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Request cancellation of a job.
+
+        Queued jobs are cancelled immediately; running jobs stop at the next
+        progress checkpoint. Jobs that have started storing the document
+        run to completion.
+
+        Returns:
+            True if the job exists, was not already finished and had not
+            started storing the document
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if not job or job.status in FINISHED_STATUSES:
+                return False
+            if job.storage_started:
+                logger.info(f"Upload job {job_id} is already storing the document; not cancelled")
+                return False
+
+            job.cancel_event.set()
+            if job.status == JobStatus.QUEUED:
+                self._finish(job, JobStatus.CANCELLED)
+
+        logger.info(f"Cancellation requested for upload job {job_id}")
+        return True
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """List all known jobs, newest first."""
+        with self._lock:
+            return [job.to_dict() for job in reversed(list(self._jobs.values()))]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Cancel outstanding jobs and stop the worker pool."""
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status not in FINISHED_STATUSES:
+                    job.cancel_event.set()
+        self._executor.shutdown(wait=wait)
+
+    def _run_job(self, job: UploadJob) -> None:
+        """Execute a job on a worker thread."""
+        with self._lock:
+            if job.status != JobStatus.QUEUED:
+                return
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+            self._record_event(job, "started", 0.0)
+
+        def progress_callback(stage: str, progress: float) -> bool:
+            with self._lock:
+                self._record_event(job, stage, progress)
+                if job.storage_started:
+                    return True
+                if job.cancel_event.is_set():
+                    return False
+                if stage in STORAGE_STAGES:
+                    job.storage_started = True
+                return True
+
+        try:
+            result = self.processor(job.file_path, job.filename, progress_callback)
+
+            with self._lock:
+                if job.cancel_event.is_set() and not job.storage_started:
+                    self._finish(job, JobStatus.CANCELLED)
+                elif result and 'error' in result:
+                    job.error = result['error']
+                    self._finish(job, JobStatus.FAILED)
+                else:
+                    job.result = result
+                    self._finish(job, JobStatus.COMPLETED)
+
+        except Exception as e:
+            logger.error(f"Upload job {job.job_id} failed: {e}")
+            with self._lock:
+                job.error = str(e)
+                self._finish(job, JobStatus.FAILED)
+
+        logger.info(f"Upload job {job.job_id} finished with status {job.status.value}")
+
+    def _finish(self, job: UploadJob, status: JobStatus) -> None:
+        """Mark a job finished (caller holds the lock)."""
+        job.status = status
+        job.finished_at = time.time()
+        self._record_event(job, status.value, 1.0 if status == JobStatus.COMPLETED else job.progress)
+
+    def _record_event(self, job: UploadJob, stage: str, progress: float) -> None:
+        """Record a progress event (caller holds the lock)."""
+        job.stage = stage
+        job.progress = max(job.progress, min(1.0, progress))
+        job.events.append({
+            'stage': stage,
+            'progress': round(job.progress, 3),
+            'timestamp': time.time()
+        })
+
+    def _prune_finished_jobs(self) -> None:
+        """Drop the oldest finished jobs beyond the retention limit (caller holds the lock)."""
+        finished = [job_id for job_id, job in self._jobs.items() if job.status in FINISHED_STATUSES]
+        for job_id in finished[:max(0, len(finished) - self.max_finished_jobs)]:
+            del self._jobs[job_id]